@@ -129,24 +129,10 @@ function getSortedDecades() {
     return out;
 }
 
-// Country normalization index (built from admin/country_mappings.js)
+// Country normalization index (precomputed in admin/country_mappings.js by scripts/country_index.py).
+// foldKey()/countryKey() come from the same file: country_key() from country_index.py in JS.
 let _countryIndexCache = null;
 
-function normalizeLookupKey(value) {
-    if (value === null || value === undefined) return '';
-    let s = String(value).trim();
-    // Normalize curly apostrophes/quotes to ASCII
-    s = s.replace(/[\u2019\u2018\u201B\u02BC’‘]/g, "'");
-    s = s.replace(/\s+/g, ' ');
-    // Remove combining marks then lowercase for robust matching
-    // (e.g., Turkish dotted i can become i + combining dot above)
-    s = s.normalize('NFKD').replace(/[\u0300-\u036f]/g, '');
-    s = s.toLowerCase();
-    // Dotless i
-    s = s.replace(/ı/g, 'i');
-    return s;
-}
-
 function getCountryIndex() {
     if (_countryIndexCache) return _countryIndexCache;
 
@@ -154,21 +140,15 @@ function getCountryIndex() {
     const lookup = new Map(); // normalized key -> { turkish, iso2 }
     const byTurkish = new Map(); // exact Turkish -> { turkish, iso2 }
 
-    mappings.forEach(m => {
-        const tr = (m.turkish || '').trim();
-        const iso2 = (m.iso2 || '').trim().toUpperCase();
-        if (!tr) return;
-        const canon = { turkish: tr, iso2 };
-        byTurkish.set(tr, canon);
-
-        const keys = [m.turkish, m.english].concat(m.aliases || []);
-        keys.forEach(k => {
-            if (!k) return;
-            const nk = normalizeLookupKey(k);
-            if (!nk) return;
-            if (!lookup.has(nk)) lookup.set(nk, canon);
+    // Regenerate admin/country_mappings.js (normalize_events.py) if the table is missing.
+    const table = window.__COUNTRY_INDEX__;
+    if (table && Array.isArray(table.c) && table.k) {
+        const canons = table.c.map(c => ({ turkish: c[0], iso2: String(c[2] || '').toUpperCase() }));
+        canons.forEach(canon => {
+            if (!byTurkish.has(canon.turkish)) byTurkish.set(canon.turkish, canon);
         });
-    });
+        Object.keys(table.k).forEach(k => lookup.set(k, canons[table.k[k]]));
+    }
 
     _countryIndexCache = { lookup, byTurkish, mappings };
     return _countryIndexCache;
@@ -178,7 +158,7 @@ function canonicalizeCountry(name) {
     const raw = (name || '').trim();
     if (!raw) return null;
     const idx = getCountryIndex();
-    const hit = idx.lookup.get(normalizeLookupKey(raw));
+    const hit = idx.lookup.get(countryKey(raw));
     if (hit) return hit;
     return idx.byTurkish.get(raw) || null;
 }
@@ -291,6 +271,7 @@ function normalizeEventsDataInPlace() {
         if (canon && canon.turkish && canon.turkish !== rawName) {
             ev.country_name = canon.turkish;
             changedCountries += 1;
+            dirtyEvents.add(ev);
         }
 
         const rawCode = String(ev.country_code || '').trim();
@@ -299,13 +280,16 @@ function normalizeEventsDataInPlace() {
             if (!rawCode) {
                 ev.country_code = iso2;
                 filledCodes += 1;
+                dirtyEvents.add(ev);
             } else if (rawCode.toUpperCase() !== rawCode) {
                 ev.country_code = rawCode.toUpperCase();
                 standardizedCodes += 1;
+                dirtyEvents.add(ev);
             }
         } else if (rawCode && rawCode.toUpperCase() !== rawCode) {
             ev.country_code = rawCode.toUpperCase();
             standardizedCodes += 1;
+            dirtyEvents.add(ev);
         }
 
         // Keep decade aligned with year for both Admin + Map filters.
@@ -315,6 +299,7 @@ function normalizeEventsDataInPlace() {
             if (!rawDecade || rawDecade !== dy) {
                 ev.decade = dy;
                 fixedDecades += 1;
+                dirtyEvents.add(ev);
             }
         }
     });
@@ -351,13 +336,22 @@ function normalizeEventsDataInPlace() {
             const i = unique.indexOf(existing);
             if (i >= 0) unique[i] = ev;
             byKey.set(key, ev);
+            // The survivor takes over the stored position of the event it replaces.
+            const pos = eventPos.get(String(existing.id));
+            if (pos !== undefined) eventPos.set(String(ev.id), pos);
+            dirtyEvents.add(ev);
         }
 
-        if (mergeEventFields(primary, secondary)) mergedOps += 1;
+        if (mergeEventFields(primary, secondary)) {
+            mergedOps += 1;
+            dirtyEvents.add(primary);
+        }
+        removedEventIds.add(String(secondary.id));
         removed += 1;
     });
 
     eventsData.events = unique;
+    rebuildEventIndex();
 
     if (changedCountries || filledCodes || standardizedCodes || fixedDecades || removed) {
         console.log('Normalization applied:', { changedCountries, filledCodes, standardizedCodes, fixedDecades, removed, mergedOps });
@@ -382,25 +376,182 @@ function populateCountryDatalist() {
     });
 }
 
+// ---- Persistence ------------------------------------------------------------------------
+// Events live in IndexedDB, one record per event: { id, pos, event }. `pos` keeps the
+// events.json order (new events go last), so saving an edit or a delete writes one record
+// instead of re-serializing the whole dataset. Everything except `events` (categories, other
+// top-level keys) is the single `meta` record 'doc'. Without IndexedDB (some file:// or private
+// browsing setups) the whole document is kept in localStorage as before.
+const DB_NAME = 'geopoliticalAdmin';
+const DB_VERSION = 1;
+const LEGACY_STORAGE_KEY = 'geopoliticalEvents';
+let eventDb = null;
+let eventPos = new Map(); // id -> stored position
+let nextEventPos = 0;
+// Changes not yet written: filled by saveEvent/confirmDelete, normalizeEventsDataInPlace() and
+// rebuildEventIndex(), flushed by saveData().
+let dirtyEvents = new Set();
+let removedEventIds = new Set();
+
+function idbRequest(req) {
+    return new Promise((resolve, reject) => {
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => reject(req.error);
+    });
+}
+
+function idbDone(tx) {
+    return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error);
+    });
+}
+
+function openEventDb() {
+    if (!window.indexedDB) return Promise.resolve(null);
+    return new Promise(resolve => {
+        let req;
+        try {
+            req = indexedDB.open(DB_NAME, DB_VERSION);
+        } catch (e) {
+            console.warn('IndexedDB unavailable, using localStorage:', e);
+            resolve(null);
+            return;
+        }
+        req.onupgradeneeded = () => {
+            const db = req.result;
+            if (!db.objectStoreNames.contains('events')) db.createObjectStore('events', { keyPath: 'id' });
+            if (!db.objectStoreNames.contains('meta')) db.createObjectStore('meta');
+        };
+        req.onsuccess = () => resolve(req.result);
+        req.onerror = () => {
+            console.warn('IndexedDB unavailable, using localStorage:', req.error);
+            resolve(null);
+        };
+    });
+}
+
+function metaRecord() {
+    const meta = {};
+    Object.keys(eventsData).forEach(k => {
+        if (k !== 'events') meta[k] = eventsData[k];
+    });
+    return meta;
+}
+
+// Stored document, or null when nothing has been saved yet.
+async function readStoredData() {
+    if (!eventDb) {
+        const stored = localStorage.getItem(LEGACY_STORAGE_KEY);
+        return stored ? JSON.parse(stored) : null;
+    }
+    const tx = eventDb.transaction(['events', 'meta'], 'readonly');
+    const [meta, records] = await Promise.all([
+        idbRequest(tx.objectStore('meta').get('doc')),
+        idbRequest(tx.objectStore('events').getAll())
+    ]);
+    if (!meta) return null;
+    records.sort((a, b) => a.pos - b.pos);
+    eventPos = new Map(records.map(r => [r.id, r.pos]));
+    nextEventPos = records.length ? records[records.length - 1].pos + 1 : 0;
+    return Object.assign({}, meta, { events: records.map(r => r.event) });
+}
+
+// Bulk path (first load, import, reset): replace every record in one transaction.
+async function saveAllData() {
+    dirtyEvents = new Set();
+    removedEventIds = new Set();
+    if (!eventDb) {
+        localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify(eventsData));
+        return;
+    }
+    const tx = eventDb.transaction(['events', 'meta'], 'readwrite');
+    const store = tx.objectStore('events');
+    store.clear();
+    eventPos = new Map();
+    (eventsData.events || []).forEach((ev, pos) => {
+        eventPos.set(String(ev.id), pos);
+        store.put({ id: String(ev.id), pos, event: ev });
+    });
+    nextEventPos = (eventsData.events || []).length;
+    tx.objectStore('meta').put(metaRecord(), 'doc');
+    await idbDone(tx);
+}
+
+// Per-event path: write the events changed since the last save and drop the removed ones.
+async function saveData() {
+    // Only events still in the dataset under their id; a removed id may have been reused.
+    const changed = [...dirtyEvents].filter(ev => eventsById.get(String(ev.id)) === ev);
+    const removed = [...removedEventIds].filter(id => !eventsById.has(id));
+    dirtyEvents = new Set();
+    removedEventIds = new Set();
+    if (!eventDb) {
+        localStorage.setItem(LEGACY_STORAGE_KEY, JSON.stringify(eventsData));
+        return;
+    }
+    const tx = eventDb.transaction(['events', 'meta'], 'readwrite');
+    const store = tx.objectStore('events');
+    removed.forEach(id => {
+        store.delete(id);
+        eventPos.delete(id);
+    });
+    changed.forEach(ev => {
+        const id = String(ev.id);
+        let pos = eventPos.get(id);
+        if (pos === undefined) {
+            pos = nextEventPos++;
+            eventPos.set(id, pos);
+        }
+        store.put({ id, pos, event: ev });
+    });
+    tx.objectStore('meta').put(metaRecord(), 'doc');
+    await idbDone(tx);
+}
+
+function reportSaveError(e) {
+    console.error('Save failed:', e);
+    alert('Degisiklikler kaydedilemedi: ' + (e && e.message ? e.message : String(e)));
+}
+
 // Initialize on page load
 document.addEventListener('DOMContentLoaded', () => {
     loadData();
 });
 
-// Load data from localStorage or default
-function loadData() {
-    const stored = localStorage.getItem('geopoliticalEvents');
+// Load the saved dataset, else the repo data (admin/data.js or ../data/events.json)
+async function loadData() {
+    eventDb = await openEventDb();
+    let stored = null;
+    try {
+        stored = await readStoredData();
+    } catch (e) {
+        console.error('Could not read saved data:', e);
+    }
+    // One-time move of the old localStorage snapshot into IndexedDB.
+    const legacy = (!stored && eventDb) ? localStorage.getItem(LEGACY_STORAGE_KEY) : null;
+
     if (stored) {
-        eventsData = JSON.parse(stored);
+        eventsData = stored;
+    } else if (legacy) {
+        eventsData = JSON.parse(legacy);
     } else if (window.__EVENTS_DATA__) {
         eventsData = window.__EVENTS_DATA__;
     } else {
         // Try to load from file path (for local development)
-        fetchDefaultData();
-        return;
+        eventsData = await fetchDefaultData();
     }
     normalizeEventsDataInPlace();
-    saveData();
+    try {
+        if (stored) {
+            await saveData();
+        } else {
+            await saveAllData();
+            if (legacy) localStorage.removeItem(LEGACY_STORAGE_KEY);
+        }
+    } catch (e) {
+        reportSaveError(e);
+    }
     initializeUI();
 }
 
@@ -409,29 +560,21 @@ async function fetchDefaultData() {
     try {
         const response = await fetch('../data/events.json');
         if (response.ok) {
-            eventsData = await response.json();
+            return await response.json();
         }
     } catch (e) {
         console.log('Could not load default data, starting fresh');
-        eventsData = {
-            categories: {
-                war: { label: 'Savas/Catisma', icon: 'fa-fire', color: '#e74c3c' },
-                genocide: { label: 'Soykirim', icon: 'fa-skull', color: '#2c3e50' },
-                revolution: { label: 'Devrim/Rejim Degisikligi', icon: 'fa-flag', color: '#e67e22' },
-                terror: { label: 'Teror Saldirisi', icon: 'fa-bomb', color: '#9b59b6' },
-                leader: { label: 'Onemli Lider', icon: 'fa-user', color: '#3498db' }
-            },
-            events: []
-        };
     }
-    normalizeEventsDataInPlace();
-    saveData();
-    initializeUI();
-}
-
-// Save data to localStorage
-function saveData() {
-    localStorage.setItem('geopoliticalEvents', JSON.stringify(eventsData));
+    return {
+        categories: {
+            war: { label: 'Savas/Catisma', icon: 'fa-fire', color: '#e74c3c' },
+            genocide: { label: 'Soykirim', icon: 'fa-skull', color: '#2c3e50' },
+            revolution: { label: 'Devrim/Rejim Degisikligi', icon: 'fa-flag', color: '#e67e22' },
+            terror: { label: 'Teror Saldirisi', icon: 'fa-bomb', color: '#9b59b6' },
+            leader: { label: 'Onemli Lider', icon: 'fa-user', color: '#3498db' }
+        },
+        events: []
+    };
 }
 
 // Initialize UI
@@ -446,7 +589,7 @@ function initializeUI() {
 
 // Populate country filter dropdown
 function populateCountryFilter() {
-    const countries = [...new Set((eventsData.events || []).map(e => e.country_name).filter(Boolean))]
+    const countries = [...getFilterIndex().byCountry.keys()].filter(Boolean)
         .sort((a, b) => a.localeCompare(b, 'tr'));
     const select = document.getElementById('filterCountry');
     select.innerHTML = '<option value="">Tumu</option>';
@@ -508,48 +651,145 @@ function populateCategorySelects() {
     }
 }
 
+// ---- Filter index ------------------------------------------------------------------------
+// Built once per data change (rebuildEventIndex/confirmDelete drop it): the events in display
+// order (year descending), position lists per country/decade/category and a token index over
+// the folded titles. Filtering then walks the smallest matching list instead of scanning and
+// re-sorting every event on each keystroke; the lists are ascending, so results stay in order.
+let filterIndex = null;
+let searchTimer = null;
+const SEARCH_DEBOUNCE_MS = 120;
+
+function invalidateFilterIndex() {
+    filterIndex = null;
+}
+
+function pushPosition(map, key, pos) {
+    const list = map.get(key);
+    if (list) list.push(pos);
+    else map.set(key, [pos]);
+}
+
+function getFilterIndex() {
+    if (filterIndex) return filterIndex;
+    // Array.prototype.sort is stable: equal years keep their dataset order.
+    const order = (eventsData.events || []).slice().sort((a, b) => b.year - a.year);
+    const byCountry = new Map();
+    const byDecade = new Map();
+    const byCategory = new Map();
+    const tokens = new Map();
+    const titles = new Array(order.length);
+    order.forEach((ev, pos) => {
+        pushPosition(byCountry, ev.country_name, pos);
+        pushPosition(byDecade, ev.decade, pos);
+        pushPosition(byCategory, ev.category, pos);
+        titles[pos] = foldKey(ev.title);
+        new Set(titles[pos].split(' ')).forEach(t => {
+            if (t) pushPosition(tokens, t, pos);
+        });
+    });
+    filterIndex = {
+        order,
+        byCountry,
+        byDecade,
+        byCategory,
+        tokens,
+        tokenKeys: [...tokens.keys()].sort(),
+        titles
+    };
+    return filterIndex;
+}
+
+// Marks positions whose title has a token starting with every search term ("sov bir" ->
+// "Sovyetler Birligi"); when no title does, falls back to a substring match on the folded
+// titles (e.g. "021" or a word fragment). null when the search box is empty.
+function searchPositions(idx, search) {
+    const query = foldKey(search);
+    const terms = [...new Set(query.split(' ').filter(Boolean))];
+    if (!terms.length) return null;
+    const n = idx.order.length;
+    let hits = null;
+    for (const term of terms) {
+        const mark = new Uint8Array(n);
+        // tokenKeys is sorted: binary search for the first key >= term, then walk the prefix range.
+        let lo = 0;
+        let hi = idx.tokenKeys.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (idx.tokenKeys[mid] < term) lo = mid + 1;
+            else hi = mid;
+        }
+        for (let k = lo; k < idx.tokenKeys.length && idx.tokenKeys[k].startsWith(term); k++) {
+            idx.tokens.get(idx.tokenKeys[k]).forEach(pos => { mark[pos] = 1; });
+        }
+        if (hits) {
+            for (let i = 0; i < n; i++) hits[i] &= mark[i];
+        } else {
+            hits = mark;
+        }
+    }
+    // Always add plain substring matches ("ava" finds "Savaşı"), so a title's hits never
+    // depend on whether some other title happens to have a word starting with the query.
+    idx.titles.forEach((title, pos) => {
+        if (title.includes(query)) hits[pos] = 1;
+    });
+    return hits;
+}
+
+// Debounced search box (selects call applyFilters directly)
+function onSearchInput() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(applyFilters, SEARCH_DEBOUNCE_MS);
+}
+
 // Apply filters and render table
 function applyFilters() {
+    clearTimeout(searchTimer);
     const country = document.getElementById('filterCountry').value;
     const decade = document.getElementById('filterDecade').value;
     const category = document.getElementById('filterCategory').value;
-    const search = document.getElementById('filterSearch').value.toLowerCase();
-
-    filteredEvents = eventsData.events.filter(event => {
-        if (country && event.country_name !== country) return false;
-        if (decade && event.decade !== decade) return false;
-        if (category && event.category !== category) return false;
-        if (search && !event.title.toLowerCase().includes(search)) return false;
-        return true;
-    });
-
-    // Sort by year descending
-    filteredEvents.sort((a, b) => b.year - a.year);
+    const search = document.getElementById('filterSearch').value;
+
+    const idx = getFilterIndex();
+    const lists = [];
+    if (country) lists.push(idx.byCountry.get(country) || []);
+    if (decade) lists.push(idx.byDecade.get(decade) || []);
+    if (category) lists.push(idx.byCategory.get(category) || []);
+    lists.sort((a, b) => a.length - b.length);
+    const hits = searchPositions(idx, search);
+
+    filteredEvents = [];
+    const keep = pos => {
+        if (hits && !hits[pos]) return;
+        const ev = idx.order[pos];
+        if (country && ev.country_name !== country) return;
+        if (decade && ev.decade !== decade) return;
+        if (category && ev.category !== category) return;
+        filteredEvents.push(ev);
+    };
+    if (lists.length) lists[0].forEach(keep);
+    else for (let pos = 0; pos < idx.order.length; pos++) keep(pos);
 
     renderTable();
 }
 
-// Render events table
-function renderTable() {
-    const tbody = document.getElementById('eventsBody');
-    const noResults = document.getElementById('noResults');
-    const table = document.getElementById('eventsTable');
-
-    if (filteredEvents.length === 0) {
-        table.style.display = 'none';
-        noResults.style.display = 'block';
-        return;
-    }
-
-    table.style.display = '';
-    noResults.style.display = 'none';
-
-    tbody.innerHTML = filteredEvents.map(event => `
-        <tr>
+// ---- Virtualized table -------------------------------------------------------------------
+// Only the rows near the viewport are in the DOM; spacer rows above and below keep the page
+// height, and window scroll/resize re-render the window once per animation frame. Rows are
+// kept to one height (.event-row in admin.css); the spacers use the average measured height.
+const ROW_OVERSCAN = 10;
+const DEFAULT_ROW_HEIGHT = 73;
+let rowHeight = 0;
+let renderedRange = null;
+let rowsFrameRequested = false;
+
+function eventRowHtml(event) {
+    return `
+        <tr class="event-row">
             <td><strong>${event.country_name}</strong><br><small style="color:#666">${event.country_code}</small></td>
             <td>${event.year}<br><small style="color:#666">${event.decade}</small></td>
             <td>${renderCategoryBadge(event.category)}</td>
-            <td><strong>${event.title}</strong></td>
+            <td><div class="clamp-2"><strong>${event.title}</strong></div></td>
             <td class="truncate" title="${event.description}">${event.description}</td>
             <td>
                 <div class="action-btns">
@@ -562,24 +802,117 @@ function renderTable() {
                 </div>
             </td>
         </tr>
-    `).join('');
+    `;
+}
+
+function spacerRowHtml(height) {
+    return height > 0 ? `<tr class="spacer-row" style="height:${height}px"><td colspan="6"></td></tr>` : '';
+}
+
+// Render events table
+function renderTable() {
+    const noResults = document.getElementById('noResults');
+    const table = document.getElementById('eventsTable');
+
+    renderedRange = null;
+    if (filteredEvents.length === 0) {
+        table.style.display = 'none';
+        noResults.style.display = 'block';
+        document.getElementById('eventsBody').innerHTML = '';
+        return;
+    }
+
+    table.style.display = '';
+    noResults.style.display = 'none';
+    renderVisibleRows();
 }
 
-// Update statistics
+function renderVisibleRows() {
+    const tbody = document.getElementById('eventsBody');
+    const total = filteredEvents.length;
+    if (!tbody || !total) return;
+
+    const h = rowHeight || DEFAULT_ROW_HEIGHT;
+    // tbody's top edge is row 0 (the top spacer is inside it); negative once scrolled past.
+    const top = tbody.getBoundingClientRect().top;
+    const visible = Math.ceil(window.innerHeight / h);
+    const start = Math.min(total, Math.max(0, Math.floor(-top / h) - ROW_OVERSCAN));
+    const end = Math.min(total, start + visible + 2 * ROW_OVERSCAN);
+    if (renderedRange && renderedRange[0] === start && renderedRange[1] === end) return;
+    renderedRange = [start, end];
+
+    tbody.innerHTML = spacerRowHtml(start * h)
+        + filteredEvents.slice(start, end).map(eventRowHtml).join('')
+        + spacerRowHtml((total - end) * h);
+
+    if (!rowHeight) {
+        const rows = tbody.querySelectorAll('tr.event-row');
+        const first = rows[0];
+        const last = rows[rows.length - 1];
+        if (first && first.offsetHeight) {
+            rowHeight = (last.offsetTop + last.offsetHeight - first.offsetTop) / rows.length;
+            renderedRange = null;
+            renderVisibleRows();
+        }
+    }
+}
+
+function scheduleVisibleRows() {
+    if (rowsFrameRequested) return;
+    rowsFrameRequested = true;
+    requestAnimationFrame(() => {
+        rowsFrameRequested = false;
+        renderVisibleRows();
+    });
+}
+
+window.addEventListener('scroll', scheduleVisibleRows, { passive: true });
+window.addEventListener('resize', () => {
+    rowHeight = 0;
+    renderedRange = null;
+    scheduleVisibleRows();
+});
+
+// Update statistics (counts come from the filter index, no extra scans)
 function updateStats() {
-    const events = eventsData.events;
-    const countries = new Set(events.map(e => e.country_name));
+    const idx = getFilterIndex();
+    const count = key => (idx.byCategory.get(key) || []).length;
+
+    document.getElementById('totalEvents').textContent = idx.order.length;
+    document.getElementById('totalCountries').textContent = idx.byCountry.size;
+    document.getElementById('totalWars').textContent = count('war');
+    document.getElementById('totalGenocides').textContent = count('genocide');
+    document.getElementById('totalRevolutions').textContent = count('revolution');
+}
 
-    document.getElementById('totalEvents').textContent = events.length;
-    document.getElementById('totalCountries').textContent = countries.size;
-    document.getElementById('totalWars').textContent = events.filter(e => e.category === 'war').length;
-    document.getElementById('totalGenocides').textContent = events.filter(e => e.category === 'genocide').length;
-    document.getElementById('totalRevolutions').textContent = events.filter(e => e.category === 'revolution').length;
+// id -> event. Rebuilt by normalizeEventsDataInPlace() (every load path runs it), kept current on add/delete.
+let eventsById = new Map();
+
+// Content-derived id for a new event; must stay in sync with scripts/event_ids.py content_id().
+// Ids are never recomputed after creation, so renaming an event keeps its id.
+function contentEventId(ev) {
+    const raw = `${String(ev.country_name || '').trim()}\x1f${String(ev.year).trim()}\x1f${foldKey(ev.title)}`;
+    let h = 0xcbf29ce484222325n;
+    for (const b of new TextEncoder().encode(raw)) {
+        h = ((h ^ BigInt(b)) * 0x100000001b3n) & 0xffffffffffffffffn;
+    }
+    const base = 'ev_' + h.toString(16).padStart(16, '0').slice(0, 12);
+    let id = base;
+    for (let n = 2; eventsById.has(id); n++) id = `${base}_${n}`;
+    return id;
 }
 
-// Generate unique ID
-function generateId() {
-    return 'ev' + Date.now().toString(36) + Math.random().toString(36).substr(2, 5);
+function rebuildEventIndex() {
+    eventsById = new Map();
+    invalidateFilterIndex();
+    (eventsData.events || []).forEach(ev => {
+        // Missing or shared id: mint one (same rule as `event_store.py ids --fix`).
+        if (!ev.id || eventsById.has(String(ev.id))) {
+            ev.id = contentEventId(ev);
+            dirtyEvents.add(ev);
+        }
+        eventsById.set(String(ev.id), ev);
+    });
 }
 
 // Open modal for new event
@@ -597,7 +930,7 @@ function closeModal() {
 
 // Edit event
 function editEvent(id) {
-    const event = eventsData.events.find(e => e.id === id);
+    const event = eventsById.get(id);
     if (!event) return;
 
     document.getElementById('modalTitle').textContent = 'Olay Duzenle';
@@ -634,7 +967,7 @@ function saveEvent(e) {
     const countryCode = (canon && canon.iso2) ? canon.iso2.toUpperCase() : String(rawCountryCode || '').toUpperCase();
 
     const eventData = {
-        id: id || generateId(),
+        id: id,
         country_code: countryCode,
         country_name: countryName,
         lat: parseFloat(document.getElementById('eventLat').value),
@@ -650,19 +983,23 @@ function saveEvent(e) {
     };
 
     if (id) {
-        // Update existing
-        const index = eventsData.events.findIndex(e => e.id === id);
-        if (index !== -1) {
-            eventsData.events[index] = eventData;
+        // Update existing (in place: same id, same position)
+        const existing = eventsById.get(id);
+        if (existing) {
+            Object.assign(existing, eventData);
+            dirtyEvents.add(existing);
         }
     } else {
         // Add new
+        eventData.id = contentEventId(eventData);
         eventsData.events.push(eventData);
+        eventsById.set(eventData.id, eventData);
+        dirtyEvents.add(eventData);
     }
 
     // Ensure we don't reintroduce duplicates or mixed country naming.
     normalizeEventsDataInPlace();
-    saveData();
+    saveData().catch(reportSaveError);
     closeModal();
     populateCountryFilter();
     populateDecadeSelects();
@@ -673,7 +1010,7 @@ function saveEvent(e) {
 
 // Delete event - show confirmation
 function deleteEvent(id) {
-    const event = eventsData.events.find(e => e.id === id);
+    const event = eventsById.get(id);
     if (!event) return;
 
     deleteEventId = id;
@@ -691,8 +1028,12 @@ function closeDeleteModal() {
 function confirmDelete() {
     if (!deleteEventId) return;
 
-    eventsData.events = eventsData.events.filter(e => e.id !== deleteEventId);
-    saveData();
+    const index = eventsData.events.indexOf(eventsById.get(deleteEventId));
+    if (index !== -1) eventsData.events.splice(index, 1);
+    eventsById.delete(deleteEventId);
+    removedEventIds.add(deleteEventId);
+    invalidateFilterIndex();
+    saveData().catch(reportSaveError);
     closeDeleteModal();
     populateCountryFilter();
     populateDecadeSelects();
@@ -701,7 +1042,7 @@ function confirmDelete() {
     updateStats();
 }
 
-// Reset localStorage state to the repo-embedded data (admin/data.js) or to ../data/events.json.
+// Reset the saved state to the repo-embedded data (admin/data.js) or to ../data/events.json.
 async function resetToRepoData() {
     const ok = confirm("Repo verisi tekrar yüklenecek. Local degisiklikleriniz kaybolabilir. Devam edilsin mi?");
     if (!ok) return;
@@ -710,7 +1051,11 @@ async function resetToRepoData() {
         // Deep copy so we don't mutate the embedded object reference.
         eventsData = JSON.parse(JSON.stringify(window.__EVENTS_DATA__));
         normalizeEventsDataInPlace();
-        saveData();
+        try {
+            await saveAllData();
+        } catch (e) {
+            reportSaveError(e);
+        }
         initializeUI();
         alert("Repo verisi yüklendi!");
         return;
@@ -721,7 +1066,7 @@ async function resetToRepoData() {
         if (!response.ok) throw new Error(`HTTP ${response.status}`);
         eventsData = await response.json();
         normalizeEventsDataInPlace();
-        saveData();
+        await saveAllData();
         initializeUI();
         alert("Repo verisi yüklendi!");
     } catch (e) {
@@ -756,9 +1101,8 @@ function importJSON(e) {
             if (imported.events && Array.isArray(imported.events)) {
                 eventsData = imported;
                 normalizeEventsDataInPlace();
-                saveData();
                 initializeUI();
-                alert('Veriler basariyla yuklendi!');
+                saveAllData().then(() => alert('Veriler basariyla yuklendi!'), reportSaveError);
             } else {
                 alert('Gecersiz dosya formati!');
             }
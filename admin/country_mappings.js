@@ -1 +1,10 @@
-window.__COUNTRY_MAPPINGS__ = [{"turkish": "ABD", "english": "United States of America", "iso2": "us", "aliases": ["USA", "Amerika", "Amerika Birlesik Devletleri", "Amerika Birleşik Devletleri", "United States"]}, {"turkish": "Afganistan", "english": "Afghanistan", "iso2": "af"}, {"turkish": "Almanya", "english": "Germany", "iso2": "de"}, {"turkish": "Angola", "english": "Angola", "iso2": "ao"}, {"turkish": "Arjantin", "english": "Argentina", "iso2": "ar", "aliases": ["Argentina"]}, {"turkish": "Arnavutluk", "english": "Albania", "iso2": "al"}, {"turkish": "Avustralya", "english": "Australia", "iso2": "au"}, {"turkish": "Avusturya", "english": "Austria", "iso2": "at", "aliases": ["Austria"]}, {"turkish": "Azerbaycan", "english": "Azerbaijan", "iso2": "az"}, {"turkish": "Bangladeş", "english": "Bangladesh", "iso2": "bd", "aliases": ["Banglades"]}, {"turkish": "Batı Sahra", "english": "Western Sahara", "iso2": "eh"}, {"turkish": "Batı Şeria", "english": "Palestine", "iso2": "ps"}, {"turkish": "Belarus", "english": "Belarus", "iso2": "by"}, {"turkish": "Belçika", "english": "Belgium", "iso2": "be", "aliases": ["Belcika"]}, {"turkish": "Benin", "english": "Benin", "iso2": "bj"}, {"turkish": "Birleşik Arap Emirlikleri", "english": "United Arab Emirates", "iso2": "ae", "aliases": ["BAE"]}, {"turkish": "Birleşik Krallık", "english": "United Kingdom", "iso2": "gb", "aliases": ["Birlesik Krallik", "İngiltere"]}, {"turkish": "Bolivya", "english": "Bolivia", "iso2": "bo", "aliases": ["Bolivia"]}, {"turkish": "Bosna Hersek", "english": "Bosnia and Herzegovina", "iso2": "ba"}, {"turkish": "Botsvana", "english": "Botswana", "iso2": "bw"}, {"turkish": "Brezilya", "english": "Brazil", "iso2": "br", "aliases": ["Brazil"]}, {"turkish": "Bulgaristan", "english": "Bulgaria", "iso2": "bg"}, {"turkish": "Burkina Faso", "english": "Burkina Faso", "iso2": "bf"}, {"turkish": "Burundi", "english": "Burundi", "iso2": "bi"}, {"turkish": "Cabo Verde", "english": "Cabo Verde", "iso2": "cv", "aliases": ["Yeşil Burun Adalari", "Yesil Burun Adalari"]}, {"turkish": "Cezayir", "english": "Algeria", "iso2": "dz", "aliases": ["Algeria"]}, {"turkish": "Cibuti", "english": "Djibouti", "iso2": "dj"}, {"turkish": "Çad", "english": "Chad", "iso2": "td"}, {"turkish": "Çek Cumhuriyeti", "english": "Czechia", "iso2": "cz", "aliases": ["Cekya", "Czech Republic", "Cekoslovakya"]}, {"turkish": "Çin", "english": "China", "iso2": "cn", "aliases": ["Cin"]}, {"turkish": "Danimarka", "english": "Denmark", "iso2": "dk"}, {"turkish": "Demokratik Kongo Cumhuriyeti", "english": "Democratic Republic of the Congo", "iso2": "cd", "aliases": ["Kongo", "DRC"]}, {"turkish": "Ekvador", "english": "Ecuador", "iso2": "ec", "aliases": ["Ecuador"]}, {"turkish": "Ekvator Ginesi", "english": "Equatorial Guinea", "iso2": "gq"}, {"turkish": "El Salvador", "english": "El Salvador", "iso2": "sv"}, {"turkish": "Endonezya", "english": "Indonesia", "iso2": "id"}, {"turkish": "Eritre", "english": "Eritrea", "iso2": "er"}, {"turkish": "Ermenistan", "english": "Armenia", "iso2": "am"}, {"turkish": "Estonya", "english": "Estonia", "iso2": "ee"}, {"turkish": "Esvatini", "english": "eSwatini", "iso2": "sz"}, {"turkish": "Etiyopya", "english": "Ethiopia", "iso2": "et", "aliases": ["Ethiopia"]}, {"turkish": "Fas", "english": "Morocco", "iso2": "ma", "aliases": ["Morocco"]}, {"turkish": "Fildişi Sahili", "english": "Ivory Coast", "iso2": "ci", "aliases": ["Fildisi Sahili", "Côte d'Ivoire"]}, {"turkish": "Filipinler", "english": "Philippines", "iso2": "ph"}, {"turkish": "Filistin", "english": "Palestine", "iso2": "ps"}, {"turkish": "Finlandiya", "english": "Finland", "iso2": "fi"}, {"turkish": "Fransa", "english": "France", "iso2": "fr"}, {"turkish": "Gabon", "english": "Gabon", "iso2": "ga"}, {"turkish": "Gambiya", "english": "Gambia", "iso2": "gm"}, {"turkish": "Gana", "english": "Ghana", "iso2": "gh"}, {"turkish": "Gazze", "english": "Palestine", "iso2": "ps"}, {"turkish": "Gine", "english": "Guinea", "iso2": "gn"}, {"turkish": "Gine-Bissau", "english": "Guinea-Bissau", "iso2": "gw"}, {"turkish": "Gronland", "english": "Greenland", "iso2": "gl"}, {"turkish": "Guatemala", "english": "Guatemala", "iso2": "gt"}, {"turkish": "Güney Afrika", "english": "South Africa", "iso2": "za", "aliases": ["Guney Afrika"]}, {"turkish": "Güney Kore", "english": "South Korea", "iso2": "kr", "aliases": ["Guney Kore"]}, {"turkish": "Güney Sudan", "english": "South Sudan", "iso2": "ss", "aliases": ["Guney Sudan", "South Sudan"]}, {"turkish": "Gürcistan", "english": "Georgia", "iso2": "ge", "aliases": ["Gurcistan"]}, {"turkish": "Guyana", "english": "Guyana", "iso2": "gy"}, {"turkish": "Haiti", "english": "Haiti", "iso2": "ht"}, {"turkish": "Hindistan", "english": "India", "iso2": "in"}, {"turkish": "Hollanda", "english": "Netherlands", "iso2": "nl"}, {"turkish": "Hırvatistan", "english": "Croatia", "iso2": "hr", "aliases": ["Hirvatistan"]}, {"turkish": "Irak", "english": "Iraq", "iso2": "iq"}, {"turkish": "İran", "english": "Iran", "iso2": "ir", "aliases": ["Iran"]}, {"turkish": "İrlanda", "english": "Ireland", "iso2": "ie", "aliases": ["Irlanda"]}, {"turkish": "İspanya", "english": "Spain", "iso2": "es", "aliases": ["Ispanya"]}, {"turkish": "İsrail", "english": "Israel", "iso2": "il", "aliases": ["Israil"]}, {"turkish": "İsveç", "english": "Sweden", "iso2": "se", "aliases": ["Isvec"]}, {"turkish": "İsviçre", "english": "Switzerland", "iso2": "ch", "aliases": ["Isvicre", "Switzerland"]}, {"turkish": "İtalya", "english": "Italy", "iso2": "it", "aliases": ["Italya"]}, {"turkish": "İzlanda", "english": "Iceland", "iso2": "is", "aliases": ["Izlanda"]}, {"turkish": "Jamaika", "english": "Jamaica", "iso2": "jm"}, {"turkish": "Japonya", "english": "Japan", "iso2": "jp"}, {"turkish": "Kamboçya", "english": "Cambodia", "iso2": "kh", "aliases": ["Kambocya"]}, {"turkish": "Kamerun", "english": "Cameroon", "iso2": "cm"}, {"turkish": "Kanada", "english": "Canada", "iso2": "ca"}, {"turkish": "Karadağ", "english": "Montenegro", "iso2": "me"}, {"turkish": "Katar", "english": "Qatar", "iso2": "qa"}, {"turkish": "Kazakistan", "english": "Kazakhstan", "iso2": "kz"}, {"turkish": "Kenya", "english": "Kenya", "iso2": "ke"}, {"turkish": "Kıbrıs", "english": "Cyprus", "iso2": "cy", "aliases": ["Kibris"]}, {"turkish": "Kırgızistan", "english": "Kyrgyzstan", "iso2": "kg"}, {"turkish": "Kolombiya", "english": "Colombia", "iso2": "co", "aliases": ["Colombia"]}, {"turkish": "Komorlar", "english": "Comoros", "iso2": "km"}, {"turkish": "Kosova", "english": "Kosovo", "iso2": "xk"}, {"turkish": "Küba", "english": "Cuba", "iso2": "cu", "aliases": ["Kuba"]}, {"turkish": "Kuveyt", "english": "Kuwait", "iso2": "kw"}, {"turkish": "Kuzey Kıbrıs", "english": "Northern Cyprus", "iso2": "kktc", "aliases": ["KKTC", "Kuzey Kibris"]}, {"turkish": "Kuzey Kore", "english": "North Korea", "iso2": "kp"}, {"turkish": "Lesoto", "english": "Lesotho", "iso2": "ls"}, {"turkish": "Letonya", "english": "Latvia", "iso2": "lv"}, {"turkish": "Liberya", "english": "Liberia", "iso2": "lr"}, {"turkish": "Libya", "english": "Libya", "iso2": "ly"}, {"turkish": "Litvanya", "english": "Lithuania", "iso2": "lt"}, {"turkish": "Lübnan", "english": "Lebanon", "iso2": "lb"}, {"turkish": "Lüksemburg", "english": "Luxembourg", "iso2": "lu"}, {"turkish": "Macaristan", "english": "Hungary", "iso2": "hu", "aliases": ["Hungary"]}, {"turkish": "Madagaskar", "english": "Madagascar", "iso2": "mg"}, {"turkish": "Makedonya", "english": "North Macedonia", "iso2": "mk"}, {"turkish": "Malavi", "english": "Malawi", "iso2": "mw"}, {"turkish": "Maldivler", "english": "Maldives", "iso2": "mv"}, {"turkish": "Malezya", "english": "Malaysia", "iso2": "my"}, {"turkish": "Mali", "english": "Mali", "iso2": "ml"}, {"turkish": "Mauritius", "english": "Mauritius", "iso2": "mu"}, {"turkish": "Meksika", "english": "Mexico", "iso2": "mx"}, {"turkish": "Mısır", "english": "Egypt", "iso2": "eg", "aliases": ["Misir"]}, {"turkish": "Moldova", "english": "Moldova", "iso2": "md"}, {"turkish": "Moğolistan", "english": "Mongolia", "iso2": "mn", "aliases": ["Mogolistan"]}, {"turkish": "Moritanya", "english": "Mauritania", "iso2": "mr"}, {"turkish": "Mozambik", "english": "Mozambique", "iso2": "mz"}, {"turkish": "Myanmar", "english": "Myanmar", "iso2": "mm"}, {"turkish": "Namibya", "english": "Namibia", "iso2": "na"}, {"turkish": "Nepal", "english": "Nepal", "iso2": "np"}, {"turkish": "Nijer", "english": "Niger", "iso2": "ne"}, {"turkish": "Nijerya", "english": "Nigeria", "iso2": "ng", "aliases": ["Nigeria"]}, {"turkish": "Nikaragua", "english": "Nicaragua", "iso2": "ni"}, {"turkish": "Norveç", "english": "Norway", "iso2": "no", "aliases": ["Norvec"]}, {"turkish": "Orta Afrika Cumhuriyeti", "english": "Central African Republic", "iso2": "cf"}, {"turkish": "Özbekistan", "english": "Uzbekistan", "iso2": "uz", "aliases": ["Ozbekistan"]}, {"turkish": "Pakistan", "english": "Pakistan", "iso2": "pk"}, {"turkish": "Papua Yeni Gine", "english": "Papua New Guinea", "iso2": "pg"}, {"turkish": "Paraguay", "english": "Paraguay", "iso2": "py"}, {"turkish": "Peru", "english": "Peru", "iso2": "pe"}, {"turkish": "Polonya", "english": "Poland", "iso2": "pl", "aliases": ["Poland"]}, {"turkish": "Portekiz", "english": "Portugal", "iso2": "pt"}, {"turkish": "Romanya", "english": "Romania", "iso2": "ro"}, {"turkish": "Ruanda", "english": "Rwanda", "iso2": "rw"}, {"turkish": "Rusya", "english": "Russia", "iso2": "ru"}, {"turkish": "Sao Tome ve Principe", "english": "São Tomé and Principe", "iso2": "st"}, {"turkish": "Senegal", "english": "Senegal", "iso2": "sn"}, {"turkish": "Seyseller", "english": "Seychelles", "iso2": "sc"}, {"turkish": "Sierra Leone", "english": "Sierra Leone", "iso2": "sl"}, {"turkish": "Singapur", "english": "Singapore", "iso2": "sg"}, {"turkish": "Sırbistan", "english": "Republic of Serbia", "iso2": "rs", "aliases": ["Sirbistan", "Yugoslavya"]}, {"turkish": "Slovakya", "english": "Slovakia", "iso2": "sk", "aliases": ["Slovakia"]}, {"turkish": "Slovenya", "english": "Slovenia", "iso2": "si"}, {"turkish": "Somali", "english": "Somalia", "iso2": "so"}, {"turkish": "Sri Lanka", "english": "Sri Lanka", "iso2": "lk"}, {"turkish": "Sudan", "english": "Sudan", "iso2": "sd"}, {"turkish": "Surinam", "english": "Suriname", "iso2": "sr", "aliases": ["Suriname"]}, {"turkish": "Suriye", "english": "Syria", "iso2": "sy"}, {"turkish": "Suudi Arabistan", "english": "Saudi Arabia", "iso2": "sa"}, {"turkish": "Şili", "english": "Chile", "iso2": "cl", "aliases": ["Sili", "Chile"]}, {"turkish": "Tacikistan", "english": "Tajikistan", "iso2": "tj"}, {"turkish": "Tanzanya", "english": "United Republic of Tanzania", "iso2": "tz"}, {"turkish": "Tayland", "english": "Thailand", "iso2": "th"}, {"turkish": "Togo", "english": "Togo", "iso2": "tg"}, {"turkish": "Trinidad ve Tobago", "english": "Trinidad and Tobago", "iso2": "tt"}, {"turkish": "Tunus", "english": "Tunisia", "iso2": "tn", "aliases": ["Tunisia"]}, {"turkish": "Türkiye", "english": "Turkey", "iso2": "tr", "aliases": ["Turkiye", "Republic of Turkey"]}, {"turkish": "Türkmenistan", "english": "Turkmenistan", "iso2": "tm"}, {"turkish": "Uganda", "english": "Uganda", "iso2": "ug"}, {"turkish": "Ukrayna", "english": "Ukraine", "iso2": "ua"}, {"turkish": "Ürdün", "english": "Jordan", "iso2": "jo", "aliases": ["Urdun"]}, {"turkish": "Uruguay", "english": "Uruguay", "iso2": "uy"}, {"turkish": "Venezuela", "english": "Venezuela", "iso2": "ve", "aliases": ["Venezüela"]}, {"turkish": "Vietnam", "english": "Vietnam", "iso2": "vn"}, {"turkish": "Yemen", "english": "Yemen", "iso2": "ye"}, {"turkish": "Yeni Zelanda", "english": "New Zealand", "iso2": "nz"}, {"turkish": "Yunanistan", "english": "Greece", "iso2": "gr"}, {"turkish": "Zambiya", "english": "Zambia", "iso2": "zm"}, {"turkish": "Zimbabve", "english": "Zimbabwe", "iso2": "zw", "aliases": ["Zimbabwe"]}];
+window.__COUNTRY_MAPPINGS__ = [{"turkish": "ABD", "english": "United States of America", "iso2": "us", "aliases": ["USA", "Amerika", "Amerika Birlesik Devletleri", "Amerika Birleşik Devletleri", "United States"]}, {"turkish": "Afganistan", "english": "Afghanistan", "iso2": "af"}, {"turkish": "Almanya", "english": "Germany", "iso2": "de"}, {"turkish": "Angola", "english": "Angola", "iso2": "ao"}, {"turkish": "Arjantin", "english": "Argentina", "iso2": "ar", "aliases": ["Argentina"]}, {"turkish": "Arnavutluk", "english": "Albania", "iso2": "al"}, {"turkish": "Avustralya", "english": "Australia", "iso2": "au"}, {"turkish": "Avusturya", "english": "Austria", "iso2": "at", "aliases": ["Austria"]}, {"turkish": "Azerbaycan", "english": "Azerbaijan", "iso2": "az"}, {"turkish": "Bangladeş", "english": "Bangladesh", "iso2": "bd", "aliases": ["Banglades"]}, {"turkish": "Batı Sahra", "english": "Western Sahara", "iso2": "eh"}, {"turkish": "Batı Şeria", "english": "Palestine", "iso2": "ps"}, {"turkish": "Belarus", "english": "Belarus", "iso2": "by"}, {"turkish": "Belçika", "english": "Belgium", "iso2": "be", "aliases": ["Belcika"]}, {"turkish": "Benin", "english": "Benin", "iso2": "bj"}, {"turkish": "Birleşik Arap Emirlikleri", "english": "United Arab Emirates", "iso2": "ae", "aliases": ["BAE", "UAE"]}, {"turkish": "Birleşik Krallık", "english": "United Kingdom", "iso2": "gb", "aliases": ["Birlesik Krallik", "İngiltere", "UK"]}, {"turkish": "Bolivya", "english": "Bolivia", "iso2": "bo", "aliases": ["Bolivia"]}, {"turkish": "Bosna Hersek", "english": "Bosnia and Herzegovina", "iso2": "ba"}, {"turkish": "Botsvana", "english": "Botswana", "iso2": "bw"}, {"turkish": "Brezilya", "english": "Brazil", "iso2": "br", "aliases": ["Brazil"]}, {"turkish": "Bulgaristan", "english": "Bulgaria", "iso2": "bg"}, {"turkish": "Burkina Faso", "english": "Burkina Faso", "iso2": "bf"}, {"turkish": "Burundi", "english": "Burundi", "iso2": "bi"}, {"turkish": "Cabo Verde", "english": "Cabo Verde", "iso2": "cv", "aliases": ["Yeşil Burun Adalari", "Yesil Burun Adalari", "Cape Verde"]}, {"turkish": "Cezayir", "english": "Algeria", "iso2": "dz", "aliases": ["Algeria"]}, {"turkish": "Cibuti", "english": "Djibouti", "iso2": "dj"}, {"turkish": "Çad", "english": "Chad", "iso2": "td"}, {"turkish": "Çek Cumhuriyeti", "english": "Czechia", "iso2": "cz", "aliases": ["Cekya", "Czech Republic", "Cekoslovakya"]}, {"turkish": "Çin", "english": "China", "iso2": "cn", "aliases": ["Cin"]}, {"turkish": "Danimarka", "english": "Denmark", "iso2": "dk"}, {"turkish": "Demokratik Kongo Cumhuriyeti", "english": "Democratic Republic of the Congo", "iso2": "cd", "aliases": ["Kongo", "Congo", "DRC"]}, {"turkish": "Ekvador", "english": "Ecuador", "iso2": "ec", "aliases": ["Ecuador"]}, {"turkish": "Ekvator Ginesi", "english": "Equatorial Guinea", "iso2": "gq"}, {"turkish": "El Salvador", "english": "El Salvador", "iso2": "sv"}, {"turkish": "Endonezya", "english": "Indonesia", "iso2": "id"}, {"turkish": "Eritre", "english": "Eritrea", "iso2": "er"}, {"turkish": "Ermenistan", "english": "Armenia", "iso2": "am"}, {"turkish": "Estonya", "english": "Estonia", "iso2": "ee"}, {"turkish": "Esvatini", "english": "eSwatini", "iso2": "sz", "aliases": ["Swaziland"]}, {"turkish": "Etiyopya", "english": "Ethiopia", "iso2": "et", "aliases": ["Ethiopia"]}, {"turkish": "Fas", "english": "Morocco", "iso2": "ma", "aliases": ["Morocco"]}, {"turkish": "Fildişi Sahili", "english": "Ivory Coast", "iso2": "ci", "aliases": ["Fildisi Sahili", "Côte d'Ivoire"]}, {"turkish": "Filipinler", "english": "Philippines", "iso2": "ph"}, {"turkish": "Filistin", "english": "Palestine", "iso2": "ps"}, {"turkish": "Finlandiya", "english": "Finland", "iso2": "fi"}, {"turkish": "Fransa", "english": "France", "iso2": "fr"}, {"turkish": "Gabon", "english": "Gabon", "iso2": "ga"}, {"turkish": "Gambiya", "english": "Gambia", "iso2": "gm"}, {"turkish": "Gana", "english": "Ghana", "iso2": "gh"}, {"turkish": "Gazze", "english": "Palestine", "iso2": "ps"}, {"turkish": "Gine", "english": "Guinea", "iso2": "gn"}, {"turkish": "Gine-Bissau", "english": "Guinea-Bissau", "iso2": "gw"}, {"turkish": "Gronland", "english": "Greenland", "iso2": "gl"}, {"turkish": "Guatemala", "english": "Guatemala", "iso2": "gt"}, {"turkish": "Güney Afrika", "english": "South Africa", "iso2": "za", "aliases": ["Guney Afrika"]}, {"turkish": "Güney Kore", "english": "South Korea", "iso2": "kr", "aliases": ["Guney Kore"]}, {"turkish": "Güney Sudan", "english": "South Sudan", "iso2": "ss", "aliases": ["Guney Sudan", "South Sudan"]}, {"turkish": "Gürcistan", "english": "Georgia", "iso2": "ge", "aliases": ["Gurcistan"]}, {"turkish": "Guyana", "english": "Guyana", "iso2": "gy"}, {"turkish": "Haiti", "english": "Haiti", "iso2": "ht"}, {"turkish": "Hindistan", "english": "India", "iso2": "in"}, {"turkish": "Hollanda", "english": "Netherlands", "iso2": "nl"}, {"turkish": "Hırvatistan", "english": "Croatia", "iso2": "hr", "aliases": ["Hirvatistan"]}, {"turkish": "Irak", "english": "Iraq", "iso2": "iq"}, {"turkish": "İran", "english": "Iran", "iso2": "ir", "aliases": ["Iran"]}, {"turkish": "İrlanda", "english": "Ireland", "iso2": "ie", "aliases": ["Irlanda"]}, {"turkish": "İspanya", "english": "Spain", "iso2": "es", "aliases": ["Ispanya"]}, {"turkish": "İsrail", "english": "Israel", "iso2": "il", "aliases": ["Israil"]}, {"turkish": "İsveç", "english": "Sweden", "iso2": "se", "aliases": ["Isvec"]}, {"turkish": "İsviçre", "english": "Switzerland", "iso2": "ch", "aliases": ["Isvicre", "Switzerland"]}, {"turkish": "İtalya", "english": "Italy", "iso2": "it", "aliases": ["Italya"]}, {"turkish": "İzlanda", "english": "Iceland", "iso2": "is", "aliases": ["Izlanda"]}, {"turkish": "Jamaika", "english": "Jamaica", "iso2": "jm"}, {"turkish": "Japonya", "english": "Japan", "iso2": "jp"}, {"turkish": "Kamboçya", "english": "Cambodia", "iso2": "kh", "aliases": ["Kambocya"]}, {"turkish": "Kamerun", "english": "Cameroon", "iso2": "cm"}, {"turkish": "Kanada", "english": "Canada", "iso2": "ca"}, {"turkish": "Karadağ", "english": "Montenegro", "iso2": "me"}, {"turkish": "Katar", "english": "Qatar", "iso2": "qa"}, {"turkish": "Kazakistan", "english": "Kazakhstan", "iso2": "kz"}, {"turkish": "Kenya", "english": "Kenya", "iso2": "ke"}, {"turkish": "Kıbrıs", "english": "Cyprus", "iso2": "cy", "aliases": ["Kibris"]}, {"turkish": "Kırgızistan", "english": "Kyrgyzstan", "iso2": "kg"}, {"turkish": "Kolombiya", "english": "Colombia", "iso2": "co", "aliases": ["Colombia"]}, {"turkish": "Komorlar", "english": "Comoros", "iso2": "km"}, {"turkish": "Kosova", "english": "Kosovo", "iso2": "xk"}, {"turkish": "Küba", "english": "Cuba", "iso2": "cu", "aliases": ["Kuba"]}, {"turkish": "Kuveyt", "english": "Kuwait", "iso2": "kw"}, {"turkish": "Kuzey Kıbrıs", "english": "Northern Cyprus", "iso2": "kktc", "aliases": ["KKTC", "Kuzey Kibris"]}, {"turkish": "Kuzey Kore", "english": "North Korea", "iso2": "kp"}, {"turkish": "Lesoto", "english": "Lesotho", "iso2": "ls"}, {"turkish": "Letonya", "english": "Latvia", "iso2": "lv"}, {"turkish": "Liberya", "english": "Liberia", "iso2": "lr"}, {"turkish": "Libya", "english": "Libya", "iso2": "ly"}, {"turkish": "Litvanya", "english": "Lithuania", "iso2": "lt"}, {"turkish": "Lübnan", "english": "Lebanon", "iso2": "lb"}, {"turkish": "Lüksemburg", "english": "Luxembourg", "iso2": "lu"}, {"turkish": "Macaristan", "english": "Hungary", "iso2": "hu", "aliases": ["Hungary"]}, {"turkish": "Madagaskar", "english": "Madagascar", "iso2": "mg"}, {"turkish": "Makedonya", "english": "North Macedonia", "iso2": "mk"}, {"turkish": "Malavi", "english": "Malawi", "iso2": "mw"}, {"turkish": "Maldivler", "english": "Maldives", "iso2": "mv"}, {"turkish": "Malezya", "english": "Malaysia", "iso2": "my"}, {"turkish": "Mali", "english": "Mali", "iso2": "ml"}, {"turkish": "Mauritius", "english": "Mauritius", "iso2": "mu"}, {"turkish": "Meksika", "english": "Mexico", "iso2": "mx"}, {"turkish": "Mısır", "english": "Egypt", "iso2": "eg", "aliases": ["Misir"]}, {"turkish": "Moldova", "english": "Moldova", "iso2": "md"}, {"turkish": "Moğolistan", "english": "Mongolia", "iso2": "mn", "aliases": ["Mogolistan"]}, {"turkish": "Moritanya", "english": "Mauritania", "iso2": "mr"}, {"turkish": "Mozambik", "english": "Mozambique", "iso2": "mz"}, {"turkish": "Myanmar", "english": "Myanmar", "iso2": "mm"}, {"turkish": "Namibya", "english": "Namibia", "iso2": "na"}, {"turkish": "Nepal", "english": "Nepal", "iso2": "np"}, {"turkish": "Nijer", "english": "Niger", "iso2": "ne"}, {"turkish": "Nijerya", "english": "Nigeria", "iso2": "ng", "aliases": ["Nigeria"]}, {"turkish": "Nikaragua", "english": "Nicaragua", "iso2": "ni"}, {"turkish": "Norveç", "english": "Norway", "iso2": "no", "aliases": ["Norvec"]}, {"turkish": "Orta Afrika Cumhuriyeti", "english": "Central African Republic", "iso2": "cf"}, {"turkish": "Özbekistan", "english": "Uzbekistan", "iso2": "uz", "aliases": ["Ozbekistan"]}, {"turkish": "Pakistan", "english": "Pakistan", "iso2": "pk"}, {"turkish": "Papua Yeni Gine", "english": "Papua New Guinea", "iso2": "pg"}, {"turkish": "Paraguay", "english": "Paraguay", "iso2": "py"}, {"turkish": "Peru", "english": "Peru", "iso2": "pe"}, {"turkish": "Polonya", "english": "Poland", "iso2": "pl", "aliases": ["Poland"]}, {"turkish": "Portekiz", "english": "Portugal", "iso2": "pt"}, {"turkish": "Romanya", "english": "Romania", "iso2": "ro"}, {"turkish": "Ruanda", "english": "Rwanda", "iso2": "rw"}, {"turkish": "Rusya", "english": "Russia", "iso2": "ru"}, {"turkish": "Sao Tome ve Principe", "english": "São Tomé and Principe", "iso2": "st"}, {"turkish": "Senegal", "english": "Senegal", "iso2": "sn"}, {"turkish": "Seyseller", "english": "Seychelles", "iso2": "sc"}, {"turkish": "Sierra Leone", "english": "Sierra Leone", "iso2": "sl"}, {"turkish": "Singapur", "english": "Singapore", "iso2": "sg"}, {"turkish": "Sırbistan", "english": "Republic of Serbia", "iso2": "rs", "aliases": ["Sirbistan", "Yugoslavya"]}, {"turkish": "Slovakya", "english": "Slovakia", "iso2": "sk", "aliases": ["Slovakia"]}, {"turkish": "Slovenya", "english": "Slovenia", "iso2": "si"}, {"turkish": "Somali", "english": "Somalia", "iso2": "so"}, {"turkish": "Sri Lanka", "english": "Sri Lanka", "iso2": "lk"}, {"turkish": "Sudan", "english": "Sudan", "iso2": "sd"}, {"turkish": "Surinam", "english": "Suriname", "iso2": "sr", "aliases": ["Suriname"]}, {"turkish": "Suriye", "english": "Syria", "iso2": "sy"}, {"turkish": "Suudi Arabistan", "english": "Saudi Arabia", "iso2": "sa"}, {"turkish": "Şili", "english": "Chile", "iso2": "cl", "aliases": ["Sili", "Chile"]}, {"turkish": "Tacikistan", "english": "Tajikistan", "iso2": "tj"}, {"turkish": "Tanzanya", "english": "United Republic of Tanzania", "iso2": "tz", "aliases": ["Tanzania"]}, {"turkish": "Tayland", "english": "Thailand", "iso2": "th"}, {"turkish": "Togo", "english": "Togo", "iso2": "tg"}, {"turkish": "Trinidad ve Tobago", "english": "Trinidad and Tobago", "iso2": "tt"}, {"turkish": "Tunus", "english": "Tunisia", "iso2": "tn", "aliases": ["Tunisia"]}, {"turkish": "Türkiye", "english": "Turkey", "iso2": "tr", "aliases": ["Turkiye", "Republic of Turkey"]}, {"turkish": "Türkmenistan", "english": "Turkmenistan", "iso2": "tm"}, {"turkish": "Uganda", "english": "Uganda", "iso2": "ug"}, {"turkish": "Ukrayna", "english": "Ukraine", "iso2": "ua"}, {"turkish": "Ürdün", "english": "Jordan", "iso2": "jo", "aliases": ["Urdun"]}, {"turkish": "Uruguay", "english": "Uruguay", "iso2": "uy"}, {"turkish": "Venezuela", "english": "Venezuela", "iso2": "ve", "aliases": ["Venezüela"]}, {"turkish": "Vietnam", "english": "Vietnam", "iso2": "vn"}, {"turkish": "Yemen", "english": "Yemen", "iso2": "ye"}, {"turkish": "Yeni Zelanda", "english": "New Zealand", "iso2": "nz"}, {"turkish": "Yunanistan", "english": "Greece", "iso2": "gr"}, {"turkish": "Zambiya", "english": "Zambia", "iso2": "zm"}, {"turkish": "Zimbabve", "english": "Zimbabwe", "iso2": "zw", "aliases": ["Zimbabwe"]}];
+window.__COUNTRY_INDEX__ = {"c":[["ABD","United States of America","us"],["Afganistan","Afghanistan","af"],["Almanya","Germany","de"],["Angola","Angola","ao"],["Arjantin","Argentina","ar"],["Arnavutluk","Albania","al"],["Avustralya","Australia","au"],["Avusturya","Austria","at"],["Azerbaycan","Azerbaijan","az"],["Bangladeş","Bangladesh","bd"],["Batı Sahra","Western Sahara","eh"],["Batı Şeria","Palestine","ps"],["Belarus","Belarus","by"],["Belçika","Belgium","be"],["Benin","Benin","bj"],["Birleşik Arap Emirlikleri","United Arab Emirates","ae"],["Birleşik Krallık","United Kingdom","gb"],["Bolivya","Bolivia","bo"],["Bosna Hersek","Bosnia and Herzegovina","ba"],["Botsvana","Botswana","bw"],["Brezilya","Brazil","br"],["Bulgaristan","Bulgaria","bg"],["Burkina Faso","Burkina Faso","bf"],["Burundi","Burundi","bi"],["Cabo Verde","Cabo Verde","cv"],["Cezayir","Algeria","dz"],["Cibuti","Djibouti","dj"],["Çad","Chad","td"],["Çek Cumhuriyeti","Czechia","cz"],["Çin","China","cn"],["Danimarka","Denmark","dk"],["Demokratik Kongo Cumhuriyeti","Democratic Republic of the Congo","cd"],["Ekvador","Ecuador","ec"],["Ekvator Ginesi","Equatorial Guinea","gq"],["El Salvador","El Salvador","sv"],["Endonezya","Indonesia","id"],["Eritre","Eritrea","er"],["Ermenistan","Armenia","am"],["Estonya","Estonia","ee"],["Esvatini","eSwatini","sz"],["Etiyopya","Ethiopia","et"],["Fas","Morocco","ma"],["Fildişi Sahili","Ivory Coast","ci"],["Filipinler","Philippines","ph"],["Filistin","Palestine","ps"],["Finlandiya","Finland","fi"],["Fransa","France","fr"],["Gabon","Gabon","ga"],["Gambiya","Gambia","gm"],["Gana","Ghana","gh"],["Gazze","Palestine","ps"],["Gine","Guinea","gn"],["Gine-Bissau","Guinea-Bissau","gw"],["Gronland","Greenland","gl"],["Guatemala","Guatemala","gt"],["Güney Afrika","South Africa","za"],["Güney Kore","South Korea","kr"],["Güney Sudan","South Sudan","ss"],["Gürcistan","Georgia","ge"],["Guyana","Guyana","gy"],["Haiti","Haiti","ht"],["Hindistan","India","in"],["Hollanda","Netherlands","nl"],["Hırvatistan","Croatia","hr"],["Irak","Iraq","iq"],["İran","Iran","ir"],["İrlanda","Ireland","ie"],["İspanya","Spain","es"],["İsrail","Israel","il"],["İsveç","Sweden","se"],["İsviçre","Switzerland","ch"],["İtalya","Italy","it"],["İzlanda","Iceland","is"],["Jamaika","Jamaica","jm"],["Japonya","Japan","jp"],["Kamboçya","Cambodia","kh"],["Kamerun","Cameroon","cm"],["Kanada","Canada","ca"],["Karadağ","Montenegro","me"],["Katar","Qatar","qa"],["Kazakistan","Kazakhstan","kz"],["Kenya","Kenya","ke"],["Kıbrıs","Cyprus","cy"],["Kırgızistan","Kyrgyzstan","kg"],["Kolombiya","Colombia","co"],["Komorlar","Comoros","km"],["Kosova","Kosovo","xk"],["Küba","Cuba","cu"],["Kuveyt","Kuwait","kw"],["Kuzey Kıbrıs","Northern Cyprus","kktc"],["Kuzey Kore","North Korea","kp"],["Lesoto","Lesotho","ls"],["Letonya","Latvia","lv"],["Liberya","Liberia","lr"],["Libya","Libya","ly"],["Litvanya","Lithuania","lt"],["Lübnan","Lebanon","lb"],["Lüksemburg","Luxembourg","lu"],["Macaristan","Hungary","hu"],["Madagaskar","Madagascar","mg"],["Makedonya","North Macedonia","mk"],["Malavi","Malawi","mw"],["Maldivler","Maldives","mv"],["Malezya","Malaysia","my"],["Mali","Mali","ml"],["Mauritius","Mauritius","mu"],["Meksika","Mexico","mx"],["Mısır","Egypt","eg"],["Moldova","Moldova","md"],["Moğolistan","Mongolia","mn"],["Moritanya","Mauritania","mr"],["Mozambik","Mozambique","mz"],["Myanmar","Myanmar","mm"],["Namibya","Namibia","na"],["Nepal","Nepal","np"],["Nijer","Niger","ne"],["Nijerya","Nigeria","ng"],["Nikaragua","Nicaragua","ni"],["Norveç","Norway","no"],["Orta Afrika Cumhuriyeti","Central African Republic","cf"],["Özbekistan","Uzbekistan","uz"],["Pakistan","Pakistan","pk"],["Papua Yeni Gine","Papua New Guinea","pg"],["Paraguay","Paraguay","py"],["Peru","Peru","pe"],["Polonya","Poland","pl"],["Portekiz","Portugal","pt"],["Romanya","Romania","ro"],["Ruanda","Rwanda","rw"],["Rusya","Russia","ru"],["Sao Tome ve Principe","São Tomé and Principe","st"],["Senegal","Senegal","sn"],["Seyseller","Seychelles","sc"],["Sierra Leone","Sierra Leone","sl"],["Singapur","Singapore","sg"],["Sırbistan","Republic of Serbia","rs"],["Slovakya","Slovakia","sk"],["Slovenya","Slovenia","si"],["Somali","Somalia","so"],["Sri Lanka","Sri Lanka","lk"],["Sudan","Sudan","sd"],["Surinam","Suriname","sr"],["Suriye","Syria","sy"],["Suudi Arabistan","Saudi Arabia","sa"],["Şili","Chile","cl"],["Tacikistan","Tajikistan","tj"],["Tanzanya","United Republic of Tanzania","tz"],["Tayland","Thailand","th"],["Togo","Togo","tg"],["Trinidad ve Tobago","Trinidad and Tobago","tt"],["Tunus","Tunisia","tn"],["Türkiye","Turkey","tr"],["Türkmenistan","Turkmenistan","tm"],["Uganda","Uganda","ug"],["Ukrayna","Ukraine","ua"],["Ürdün","Jordan","jo"],["Uruguay","Uruguay","uy"],["Venezuela","Venezuela","ve"],["Vietnam","Vietnam","vn"],["Yemen","Yemen","ye"],["Yeni Zelanda","New Zealand","nz"],["Yunanistan","Greece","gr"],["Zambiya","Zambia","zm"],["Zimbabve","Zimbabwe","zw"]],"k":{"abd":0,"afganistan":1,"afghanistan":1,"albania":5,"algeria":25,"almanya":2,"amerika":0,"amerika birlesik devletleri":0,"angola":3,"argentina":4,"arjantin":4,"armenia":37,"arnavutluk":5,"australia":6,"austria":7,"avustralya":6,"avusturya":7,"azerbaijan":8,"azerbaycan":8,"bae":15,"banglades":9,"bangladesh":9,"bati sahra":10,"bati seria":11,"belarus":12,"belcika":13,"belgium":13,"benin":14,"birlesik arap emirlikleri":15,"birlesik krallik":16,"bolivia":17,"bolivya":17,"bosna hersek":18,"bosnia and herzegovina":18,"botsvana":19,"botswana":19,"brazil":20,"brezilya":20,"bulgaria":21,"bulgaristan":21,"burkina faso":22,"burundi":23,"cabo verde":24,"cad":27,"cambodia":75,"cameroon":76,"canada":77,"cape verde":24,"cek cumhuriyeti":28,"cekoslovakya":28,"cekya":28,"central african republic":119,"cezayir":25,"chad":27,"chile":144,"china":29,"cibuti":26,"cin":29,"colombia":84,"comoros":85,"congo":31,"cote d ivoire":42,"croatia":63,"cuba":87,"cyprus":82,"czech republic":28,"czechia":28,"danimarka":30,"democratic republic of the congo":31,"demokratik kongo cumhuriyeti":31,"denmark":30,"djibouti":26,"drc":31,"ecuador":32,"egypt":107,"ekvador":32,"ekvator ginesi":33,"el salvador":34,"endonezya":35,"equatorial guinea":33,"eritre":36,"eritrea":36,"ermenistan":37,"estonia":38,"estonya":38,"esvatini":39,"eswatini":39,"ethiopia":40,"etiyopya":40,"fas":41,"fildisi sahili":42,"filipinler":43,"filistin":44,"finland":45,"finlandiya":45,"france":46,"fransa":46,"gabon":47,"gambia":48,"gambiya":48,"gana":49,"gazze":50,"georgia":58,"germany":2,"ghana":49,"gine":51,"gine bissau":52,"greece":161,"greenland":53,"gronland":53,"guatemala":54,"guinea":51,"guinea bissau":52,"guney afrika":55,"guney kore":56,"guney sudan":57,"gurcistan":58,"guyana":59,"haiti":60,"hindistan":61,"hirvatistan":63,"hollanda":62,"hungary":98,"iceland":72,"india":61,"indonesia":35,"ingiltere":16,"irak":64,"iran":65,"iraq":64,"ireland":66,"irlanda":66,"ispanya":67,"israel":68,"israil":68,"isvec":69,"isvicre":70,"italy":71,"italya":71,"ivory coast":42,"izlanda":72,"jamaica":73,"jamaika":73,"japan":74,"japonya":74,"jordan":155,"kambocya":75,"kamerun":76,"kanada":77,"karadag":78,"katar":79,"kazakhstan":80,"kazakistan":80,"kenya":81,"kibris":82,"kirgizistan":83,"kktc":89,"kolombiya":84,"komorlar":85,"kongo":31,"kosova":86,"kosovo":86,"kuba":87,"kuveyt":88,"kuwait":88,"kuzey kibris":89,"kuzey kore":90,"kyrgyzstan":83,"latvia":92,"lebanon":96,"lesotho":91,"lesoto":91,"letonya":92,"liberia":93,"liberya":93,"libya":94,"lithuania":95,"litvanya":95,"lubnan":96,"luksemburg":97,"luxembourg":97,"macaristan":98,"madagascar":99,"madagaskar":99,"makedonya":100,"malavi":101,"malawi":101,"malaysia":103,"maldives":102,"maldivler":102,"malezya":103,"mali":104,"mauritania":110,"mauritius":105,"meksika":106,"mexico":106,"misir":107,"mogolistan":109,"moldova":108,"mongolia":109,"montenegro":78,"moritanya":110,"morocco":41,"mozambik":111,"mozambique":111,"myanmar":112,"namibia":113,"namibya":113,"nepal":114,"netherlands":62,"new zealand":160,"nicaragua":117,"niger":115,"nigeria":116,"nijer":115,"nijerya":116,"nikaragua":117,"north korea":90,"north macedonia":100,"northern cyprus":89,"norvec":118,"norway":118,"orta afrika cumhuriyeti":119,"ozbekistan":120,"pakistan":121,"palestine":11,"papua new guinea":122,"papua yeni gine":122,"paraguay":123,"peru":124,"philippines":43,"poland":125,"polonya":125,"portekiz":126,"portugal":126,"qatar":79,"republic of serbia":135,"republic of turkey":151,"romania":127,"romanya":127,"ruanda":128,"russia":129,"rusya":129,"rwanda":128,"sao tome and principe":130,"sao tome ve principe":130,"saudi arabia":143,"senegal":131,"seychelles":132,"seyseller":132,"sierra leone":133,"sili":144,"singapore":134,"singapur":134,"sirbistan":135,"slovakia":136,"slovakya":136,"slovenia":137,"slovenya":137,"somali":138,"somalia":138,"south africa":55,"south korea":56,"south sudan":57,"spain":67,"sri lanka":139,"sudan":140,"surinam":141,"suriname":141,"suriye":142,"suudi arabistan":143,"swaziland":39,"sweden":69,"switzerland":70,"syria":142,"tacikistan":145,"tajikistan":145,"tanzania":146,"tanzanya":146,"tayland":147,"thailand":147,"togo":148,"trinidad and tobago":149,"trinidad ve tobago":149,"tunisia":150,"tunus":150,"turkey":151,"turkiye":151,"turkmenistan":152,"uae":15,"uganda":153,"uk":16,"ukraine":154,"ukrayna":154,"united arab emirates":15,"united kingdom":16,"united republic of tanzania":146,"united states":0,"united states of america":0,"urdun":155,"uruguay":156,"usa":0,"uzbekistan":120,"venezuela":157,"vietnam":158,"western sahara":10,"yemen":159,"yeni zelanda":160,"yesil burun adalari":24,"yugoslavya":135,"yunanistan":161,"zambia":162,"zambiya":162,"zimbabve":163,"zimbabwe":163}};
+function foldKey(value) {
+    if (value === null || value === undefined) return '';
+    return String(value).normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+        .replace(/ı/g, 'i').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+}
+function countryKey(value) {
+    return foldKey(value);
+}
@@ -1,7 +1,6 @@
-import json
-import os
+from event_store import EVENTS_PATH, EventStore
 
-events_path = '/Users/gurursonmez/Documents/Harita/data/events.json'
+events_path = EVENTS_PATH
 
 # Manual list of 1980 events (Translated)
 # Format: Country, Year, Category (mapped), Title, Description
@@ -59,8 +58,7 @@ COUNTRY_NAME_FIX = {
 }
 
 def load_events():
-    with open(events_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return EventStore.load(events_path)
 
 def get_coords(events_data, country_name):
     # Try to find a lat/lon for this country from existing events
@@ -76,7 +74,8 @@ def get_coords(events_data, country_name):
     return 0, 0
 
 def add_events():
-    data = load_events()
+    store = load_events()
+    data = store.data
     existing_ids = set(ev['id'] for ev in data['events'])
     
     cnt = 0
@@ -140,8 +139,7 @@ def add_events():
 
     print(f"Added {cnt} new events.")
     
-    with open(events_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
 
 if __name__ == "__main__":
     add_events()
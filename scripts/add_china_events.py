@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
-import json
-import uuid
 from pathlib import Path
 
+from event_ingest import ingest_events
+from event_ids import content_id
+from event_store import EventStore
+
 def generate_china_events():
     events = []
     china_data = {"country_code": "CN", "country_name": "Cin", "lat": 35.8617, "lon": 104.1954}
@@ -161,7 +163,7 @@ def generate_china_events():
             "wikipedia_url": "",
             "casualties": casualties,
             "key_figures": key_figures,
-            "id": f"ev{uuid.uuid4().hex[:8]}"
+            "id": content_id(china_data["country_name"], year, title)
         }
         events.append(event)
     
@@ -172,21 +174,19 @@ def main():
     print(f"Uretilen Cin olayi: {len(new_events)}")
     
     data_path = Path(__file__).parent.parent / "data" / "events.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    existing_count = len(data['events'])
-    print(f"Mevcut toplam olay: {existing_count}")
-    
-    data['events'].extend(new_events)
+    store = EventStore.load(data_path)
+    print(f"Mevcut toplam olay: {len(store)}")
     
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Zaten var olan olaylar (ulke, yil, baslik) atlanir; tekrar calistirmak cift kayit uretmez.
+    ingest = ingest_events(store, new_events, source="add_china_events.py")
+    summary = ingest.stats.summary()
+    if summary["inserted"] or summary["merged"]:
+        store.save()
     
-    print(f"Yeni toplam olay: {len(data['events'])}")
-    print(f"Eklenen Cin olayi: {len(new_events)}")
+    print(f"Yeni toplam olay: {len(store)}")
+    print(f"Eklenen Cin olayi: {summary['inserted']} (zaten var: {summary['duplicates']})")
     
-    china_events = [e for e in data['events'] if e.get('country_code') == 'CN']
+    china_events = [e for e in store if e.get('country_code') == 'CN']
     by_decade = {}
     for e in china_events:
         d = e.get('decade', 'unknown')
@@ -4,10 +4,12 @@ Fransa için 1920-2020 arası her 10 yılda 50 olay ekler.
 Mevcut olaylarla çakışmaması için kontrol yapar.
 """
 
-import json
-import uuid
 from pathlib import Path
 
+from event_ingest import ingest_events
+from event_ids import content_id
+from event_store import EventStore
+
 def generate_france_events():
     """Fransa olaylarını üret"""
     events = []
@@ -271,7 +273,7 @@ def generate_france_events():
                 "wikipedia_url": "",
                 "casualties": casualties,
                 "key_figures": key_figures,
-                "id": f"ev{uuid.uuid4().hex[:8]}"
+                "id": content_id(france_data["country_name"], year, title)
             }
             events.append(event)
     
@@ -285,25 +287,20 @@ def main():
     
     # Mevcut events.json'u oku
     data_path = Path(__file__).parent.parent / "data" / "events.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Mevcut olay sayısı
-    existing_count = len(data['events'])
-    print(f"Mevcut toplam olay: {existing_count}")
-    
-    # Yeni olayları ekle
-    data['events'].extend(new_events)
+    store = EventStore.load(data_path)
+    print(f"Mevcut toplam olay: {len(store)}")
     
-    # Kaydet
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Zaten var olan olaylar (ülke, yıl, başlık) atlanır; tekrar çalıştırmak çift kayıt üretmez.
+    ingest = ingest_events(store, new_events, source="add_france_events.py")
+    summary = ingest.stats.summary()
+    if summary["inserted"] or summary["merged"]:
+        store.save()
     
-    print(f"Yeni toplam olay: {len(data['events'])}")
-    print(f"Eklenen Fransa olayı: {len(new_events)}")
+    print(f"Yeni toplam olay: {len(store)}")
+    print(f"Eklenen Fransa olayı: {summary['inserted']} (zaten var: {summary['duplicates']})")
     
     # İstatistik
-    france_events = [e for e in data['events'] if e.get('country_code') == 'FR']
+    france_events = [e for e in store if e.get('country_code') == 'FR']
     by_decade = {}
     for e in france_events:
         d = e.get('decade', 'unknown')
@@ -6,19 +6,22 @@ Approach:
 - Pull broader channel history with `yt-dlp` (fallback to RSS).
 - Use conservative, event-id-based rules for high-confidence title matches.
 - Never overwrite an existing `youtube_video_id`.
+- RSS responses and yt-dlp listings are recorded via `http_cache.py`, so HTTP_CACHE_MODE=offline
+  re-runs the matching without network access.
 """
 
 from __future__ import annotations
 
-import json
-import re
 import subprocess
 import sys
-import urllib.request
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+import http_cache
+from event_store import EventStore
+from text_matcher import KeywordRules, fold_ascii
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -58,40 +61,13 @@ EVENT_VIDEO_RULES: Dict[str, Tuple[str, List[str]]] = {
 }
 
 
-TR_TRANSLATE = str.maketrans(
-    {
-        "ı": "i",
-        "İ": "i",
-        "ş": "s",
-        "Ş": "s",
-        "ğ": "g",
-        "Ğ": "g",
-        "ü": "u",
-        "Ü": "u",
-        "ö": "o",
-        "Ö": "o",
-        "ç": "c",
-        "Ç": "c",
-        "â": "a",
-        "Â": "a",
-        "î": "i",
-        "Î": "i",
-        "û": "u",
-        "Û": "u",
-    }
-)
-
-
-def normalize_text(value: str) -> str:
-    s = (value or "").strip().translate(TR_TRANSLATE).lower()
-    s = re.sub(r"[^a-z0-9]+", " ", s)
-    return " ".join(s.split())
+# Diacritic-free, punctuation-insensitive matching key (shared with text_matcher).
+normalize_text = fold_ascii
 
 
 def fetch_latest_videos(channel_id: str) -> List[Dict[str, str]]:
     feed_url = f"https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
-    req = urllib.request.Request(feed_url, headers={"User-Agent": "Mozilla/5.0"})
-    xml_bytes = urllib.request.urlopen(req, timeout=30).read()
+    xml_bytes = http_cache.fetch(feed_url, headers={"User-Agent": "Mozilla/5.0"}, timeout=30)
     root = ET.fromstring(xml_bytes)
 
     ns = {
@@ -136,23 +112,27 @@ def fetch_channel_history(channel_url: str, playlist_end: int = 500) -> List[Dic
         "%(id)s\\t%(upload_date)s\\t%(title)s",
         channel_url,
     ]
-    try:
+
+    def run_ytdlp() -> bytes:
         proc = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=180,
             check=False,
         )
+        return proc.stdout if proc.returncode == 0 and proc.stdout.strip() else b""
+
+    try:
+        stdout = http_cache.recorded(f"yt-dlp:{channel_url}:{playlist_end}", run_ytdlp).decode("utf-8", "replace")
     except Exception:
         return []
 
-    if proc.returncode != 0 or not proc.stdout.strip():
+    if not stdout.strip():
         return []
 
     out: List[Dict[str, str]] = []
     seen_ids = set()
-    for raw in proc.stdout.splitlines():
+    for raw in stdout.splitlines():
         video_id, upload_date, title = parse_ytdlp_print_line(raw.strip())
         if not video_id or not title or video_id in seen_ids:
             continue
@@ -167,21 +147,15 @@ def fetch_channel_history(channel_url: str, playlist_end: int = 500) -> List[Dic
     return out
 
 
-def find_video_id_by_keywords(videos: List[Dict[str, str]], keywords: List[str]) -> str:
-    # Input list is latest-first. First matching title wins.
-    kws = [normalize_text(k) for k in keywords]
-    for v in videos:
-        t = normalize_text(v.get("title") or "")
-        if all(k in t for k in kws):
-            return v.get("video_id") or ""
-    return ""
+def find_video_ids_by_keywords(videos: List[Dict[str, str]], rules: Dict[str, List[str]]) -> Dict[str, str]:
+    # Input list is latest-first. First matching title wins. All rules are matched in one pass.
+    matcher = KeywordRules(rules, normalize=normalize_text)
+    first = matcher.first_per_rule(v.get("title") or "" for v in videos)
+    return {key: videos[idx].get("video_id") or "" for key, idx in first.items()}
 
 
 def main() -> None:
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events") or []
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
+    store = EventStore.load(EVENTS_PATH)
 
     # Fetch each channel once (history first, RSS fallback).
     videos_by_channel: Dict[str, List[Dict[str, str]]] = {}
@@ -192,9 +166,7 @@ def main() -> None:
             videos = fetch_latest_videos(channel_id)
         videos_by_channel[channel_key] = videos
 
-    event_by_id: Dict[str, dict] = {
-        str(e.get("id")): e for e in events if isinstance(e, dict) and e.get("id")
-    }
+    event_by_id = store.by_id
 
     changed: List[Tuple[str, str, str]] = []  # (event_id, event_title, video_id)
     skipped_existing = 0
@@ -202,6 +174,7 @@ def main() -> None:
     missing_video_match: List[str] = []
     missing_channels: List[str] = []
 
+    pending_by_channel: Dict[str, Dict[str, List[str]]] = {}
     for event_id, (channel_key, keywords) in EVENT_VIDEO_RULES.items():
         ev = event_by_id.get(event_id)
         if not ev:
@@ -211,12 +184,18 @@ def main() -> None:
             skipped_existing += 1
             continue
 
-        channel_videos = videos_by_channel.get(channel_key)
-        if channel_videos is None:
+        if channel_key not in videos_by_channel:
             missing_channels.append(channel_key)
             continue
+        pending_by_channel.setdefault(channel_key, {})[event_id] = keywords
 
-        video_id = find_video_id_by_keywords(channel_videos, keywords)
+    video_ids: Dict[str, str] = {}
+    for channel_key, rules in pending_by_channel.items():
+        video_ids.update(find_video_ids_by_keywords(videos_by_channel[channel_key], rules))
+
+    for event_id in (eid for rules in pending_by_channel.values() for eid in rules):
+        ev = event_by_id[event_id]
+        video_id = video_ids.get(event_id, "")
         if not video_id:
             missing_video_match.append(event_id)
             continue
@@ -225,10 +204,7 @@ def main() -> None:
         changed.append((event_id, str(ev.get("title") or ""), video_id))
 
     if changed:
-        EVENTS_PATH.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2) + "\n",
-            encoding="utf-8",
-        )
+        store.save()
 
     print("Additional channel video enrichment complete.")
     print(f"- channels fetched: {len(videos_by_channel)}")
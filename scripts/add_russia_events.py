@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """Rusya için ~550 olay ekler (1920s-2020s, her dekad 50 olay)"""
 
-import json
-import uuid
 from pathlib import Path
 
+from event_ingest import ingest_events
+from event_ids import content_id
+from event_store import EventStore
+
 def generate_russia_events():
     events = []
     russia_data = {"country_code": "RU", "country_name": "Rusya", "lat": 61.5240, "lon": 105.3188}
@@ -542,7 +544,7 @@ def generate_russia_events():
             "wikipedia_url": "",
             "casualties": casualties,
             "key_figures": key_figures,
-            "id": f"ev{uuid.uuid4().hex[:8]}"
+            "id": content_id(russia_data["country_name"], year, title)
         }
         events.append(event)
     
@@ -554,21 +556,19 @@ def main():
     print(f"Üretilen Rusya olayı: {len(new_events)}")
     
     data_path = Path(__file__).parent.parent / "data" / "events.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    existing_count = len(data['events'])
-    print(f"Mevcut toplam olay: {existing_count}")
-    
-    data['events'].extend(new_events)
+    store = EventStore.load(data_path)
+    print(f"Mevcut toplam olay: {len(store)}")
     
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Zaten var olan olaylar (ülke, yıl, başlık) atlanır; tekrar çalıştırmak çift kayıt üretmez.
+    ingest = ingest_events(store, new_events, source="add_russia_events.py")
+    summary = ingest.stats.summary()
+    if summary["inserted"] or summary["merged"]:
+        store.save()
     
-    print(f"Yeni toplam olay: {len(data['events'])}")
-    print(f"Eklenen Rusya olayı: {len(new_events)}")
+    print(f"Yeni toplam olay: {len(store)}")
+    print(f"Eklenen Rusya olayı: {summary['inserted']} (zaten var: {summary['duplicates']})")
     
-    russia_events = [e for e in data['events'] if e.get('country_code') == 'RU']
+    russia_events = [e for e in store if e.get('country_code') == 'RU']
     by_decade = {}
     for e in russia_events:
         d = e.get('decade', 'unknown')
@@ -12,11 +12,12 @@ Goals:
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from event_store import EventStore
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -410,10 +411,8 @@ def _load_user_events() -> List[Dict[str, Any]]:
 
 
 def main() -> None:
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events") or []
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
+    store = EventStore.load(EVENTS_PATH)
+    events = store.events
 
     coords = _coords_index([e for e in events if isinstance(e, dict)])
 
@@ -473,8 +472,7 @@ def main() -> None:
         added += 1
 
     if added or updated:
-        data["events"] = events
-        EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        store.save()
 
     print("Scandinavia + Baltics merge complete.")
     print(f"- incoming: {len(incoming)}")
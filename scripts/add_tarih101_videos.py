@@ -10,12 +10,14 @@ Approach:
 
 from __future__ import annotations
 
-import json
 import urllib.request
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from event_store import EventStore
+from text_matcher import KeywordRules, casefold_tr
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -59,36 +61,30 @@ def fetch_latest_videos(channel_id: str) -> List[Dict[str, str]]:
     return out
 
 
-def find_video_id_by_keywords(videos: List[Dict[str, str]], keywords: List[str]) -> str:
-    # Latest-first list from RSS: first matching title wins.
-    kws = [k.casefold() for k in keywords]
-    for v in videos:
-        t = (v.get("title") or "").casefold()
-        if all(k in t for k in kws):
-            return v.get("video_id") or ""
-    return ""
+def find_video_ids_by_keywords(videos: List[Dict[str, str]], rules: Dict[str, List[str]]) -> Dict[str, str]:
+    # Latest-first list from RSS: first matching title wins. All rules are matched in one pass.
+    # casefold-compatible: upper-case Latin titles ('MUSSOLINI') still match lowercase keywords.
+    matcher = KeywordRules(rules, normalize=casefold_tr)
+    first = matcher.first_per_rule(v.get("title") or "" for v in videos)
+    return {key: videos[idx].get("video_id") or "" for key, idx in first.items()}
 
 
 def main() -> None:
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events") or []
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
+    store = EventStore.load(EVENTS_PATH)
 
     videos = fetch_latest_videos(TARIH101_CHANNEL_ID)
     if not videos:
         print("No videos fetched from Tarih101 feed; no changes made.")
         return
 
-    event_by_id: Dict[str, dict] = {
-        str(e.get("id")): e for e in events if isinstance(e, dict) and e.get("id")
-    }
+    event_by_id = store.by_id
 
     changed: List[Tuple[str, str, str]] = []  # (event_id, event_title, video_id)
     skipped_existing = 0
     missing_event_ids: List[str] = []
     missing_video_match: List[str] = []
 
+    pending: Dict[str, List[str]] = {}
     for event_id, keywords in EVENT_VIDEO_RULES.items():
         ev = event_by_id.get(event_id)
         if not ev:
@@ -97,7 +93,12 @@ def main() -> None:
         if ev.get("youtube_video_id"):
             skipped_existing += 1
             continue
-        video_id = find_video_id_by_keywords(videos, keywords)
+        pending[event_id] = keywords
+
+    video_ids = find_video_ids_by_keywords(videos, pending)
+    for event_id in pending:
+        ev = event_by_id[event_id]
+        video_id = video_ids.get(event_id, "")
         if not video_id:
             missing_video_match.append(event_id)
             continue
@@ -106,7 +107,7 @@ def main() -> None:
         changed.append((event_id, str(ev.get("title") or ""), video_id))
 
     if changed:
-        EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        store.save()
 
     print("Tarih101 video enrichment complete.")
     print(f"- feed videos fetched: {len(videos)}")
@@ -12,12 +12,13 @@ Rules:
 from __future__ import annotations
 
 import hashlib
-import json
 import re
 from collections import Counter, defaultdict
 from pathlib import Path
 from typing import Dict, List
 
+from event_store import EventStore
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -197,10 +198,8 @@ def build_event(year: int, category: str, title: str, description: str, key_figu
 
 
 def main() -> None:
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events") or []
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
+    store = EventStore.load(EVENTS_PATH)
+    events = store.events
 
     by_decade_count: Counter = Counter()
     existing_keys = set()
@@ -265,8 +264,7 @@ def main() -> None:
     if not added_events:
         print("No new UK events were added.")
     else:
-        data["events"] = events
-        EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        store.save()
         print(f"Added UK events: {len(added_events)}")
         for dec in TARGET_DECADES:
             print(f"- {dec}: +{added_by_decade.get(dec, 0)} (total={by_decade_count.get(dec, 0)})")
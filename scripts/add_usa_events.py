@@ -1,10 +1,12 @@
 #!/usr/bin/env python3
 """ABD için ~550 olay ekler (1920s-2020s, her dekad 50 olay)"""
 
-import json
-import uuid
 from pathlib import Path
 
+from event_ingest import ingest_events
+from event_ids import content_id
+from event_store import EventStore
+
 def generate_usa_events():
     events = []
     usa_data = {"country_code": "US", "country_name": "Amerika Birleşik Devletleri", "lat": 37.0902, "lon": -95.7129}
@@ -595,7 +597,7 @@ def generate_usa_events():
             "wikipedia_url": "",
             "casualties": casualties,
             "key_figures": key_figures,
-            "id": f"ev{uuid.uuid4().hex[:8]}"
+            "id": content_id(usa_data["country_name"], year, title)
         }
         events.append(event)
     
@@ -603,31 +605,23 @@ def generate_usa_events():
 
 
 def main():
-    # Yeni olayları üret
     new_events = generate_usa_events()
     print(f"Üretilen ABD olayı: {len(new_events)}")
     
-    # Mevcut events.json'u oku
     data_path = Path(__file__).parent.parent / "data" / "events.json"
-    with open(data_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    # Mevcut olay sayısı
-    existing_count = len(data['events'])
-    print(f"Mevcut toplam olay: {existing_count}")
-    
-    # Yeni olayları ekle
-    data['events'].extend(new_events)
+    store = EventStore.load(data_path)
+    print(f"Mevcut toplam olay: {len(store)}")
     
-    # Kaydet
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Zaten var olan olaylar (ülke, yıl, başlık) atlanır; tekrar çalıştırmak çift kayıt üretmez.
+    ingest = ingest_events(store, new_events, source="add_usa_events.py")
+    summary = ingest.stats.summary()
+    if summary["inserted"] or summary["merged"]:
+        store.save()
     
-    print(f"Yeni toplam olay: {len(data['events'])}")
-    print(f"Eklenen ABD olayı: {len(new_events)}")
+    print(f"Yeni toplam olay: {len(store)}")
+    print(f"Eklenen ABD olayı: {summary['inserted']} (zaten var: {summary['duplicates']})")
     
-    # İstatistik
-    usa_events = [e for e in data['events'] if e.get('country_code') == 'US']
+    usa_events = [e for e in store if e.get('country_code') == 'US']
     by_decade = {}
     for e in usa_events:
         d = e.get('decade', 'unknown')
@@ -1,46 +1,62 @@
-import json
-import re
+from pathlib import Path
 
-def add_youtube_videos(json_path):
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    events = data.get('events', [])
+from event_store import EventStore
+from text_matcher import AhoCorasick, fold_ascii
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+EVENTS_PATH = BASE_DIR / "data" / "events.json"
+
+def add_youtube_videos(json_path=EVENTS_PATH):
+    store = EventStore.load(Path(json_path))
+    events = store.events
     
     # Mapping of criteria to youtube_video_id
-    # Criteria: (country_name, year_range_start, year_range_end, title_regex)
+    # Criteria: (country_name, year_range_start, year_range_end, keywords in title/description)
+    # Keywords are matched case- and diacritic-insensitively (Savaş == Savas == SAVAŞ).
     video_mappings = [
-        ("Filipinler", 1986, 1988, r"Gerilla|Akvino|Aquino", "0rF0S48Xegs"),
-        ("Azerbaycan", 1989, 1991, r"Kara Ocak|Black January|Azerbaycan", "vz8_zOgnVgg"),
-        ("Almanya", 1989, 1991, r"Birle[sş]me", "X6pg4KT7Da4"),
-        ("Irak", 1990, 1992, r"Körfez|Gulf", "W0JA9b_uMKs"),
-        ("Kuveyt", 1990, 1992, r"İşgal|Occupation|Körfez", "W0JA9b_uMKs"),
-        ("Bosna Hersek", 1991, 1996, r"Sava[sş]|Srebrenica", "ngDfMflSwD8"),
-        ("Turkiye", 1974, 1975, r"Kıbrıs|Barış Harek", "9owC4fHLRIc"),
-        ("Kuzey Kıbrıs", 1974, 1975, r"Barış Harek", "9owC4fHLRIc"),
-        ("Kuzey Kıbrıs", 1995, 1997, r"Kardak", "_xi9B1nsCBQ"),
-        ("Turkiye", 1995, 1997, r"Kardak", "_xi9B1nsCBQ"),
-        ("Turkiye", 1980, 1981, r"12 Eylül|Darbe", "SOnjYp6M_rE"),
-        ("Turkiye", 1998, 2000, r"Öcalan|Apo", "3iQfB_6j8mI"),
-        ("Vietnam", 1974, 1976, r"Sava[sş]|Sona|Fall of Saigon", "T8CNo97GNo0"), # Generic 32. Gun Vietnam id if found
+        ("Filipinler", 1986, 1988, ["Gerilla", "Akvino", "Aquino"], "0rF0S48Xegs"),
+        ("Azerbaycan", 1989, 1991, ["Kara Ocak", "Black January", "Azerbaycan"], "vz8_zOgnVgg"),
+        ("Almanya", 1989, 1991, ["Birleşme"], "X6pg4KT7Da4"),
+        ("Irak", 1990, 1992, ["Körfez", "Gulf"], "W0JA9b_uMKs"),
+        ("Kuveyt", 1990, 1992, ["İşgal", "Occupation", "Körfez"], "W0JA9b_uMKs"),
+        ("Bosna Hersek", 1991, 1996, ["Savaş", "Srebrenica"], "ngDfMflSwD8"),
+        ("Turkiye", 1974, 1975, ["Kıbrıs", "Barış Harek"], "9owC4fHLRIc"),
+        ("Kuzey Kıbrıs", 1974, 1975, ["Barış Harek"], "9owC4fHLRIc"),
+        ("Kuzey Kıbrıs", 1995, 1997, ["Kardak"], "_xi9B1nsCBQ"),
+        ("Turkiye", 1995, 1997, ["Kardak"], "_xi9B1nsCBQ"),
+        ("Turkiye", 1980, 1981, ["12 Eylül", "Darbe"], "SOnjYp6M_rE"),
+        ("Turkiye", 1998, 2000, ["Öcalan", "Apo"], "3iQfB_6j8mI"),
+        ("Vietnam", 1974, 1976, ["Savaş", "Sona", "Fall of Saigon"], "T8CNo97GNo0"), # Generic 32. Gun Vietnam id if found
     ]
-    
+
+    # One automaton over every keyword; each keyword points back to the mappings that use it.
+    keywords = []
+    keyword_rows = []
+    for row, (_, _, _, kws, _) in enumerate(video_mappings):
+        for kw in kws:
+            keywords.append(kw)
+            keyword_rows.append(row)
+    matcher = AhoCorasick(keywords, normalize=fold_ascii)
+
     changed_count = 0
     for event in events:
-        for country, y_start, y_end, title_re, video_id in video_mappings:
-            if event.get('country_name') == country:
-                if y_start <= event.get('year', 0) <= y_end:
-                    if re.search(title_re, event.get('title', ''), re.IGNORECASE) or re.search(title_re, event.get('description', ''), re.IGNORECASE):
-                        event['youtube_video_id'] = video_id
-                        changed_count += 1
-                        break # Only one video per event
+        hit_rows = {
+            keyword_rows[pid]
+            for text in (event.get('title', ''), event.get('description', ''))
+            for pid in matcher.matched_ids(text)
+        }
+        for row in sorted(hit_rows):
+            country, y_start, y_end, _, video_id = video_mappings[row]
+            if event.get('country_name') == country and y_start <= event.get('year', 0) <= y_end:
+                event['youtube_video_id'] = video_id
+                changed_count += 1
+                break # Only one video per event
                         
     if changed_count > 0:
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        store.save()
         print(f"Updated {changed_count} events with YouTube videos.")
     else:
         print("No matches found for YouTube videos.")
 
 if __name__ == "__main__":
-    add_youtube_videos('data/events.json')
+    add_youtube_videos()
@@ -2,139 +2,112 @@
 """
 Consistency checks to keep Admin + Map aligned.
 
-Validates:
+Validates (rules in event_validation.py):
 - Every event.country_name is a canonical Turkish name from data/country_mappings.json
 - Every event.country_code matches the mapping's iso2 (uppercased)
-- No duplicates by (country_name, year, title)
+- No duplicates by (country_name, year, title), no duplicate ids
 - Every event.category has a definition in the top-level `categories` map
 - Every event.decade matches the decade derived from event.year (e.g. 1991 -> 1990s)
+- wikipedia_url (when set) is a direct article link
+- Warnings: 0,0 / invalid coordinates, contextless stubs (see remove_contextless_events.py)
+
+Only events changed since the last run are re-checked (per-event result cache), so it is cheap
+enough for a git pre-commit hook:
+  printf '#!/bin/sh\\nexec python3 scripts/check_events_consistency.py --quiet\\n' > .git/hooks/pre-commit
+  chmod +x .git/hooks/pre-commit
+
+Usage:
+  python3 scripts/check_events_consistency.py [--json report.json|-] [--strict] [--no-cache]
 """
 
 from __future__ import annotations
 
+import argparse
 import json
+import sys
+import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Dict, List
+
+from event_store import EventStore
+from event_validation import CACHE_PATH, ERROR, Issue, Validator, build_context, report
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
 COUNTRY_MAPPINGS_PATH = BASE_DIR / "data" / "country_mappings.json"
 
+# Human-readable headings per rule (errors first, same wording as before the rule engine).
+HEADINGS = {
+    "country_name": "Non-canonical country_name values found",
+    "country_code": "country_code mismatch vs country_mappings",
+    "duplicate": "Duplicate events by (country_name, year, title)",
+    "duplicate_id": "Duplicate event ids",
+    "category": "Events with a category missing from top-level `categories`",
+    "decade": "Events with decade != derived-from-year decade",
+    "wiki_url": "Malformed wikipedia_url values",
+    "coordinates": "Events with missing or 0,0 coordinates",
+    "contextless": "Contextless events (remove_contextless_events.py --apply)",
+}
+MAX_LISTED = 50
+
+
+def _print_issues(issues: List[Issue], events: list, quiet: bool) -> None:
+    by_rule: Dict[str, List[Issue]] = defaultdict(list)
+    for issue in issues:
+        by_rule[issue.rule].append(issue)
+    for rule in sorted(by_rule, key=lambda r: (by_rule[r][0].severity != ERROR, list(HEADINGS).index(r) if r in HEADINGS else 99)):
+        found = by_rule[rule]
+        severity = found[0].severity
+        label = "ERROR" if severity == ERROR else "WARNING"
+        print(f"{label}: {HEADINGS.get(rule, rule)}: {len(found)}")
+        if quiet and severity != ERROR:
+            continue
+        for issue in found[:MAX_LISTED]:
+            ev = events[issue.index]
+            print(f"- {issue.index} ({issue.event_id} {ev.get('country_name')} {ev.get('year')}): {issue.message}")
+        if len(found) > MAX_LISTED:
+            print(f"... and {len(found) - MAX_LISTED} more")
+
 
 def main() -> None:
+    ap = argparse.ArgumentParser(description="Validate events.json against country mappings and content rules")
+    ap.add_argument("--events", default=str(EVENTS_PATH), help="Path to events.json (or its shard directory)")
+    ap.add_argument("--json", dest="json_out", help="Write the machine-readable report here ('-' = stdout)")
+    ap.add_argument("--strict", action="store_true", help="Fail on warnings too")
+    ap.add_argument("--no-cache", action="store_true", help="Re-check every event")
+    ap.add_argument("--quiet", action="store_true", help="Only counts for warnings")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
     with open(COUNTRY_MAPPINGS_PATH, "r", encoding="utf-8") as f:
         countries = json.load(f).get("countries", [])
+    store = EventStore.load(Path(args.events))
+    events = store.events
 
-    iso_by_tr = {
-        (c.get("turkish") or "").strip(): (c.get("iso2") or "").strip().upper()
-        for c in countries
-        if (c.get("turkish") or "").strip()
-    }
-    canonical_tr = set(iso_by_tr.keys())
-
-    with open(EVENTS_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    events = data.get("events") or []
-    categories = data.get("categories") or {}
-    if not isinstance(categories, dict):
-        categories = {}
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
-
-    bad_names: List[Tuple[int, str]] = []
-    bad_codes: List[Tuple[int, str, str, str]] = []
-    bad_categories: List[Tuple[int, str]] = []
-    bad_decades: List[Tuple[int, int, str, str]] = []
-
-    for i, ev in enumerate(events):
-        if not isinstance(ev, dict):
-            continue
-        name = (ev.get("country_name") or "").strip()
-        code = (ev.get("country_code") or "").strip().upper()
-        category = (ev.get("category") or "").strip()
-        decade = (ev.get("decade") or "").strip()
-        year_raw = ev.get("year")
-
-        if not name or name not in canonical_tr:
-            bad_names.append((i, name))
-            continue
+    validator = Validator(build_context(countries, store.categories), cache_path=None if args.no_cache else CACHE_PATH)
+    issues = validator.validate(events, store.content_hash)
+    result = report(issues, events, validator)
+    elapsed_ms = (time.perf_counter() - t0) * 1000
+    result["elapsed_ms"] = round(elapsed_ms, 1)
 
-        expected = iso_by_tr.get(name, "")
-        if expected and code != expected:
-            bad_codes.append((i, name, code, expected))
-
-        if category and category not in categories:
-            bad_categories.append((i, category))
-
-        try:
-            year = int(year_raw)
-        except Exception:
-            year = None
-        if year is not None:
-            expected_decade = f"{(year // 10) * 10}s"
-            if decade != expected_decade:
-                bad_decades.append((i, year, decade, expected_decade))
-
-    dup_groups = defaultdict(list)
-    for i, ev in enumerate(events):
-        if not isinstance(ev, dict):
-            continue
-        key = (
-            (ev.get("country_name") or "").strip(),
-            ev.get("year"),
-            (ev.get("title") or "").strip(),
-        )
-        dup_groups[key].append(i)
-    dups = [(k, idxs) for k, idxs in dup_groups.items() if len(idxs) > 1]
-
-    ok = True
-    if bad_names:
-        ok = False
-        print("ERROR: Non-canonical country_name values found (index, value):")
-        for idx, name in bad_names[:50]:
-            print(f"- {idx}: {name!r}")
-        if len(bad_names) > 50:
-            print(f"... and {len(bad_names) - 50} more")
-
-    if bad_codes:
-        ok = False
-        print("ERROR: country_code mismatch vs country_mappings (index, name, code, expected):")
-        for idx, name, code, expected in bad_codes[:50]:
-            print(f"- {idx}: {name} code={code!r} expected={expected!r}")
-        if len(bad_codes) > 50:
-            print(f"... and {len(bad_codes) - 50} more")
-
-    if dups:
-        ok = False
-        print("ERROR: Duplicate events by (country_name, year, title):")
-        for (name, year, title), idxs in dups[:30]:
-            print(f"- {name} {year} {title} -> {len(idxs)} duplicates at indices {idxs[:10]}")
-        if len(dups) > 30:
-            print(f"... and {len(dups) - 30} more duplicate groups")
-
-    if bad_categories:
-        ok = False
-        print("ERROR: Events with a category missing from top-level `categories` (index, category):")
-        for idx, cat in bad_categories[:50]:
-            print(f"- {idx}: {cat!r}")
-        if len(bad_categories) > 50:
-            print(f"... and {len(bad_categories) - 50} more")
-
-    if bad_decades:
-        ok = False
-        print("ERROR: Events with decade != derived-from-year decade (index, year, decade, expected):")
-        for idx, year, decade, expected in bad_decades[:50]:
-            print(f"- {idx}: year={year} decade={decade!r} expected={expected!r}")
-        if len(bad_decades) > 50:
-            print(f"... and {len(bad_decades) - 50} more")
+    ok = result["ok"] and not (args.strict and issues)
+
+    if args.json_out:
+        text = json.dumps(result, ensure_ascii=False, indent=2) + "\n"
+        if args.json_out == "-":
+            sys.stdout.write(text)
+            raise SystemExit(0 if ok else 1)
+        Path(args.json_out).write_text(text, encoding="utf-8")
 
+    _print_issues(issues, events, args.quiet)
     if ok:
         print("OK: events.json is consistent with country_mappings.json")
         print(f"- events: {len(events)}")
         print(f"- countries (canonical): {len({(e.get('country_name') or '').strip() for e in events if isinstance(e, dict)})}")
-    else:
+    print(f"- checked {validator.checked}, reused {validator.reused} cached results ({elapsed_ms:.0f}ms)")
+    if not ok:
         raise SystemExit(1)
 
 
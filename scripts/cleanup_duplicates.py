@@ -1,13 +1,14 @@
 
-import json
 import csv
 from pathlib import Path
 
+from event_store import EventStore
+
 def normalize(text):
     return text.strip()
 
 def main():
-    base_dir = Path(__file__).parent.parent
+    base_dir = Path(__file__).resolve().parent.parent
     events_json_path = base_dir / "data" / "events.json"
     
     # helper to load CSV map
@@ -36,11 +37,9 @@ def main():
                 
     print(f"Tracking {len(title_country_map)} unique titles for cleanup.")
     
-    # Load JSON
-    with open(events_json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    events = data.get('events', [])
+    # Load events (events.json or its shard directory)
+    store = EventStore.load(events_json_path)
+    events = store.events
     initial_count = len(events)
     
     kept_events = []
@@ -59,11 +58,10 @@ def main():
         
         kept_events.append(e)
         
-    data['events'] = kept_events
+    store.events = kept_events
     
-    # Save
-    with open(events_json_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # Save (atomic + journaled)
+    store.save()
         
     print(f"Cleanup complete. Removed {removed_count} events. Count: {initial_count} -> {len(kept_events)}")
 
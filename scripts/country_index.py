@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+One country-name canonicalizer for every script and for the map/admin pages.
+
+Why:
+- Country resolution was re-implemented in normalize_events.py, fetch_indicators.py,
+  import_events_from_csv.py, merge_events.py (COUNTRY_NAME_MAP), check_africa_gaps.py (NORM_MAP),
+  GeopoliticalMap._load_data and the page's `findCountryMeta` variants, each with slightly
+  different folding and alias coverage, so a name could resolve in one place and not another.
+
+How:
+- `country_key()` folds a name (NFKD + drop combining marks, dotless ı -> i, lowercase,
+  punctuation/whitespace runs -> one space). `COUNTRY_KEY_JS` is the same function in JS; both
+  only use Unicode normalization + ASCII rules, so the two sides produce identical keys.
+- `CountryIndex` folds every Turkish name, English name and alias from data/country_mappings.json
+  into one dict (first mapping wins on a collision, as before), so resolving is a single lookup.
+- `js_table()` + `COUNTRY_LOOKUP_JS` put the same table on the map page (`countryIndex`,
+  `resolveCountry()`); `admin_embed()` writes it, plus `countryKey()`, to
+  admin/country_mappings.js so the admin panel does not carry its own copy of the folding.
+
+Usage:
+  from country_index import CountryIndex
+  countries = CountryIndex.load()
+  countries.canonical("Turkey")   # -> "Türkiye"
+  countries.iso2("Cote d'Ivoire") # -> "CI"
+
+  python3 scripts/country_index.py "Cote d'Ivoire" USA Gurcistan
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+COUNTRY_MAPPINGS_PATH = BASE_DIR / "data" / "country_mappings.json"
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def country_key(value: Any) -> str:
+    """Lookup key: "Côte d’Ivoire" / "cote d'ivoire" / "COTE-D-IVOIRE" -> "cote d ivoire"."""
+    if value is None:
+        return ""
+    s = unicodedata.normalize("NFKD", str(value))
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = s.replace("ı", "i").lower()
+    return _NON_ALNUM_RE.sub(" ", s).strip()
+
+
+# Must stay in sync with country_key() above. foldKey() is the general text folding (the admin
+# uses it for title search too); countryKey() is the country-lookup spelling of it.
+COUNTRY_KEY_JS = r"""function foldKey(value) {
+    if (value === null || value === undefined) return '';
+    return String(value).normalize('NFKD').replace(/[\u0300-\u036f]/g, '')
+        .replace(/ı/g, 'i').toLowerCase().replace(/[^a-z0-9]+/g, ' ').trim();
+}
+function countryKey(value) {
+    return foldKey(value);
+}"""
+
+# Page-side lookup over a `countryIndex` table (CountryIndex.js_table()): [turkish, english, iso2] or null.
+COUNTRY_LOOKUP_JS = COUNTRY_KEY_JS + """
+function resolveCountry(name) {
+    const i = countryIndex.k[countryKey(name)];
+    return i === undefined ? null : countryIndex.c[i];
+}
+"""
+
+
+class Country(NamedTuple):
+    turkish: str
+    english: str
+    iso2: str  # upper-case ("" when unknown)
+
+
+class CountryIndex:
+    """Folded name/alias -> Country, built once per mappings file."""
+
+    _LOADED: Dict[Tuple[str, float], "CountryIndex"] = {}
+
+    def __init__(self, mappings: List[Dict[str, Any]]) -> None:
+        self.mappings = mappings
+        self.countries: List[Country] = []
+        self.by_turkish: Dict[str, Country] = {}
+        self.by_key: Dict[str, Country] = {}
+        for entry in mappings:
+            tr = (entry.get("turkish") or "").strip()
+            if not tr:
+                continue
+            country = Country(tr, (entry.get("english") or "").strip(), (entry.get("iso2") or "").strip().upper())
+            self.countries.append(country)
+            self.by_turkish.setdefault(tr, country)
+            for name in [entry.get("turkish"), entry.get("english"), *(entry.get("aliases") or [])]:
+                key = country_key(name)
+                if key:
+                    # On a collision (e.g. "Palestine") the first mapping wins deterministically.
+                    self.by_key.setdefault(key, country)
+
+    @classmethod
+    def load(cls, path: Path = COUNTRY_MAPPINGS_PATH) -> "CountryIndex":
+        """Index for `path`, reused while the file is unchanged."""
+        path = Path(path)
+        cache_key = (str(path), path.stat().st_mtime if path.exists() else 0.0)
+        index = cls._LOADED.get(cache_key)
+        if index is None:
+            mappings = []
+            if path.exists():
+                with open(path, "r", encoding="utf-8") as f:
+                    mappings = json.load(f).get("countries", [])
+            index = cls._LOADED[cache_key] = cls(mappings)
+        return index
+
+    def resolve(self, name: Any) -> Optional[Country]:
+        return self.by_key.get(country_key(name))
+
+    def canonical(self, name: Any, default: Optional[str] = None) -> Optional[str]:
+        """Canonical Turkish name, or `default` when the name is unknown."""
+        country = self.resolve(name)
+        return country.turkish if country else default
+
+    def iso2(self, name: Any) -> str:
+        country = self.resolve(name)
+        return country.iso2 if country else ""
+
+    def js_table(self) -> Dict[str, Any]:
+        """{"c": [[turkish, english, iso2 (lower-case, as flag URLs use it)]], "k": {key: position in c}}."""
+        positions = {c: i for i, c in enumerate(self.countries)}
+        return {
+            "c": [[c.turkish, c.english, c.iso2.lower()] for c in self.countries],
+            "k": {k: positions[c] for k, c in sorted(self.by_key.items())},
+        }
+
+    def to_js(self) -> str:
+        """`const countryIndex` + countryKey()/resolveCountry() for the map page."""
+        body = json.dumps(self.js_table(), ensure_ascii=False, separators=(",", ":"))
+        return f"const countryIndex = {body};\n{COUNTRY_LOOKUP_JS}"
+
+    def admin_embed(self) -> str:
+        """admin/country_mappings.js: the raw mappings, the precomputed lookup table and countryKey()."""
+        return (
+            "window.__COUNTRY_MAPPINGS__ = " + json.dumps(self.mappings, ensure_ascii=False) + ";\n"
+            "window.__COUNTRY_INDEX__ = " + json.dumps(self.js_table(), ensure_ascii=False, separators=(",", ":")) + ";\n"
+            + COUNTRY_KEY_JS + "\n"
+        )
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Resolve country names via data/country_mappings.json")
+    ap.add_argument("names", nargs="*", help="Names to resolve")
+    ap.add_argument("--js", action="store_true", help="Print the page lookup table instead")
+    args = ap.parse_args()
+
+    index = CountryIndex.load()
+    if args.js:
+        print(index.to_js(), end="")
+        return
+    for name in args.names:
+        country = index.resolve(name)
+        print(f"{name!r} -> {country.turkish} ({country.iso2})" if country else f"{name!r} -> ?")
+
+
+if __name__ == "__main__":
+    main()
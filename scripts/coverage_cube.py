@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Country × decade × category event counts ("coverage cube"), region gap reports and the
+compact density artifact used by the map.
+
+Why:
+- Finding thin spots meant one script per question: check_africa_gaps.py hard-coded an African
+  country list and counted events per country; the gap_filler_*.csv files were assembled by
+  re-running variations of that by hand, per region and per decade, each a fresh loop over events.json.
+
+How:
+- `CoverageCube.build()` makes one pass over the events and fills a flat `array('I')` of counts at
+  `(country * n_decades + decade) * n_categories + category`. The country axis is every canonical
+  country in country_mappings.json (so countries with no events at all show up as empty cells),
+  decades are the contiguous range found in the data, categories come from events.json.
+  Names that do not resolve are tallied in `unmapped` instead of growing the axis.
+- data/regions.json groups the countries: `regions` partition them (each country in exactly one),
+  `groups` are overlapping sub-regions (Balkanlar, Kafkasya, Batı Afrika, ...). Both are addressed
+  by the same `members()` lookup.
+- `gaps()` lists cells under a threshold, per country × decade (all/selected categories summed) or
+  per country × decade × category; `region_summary()` rolls the same cells up per region.
+- `to_compact()` is the artifact (output/coverage.json, `--json`): the three axes, the region
+  and group member positions and the non-zero cells as one flat `[country, decade, category,
+  count, ...]` list. The map embeds the same structure for its "Olay yoğunluğu" shading and sums
+  it for the decades/categories currently selected on the page.
+
+Usage:
+  python3 scripts/coverage_cube.py                       # per-region summary (< 3 events per decade)
+  python3 scripts/coverage_cube.py --region Afrika --min 2 --from 1950s
+  python3 scripts/coverage_cube.py --region Balkanlar --category war --category revolution --per-category
+  python3 scripts/coverage_cube.py --region Afrika --totals --min 10
+  python3 scripts/coverage_cube.py --json output/coverage.json --quiet
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from array import array
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from country_index import CountryIndex
+from event_store import EVENTS_PATH, EventStore
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+REGIONS_PATH = BASE_DIR / "data" / "regions.json"
+DEFAULT_OUTPUT = BASE_DIR / "output" / "coverage.json"
+
+# Decades before this are sparse by design (the map is about the last 100 years).
+DEFAULT_FROM = "1920s"
+DEFAULT_MIN = 3
+NO_REGION = "Diğer"
+
+_FORMAT = 1
+
+
+class Gap(NamedTuple):
+    country: str
+    decade: str
+    category: str  # "" when the cell sums several categories
+    count: int
+
+
+def decade_of(ev: Dict[str, Any]) -> Optional[int]:
+    """Start year of the event's decade ("1990s" -> 1990), from `decade` or else `year`."""
+    d = str(ev.get("decade") or "").strip()
+    if d.endswith("s") and d[:-1].isdigit():
+        return int(d[:-1])
+    try:
+        return int(ev.get("year")) // 10 * 10
+    except (TypeError, ValueError):
+        return None
+
+
+def load_regions(path: Path = REGIONS_PATH, countries: Optional[CountryIndex] = None) -> Dict[str, Dict[str, List[str]]]:
+    """{"regions": {name: [country]}, "groups": {name: [country]}} with names made canonical."""
+    path = Path(path)
+    if not path.exists():
+        return {"regions": {}, "groups": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+    countries = countries or CountryIndex.load()
+    return {
+        kind: {
+            name: list(dict.fromkeys(countries.canonical(c, c) for c in members))
+            for name, members in (raw.get(kind) or {}).items()
+        }
+        for kind in ("regions", "groups")
+    }
+
+
+class CoverageCube:
+    """Event counts over (country, decade, category), stored flat in one array."""
+
+    def __init__(
+        self,
+        countries: Sequence[str],
+        decades: Sequence[str],
+        categories: Sequence[str],
+        counts: Optional[array] = None,
+        regions: Optional[Dict[str, Dict[str, List[str]]]] = None,
+        unmapped: Optional[Counter] = None,
+    ) -> None:
+        self.countries = list(countries)
+        self.decades = list(decades)
+        self.categories = list(categories)
+        self.country_pos = {c: i for i, c in enumerate(self.countries)}
+        self.decade_pos = {d: i for i, d in enumerate(self.decades)}
+        self.category_pos = {k: i for i, k in enumerate(self.categories)}
+        size = len(self.countries) * len(self.decades) * len(self.categories)
+        self.counts = counts if counts is not None else array("I", bytes(4 * size))
+        if len(self.counts) != size:
+            raise ValueError(f"counts has {len(self.counts)} cells, axes need {size}")
+        self.regions = regions or {"regions": {}, "groups": {}}
+        self.unmapped = unmapped or Counter()
+
+    @classmethod
+    def build(
+        cls,
+        events: Iterable[Dict[str, Any]],
+        countries: Optional[CountryIndex] = None,
+        categories: Optional[Sequence[str]] = None,
+        regions: Optional[Dict[str, Dict[str, List[str]]]] = None,
+    ) -> "CoverageCube":
+        countries = countries or CountryIndex.load()
+        events = events if isinstance(events, list) else list(events)
+        country_axis = list(dict.fromkeys(c.turkish for c in countries.countries))
+        category_axis = list(dict.fromkeys(categories or ()))
+        for ev in events:
+            cat = ev.get("category")
+            if cat and cat not in category_axis:
+                category_axis.append(cat)
+        starts = [d for d in map(decade_of, events) if d is not None]
+        decade_axis = [f"{d}s" for d in range(min(starts), max(starts) + 10, 10)] if starts else []
+
+        cube = cls(country_axis, decade_axis, category_axis, regions=regions)
+        counts, unmapped = cube.counts, cube.unmapped
+        n_dec, n_cat = len(decade_axis), len(category_axis)
+        first_decade = min(starts) if starts else 0
+        country_pos, category_pos = cube.country_pos, cube.category_pos
+        # Raw name -> axis position, so each distinct spelling is resolved once.
+        name_pos: Dict[Any, Optional[int]] = {}
+        for ev, start in zip(events, map(decade_of, events)):
+            name = ev.get("country_name")
+            ci = name_pos.get(name, -1)
+            if ci == -1:
+                ci = name_pos[name] = country_pos.get(countries.canonical(name, ""))
+            ki = category_pos.get(ev.get("category"))
+            if ci is None or start is None or ki is None:
+                unmapped[name or ""] += 1  # unknown country, or no decade/category
+                continue
+            counts[(ci * n_dec + (start - first_decade) // 10) * n_cat + ki] += 1
+        return cube
+
+    # ---- lookups ---------------------------------------------------------------------------
+
+    def members(self, name: str) -> List[str]:
+        """Countries of a region or group (regions first), in cube axis order."""
+        for kind in ("regions", "groups"):
+            if name in self.regions.get(kind, {}):
+                wanted = set(self.regions[kind][name])
+                return [c for c in self.countries if c in wanted]
+        raise KeyError(f"unknown region/group: {name}")
+
+    def region_of(self) -> Dict[str, str]:
+        """country -> region (NO_REGION for countries regions.json does not place)."""
+        out = {c: NO_REGION for c in self.countries}
+        for region, members in self.regions.get("regions", {}).items():
+            for c in members:
+                if c in out:
+                    out[c] = region
+        return out
+
+    def _decade(self, value: str) -> int:
+        """Axis position of '1950s' (a bare year such as '1950' or '1953' means its decade)."""
+        label = value.strip()
+        if label.isdigit():
+            label = f"{int(label) // 10 * 10}s"
+        if label not in self.decade_pos:
+            raise KeyError(f"unknown decade: {value}")
+        return self.decade_pos[label]
+
+    def decade_range(self, start: Optional[str] = None, end: Optional[str] = None) -> List[str]:
+        """Decades from `start` to `end` inclusive (None = open end); KeyError for unknown ones."""
+        lo = self._decade(start) if start else 0
+        hi = self._decade(end) if end else len(self.decades) - 1
+        return self.decades[lo : hi + 1]
+
+    def _positions(self, axis: Dict[str, int], names: Optional[Iterable[str]]) -> List[int]:
+        if names is None:
+            return list(axis.values())
+        return [axis[n] for n in names if n in axis]
+
+    def count(
+        self,
+        countries: Optional[Iterable[str]] = None,
+        decades: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Events in the sub-cube (None = whole axis)."""
+        return sum(self.country_totals(countries, decades, categories).values())
+
+    def country_totals(
+        self,
+        countries: Optional[Iterable[str]] = None,
+        decades: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+    ) -> Dict[str, int]:
+        counts, n_dec, n_cat = self.counts, len(self.decades), len(self.categories)
+        dis = self._positions(self.decade_pos, decades)
+        kis = self._positions(self.category_pos, categories)
+        out = {}
+        for ci in self._positions(self.country_pos, countries):
+            total = 0
+            for di in dis:
+                base = (ci * n_dec + di) * n_cat
+                for ki in kis:
+                    total += counts[base + ki]
+            out[self.countries[ci]] = total
+        return out
+
+    # ---- reports ---------------------------------------------------------------------------
+
+    def gaps(
+        self,
+        min_count: int = DEFAULT_MIN,
+        countries: Optional[Iterable[str]] = None,
+        decades: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+        per_category: bool = False,
+    ) -> List[Gap]:
+        """Cells with fewer than `min_count` events, emptiest first.
+
+        Per country × decade (selected categories summed), or per country × decade × category
+        with `per_category`.
+        """
+        counts, n_dec, n_cat = self.counts, len(self.decades), len(self.categories)
+        dis = self._positions(self.decade_pos, decades)
+        kis = self._positions(self.category_pos, categories)
+        out: List[Gap] = []
+        for ci in self._positions(self.country_pos, countries):
+            for di in dis:
+                base = (ci * n_dec + di) * n_cat
+                if per_category:
+                    for ki in kis:
+                        if counts[base + ki] < min_count:
+                            out.append(Gap(self.countries[ci], self.decades[di], self.categories[ki], counts[base + ki]))
+                    continue
+                n = sum(counts[base + ki] for ki in kis)
+                if n < min_count:
+                    out.append(Gap(self.countries[ci], self.decades[di], "", n))
+        out.sort(key=lambda g: (g.count, g.country, g.decade, g.category))
+        return out
+
+    def region_summary(
+        self,
+        min_count: int = DEFAULT_MIN,
+        decades: Optional[Iterable[str]] = None,
+        categories: Optional[Iterable[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Per region: countries, events, empty and under-covered country × decade cells."""
+        decades = list(decades) if decades is not None else None
+        categories = list(categories) if categories is not None else None
+        by_region: Dict[str, List[str]] = {}
+        for country, region in self.region_of().items():
+            by_region.setdefault(region, []).append(country)
+        rows = []
+        for region, members in by_region.items():
+            totals = self.country_totals(members, decades, categories)
+            cells = self.gaps(min_count, members, decades, categories)
+            n_dec = len(decades) if decades is not None else len(self.decades)
+            rows.append({
+                "region": region,
+                "countries": len(members),
+                "events": sum(totals.values()),
+                "cells": len(members) * n_dec,
+                "empty": sum(1 for g in cells if g.count == 0),
+                "under": len(cells),
+                "weakest": sorted(totals.items(), key=lambda kv: (kv[1], kv[0]))[:3],
+            })
+        rows.sort(key=lambda r: (-r["under"] / max(r["cells"], 1), r["region"]))
+        return rows
+
+    # ---- artifact --------------------------------------------------------------------------
+
+    def to_compact(self) -> Dict[str, Any]:
+        """Axes, region/group member positions and the non-zero cells as flat quadruples."""
+        n_dec, n_cat = len(self.decades), len(self.categories)
+        cells: List[int] = []
+        for i, n in enumerate(self.counts):
+            if n:
+                ci, rest = divmod(i, n_dec * n_cat)
+                di, ki = divmod(rest, n_cat)
+                cells.extend((ci, di, ki, n))
+        pos = self.country_pos
+        return {
+            "format": _FORMAT,
+            "countries": self.countries,
+            "decades": self.decades,
+            "categories": self.categories,
+            "regions": {k: [pos[c] for c in v if c in pos] for k, v in self.regions.get("regions", {}).items()},
+            "groups": {k: [pos[c] for c in v if c in pos] for k, v in self.regions.get("groups", {}).items()},
+            "cells": cells,
+            "unmapped": sum(self.unmapped.values()),
+        }
+
+    @classmethod
+    def from_compact(cls, data: Dict[str, Any]) -> "CoverageCube":
+        countries, decades, categories = data["countries"], data["decades"], data["categories"]
+        cube = cls(countries, decades, categories, regions={
+            kind: {k: [countries[i] for i in v] for k, v in (data.get(kind) or {}).items()}
+            for kind in ("regions", "groups")
+        })
+        n_dec, n_cat = len(decades), len(categories)
+        cells = data.get("cells") or []
+        for j in range(0, len(cells), 4):
+            ci, di, ki, n = cells[j : j + 4]
+            cube.counts[(ci * n_dec + di) * n_cat + ki] = n
+        return cube
+
+
+def build_cube(events_path: Path = EVENTS_PATH, regions_path: Path = REGIONS_PATH) -> CoverageCube:
+    store = EventStore.load(events_path)
+    countries = CountryIndex.load()
+    return CoverageCube.build(store.events, countries, list(store.categories), load_regions(regions_path, countries))
+
+
+def check_regions(cube: CoverageCube) -> List[str]:
+    """Problems with regions.json: unplaced countries, countries in two regions, unknown names."""
+    problems = []
+    seen: Dict[str, str] = {}
+    for kind in ("regions", "groups"):
+        for name, members in cube.regions.get(kind, {}).items():
+            for c in members:
+                if c not in cube.country_pos:
+                    problems.append(f"{kind}.{name}: unknown country {c!r}")
+                elif kind == "regions":
+                    if c in seen:
+                        problems.append(f"{c} is in both {seen[c]} and {name}")
+                    seen.setdefault(c, name)
+    if cube.regions.get("regions"):
+        missing = [c for c in cube.countries if c not in seen]
+        if missing:
+            problems.append(f"not in any region: {', '.join(missing)}")
+    return problems
+
+
+def _print_gaps(gaps: List[Gap], limit: int) -> None:
+    shown = gaps[:limit] if limit else gaps
+    for g in shown:
+        cat = f" {g.category}" if g.category else ""
+        print(f"  {g.country:<32} {g.decade}{cat:<12} {g.count}")
+    if len(shown) < len(gaps):
+        print(f"  ... {len(gaps) - len(shown)} more (--limit 0 for all)")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Country × decade × category coverage of events.json")
+    ap.add_argument("--events", default=str(EVENTS_PATH))
+    ap.add_argument("--regions", default=str(REGIONS_PATH))
+    ap.add_argument("--region", action="append", default=[], help="region or group from regions.json (repeatable)")
+    ap.add_argument("--country", action="append", default=[], help="country name (repeatable)")
+    ap.add_argument("--category", action="append", default=[], help="only these categories (repeatable)")
+    ap.add_argument("--from", dest="start", default=DEFAULT_FROM, help=f"first decade, e.g. 1950s or 1950 (default {DEFAULT_FROM})")
+    ap.add_argument("--to", dest="end", default=None, help="last decade (default: latest)")
+    ap.add_argument("--min", type=int, default=DEFAULT_MIN, help=f"under-covered below this many events (default {DEFAULT_MIN})")
+    ap.add_argument("--per-category", action="store_true", help="report country × decade × category cells")
+    ap.add_argument("--totals", action="store_true", help="compare per-country totals over the decade range instead of cells")
+    ap.add_argument("--limit", type=int, default=50, help="max gap rows to print (0 = all)")
+    ap.add_argument("--json", default=None, help=f"write the compact cube ('-' for stdout), e.g. {DEFAULT_OUTPUT.relative_to(BASE_DIR)}")
+    ap.add_argument("--quiet", action="store_true", help="no report (with --json)")
+    args = ap.parse_args()
+
+    cube = build_cube(Path(args.events), Path(args.regions))
+    countries = CountryIndex.load()
+
+    if args.json:
+        compact = cube.to_compact()
+        body = json.dumps(compact, ensure_ascii=False, separators=(",", ":"))
+        if args.json == "-":
+            print(body)
+            return
+        out = Path(args.json)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        tmp = out.with_suffix(out.suffix + ".tmp")
+        tmp.write_text(body + "\n", encoding="utf-8")
+        tmp.replace(out)
+        if not args.quiet:
+            print(f"Wrote {out} ({len(compact['cells']) // 4} non-empty cells)")
+    if args.quiet:
+        return
+
+    for problem in check_regions(cube):
+        print(f"WARNING: regions.json: {problem}")
+    if cube.unmapped:
+        print(f"WARNING: {sum(cube.unmapped.values())} events with unknown countries: "
+              + ", ".join(f"{k or '<empty>'} ({n})" for k, n in cube.unmapped.most_common(5)))
+
+    try:
+        decades = cube.decade_range(args.start, args.end)
+    except KeyError as e:
+        sys.exit(f"ERROR: {e.args[0]} (known: {', '.join(cube.decades)})")
+    categories = args.category or None
+    selected: Optional[List[str]] = None
+    try:
+        for name in args.region:
+            selected = (selected or []) + cube.members(name)
+    except KeyError as e:
+        sys.exit(f"ERROR: {e.args[0]} (known: {', '.join([*cube.regions['regions'], *cube.regions['groups']])})")
+    for name in args.country:
+        selected = (selected or []) + [countries.canonical(name, name)]
+    if selected is not None:
+        selected = list(dict.fromkeys(selected))
+
+    span = f"{decades[0]}-{decades[-1]}" if decades else "-"
+    cats = ", ".join(categories) if categories else "all categories"
+
+    if args.totals:
+        totals = cube.country_totals(selected, decades, categories)
+        low = sorted(((n, c) for c, n in totals.items() if n < args.min))
+        print(f"Countries with < {args.min} events ({span}, {cats}): {len(low)}/{len(totals)}")
+        for n, c in low[: args.limit or None]:
+            print(f"  {c:<32} {n}")
+        return
+
+    if selected is None and not args.per_category:
+        print(f"Coverage {span}, {cats}: country × decade cells with < {args.min} events")
+        print(f"  {'region':<28} {'countries':>9} {'events':>7} {'empty':>7} {'under':>7}   weakest")
+        for row in cube.region_summary(args.min, decades, categories):
+            weakest = ", ".join(f"{c} ({n})" for c, n in row["weakest"])
+            print(f"  {row['region']:<28} {row['countries']:>9} {row['events']:>7} "
+                  f"{row['empty']:>7} {row['under']:>4}/{row['cells']:<4} {weakest}")
+        return
+
+    gaps = cube.gaps(args.min, selected, decades, categories, per_category=args.per_category)
+    what = "country × decade × category" if args.per_category else "country × decade"
+    print(f"{len(gaps)} {what} cells with < {args.min} events ({span}, {cats}):")
+    _print_gaps(gaps, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,18 @@
 
 import csv
-import json
+from pathlib import Path
 
-CSV_PATH = '/Users/gurursonmez/Documents/Harita/data/gap_filler_africa_supplement.csv'
-EVENTS_PATH = '/Users/gurursonmez/Documents/Harita/data/events.json'
+from event_store import EventStore
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+CSV_PATH = BASE_DIR / "data" / "gap_filler_africa_supplement.csv"
+EVENTS_PATH = BASE_DIR / "data" / "events.json"
 
 def debug_merge():
-    with open(EVENTS_PATH, 'r') as f:
-        data = json.load(f)
+    store = EventStore.load(EVENTS_PATH)
     
     existing_events = []
-    for ev in data['events']:
+    for ev in store:
         existing_events.append((ev.get('country_name'), ev.get('year'), ev.get('title')))
     
     print(f"Loaded {len(existing_events)} existing events.")
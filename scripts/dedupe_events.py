@@ -15,13 +15,14 @@ When duplicates are found, keep a single "best" record and merge some fields:
 
 from __future__ import annotations
 
-import json
 import re
 import sys
 import unicodedata
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from event_store import EventStore
+
 
 def _norm_title(s: str) -> str:
     if not s:
@@ -90,11 +91,9 @@ def main() -> int:
         print(f"ERROR: not found: {events_path}", file=sys.stderr)
         return 2
 
-    data = json.loads(events_path.read_text(encoding="utf-8"))
-    events = data.get("events", [])
-    if not isinstance(events, list):
-        print("ERROR: data.events is not a list", file=sys.stderr)
-        return 2
+    store = EventStore.load(events_path)
+    data = store.data
+    events = store.events
 
     buckets: Dict[Tuple[str, int, str], List[int]] = {}
     for i, ev in enumerate(events):
@@ -136,7 +135,7 @@ def main() -> int:
 
     if removed:
         data["events"] = [ev for i, ev in enumerate(events) if keep_mask[i]]
-        events_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        store.save()
 
     print(f"dedupe: groups_merged={merged_groups} removed={removed} remaining={len(data.get('events', []))}")
     return 0
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Compact per-country disaster aggregates (from country_metadata.json `felaketler` lists).
+
+Why:
+- The raw `felaketler` arrays are ~560KB of the 1.2MB metadata and used to be embedded in full
+  into the map page for every visitor.
+- The page now carries only `felaket_ozet` (totals, per-decade and per-type tables, top-N
+  entries); the full list per country is written to `disasters/<file>.json` next to the page
+  and fetched only when the user expands it.
+
+Used by `process_disasters.py` (stores the summary in the metadata) and `geopolitical_map.py`
+(strips the raw lists from the page payload and writes the lazy per-country files).
+"""
+
+from __future__ import annotations
+
+import json
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from text_matcher import fold_ascii
+
+
+SUMMARY_KEY = "felaket_ozet"
+LIST_KEY = "felaketler"
+DISASTER_DIR_NAME = "disasters"
+TOP_N = 5
+
+
+def decade_of(year: Any) -> str:
+    try:
+        return f"{int(year) // 10 * 10}s"
+    except (TypeError, ValueError):
+        return ""
+
+
+def _num(value: Any) -> float:
+    return value if isinstance(value, (int, float)) else 0
+
+
+def _row_totals(rows: List[dict]) -> Tuple[int, int, float]:
+    return (
+        len(rows),
+        int(sum(_num(d.get("deaths")) for d in rows)),
+        round(sum(_num(d.get("damage_usd_millions")) for d in rows), 1),
+    )
+
+
+def summarize(felaketler: List[dict], top_n: int = TOP_N) -> Dict[str, Any]:
+    """Totals plus [label, count, deaths, damage_usd_millions] rows per decade and per type."""
+    by_decade: Dict[str, List[dict]] = {}
+    by_type: Dict[str, List[dict]] = {}
+    for d in felaketler:
+        by_decade.setdefault(decade_of(d.get("year")), []).append(d)
+        by_type.setdefault(d.get("type") or "", []).append(d)
+
+    count, deaths, damage = _row_totals(felaketler)
+    top = sorted(
+        felaketler,
+        key=lambda d: (-_num(d.get("deaths")), -_num(d.get("damage_usd_millions")), _num(d.get("year"))),
+    )[:top_n]
+    return {
+        "count": count,
+        "deaths": deaths,
+        "affected": int(sum(_num(d.get("affected")) for d in felaketler)),
+        "damage_usd_millions": damage,
+        "by_decade": [[k, *_row_totals(v)] for k, v in sorted(by_decade.items()) if k],
+        "by_type": sorted(
+            ([k, *_row_totals(v)] for k, v in by_type.items() if k),
+            key=lambda row: (-row[1], -row[2], row[0]),
+        ),
+        "top": [
+            [d.get("year"), d.get("type") or "", d.get("name") or "", d.get("deaths") or 0, d.get("damage_usd_millions") or 0]
+            for d in top
+        ],
+    }
+
+
+def attach_summaries(metadata: Dict[str, dict], top_n: int = TOP_N) -> int:
+    """Store SUMMARY_KEY next to every non-empty LIST_KEY (drop stale ones); returns count."""
+    n = 0
+    for entry in metadata.values():
+        if not isinstance(entry, dict):
+            continue
+        rows = entry.get(LIST_KEY) or []
+        if rows:
+            entry[SUMMARY_KEY] = summarize(rows, top_n)
+            n += 1
+        else:
+            entry.pop(SUMMARY_KEY, None)
+    return n
+
+
+def country_file_name(key: str) -> str:
+    """ASCII file name per metadata key; the crc suffix keeps 'Turkiye' and 'Türkiye' apart."""
+    slug = fold_ascii(key).replace(" ", "-") or "country"
+    return f"{slug}-{zlib.crc32(key.encode('utf-8')):08x}.json"
+
+
+def split_metadata(metadata: Dict[str, dict], top_n: int = TOP_N) -> Tuple[Dict[str, dict], Dict[str, List[dict]]]:
+    """Page payload without raw lists (summary + lazy file path instead), and file name -> full list."""
+    compact: Dict[str, dict] = {}
+    files: Dict[str, List[dict]] = {}
+    for key, entry in metadata.items():
+        if not isinstance(entry, dict):
+            compact[key] = entry
+            continue
+        rows = entry.get(LIST_KEY) or []
+        slim = {k: v for k, v in entry.items() if k not in (LIST_KEY, SUMMARY_KEY)}
+        if rows:
+            name = country_file_name(key)
+            files[name] = rows
+            summary = dict(entry.get(SUMMARY_KEY) or summarize(rows, top_n))
+            summary["file"] = f"{DISASTER_DIR_NAME}/{name}"
+            slim[SUMMARY_KEY] = summary
+        compact[key] = slim
+    return compact, files
+
+
+def write_country_files(files: Dict[str, List[dict]], out_dir: Path) -> None:
+    """One compact JSON list per country; stale files from earlier builds are removed."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for old in out_dir.glob("*.json*"):
+        if old.name.split(".json")[0] + ".json" not in files:
+            old.unlink()
+    for name, rows in files.items():
+        text = json.dumps(rows, ensure_ascii=False, separators=(",", ":"))
+        path = out_dir / name
+        if not path.exists() or path.read_text(encoding="utf-8") != text:
+            path.write_text(text, encoding="utf-8")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite mirror of data/events.json for indexed curation queries.
+
+Why:
+- Curation questions ("culture events without links in the 1980s", "everything mentioning
+  'darbe' in Chile") were answered with ad-hoc loops over the full events list.
+- The mirror has B-tree indexes on id, country, year, category and wikipedia_url plus an FTS5
+  index over title/description, so such queries stay in the millisecond range as the dataset grows.
+
+events.json stays the source of truth: the mirror is rebuilt when the JSON's sha256 changes,
+and `export` writes a byte-identical events.json back (each event's full JSON is kept in `doc`,
+top-level keys other than `events` in `meta`).
+
+Usage:
+  python scripts/event_db.py build
+  python scripts/event_db.py query --category culture --decade 1980s --no-link
+  python scripts/event_db.py search "darbe" --country Şili
+  python scripts/event_db.py sql "SELECT category, COUNT(*) FROM events GROUP BY 1"
+  python scripts/event_db.py export -o /tmp/events.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from event_store import BASE_DIR, EVENTS_PATH, EventStore
+
+
+DEFAULT_DB_PATH = BASE_DIR / ".cache" / "events.sqlite"
+_SCHEMA_VERSION = "1"
+
+# Scalar columns mirrored from each event (everything else stays in `doc`).
+COLUMNS: Sequence[Tuple[str, str]] = (
+    ("id", "TEXT"),
+    ("country_name", "TEXT"),
+    ("country_code", "TEXT"),
+    ("year", "INTEGER"),
+    ("decade", "TEXT"),
+    ("category", "TEXT"),
+    ("title", "TEXT"),
+    ("description", "TEXT"),
+    ("wikipedia_url", "TEXT"),
+    ("youtube_video_id", "TEXT"),
+    ("lat", "REAL"),
+    ("lon", "REAL"),
+    ("casualties", "INTEGER"),
+)
+INDEXED = ("id", "country_name", "year", "category", "wikipedia_url")
+
+
+def fts_query(text: str) -> str:
+    """User text as an FTS5 query: every whitespace-separated token quoted as a string, ANDed.
+
+    Raw input is not valid FTS5 syntax in general ("Savaş-", "23-F" and "Duvarı'nın" are
+    syntax errors or column filters); a quoted token is matched as a phrase of its own tokens.
+    """
+    return " ".join('"' + token.replace('"', '""') + '"' for token in text.split())
+
+
+def _fts5_available(conn: sqlite3.Connection) -> bool:
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp._fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp._fts5_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+class EventDB:
+    def __init__(self, path: Path = DEFAULT_DB_PATH) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.row_factory = sqlite3.Row
+        self.has_fts = _fts5_available(self.conn)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    # ---- build / sync ------------------------------------------------------------------------
+
+    def _meta(self, key: str) -> Optional[str]:
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def is_current(self, store: EventStore) -> bool:
+        return self._meta("schema") == _SCHEMA_VERSION and self._meta("source_sha256") == store.content_hash
+
+    def sync(self, store: EventStore, force: bool = False) -> bool:
+        """Rebuild the mirror from store unless it already matches; returns True if rebuilt."""
+        if not force and self.is_current(store):
+            return False
+        cols = ", ".join(f"{name} {typ}" for name, typ in COLUMNS)
+        c = self.conn
+        with c:
+            c.executescript(
+                f"""
+                DROP TABLE IF EXISTS events_fts;
+                DROP TABLE IF EXISTS events;
+                DROP TABLE IF EXISTS meta;
+                CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+                CREATE TABLE events (pos INTEGER PRIMARY KEY, {cols}, doc TEXT NOT NULL);
+                """
+            )
+            names = [name for name, _ in COLUMNS]
+            placeholders = ", ".join("?" for _ in range(len(names) + 2))
+            c.executemany(
+                f"INSERT INTO events (pos, {', '.join(names)}, doc) VALUES ({placeholders})",
+                (
+                    (pos, *[self._scalar(ev.get(n)) for n in names], json.dumps(ev, ensure_ascii=False))
+                    for pos, ev in enumerate(store.events)
+                ),
+            )
+            for name in INDEXED:
+                c.execute(f"CREATE INDEX idx_events_{name} ON events({name})")
+            c.execute("CREATE INDEX idx_events_country_year ON events(country_name, year)")
+            if self.has_fts:
+                c.execute(
+                    "CREATE VIRTUAL TABLE events_fts USING fts5("
+                    "title, description, content='events', content_rowid='pos', tokenize='unicode61 remove_diacritics 2')"
+                )
+                c.execute("INSERT INTO events_fts(rowid, title, description) SELECT pos, title, description FROM events")
+            top_level = {k: v for k, v in store.data.items() if k != "events"}
+            c.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [
+                    ("schema", _SCHEMA_VERSION),
+                    ("source_sha256", store.content_hash),
+                    ("top_level", json.dumps(top_level, ensure_ascii=False)),
+                    ("key_order", json.dumps(list(store.data.keys()), ensure_ascii=False)),
+                ],
+            )
+        return True
+
+    @staticmethod
+    def _scalar(value: Any) -> Any:
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        return json.dumps(value, ensure_ascii=False)
+
+    # ---- queries -----------------------------------------------------------------------------
+
+    def events(self, where: str = "1", params: Iterable[Any] = (), order: str = "pos") -> List[Dict[str, Any]]:
+        """Full event dicts for a SQL WHERE clause over the mirrored columns."""
+        rows = self.conn.execute(f"SELECT doc FROM events WHERE {where} ORDER BY {order}", tuple(params))
+        return [json.loads(r[0]) for r in rows]
+
+    def query(
+        self,
+        country: str = "",
+        category: str = "",
+        decade: str = "",
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None,
+        no_link: bool = False,
+    ) -> List[Dict[str, Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        for column, value in (("country_name", country), ("category", category), ("decade", decade)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if year_from is not None:
+            clauses.append("year >= ?")
+            params.append(year_from)
+        if year_to is not None:
+            clauses.append("year <= ?")
+            params.append(year_to)
+        if no_link:
+            clauses.append("(wikipedia_url IS NULL OR wikipedia_url = '')")
+        return self.events(" AND ".join(clauses) or "1", params)
+
+    def search(self, text: str, country: str = "", limit: int = 50) -> List[Dict[str, Any]]:
+        """Full-text search over title/description (FTS5 ranking; LIKE fallback without FTS5)."""
+        if not text.split():
+            return []
+        extra, params = ("", [])
+        if country:
+            extra, params = (" AND e.country_name = ?", [country])
+        if self.has_fts:
+            sql = (
+                "SELECT e.doc FROM events_fts f JOIN events e ON e.pos = f.rowid "
+                f"WHERE events_fts MATCH ?{extra} ORDER BY f.rank LIMIT ?"
+            )
+            rows = self.conn.execute(sql, (fts_query(text), *params, limit))
+        else:
+            like = f"%{text}%"
+            sql = f"SELECT e.doc FROM events e WHERE (e.title LIKE ? OR e.description LIKE ?){extra} ORDER BY e.pos LIMIT ?"
+            rows = self.conn.execute(sql, (like, like, *params, limit))
+        return [json.loads(r[0]) for r in rows]
+
+    # ---- export ------------------------------------------------------------------------------
+
+    def to_data(self) -> Dict[str, Any]:
+        top_level = json.loads(self._meta("top_level") or "{}")
+        key_order = json.loads(self._meta("key_order") or '["categories", "events"]')
+        events = [json.loads(r[0]) for r in self.conn.execute("SELECT doc FROM events ORDER BY pos")]
+        data: Dict[str, Any] = {}
+        for key in key_order:
+            data[key] = events if key == "events" else top_level.get(key)
+        data.setdefault("events", events)
+        return data
+
+    def export(self, path: Path) -> None:
+        EventStore(self.to_data(), path).save(path, use_cache=False)
+
+
+def open_synced(events_path: Path = EVENTS_PATH, db_path: Path = DEFAULT_DB_PATH) -> EventDB:
+    """EventDB mirroring events_path, rebuilt first if the JSON changed."""
+    db = EventDB(db_path)
+    db.sync(EventStore.load(events_path))
+    return db
+
+
+def _print_events(events: List[Dict[str, Any]], limit: int) -> None:
+    for ev in events[:limit]:
+        print(f"- {ev.get('country_name')} {ev.get('year')} [{ev.get('category')}] {ev.get('title')} (id={ev.get('id')})")
+    if len(events) > limit:
+        print(f"... {len(events) - limit} more")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="SQLite mirror of events.json")
+    ap.add_argument("--events", default=str(EVENTS_PATH), help="Path to events.json")
+    ap.add_argument("--db", default=str(DEFAULT_DB_PATH), help="SQLite mirror path")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    b = sub.add_parser("build", help="(Re)build the mirror if events.json changed")
+    b.add_argument("--force", action="store_true")
+
+    q = sub.add_parser("query", help="Filter by indexed columns")
+    q.add_argument("--country", default="")
+    q.add_argument("--category", default="")
+    q.add_argument("--decade", default="")
+    q.add_argument("--year-from", type=int)
+    q.add_argument("--year-to", type=int)
+    q.add_argument("--no-link", action="store_true", help="Only events without wikipedia_url")
+    q.add_argument("--limit", type=int, default=50)
+
+    s = sub.add_parser("search", help="Full-text search over title/description")
+    s.add_argument("text")
+    s.add_argument("--country", default="")
+    s.add_argument("--limit", type=int, default=50)
+
+    r = sub.add_parser("sql", help="Run a read-only SQL statement")
+    r.add_argument("statement")
+
+    e = sub.add_parser("export", help="Write events.json back from the mirror")
+    e.add_argument("-o", "--output", required=True)
+
+    args = ap.parse_args()
+
+    db = EventDB(Path(args.db))
+    t0 = time.perf_counter()
+    rebuilt = db.sync(EventStore.load(Path(args.events)), force=getattr(args, "force", False))
+    if rebuilt:
+        print(f"mirror rebuilt in {(time.perf_counter() - t0) * 1000:.0f}ms (fts5={'yes' if db.has_fts else 'no'}): {db.path}")
+
+    t0 = time.perf_counter()
+    if args.cmd == "query":
+        found = db.query(args.country, args.category, args.decade, args.year_from, args.year_to, args.no_link)
+        print(f"{len(found)} events ({(time.perf_counter() - t0) * 1000:.1f}ms)")
+        _print_events(found, args.limit)
+    elif args.cmd == "search":
+        found = db.search(args.text, args.country, args.limit)
+        print(f"{len(found)} events ({(time.perf_counter() - t0) * 1000:.1f}ms)")
+        _print_events(found, args.limit)
+    elif args.cmd == "sql":
+        db.conn.execute("PRAGMA query_only = ON")
+        for row in db.conn.execute(args.statement):
+            print(tuple(row))
+    elif args.cmd == "export":
+        db.export(Path(args.output))
+        print(f"wrote: {args.output}")
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
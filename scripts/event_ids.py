@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+One event id scheme for every script and the admin page.
+
+Why:
+- New ids were minted five different ways: merge_events.py scanned every id for the highest
+  numeric suffix, import_events_from_csv.py hashed (country, year, title) with md5, the add_*
+  scripts used random `uuid` fragments, merge_gap_fillers.py counted `ev_gap_<year>_<n>` up
+  from 0, and admin.js used the clock. Re-running a generator produced different ids, and
+  nothing noticed two events sharing one.
+
+How:
+- `content_id()` derives `<prefix><12 hex>` from (country, year, folded title) with 64-bit
+  FNV-1a; admin.js `contentEventId()` computes the same value, so the browser and the scripts
+  mint identical ids for the same event.
+- An id is derived once, when the event is created, and then never recomputed: renaming an event
+  keeps its id, so references (EVENT_VIDEO_RULES, VIDEO_MAPPINGS, the change journal) stay valid.
+- `unique_id()` suffixes `_2`, `_3`, ... when the derived id is already taken (a real hash
+  collision, or the same event content twice). `EventStore.add()` refuses an explicit id that is
+  already in use, and `EventStore.new_id()` mints ids against the store's id index.
+- Existing ids are kept as they are; `python3 scripts/event_store.py ids` reports them by scheme,
+  lists missing/duplicate ids and id references in scripts that no longer resolve, and `--fix`
+  assigns content ids only where an id is missing or shared.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Container, Dict, Iterable, List, Tuple
+
+from country_index import country_key
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = BASE_DIR / "scripts"
+
+ID_PREFIX = "ev_"
+
+_FNV_OFFSET = 0xCBF29CE484222325
+_FNV_PRIME = 0x100000001B3
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
+# Known id shapes, most specific first (only used for reporting).
+SCHEMES: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("content", re.compile(r"^ev_(?:[a-z]+_)?[0-9a-f]{12}(?:_\d+)?$")),
+    ("gap_sequence", re.compile(r"^ev_gap_\d{4}_\d+$")),
+    ("csv_md5", re.compile(r"^ev_csv_[0-9a-f]{10}$")),
+    ("sequence", re.compile(r"^ev\d+$")),
+    ("country_sequence", re.compile(r"^ev_[a-z]{2}\d+$")),
+    ("country_hash", re.compile(r"^ev_[a-z]{2}_[0-9a-f]+$")),
+    ("year_sequence", re.compile(r"^ev_\d{4}_\d+$")),
+    ("decade_sequence", re.compile(r"^ev_[a-z]{2}_\d{4}s_\d+$")),
+    ("random", re.compile(r"^(?:ev)?[0-9a-f]{8}$")),
+)
+
+# String literals in scripts that look like event ids ("ev123", "ev_gap_1989_1", "eve1b96912").
+_ID_LITERAL_RE = re.compile(r"""["'](ev(?:_[a-z0-9]+)+|ev[0-9a-f]*\d[0-9a-f]*)["']""")
+
+
+def fnv1a64(data: bytes) -> int:
+    h = _FNV_OFFSET
+    for b in data:
+        h = ((h ^ b) * _FNV_PRIME) & _MASK64
+    return h
+
+
+def content_id(country: Any, year: Any, title: Any, prefix: str = ID_PREFIX) -> str:
+    """`ev_` + 12 hex digits of FNV-1a 64 over "country\\x1fyear\\x1ffolded title" (see admin.js)."""
+    raw = f"{str(country or '').strip()}\x1f{str(year).strip()}\x1f{country_key(title)}"
+    return f"{prefix}{fnv1a64(raw.encode('utf-8')):016x}"[: len(prefix) + 12]
+
+
+def unique_id(base: str, taken: Container[str]) -> str:
+    """`base`, or `base_2`, `base_3`, ... whichever is not in `taken`."""
+    eid, n = base, 1
+    while eid in taken:
+        n += 1
+        eid = f"{base}_{n}"
+    return eid
+
+
+def event_content_id(ev: Dict[str, Any], taken: Container[str] = (), prefix: str = ID_PREFIX) -> str:
+    return unique_id(content_id(ev.get("country_name"), ev.get("year"), ev.get("title"), prefix), taken)
+
+
+def scheme_of(event_id: str) -> str:
+    for name, pattern in SCHEMES:
+        if pattern.match(event_id):
+            return name
+    return "other"
+
+
+def id_references(paths: Iterable[Path] = ()) -> Dict[str, List[str]]:
+    """Event-id-looking string literals per script (EVENT_VIDEO_RULES, VIDEO_MAPPINGS, ...)."""
+    refs: Dict[str, List[str]] = {}
+    for path in paths or sorted(SCRIPTS_DIR.glob("*.py")):
+        if path.name == Path(__file__).name:
+            continue
+        found = sorted(set(_ID_LITERAL_RE.findall(path.read_text(encoding="utf-8"))))
+        if found:
+            refs[path.name] = found
+    return refs
+
+
+def id_report(events: List[Dict[str, Any]], refs: Dict[str, List[str]]) -> Dict[str, Any]:
+    """Scheme counts, missing/duplicate ids and unresolved script references."""
+    counts = Counter(str(ev.get("id")) for ev in events if ev.get("id"))
+    known = set(counts)
+    return {
+        "events": len(events),
+        "schemes": dict(Counter(scheme_of(eid) for eid in counts.elements()).most_common()),
+        "missing": [i for i, ev in enumerate(events) if not ev.get("id")],
+        "duplicates": {eid: n for eid, n in sorted(counts.items()) if n > 1},
+        "references": {name: len(ids) for name, ids in refs.items()},
+        "unresolved": {name: [i for i in ids if i not in known] for name, ids in refs.items() if any(i not in known for i in ids)},
+    }
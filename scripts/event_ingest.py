@@ -0,0 +1,487 @@
+#!/usr/bin/env python3
+"""
+Streaming ingest of new events from CSV / JSONL sources into the dataset.
+
+Why:
+- New events came in through one-off scripts (merge_events.load_all_csv_events,
+  import_events_from_csv.py, merge_gap_fillers.py, the tuple lists in add_*_events.py), each with
+  its own column guessing, country/category maps and duplicate check (often a linear scan per row).
+
+How:
+- Rows are streamed from any number of sources (`.csv`, `.jsonl`; a `.json` list or
+  `{"events": [...]}` is read whole) and mapped to event fields through a `Schema` (first
+  non-empty source column wins).
+- Countries are canonicalized with `CountryIndex`, categories with the dataset's own keys/labels
+  plus `CATEGORY_ALIASES`.
+- Duplicates are found in one pass against a hashed `(country, year, folded title)` index that
+  covers the existing dataset and everything inserted so far:
+  - a new key is inserted
+  - a known key is merged (empty fields filled, key figures unioned; a meaningfully longer
+    description replaces a curated one only with `--update-descriptions`)
+  - a row that cannot be mapped is rejected with a reason
+- One save at the end (journaled, see event_journal.py).
+
+Usage:
+  python3 scripts/event_ingest.py data/gap_filler_*.csv
+  python3 scripts/event_ingest.py new.jsonl --map title=headline --default-category politics
+  python3 scripts/event_ingest.py big.csv --dry-run --rejects /tmp/rejects.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import math
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from country_index import CountryIndex
+from event_ids import ID_PREFIX
+from event_store import EVENTS_PATH, EventStore
+from text_matcher import fold_ascii
+
+
+# Event field -> source columns, in order of preference (covers every CSV layout under data/).
+DEFAULT_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "country_name": ("country_name", "country", "Country"),
+    "country_code": ("country_code", "iso2"),
+    "year": ("year", "Year", "year_start", "start_year"),
+    "title": ("title", "Title", "event", "Event", "event_title", "war_name"),
+    "description": ("description", "Description", "summary", "Summary", "description_tr", "summary_1_2_sentences"),
+    "category": ("category", "Category"),
+    "wikipedia_url": ("wikipedia_url", "wiki", "url"),
+    "youtube_video_id": ("youtube_video_id",),
+    "lat": ("lat", "latitude"),
+    "lon": ("lon", "lng", "longitude"),
+    "casualties": ("casualties",),
+    "key_figures": ("key_figures",),
+    "id": ("id",),
+}
+
+# Folded source category labels -> category keys (in addition to the dataset's keys and labels).
+CATEGORY_ALIASES: Dict[str, str] = {
+    "savas catisma": "war",
+    "savas": "war",
+    "soykirim": "genocide",
+    "devrim rejim degisikligi": "revolution",
+    "independence": "revolution",
+    "teror saldirisi": "terror",
+    "onemli lider": "leader",
+    "diplomasi": "diplomacy",
+    "baris diplomasi": "diplomacy",
+    "politika": "politics",
+    "ekonomi": "revolution",  # as merge_gap_fillers.py has always mapped "Ekonomi"
+    "protest": "politics",
+    "law": "politics",
+    "kultur toplum": "culture",
+    "kultur bilim": "culture",
+    "teknoloji": "culture",
+    "dogal afet": "culture",
+    "time 100": "time_100",
+}
+
+YEAR_RANGE = (1800, 2100)
+# With update_descriptions, an incoming description replaces the current one only when it is this much longer.
+LONGER_DESCRIPTION = 30
+
+
+class Schema(NamedTuple):
+    columns: Dict[str, Tuple[str, ...]]
+
+    def with_overrides(self, overrides: Sequence[str]) -> "Schema":
+        """`field=column` pairs put `column` first for `field`."""
+        columns = dict(self.columns)
+        for item in overrides:
+            field, _, column = item.partition("=")
+            if not field or not column:
+                raise ValueError(f"expected field=column, got {item!r}")
+            columns[field] = (column, *[c for c in columns.get(field, ()) if c != column])
+        return Schema(columns)
+
+    def plan(self, keys: Iterable[str]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Per field, only the candidate columns a source actually has (CSV rows share one plan)."""
+        present = set(keys)
+        return tuple(
+            (field, cols)
+            for field, cols in ((f, tuple(c for c in cands if c in present)) for f, cands in self.columns.items())
+            if cols
+        )
+
+    def apply(self, row: Dict[str, Any], plan: Optional[Tuple[Tuple[str, Tuple[str, ...]], ...]] = None) -> Dict[str, Any]:
+        out: Dict[str, Any] = {}
+        for field, candidates in plan if plan is not None else self.plan(row):
+            for column in candidates:
+                value = row.get(column)
+                if isinstance(value, str):
+                    value = value.strip()
+                if value not in (None, "", []):
+                    out[field] = value
+                    break
+        return out
+
+
+DEFAULT_SCHEMA = Schema(DEFAULT_COLUMNS)
+
+
+class Row(NamedTuple):
+    source: str
+    line: int
+    data: Dict[str, Any]
+
+
+class Reject(NamedTuple):
+    source: str
+    line: int
+    reason: str
+    row: Dict[str, Any]
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """Stream raw rows from a CSV / JSONL (or whole-file JSON) source."""
+    name = path.name
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        # utf-8-sig: some exports start with a BOM (it would end up in the first column name)
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            for i, row in enumerate(csv.DictReader(f), start=2):
+                yield Row(name, i, row)
+    elif suffix == ".jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for i, line in enumerate(f, start=1):
+                line = line.strip()
+                if line:
+                    try:
+                        yield Row(name, i, json.loads(line))
+                    except ValueError:
+                        yield Row(name, i, {"__error__": "invalid JSON line"})
+    elif suffix == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            doc = json.load(f)
+        items = doc.get("events", []) if isinstance(doc, dict) else doc
+        for i, item in enumerate(items):
+            yield Row(name, i, item)
+    else:
+        raise ValueError(f"unsupported source type: {path}")
+
+
+def title_key(title: str) -> str:
+    return fold_ascii(title)
+
+
+def _dedupe_key(country: str, year: int, title: str) -> bytes:
+    """8-byte hash of (country, year, folded title): compact index keys for large batches."""
+    raw = f"{country}\0{year}\0{title_key(title)}".encode("utf-8")
+    return hashlib.blake2b(raw, digest_size=8).digest()
+
+
+def _as_list(value: Any) -> List[str]:
+    if isinstance(value, list):
+        return [str(v).strip() for v in value if str(v).strip()]
+    if isinstance(value, str):
+        return [v.strip() for v in value.replace(";", ",").split(",") if v.strip()]
+    return []
+
+
+_YEAR_RE = re.compile(r"^\s*(\d{3,4})(?:\.0)?(?:\s*[-–]\s*\d{2,4})?\s*$")
+
+
+def _as_year(value: Any) -> Optional[int]:
+    """1991, "1991", "1991.0" and ranges like "1990–1991" (start year)."""
+    if isinstance(value, int):
+        return value
+    m = _YEAR_RE.match(str(value))
+    return int(m.group(1)) if m else None
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return value
+    try:
+        return float(str(value).replace(",", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+def _as_int(value: Any) -> Optional[int]:
+    """Counts such as casualties: "1,000" -> 1000 (the dataset stores them as ints)."""
+    number = _as_number(value)
+    return int(round(number)) if number is not None and math.isfinite(number) else None
+
+
+class Stats:
+    def __init__(self) -> None:
+        self.rows: Counter = Counter()
+        self.inserted: Counter = Counter()
+        self.merged: Counter = Counter()
+        self.duplicates: Counter = Counter()
+        self.rejected: Counter = Counter()
+        self.reasons: Counter = Counter()
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "rows": sum(self.rows.values()),
+            "inserted": sum(self.inserted.values()),
+            "merged": sum(self.merged.values()),
+            "duplicates": sum(self.duplicates.values()),
+            "rejected": sum(self.rejected.values()),
+        }
+
+
+class Ingest:
+    """Maps, canonicalizes and dedupes rows into `store` (call `store.save()` afterwards)."""
+
+    def __init__(
+        self,
+        store: EventStore,
+        schema: Schema = DEFAULT_SCHEMA,
+        countries: Optional[CountryIndex] = None,
+        default_category: Optional[str] = None,
+        allow_unknown_country: bool = False,
+        id_prefix: str = ID_PREFIX,
+        update_descriptions: bool = False,
+    ) -> None:
+        self.store = store
+        self.schema = schema
+        self.countries = countries or CountryIndex.load()
+        self.default_category = default_category
+        self.allow_unknown_country = allow_unknown_country
+        self.id_prefix = id_prefix
+        # Off by default: existing descriptions are curated, a merge only fills empty ones.
+        self.update_descriptions = update_descriptions
+        self.stats = Stats()
+        self.rejects: List[Reject] = []
+        # Sources repeat the same few country/category spellings and column layouts.
+        self._country_cache: Dict[str, Any] = {}
+        self._category_cache: Dict[str, Optional[str]] = {}
+        self._plans: Dict[Tuple[str, ...], Any] = {}
+
+        self.categories: Dict[str, str] = dict(CATEGORY_ALIASES)
+        for key, meta in store.categories.items():
+            self.categories[fold_ascii(key)] = key
+            if isinstance(meta, dict) and meta.get("label"):
+                self.categories.setdefault(fold_ascii(meta["label"]), key)
+
+        self.index: Dict[bytes, Dict[str, Any]] = {}
+        self.coords: Dict[str, Tuple[float, float]] = {}
+        for ev in store:
+            try:
+                self.index.setdefault(_dedupe_key(ev["country_name"].strip(), int(ev["year"]), ev["title"]), ev)
+            except (KeyError, TypeError, ValueError, AttributeError):
+                pass
+            lat, lon = ev.get("lat"), ev.get("lon")
+            if isinstance(lat, (int, float)) and isinstance(lon, (int, float)) and (lat or lon):
+                self.coords.setdefault((ev.get("country_name") or "").strip(), (lat, lon))
+
+    # ---- per row -----------------------------------------------------------------------------
+
+    def _reject(self, row: Row, reason: str) -> None:
+        self.stats.rejected[row.source] += 1
+        self.stats.reasons[reason] += 1
+        self.rejects.append(Reject(row.source, row.line, reason, row.data))
+
+    def _to_event(self, row: Row) -> Optional[Dict[str, Any]]:
+        if not isinstance(row.data, dict) or "__error__" in row.data:
+            self._reject(row, "unreadable row")
+            return None
+        layout = tuple(row.data)
+        plan = self._plans.get(layout)
+        if plan is None:
+            plan = self._plans[layout] = self.schema.plan(layout)
+        fields = self.schema.apply(row.data, plan)
+        raw_country, raw_year, title = fields.get("country_name"), fields.get("year"), fields.get("title")
+        if not raw_country or raw_year is None or not title:
+            self._reject(row, "missing country/year/title")
+            return None
+        year = _as_year(raw_year)
+        if year is None:
+            self._reject(row, "invalid year")
+            return None
+        if not YEAR_RANGE[0] <= year <= YEAR_RANGE[1]:
+            self._reject(row, "year out of range")
+            return None
+
+        raw_country = str(raw_country)
+        if raw_country not in self._country_cache:
+            self._country_cache[raw_country] = self.countries.resolve(raw_country)
+        country = self._country_cache[raw_country]
+        if country is None and not self.allow_unknown_country:
+            self._reject(row, "unknown country")
+            return None
+        raw_category = str(fields.get("category") or "")
+        if raw_category not in self._category_cache:
+            self._category_cache[raw_category] = self.categories.get(fold_ascii(raw_category))
+        category = self._category_cache[raw_category] or self.default_category
+        if not category:
+            self._reject(row, f"unknown category {raw_category!r}" if raw_category else "missing category")
+            return None
+
+        name = country.turkish if country else str(raw_country)
+        lat = _as_number(fields["lat"]) if "lat" in fields else None
+        lon = _as_number(fields["lon"]) if "lon" in fields else None
+        if lat is None or lon is None:
+            lat, lon = 0, 0
+        return {
+            "country_code": country.iso2 if country else str(fields.get("country_code") or "").upper(),
+            "country_name": name,
+            "lat": lat,
+            "lon": lon,
+            "decade": f"{(year // 10) * 10}s",
+            "year": year,
+            "category": category,
+            "title": str(title),
+            "description": str(fields.get("description") or ""),
+            "wikipedia_url": str(fields.get("wikipedia_url") or ""),
+            "casualties": _as_int(fields["casualties"]) if "casualties" in fields else None,
+            "key_figures": _as_list(fields.get("key_figures")),
+            **({"youtube_video_id": fields["youtube_video_id"]} if fields.get("youtube_video_id") else {}),
+            **({"id": str(fields["id"])} if fields.get("id") else {}),
+        }
+
+    def _merge(self, target: Dict[str, Any], incoming: Dict[str, Any]) -> bool:
+        changed = False
+        desc, cur = incoming.get("description") or "", (target.get("description") or "").strip()
+        if desc and (not cur or (self.update_descriptions and len(desc) > len(cur) + LONGER_DESCRIPTION)):
+            target["description"] = desc
+            changed = True
+        for field in ("wikipedia_url", "youtube_video_id"):
+            if incoming.get(field) and not target.get(field):
+                target[field] = incoming[field]
+                changed = True
+        if incoming.get("casualties") is not None and target.get("casualties") is None:
+            target["casualties"] = incoming["casualties"]
+            changed = True
+        if (incoming["lat"] or incoming["lon"]) and not (target.get("lat") or target.get("lon")):
+            target["lat"], target["lon"] = incoming["lat"], incoming["lon"]
+            changed = True
+        figures = list(target.get("key_figures") or [])
+        extra = [f for f in incoming.get("key_figures") or [] if f not in figures]
+        if extra:
+            target["key_figures"] = figures + extra
+            changed = True
+        return changed
+
+    def add_row(self, row: Row) -> None:
+        self.stats.rows[row.source] += 1
+        ev = self._to_event(row)
+        if ev is None:
+            return
+        key = _dedupe_key(ev["country_name"], ev["year"], ev["title"])
+        existing = self.index.get(key)
+        if existing is not None:
+            if self._merge(existing, ev):
+                self.stats.merged[row.source] += 1
+            else:
+                self.stats.duplicates[row.source] += 1
+            return
+        if not (ev["lat"] or ev["lon"]):
+            # No coordinates in the source: use the country's first known position.
+            ev["lat"], ev["lon"] = self.coords.get(ev["country_name"], (0, 0))
+        if not ev.get("id") or ev["id"] in self.store.by_id:
+            ev["id"] = self.store.new_id(ev, self.id_prefix)
+        self.index[key] = ev
+        if ev["lat"] or ev["lon"]:
+            self.coords.setdefault(ev["country_name"], (ev["lat"], ev["lon"]))
+        self.store.add(ev)
+        self.stats.inserted[row.source] += 1
+
+    def add_rows(self, rows: Iterable[Row]) -> None:
+        for row in rows:
+            self.add_row(row)
+
+    def add_sources(self, paths: Iterable[Path]) -> None:
+        for path in paths:
+            self.add_rows(read_rows(Path(path)))
+
+    def add_events(self, events: Iterable[Dict[str, Any]], source: str = "<generated>") -> None:
+        """Event dicts built in code (e.g. add_*_events.py tuple lists) go through the same path."""
+        self.add_rows(Row(source, i, ev) for i, ev in enumerate(events))
+
+    # ---- report ------------------------------------------------------------------------------
+
+    def report(self) -> Dict[str, Any]:
+        s = self.stats
+        sources = {
+            name: {
+                "rows": s.rows[name],
+                "inserted": s.inserted[name],
+                "merged": s.merged[name],
+                "duplicates": s.duplicates[name],
+                "rejected": s.rejected[name],
+            }
+            for name in s.rows
+        }
+        return {**s.summary(), "reject_reasons": dict(s.reasons.most_common()), "sources": sources}
+
+    def print_report(self, elapsed: float, max_sources: int = 30) -> None:
+        report = self.report()
+        width = max([len(n) for n in report["sources"]][:max_sources] + [6])
+        print(f"{'source':<{width}}  {'rows':>7} {'insert':>7} {'merge':>7} {'dup':>7} {'reject':>7}")
+        for i, (name, r) in enumerate(report["sources"].items()):
+            if i == max_sources:
+                print(f"... {len(report['sources']) - max_sources} more sources")
+                break
+            print(f"{name:<{width}}  {r['rows']:>7} {r['inserted']:>7} {r['merged']:>7} {r['duplicates']:>7} {r['rejected']:>7}")
+        rate = report["rows"] / elapsed if elapsed > 0 else 0
+        print(
+            f"total: {report['rows']} rows -> {report['inserted']} inserted, {report['merged']} merged, "
+            f"{report['duplicates']} duplicates, {report['rejected']} rejected ({elapsed:.2f}s, {rate:,.0f} rows/s)"
+        )
+        for reason, n in report["reject_reasons"].items():
+            print(f"- rejected {n}: {reason}")
+
+
+def ingest_events(store: EventStore, events: Iterable[Dict[str, Any]], source: str = "<generated>", **kwargs: Any) -> Ingest:
+    """Convenience for scripts that build event dicts: dedupe + canonicalize into `store`."""
+    ingest = Ingest(store, **kwargs)
+    ingest.add_events(events, source)
+    return ingest
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Ingest CSV/JSONL event sources into events.json")
+    ap.add_argument("sources", nargs="+", help="CSV / JSONL / JSON files")
+    ap.add_argument("--events", default=str(EVENTS_PATH), help="Path to events.json (or its shard directory)")
+    ap.add_argument("--map", action="append", default=[], metavar="FIELD=COLUMN", help="Prefer COLUMN for FIELD")
+    ap.add_argument("--default-category", help="Category for rows whose category is missing/unknown")
+    ap.add_argument("--allow-unknown-country", action="store_true", help="Keep countries not in country_mappings")
+    ap.add_argument(
+        "--update-descriptions",
+        action="store_true",
+        help=f"Replace an existing description with one >{LONGER_DESCRIPTION} chars longer (default: fill empty only)",
+    )
+    ap.add_argument("--rejects", help="Write rejected rows (with reason) as JSONL here")
+    ap.add_argument("--dry-run", action="store_true", help="Report only, do not write")
+    args = ap.parse_args()
+
+    t0 = time.perf_counter()
+    store = EventStore.load(Path(args.events))
+    ingest = Ingest(
+        store,
+        schema=DEFAULT_SCHEMA.with_overrides(args.map),
+        default_category=args.default_category,
+        allow_unknown_country=args.allow_unknown_country,
+        update_descriptions=args.update_descriptions,
+    )
+    ingest.add_sources(Path(p) for p in args.sources)
+    elapsed = time.perf_counter() - t0
+    ingest.print_report(elapsed)
+
+    if args.rejects:
+        with open(args.rejects, "w", encoding="utf-8") as f:
+            for r in ingest.rejects:
+                f.write(json.dumps(r._asdict(), ensure_ascii=False) + "\n")
+    summary = ingest.stats.summary()
+    if args.dry_run or not (summary["inserted"] or summary["merged"]):
+        print("No changes written." if not args.dry_run else "Dry run: nothing written.")
+        return
+    store.save()
+    print(f"Saved {len(store)} events.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Append-only change journal for events.json (per-event add/update/delete patches).
+
+Why:
+- `normalize_events.py` and `reclassify_culture_media.py` copied the whole 1.8MB events.json to a
+  new timestamped `.bak` on every run, so backups grew without bound and other tools kept none.
+- `EventStore.save()` now appends one JSON line per write to `data/events.journal.jsonl` with only
+  the events that changed (`before` and/or `after`), so a backup costs the size of the change.
+
+A revision records:
+- `ops`: `{"op": "add"|"update"|"delete", "key", "index", "before", "after"}`; `index` is the
+  position in the new list (add) or the old list (delete); `key` is the event id.
+- `top`: top-level keys other than `events` (e.g. `categories`) that changed, with before/after.
+- `order_before`: the old key order, only when surviving events were reordered.
+- `base` / `hash`: sha256 of the file before and after the write.
+
+Walking revisions backwards from the current file (`reconstruct`) rebuilds any earlier revision;
+`compact` squashes old revisions into one net patch so the journal stays bounded.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+def journal_path(events_path: Path) -> Path:
+    """data/events.json and data/events/ (shards) share data/events.journal.jsonl."""
+    return Path(events_path).with_suffix(JOURNAL_SUFFIX)
+
+
+def event_keys(events: List[Any]) -> List[str]:
+    """Stable key per event: its id, else the signature; repeats get an occurrence suffix."""
+    keys: List[str] = []
+    seen: Dict[str, int] = {}
+    for ev in events:
+        if isinstance(ev, dict) and ev.get("id"):
+            key = str(ev["id"])
+        elif isinstance(ev, dict):
+            key = "sig:" + json.dumps([ev.get("country_name"), ev.get("year"), ev.get("title")], ensure_ascii=False)
+        else:
+            key = "raw:" + json.dumps(ev, ensure_ascii=False)
+        n = seen.get(key, 0)
+        seen[key] = n + 1
+        keys.append(key if n == 0 else f"{key}~{n}")
+    return keys
+
+
+def diff(before: Dict[str, Any], after: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Patch turning `before` into `after`, or None when nothing changed."""
+    old_events = before.get("events") or []
+    new_events = after.get("events") or []
+    old_keys = event_keys(old_events)
+    new_keys = event_keys(new_events)
+    old_by_key = dict(zip(old_keys, old_events))
+    new_pos = {k: i for i, k in enumerate(new_keys)}
+
+    ops: List[Dict[str, Any]] = []
+    for i, key in enumerate(old_keys):
+        if key not in new_pos:
+            ops.append({"op": "delete", "key": key, "index": i, "before": old_events[i]})
+    for i, key in enumerate(new_keys):
+        old = old_by_key.get(key)
+        if key not in old_by_key:
+            ops.append({"op": "add", "key": key, "index": i, "after": new_events[i]})
+        elif old != new_events[i]:
+            ops.append({"op": "update", "key": key, "before": old, "after": new_events[i]})
+
+    top: Dict[str, Dict[str, Any]] = {}
+    for key in list(before.keys()) + [k for k in after.keys() if k not in before]:
+        if key != "events" and before.get(key) != after.get(key):
+            top[key] = {"before": before.get(key), "after": after.get(key)}
+    if list(before.keys()) != list(after.keys()):
+        top["__keys__"] = {"before": list(before.keys()), "after": list(after.keys())}
+
+    patch: Dict[str, Any] = {"ops": ops}
+    if top:
+        patch["top"] = top
+    survivors_old = [k for k in old_keys if k in new_pos]
+    survivors_new = [k for k in new_keys if k in old_by_key]
+    if survivors_old != survivors_new:
+        patch["order_before"] = old_keys
+    if not ops and not top and "order_before" not in patch:
+        return None
+    return patch
+
+
+def revert(data: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """The document as it was before `patch` was applied to it (data itself is not modified)."""
+    ops = patch.get("ops") or []
+    added = {op["key"] for op in ops if op["op"] == "add"}
+    restored = {op["key"]: op["before"] for op in ops if op["op"] == "update"}
+
+    events = data.get("events") or []
+    kept = [
+        (key, restored.get(key, ev))
+        for key, ev in zip(event_keys(events), events)
+        if key not in added
+    ]
+    for op in sorted((op for op in ops if op["op"] == "delete"), key=lambda op: op["index"]):
+        kept.insert(op["index"], (op["key"], op["before"]))
+    order = patch.get("order_before")
+    if order:
+        by_key = dict(kept)
+        kept = [(k, by_key[k]) for k in order if k in by_key]
+
+    top = patch.get("top") or {}
+    key_order = (top.get("__keys__") or {}).get("before") or list(data.keys())
+    out: Dict[str, Any] = {}
+    for key in key_order:
+        if key == "events":
+            out[key] = [ev for _, ev in kept]
+        elif key in top:
+            out[key] = top[key]["before"]
+        else:
+            out[key] = data.get(key)
+    return out
+
+
+class Journal:
+    """One JSON line per revision, appended after each successful write of the dataset."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    # A torn last line from an interrupted append is ignored.
+                    continue
+
+    def last(self) -> Optional[Dict[str, Any]]:
+        last = None
+        for last in self.entries():
+            pass
+        return last
+
+    def append(self, patch: Dict[str, Any], base: str, new_hash: str) -> Dict[str, Any]:
+        prev = self.last()
+        entry = {
+            "rev": (prev["rev"] + 1) if prev else 1,
+            "ts": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "tool": Path(sys.argv[0]).name if sys.argv and sys.argv[0] else "",
+            "base": base,
+            "hash": new_hash,
+            **patch,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+b") as f:
+            # Start on a fresh line if an interrupted append left a torn one behind.
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write((json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        return entry
+
+    def reconstruct(
+        self, current: Dict[str, Any], rev: int, content_hash: Optional[Callable[[Dict[str, Any]], str]] = None
+    ) -> Dict[str, Any]:
+        """Document as of revision `rev` (0 = before the first journaled write).
+
+        With `content_hash`, every step is checked against the recorded hashes, so edits made
+        outside the journal (hand edits, restored files) are reported instead of silently mixed in.
+        """
+        newer = [e for e in self.entries() if e["rev"] > rev]
+        for e in newer:
+            first, last = e.get("squashed") or (e["rev"], e["rev"])
+            if first <= rev < last:
+                raise ValueError(f"revisions {first}-{last} were compacted; restore {first - 1} or {last}")
+        data = current
+        for entry in reversed(newer):
+            if content_hash and content_hash(data) != entry["hash"]:
+                raise ValueError(f"journal rev {entry['rev']} does not match the data it should undo")
+            data = revert(data, entry)
+        return data
+
+    def compact(self, current: Dict[str, Any], keep: int) -> int:
+        """Squash all but the newest `keep` revisions into one net revision; returns revisions removed."""
+        entries = list(self.entries())
+        if len(entries) <= keep + 1:
+            return 0
+        old, recent = entries[: len(entries) - keep], entries[len(entries) - keep :]
+        after_old = current
+        for entry in reversed(recent):
+            after_old = revert(after_old, entry)
+        before_old = after_old
+        for entry in reversed(old):
+            before_old = revert(before_old, entry)
+
+        squashed = diff(before_old, after_old) or {"ops": []}
+        head = {
+            "rev": old[-1]["rev"],
+            "ts": old[-1]["ts"],
+            "tool": "compact",
+            "base": old[0]["base"],
+            "hash": old[-1]["hash"],
+            "squashed": [old[0]["rev"], old[-1]["rev"]],
+            **squashed,
+        }
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in [head, *recent]:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path)
+        return len(old) - 1
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+Declarative text rules (data/event_rules.json) compiled into one matcher.
+
+Why:
+- Keyword classification lived in code, once per script: reclassify_culture_media.py ran
+  uncompiled `re.search` calls per event, remove_contextless_events.py tokenized on its own and
+  enhance_events.py was a long per-country `if 'x' in title_lower` chain. Changing a rule meant
+  editing code, and nothing recorded which rule produced a change.
+
+How:
+- The rules file holds named rulesets (`media`, `wiki`, `contextless`, ...). A ruleset has a
+  `where` filter, the text it looks at (`title` or `text` = title + description), a keyword
+  `mode` (`word` or `substring`) and an ordered rule list; the first matching rule wins, as the
+  old if-chains did. A rule may have its own `where`, keywords (`any`: at least one, `all`:
+  every one, `none`: none of them), `fullmatch` patterns per field and named `predicates`,
+  and produces field values (`set`) and/or `tags`.
+- Keywords are compiled once for all rulesets and matched on `fold_ascii` text: word-mode
+  keywords by token lookup (multi-word ones as " kw " in " text "), substring-mode keywords by
+  one Aho–Corasick automaton (text_matcher.py). A title and a description are folded and
+  scanned at most once per mode per event regardless of the number of rules, and `where`
+  filters run first, so events no ruleset applies to are never scanned.
+- Results are `Match(ruleset, rule, set, tags)`; `apply_match()` returns what changed, and
+  `--audit` writes one JSON line per match (event id, rule id, old/new values).
+
+Usage:
+  python3 scripts/event_rules.py                      # counts per rule, nothing written
+  python3 scripts/event_rules.py --ruleset wiki --apply --audit /tmp/wiki_audit.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from event_store import EVENTS_PATH, EventStore
+from text_matcher import AhoCorasick, fold_ascii
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RULES_PATH = BASE_DIR / "data" / "event_rules.json"
+
+TEXT_FIELDS = ("title", "text")
+MODES = ("word", "substring")
+
+
+def word_count(s: Any) -> int:
+    return len(str(s or "").split())
+
+
+def _stub_description(ev: Dict[str, Any]) -> bool:
+    """Empty, a copy of the title, one word, or an ultra-short two-word stub."""
+    d = str(ev.get("description") or "").strip()
+    t = str(ev.get("title") or "").strip()
+    if not d or d == t or d == f"{t}.":
+        return True
+    n = word_count(d)
+    return n <= 1 or (n <= 2 and len(d) <= 18)
+
+
+# Conditions that are not expressible as keywords/patterns, referenced by name from the rules file.
+PREDICATES: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    "stub_description": _stub_description,
+}
+
+
+class Match(NamedTuple):
+    ruleset: str
+    rule: str
+    set: Dict[str, Any]
+    tags: Tuple[str, ...]
+
+
+class Where(NamedTuple):
+    """Field filters: value in list, listed fields empty, id not starting with a prefix."""
+
+    values: Tuple[Tuple[str, frozenset], ...]
+    empty: Tuple[str, ...]
+    not_id_prefix: Tuple[str, ...]
+
+    @classmethod
+    def parse(cls, spec: Optional[Dict[str, Any]]) -> "Where":
+        spec = dict(spec or {})
+        empty = tuple(spec.pop("empty", ()))
+        prefixes = tuple(spec.pop("not_id_prefix", ()))
+        values = tuple((field, frozenset(str(v) for v in allowed)) for field, allowed in spec.items())
+        return cls(values, empty, prefixes)
+
+    def test(self, ev: Dict[str, Any]) -> bool:
+        for field, allowed in self.values:
+            if str(ev.get(field) or "").strip() not in allowed:
+                return False
+        for field in self.empty:
+            value = ev.get(field)
+            if value and (not isinstance(value, str) or value.strip()):
+                return False
+        if self.not_id_prefix and str(ev.get("id") or "").startswith(self.not_id_prefix):
+            return False
+        return True
+
+
+class Rule(NamedTuple):
+    id: str
+    where: Where
+    any_ids: frozenset
+    all_ids: frozenset
+    none_ids: frozenset
+    fullmatch: Tuple[Tuple[str, "re.Pattern[str]"], ...]
+    predicates: Tuple[Callable[[Dict[str, Any]], bool], ...]
+    set: Dict[str, Any]
+    tags: Tuple[str, ...]
+
+
+class RuleSet(NamedTuple):
+    name: str
+    field: str
+    mode: str
+    where: Where
+    rules: Tuple[Rule, ...]
+
+
+class RuleEngine:
+    """All rulesets of one rules file behind one keyword index per mode."""
+
+    _LOADED: Dict[Tuple[str, float], "RuleEngine"] = {}
+
+    def __init__(self, spec: Dict[str, Any], source: str = "<rules>") -> None:
+        self.source = source
+        self.rulesets: Dict[str, RuleSet] = {}
+        ids_by_key: Dict[Tuple[str, str], int] = {}
+        # word mode: one-token keywords by token, multi-token ones as " kw " substrings;
+        # substring mode: one Aho-Corasick automaton.
+        self._word_tokens: Dict[str, int] = {}
+        self._word_phrases: List[Tuple[str, int]] = []
+        substrings: List[str] = []
+        self._substring_ids: List[int] = []  # automaton pattern position -> keyword id
+
+        def ids(words: Sequence[str], mode: str) -> frozenset:
+            out = set()
+            for w in words:
+                key = fold_ascii(w)
+                if not key:
+                    continue
+                pid = ids_by_key.get((mode, key))
+                if pid is None:
+                    pid = ids_by_key[(mode, key)] = len(ids_by_key)
+                    if mode == "substring":
+                        substrings.append(key)
+                        self._substring_ids.append(pid)
+                    elif " " in key:
+                        self._word_phrases.append((f" {key} ", pid))
+                    else:
+                        self._word_tokens[key] = pid
+                out.add(pid)
+            return frozenset(out)
+
+        seen_ids = set()
+        for name, rs in (spec.get("rulesets") or {}).items():
+            field = rs.get("field", "text")
+            mode = rs.get("mode", "substring")
+            if field not in TEXT_FIELDS or mode not in MODES:
+                raise ValueError(f"{source}: ruleset {name!r}: field must be one of {TEXT_FIELDS}, mode one of {MODES}")
+            rules = []
+            for r in rs.get("rules") or []:
+                rid = r.get("id") or ""
+                if not rid or rid in seen_ids:
+                    raise ValueError(f"{source}: ruleset {name!r}: missing or duplicate rule id {rid!r}")
+                seen_ids.add(rid)
+                unknown = [p for p in r.get("predicates") or [] if p not in PREDICATES]
+                if unknown:
+                    raise ValueError(f"{source}: rule {rid!r}: unknown predicates {unknown}")
+                rules.append(
+                    Rule(
+                        rid,
+                        Where.parse(r.get("where")),
+                        ids(r.get("any") or (), mode),
+                        ids(r.get("all") or (), mode),
+                        ids(r.get("none") or (), mode),
+                        tuple((f, re.compile(p)) for f, p in (r.get("fullmatch") or {}).items()),
+                        tuple(PREDICATES[p] for p in r.get("predicates") or ()),
+                        dict(r.get("set") or {}),
+                        tuple(r.get("tags") or ()),
+                    )
+                )
+            self.rulesets[name] = RuleSet(name, field, mode, Where.parse(rs.get("where")), tuple(rules))
+        self._matcher = AhoCorasick(substrings, normalize=lambda s: s)
+
+    @classmethod
+    def load(cls, path: Path = RULES_PATH) -> "RuleEngine":
+        """Engine for `path`, reused while the file is unchanged."""
+        path = Path(path)
+        cache_key = (str(path), path.stat().st_mtime)
+        engine = cls._LOADED.get(cache_key)
+        if engine is None:
+            with open(path, "r", encoding="utf-8") as f:
+                engine = cls._LOADED[cache_key] = cls(json.load(f), path.name)
+        return engine
+
+    def _hits(self, text: str, mode: str) -> frozenset:
+        """Keyword ids found in already-folded `text`."""
+        if not text:
+            return frozenset()
+        if mode == "substring":
+            ids = self._substring_ids
+            return frozenset(ids[i] for i in self._matcher.matched_ids(text))
+        tokens = self._word_tokens
+        found = {tokens[t] for t in text.split(" ") if t in tokens}
+        if self._word_phrases:
+            padded = f" {text} "
+            found.update(pid for phrase, pid in self._word_phrases if phrase in padded)
+        return frozenset(found)
+
+    @staticmethod
+    def _rule_matches(rule: Rule, ev: Dict[str, Any], hits: frozenset) -> bool:
+        if rule.any_ids and not rule.any_ids & hits:
+            return False
+        if not rule.all_ids <= hits or rule.none_ids & hits:
+            return False
+        if not rule.where.test(ev):
+            return False
+        for field, pattern in rule.fullmatch:
+            if not pattern.fullmatch(str(ev.get(field) or "").strip()):
+                return False
+        return all(pred(ev) for pred in rule.predicates)
+
+    def classify(self, ev: Dict[str, Any], rulesets: Optional[Iterable[str]] = None) -> List[Match]:
+        """First matching rule of every applicable ruleset (in file order)."""
+        names = self.rulesets if rulesets is None else rulesets
+        active = [rs for rs in (self.rulesets[n] for n in names) if rs.where.test(ev)]
+        if not active:
+            return []
+        folded: Dict[str, str] = {}
+        cache: Dict[Tuple[str, str], frozenset] = {}
+
+        def hits(part: str, mode: str) -> frozenset:
+            found = cache.get((part, mode))
+            if found is None:
+                if part not in folded:
+                    folded[part] = fold_ascii(str(ev.get(part) or ""))
+                found = cache[(part, mode)] = self._hits(folded[part], mode)
+            return found
+
+        out: List[Match] = []
+        for rs in active:
+            found = hits("title", rs.mode)
+            if rs.field == "text":
+                found = found | hits("description", rs.mode)
+            for rule in rs.rules:
+                if self._rule_matches(rule, ev, found):
+                    out.append(Match(rs.name, rule.id, rule.set, rule.tags))
+                    break
+        return out
+
+    def match(self, ev: Dict[str, Any], ruleset: str) -> Optional[Match]:
+        found = self.classify(ev, (ruleset,))
+        return found[0] if found else None
+
+    def classify_all(self, events: Iterable[Any], rulesets: Optional[Sequence[str]] = None) -> Iterator[Tuple[int, Match]]:
+        """(position, match) for every event in one pass."""
+        if rulesets is not None:
+            unknown = [n for n in rulesets if n not in self.rulesets]
+            if unknown:
+                raise KeyError(f"unknown rulesets: {', '.join(unknown)}")
+        for i, ev in enumerate(events):
+            if isinstance(ev, dict):
+                for m in self.classify(ev, rulesets):
+                    yield i, m
+
+
+def apply_match(ev: Dict[str, Any], match: Match) -> Dict[str, Tuple[Any, Any]]:
+    """Set the match's fields on `ev`; field -> (old, new) for the values that changed."""
+    changed = {}
+    for field, value in match.set.items():
+        if ev.get(field) != value:
+            changed[field] = (ev.get(field), value)
+            ev[field] = value
+    return changed
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Classify events with data/event_rules.json")
+    ap.add_argument("--events", default=str(EVENTS_PATH), help="Path to events.json (or its shard directory)")
+    ap.add_argument("--rules", default=str(RULES_PATH))
+    ap.add_argument("--ruleset", action="append", help="Only these rulesets (repeatable; default: all)")
+    ap.add_argument("--apply", action="store_true", help="Write `set` values to the dataset")
+    ap.add_argument("--audit", help="Write one JSON line per match (event id, rule, changes) here")
+    args = ap.parse_args()
+
+    engine = RuleEngine.load(Path(args.rules))
+    store = EventStore.load(Path(args.events))
+    events = store.events
+
+    t0 = time.perf_counter()
+    per_rule: Counter = Counter()
+    changed_events = 0
+    audit = open(args.audit, "w", encoding="utf-8") if args.audit else None
+    try:
+        for i, m in engine.classify_all(events, args.ruleset):
+            ev = events[i]
+            per_rule[(m.ruleset, m.rule)] += 1
+            changes = apply_match(ev, m) if args.apply else {f: (ev.get(f), v) for f, v in m.set.items() if ev.get(f) != v}
+            changed_events += bool(changes)
+            if audit:
+                audit.write(json.dumps({"id": ev.get("id"), "ruleset": m.ruleset, "rule": m.rule, "tags": list(m.tags),
+                                        "changes": changes}, ensure_ascii=False) + "\n")
+    finally:
+        if audit:
+            audit.close()
+    elapsed = time.perf_counter() - t0
+
+    for (ruleset, rule), n in sorted(per_rule.items()):
+        print(f"{ruleset:<12} {rule:<48} {n:>6}")
+    print(f"{sum(per_rule.values())} matches, {changed_events} with field changes, {len(events)} events in {elapsed:.2f}s")
+    if args.apply and changed_events:
+        store.save()
+        print(f"saved (journal rev {store.last_revision})")
+    elif not args.apply:
+        print("Dry run: nothing written (use --apply).")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+"""
+Shared loader/writer for data/events.json with a binary cache and lookup indexes.
+
+Why:
+- Almost every curation script did its own `json.load` of the pretty-printed events.json and its
+  own `json.dumps(indent=2)` rewrite; chained runs paid the parse/serialize cost in every step.
+- `EventStore.load()` unpickles a cache keyed on the file's sha256 when the JSON is unchanged
+  (about 1.5x faster than json.load here), and `save()` refreshes that cache for the bytes it just wrote,
+  so the next script in a chain starts from the cache too. Unchanged data is not rewritten.
+
+Layouts:
+- `data/events.json`: one pretty-printed document (default).
+- `data/events/`: one JSONL shard per country (one event per line), `_categories.json` and a
+  `_manifest.json` that records the other top-level keys and the interleaved event order, so the
+  merged view (and `join`) reproduces events.json exactly. `save()` rewrites only the shards
+  whose bytes changed, keeping git diffs and concurrent edits per country.
+  `load(".../events.json")` falls back to the shard directory when the JSON file is absent;
+  convert with `python scripts/event_store.py split|join`.
+
+Writes go through a temp file + rename (never a half-written dataset), and every save to the
+store's own path appends the per-event changes to the journal (`event_journal.py`; inspect, restore
+and compact with `python scripts/event_store.py log|restore|compact`).
+
+Indexes (built lazily, dropped by `invalidate()` after structural edits):
+- `by_id`: id -> event (first event wins; later holders of the same id are in `duplicate_ids`)
+- `by_country`: country_name -> [events]
+- `by_signature`: (country_name, year, title) -> [events] (the duplicate key used by
+  normalize_events.py / check_events_consistency.py)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import pickle
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, TypedDict
+
+from event_ids import ID_PREFIX, event_content_id, id_references, id_report
+from event_journal import Journal, diff, journal_path
+from text_matcher import fold_ascii
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+EVENTS_PATH = BASE_DIR / "data" / "events.json"
+SHARD_DIR = BASE_DIR / "data" / "events"
+CACHE_DIR = BASE_DIR / ".cache" / "events"
+
+MANIFEST_NAME = "_manifest.json"
+CATEGORIES_NAME = "_categories.json"
+SHARD_SUFFIX = ".jsonl"
+_SHARD_FORMAT = 1
+
+# Bump when the pickled layout changes.
+_CACHE_VERSION = 1
+
+
+class Event(TypedDict, total=False):
+    id: str
+    title: str
+    description: str
+    year: int
+    decade: str
+    category: str
+    country_name: str
+    country_code: str
+    lat: float
+    lon: float
+    wikipedia_url: str
+    youtube_video_id: str
+    casualties: Optional[int]
+    key_figures: List[str]
+
+
+Signature = Tuple[str, Any, str]
+
+
+def event_signature(ev: Dict[str, Any]) -> Signature:
+    """(country_name, year, title) duplicate key, whitespace-trimmed."""
+    return (
+        (ev.get("country_name") or "").strip(),
+        ev.get("year"),
+        (ev.get("title") or "").strip(),
+    )
+
+
+def dumps_events(data: Dict[str, Any]) -> str:
+    """Canonical on-disk form of events.json (2-space indent, UTF-8, trailing newline)."""
+    return json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+
+
+def _sha256(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def canonical_hash(data: Dict[str, Any]) -> str:
+    """sha256 of data's canonical events.json bytes (the journal's revision hash in both layouts)."""
+    return _sha256(dumps_events(data).encode("utf-8"))
+
+
+def _atomic_write(path: Path, raw: bytes) -> None:
+    """Temp file in the same directory + rename: readers see the old or the new file, never a mix."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(raw)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def shard_file_name(country_name: str) -> str:
+    """ASCII shard name per country; the crc suffix keeps names that fold alike apart."""
+    key = (country_name or "").strip()
+    slug = fold_ascii(key).replace(" ", "-") or "country"
+    return f"{slug}-{zlib.crc32(key.encode('utf-8')):08x}{SHARD_SUFFIX}"
+
+
+def is_shard_dir(path: Path) -> bool:
+    return (Path(path) / MANIFEST_NAME).is_file()
+
+
+def resolve_events_path(path: Path = EVENTS_PATH) -> Path:
+    """path itself, or its shard directory (events.json -> events/) when only that exists."""
+    path = Path(path)
+    if not path.exists() and path.suffix == ".json" and is_shard_dir(path.with_suffix("")):
+        return path.with_suffix("")
+    return path
+
+
+def _dumps_compact(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _dumps_small(value: Any) -> bytes:
+    return (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+
+
+def render_shards(data: Dict[str, Any]) -> Dict[str, bytes]:
+    """File name -> bytes for the sharded layout of data (manifest and categories included)."""
+    order: List[List[Any]] = []
+    lines: Dict[str, List[str]] = {}
+    countries: Dict[str, str] = {}
+    for ev in data.get("events") or []:
+        country = (ev.get("country_name") or "").strip() if isinstance(ev, dict) else ""
+        name = shard_file_name(country)
+        countries.setdefault(name, country)
+        lines.setdefault(name, []).append(_dumps_compact(ev))
+        if order and order[-1][0] == name:
+            order[-1][1] += 1
+        else:
+            order.append([name, 1])
+
+    files = {name: ("\n".join(rows) + "\n").encode("utf-8") for name, rows in lines.items()}
+    files[CATEGORIES_NAME] = _dumps_small(data.get("categories", {}))
+    files[MANIFEST_NAME] = _dumps_small(
+        {
+            "format": _SHARD_FORMAT,
+            "keys": list(data.keys()),
+            "extra": {k: v for k, v in data.items() if k not in ("events", "categories")},
+            "shards": dict(sorted(countries.items())),
+            "order": order,
+        }
+    )
+    return files
+
+
+def _combined_hash(file_hashes: Dict[str, str]) -> str:
+    h = hashlib.sha256()
+    for name in sorted(file_hashes):
+        h.update(f"{name}\0{file_hashes[name]}\n".encode("utf-8"))
+    return h.hexdigest()
+
+
+class EventStore:
+    """events.json document (`categories`, `events` and any other top-level keys) plus indexes."""
+
+    def __init__(self, data: Dict[str, Any], path: Path = EVENTS_PATH, content_hash: str = "") -> None:
+        events = data.get("events")
+        if events is None:
+            data["events"] = events = []
+        if not isinstance(events, list):
+            raise SystemExit(f"{Path(path).name}: `events` must be a list")
+        self.data = data
+        self.path = Path(path)
+        self.content_hash = content_hash
+        self.loaded_from_cache = False
+        # Sharded layout only: shard/manifest file name -> sha256 of its bytes on disk.
+        self.shard_hashes: Dict[str, str] = {}
+        self.changed_shards: List[str] = []
+        # Journal revision written by the last save(), if any.
+        self.last_revision: Optional[int] = None
+        self._by_id: Optional[Dict[str, Event]] = None
+        self.duplicate_ids: List[str] = []
+        self._by_country: Optional[Dict[str, List[Event]]] = None
+        self._by_signature: Optional[Dict[Signature, List[Event]]] = None
+
+    # ---- load / save -------------------------------------------------------------------------
+
+    @property
+    def sharded(self) -> bool:
+        return bool(self.shard_hashes) or is_shard_dir(self.path)
+
+    @classmethod
+    def load(cls, path: Path = EVENTS_PATH, use_cache: bool = True) -> "EventStore":
+        path = resolve_events_path(path)
+        if is_shard_dir(path):
+            return cls._load_shards(path, use_cache)
+        raw = path.read_bytes()
+        digest = _sha256(raw)
+        if use_cache:
+            cached = cls._read_cache(digest)
+            if cached is not None:
+                store = cls(cached, path, digest)
+                store.loaded_from_cache = True
+                return store
+        data = json.loads(raw.decode("utf-8"))
+        if use_cache:
+            cls._write_cache(digest, data)
+        return cls(data, path, digest)
+
+    @classmethod
+    def _load_shards(cls, shard_dir: Path, use_cache: bool) -> "EventStore":
+        raw_files = {p.name: p.read_bytes() for p in shard_dir.iterdir() if p.suffix in (".json", SHARD_SUFFIX)}
+        file_hashes = {name: _sha256(raw) for name, raw in raw_files.items()}
+        digest = _combined_hash(file_hashes)
+        data = cls._read_cache(digest) if use_cache else None
+        from_cache = data is not None
+        if data is None:
+            manifest = json.loads(raw_files[MANIFEST_NAME].decode("utf-8"))
+            shards = {
+                name: [json.loads(line) for line in raw_files[name].decode("utf-8").splitlines() if line.strip()]
+                for name in manifest.get("shards", {})
+            }
+            cursors = {name: 0 for name in shards}
+            events: List[Any] = []
+            for name, count in manifest.get("order", []):
+                start = cursors[name]
+                events.extend(shards[name][start : start + count])
+                cursors[name] = start + count
+            # Lines appended to a shard by hand (not in the manifest order yet) go last.
+            for name, rows in shards.items():
+                events.extend(rows[cursors[name] :])
+            parts = dict(manifest.get("extra") or {})
+            parts["categories"] = json.loads(raw_files[CATEGORIES_NAME].decode("utf-8")) if CATEGORIES_NAME in raw_files else {}
+            parts["events"] = events
+            data = {k: parts[k] for k in manifest.get("keys", ["categories", "events"]) if k in parts}
+            data.update((k, v) for k, v in parts.items() if k not in data)
+            if use_cache:
+                cls._write_cache(digest, data)
+        store = cls(data, shard_dir, digest)
+        store.shard_hashes = file_hashes
+        store.loaded_from_cache = from_cache
+        return store
+
+    @staticmethod
+    def _cache_path(digest: str) -> Path:
+        return CACHE_DIR / f"{digest}.v{_CACHE_VERSION}.pickle"
+
+    @classmethod
+    def _read_cache(cls, digest: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(cls._cache_path(digest), "rb") as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return None
+
+    @classmethod
+    def _write_cache(cls, digest: str, data: Dict[str, Any]) -> None:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            target = cls._cache_path(digest)
+            tmp = target.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, target)
+            # Only the latest few snapshots are worth keeping.
+            snapshots = sorted(CACHE_DIR.glob("*.pickle"), key=lambda p: p.stat().st_mtime, reverse=True)
+            for old in snapshots[8:]:
+                old.unlink()
+        except OSError:
+            pass
+
+    def save(self, path: Optional[Path] = None, use_cache: bool = True, journal: bool = True) -> bool:
+        """Write the canonical JSON; returns False (and writes nothing) if the bytes are unchanged.
+
+        A shard directory target (this store's own, or any existing one) gets the sharded layout.
+        Saving over the loaded file appends the changes to the journal unless `journal=False`.
+        """
+        path = Path(path) if path else self.path
+        if (path == self.path and self.sharded) or (path != self.path and is_shard_dir(path)):
+            return self.save_shards(path, use_cache, journal)
+        raw = dumps_events(self.data).encode("utf-8")
+        digest = _sha256(raw)
+        if path == self.path and digest == self.content_hash and path.exists():
+            return False
+        before = self._baseline() if journal and path == self.path else None
+        _atomic_write(path, raw)
+        if use_cache:
+            self._write_cache(digest, self.data)
+        if path == self.path:
+            if before is not None:
+                self._record(before, self.content_hash, digest)
+            self.content_hash = digest
+        return True
+
+    def _baseline(self) -> Optional[Dict[str, Any]]:
+        """The document as loaded (or last saved): its cache snapshot, else a fresh read of the file."""
+        if not self.content_hash:
+            return None
+        cached = self._read_cache(self.content_hash)
+        if cached is not None:
+            return cached
+        try:
+            on_disk = EventStore.load(self.path, use_cache=False)
+        except (OSError, ValueError):
+            on_disk = None
+        if on_disk is None or on_disk.content_hash != self.content_hash:
+            print(f"WARNING: {self.path} changed on disk since it was loaded; this write is not journaled.")
+            return None
+        return on_disk.data
+
+    def _record(self, before: Dict[str, Any], base_hash: str, new_hash: str) -> None:
+        patch = diff(before, self.data)
+        if patch is not None:
+            entry = Journal(journal_path(self.path)).append(patch, base_hash, new_hash)
+            self.last_revision = entry["rev"]
+
+    def save_shards(self, shard_dir: Optional[Path] = None, use_cache: bool = True, journal: bool = True) -> bool:
+        """Write the sharded layout, touching only files whose bytes changed (stale shards removed)."""
+        shard_dir = Path(shard_dir) if shard_dir else self.path
+        own = shard_dir == self.path
+        known = self.shard_hashes if own else {}
+        before = self._baseline() if journal and own else None
+        files = render_shards(self.data)
+        file_hashes = {name: _sha256(raw) for name, raw in files.items()}
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        changed: List[str] = []
+        # Manifest last: a reader never sees an order that names shards not written yet.
+        for name in sorted(files, key=lambda n: n == MANIFEST_NAME):
+            target = shard_dir / name
+            if known.get(name) == file_hashes[name] and target.exists():
+                continue
+            if not known and target.exists() and _sha256(target.read_bytes()) == file_hashes[name]:
+                continue
+            _atomic_write(target, files[name])
+            changed.append(name)
+        for old in shard_dir.glob(f"*{SHARD_SUFFIX}"):
+            if old.name not in files:
+                old.unlink()
+                changed.append(old.name)
+        digest = _combined_hash(file_hashes)
+        if use_cache and changed:
+            self._write_cache(digest, self.data)
+        if own:
+            if before is not None and changed:
+                self._record(before, canonical_hash(before), canonical_hash(self.data))
+            self.shard_hashes = file_hashes
+            self.content_hash = digest
+        self.changed_shards = changed
+        return bool(changed)
+
+    # ---- accessors ---------------------------------------------------------------------------
+
+    @property
+    def events(self) -> List[Event]:
+        return self.data["events"]
+
+    @events.setter
+    def events(self, value: List[Event]) -> None:
+        self.data["events"] = value
+        self.invalidate()
+
+    @property
+    def categories(self) -> Dict[str, Dict[str, Any]]:
+        cats = self.data.get("categories")
+        if not isinstance(cats, dict):
+            cats = self.data["categories"] = {}
+        return cats
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __iter__(self) -> Iterator[Event]:
+        return (ev for ev in self.events if isinstance(ev, dict))
+
+    # ---- indexes -----------------------------------------------------------------------------
+
+    def invalidate(self) -> None:
+        """Drop indexes after adding/removing events or editing id/country/year/title."""
+        self._by_id = None
+        self._by_country = None
+        self._by_signature = None
+
+    @property
+    def by_id(self) -> Dict[str, Event]:
+        if self._by_id is None:
+            idx: Dict[str, Event] = {}
+            dupes: List[str] = []
+            for ev in self:
+                if ev.get("id"):
+                    eid = str(ev["id"])
+                    if idx.setdefault(eid, ev) is not ev:
+                        dupes.append(eid)
+            self._by_id, self.duplicate_ids = idx, dupes
+        return self._by_id
+
+    @property
+    def by_country(self) -> Dict[str, List[Event]]:
+        if self._by_country is None:
+            idx: Dict[str, List[Event]] = defaultdict(list)
+            for ev in self:
+                idx[(ev.get("country_name") or "").strip()].append(ev)
+            self._by_country = dict(idx)
+        return self._by_country
+
+    @property
+    def by_signature(self) -> Dict[Signature, List[Event]]:
+        if self._by_signature is None:
+            idx: Dict[Signature, List[Event]] = defaultdict(list)
+            for ev in self:
+                idx[event_signature(ev)].append(ev)
+            self._by_signature = dict(idx)
+        return self._by_signature
+
+    def get(self, event_id: str) -> Optional[Event]:
+        return self.by_id.get(str(event_id))
+
+    def for_country(self, country_name: str) -> List[Event]:
+        return self.by_country.get((country_name or "").strip(), [])
+
+    def find(self, country_name: str, year: Any, title: str) -> List[Event]:
+        return self.by_signature.get(((country_name or "").strip(), year, (title or "").strip()), [])
+
+    def new_id(self, ev: Event, prefix: str = ID_PREFIX) -> str:
+        """Content-derived id for `ev` that no event in the store uses yet (see event_ids.py)."""
+        return event_content_id(ev, self.by_id, prefix)
+
+    def add(self, ev: Event) -> None:
+        """Append one event (minting an id if it has none) and keep built indexes current."""
+        if not ev.get("id"):
+            ev["id"] = self.new_id(ev)
+        elif self.by_id.get(str(ev["id"]), ev) is not ev:
+            raise ValueError(f"event id already in use: {ev['id']!r}")
+        self.events.append(ev)
+        self.by_id[str(ev["id"])] = ev
+        if self._by_country is not None:
+            self._by_country.setdefault((ev.get("country_name") or "").strip(), []).append(ev)
+        if self._by_signature is not None:
+            self._by_signature.setdefault(event_signature(ev), []).append(ev)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="events.json layout conversion and change journal")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    sp = sub.add_parser("split", help="events.json -> shard directory")
+    sp.add_argument("--events", default=str(EVENTS_PATH))
+    sp.add_argument("--dir", default=str(SHARD_DIR))
+    sp.add_argument("--remove-json", action="store_true", help="Delete events.json so tools load the shards")
+    jp = sub.add_parser("join", help="shard directory -> events.json")
+    jp.add_argument("--dir", default=str(SHARD_DIR))
+    jp.add_argument("-o", "--output", default=str(EVENTS_PATH))
+    lp = sub.add_parser("log", help="List journaled revisions")
+    lp.add_argument("--events", default=str(EVENTS_PATH))
+    rp = sub.add_parser("restore", help="Rebuild the dataset as of a journal revision (0 = before the first)")
+    rp.add_argument("rev", type=int)
+    rp.add_argument("--events", default=str(EVENTS_PATH))
+    rp.add_argument("-o", "--output", help="Write a plain events.json here instead of saving over the dataset")
+    cp = sub.add_parser("compact", help="Squash all but the newest revisions into one")
+    cp.add_argument("--keep", type=int, default=20)
+    cp.add_argument("--events", default=str(EVENTS_PATH))
+    ip = sub.add_parser("ids", help="Report id schemes, missing/duplicate ids and unresolved script references")
+    ip.add_argument("--events", default=str(EVENTS_PATH))
+    ip.add_argument("--fix", action="store_true", help="Give events with a missing or shared id a content id")
+    args = ap.parse_args()
+
+    if args.cmd == "split":
+        store = EventStore.load(Path(args.events))
+        store.save_shards(Path(args.dir))
+        print(f"{len(store)} events -> {len(store.by_country)} shards in {args.dir} ({len(store.changed_shards)} files written)")
+        if args.remove_json:
+            Path(args.events).unlink()
+            print(f"removed: {args.events}")
+    elif args.cmd == "join":
+        store = EventStore.load(Path(args.dir))
+        EventStore(store.data, Path(args.output)).save()
+        print(f"{len(store)} events -> {args.output}")
+    elif args.cmd == "log":
+        journal = Journal(journal_path(resolve_events_path(Path(args.events))))
+        for e in journal.entries():
+            counts = {op: sum(1 for o in e.get("ops", []) if o["op"] == op) for op in ("add", "update", "delete")}
+            extra = "".join(f" {k}" for k in (e.get("top") or {}))
+            squashed = f" (squashed {e['squashed'][0]}-{e['squashed'][1]})" if e.get("squashed") else ""
+            print(
+                f"{e['rev']:>5}  {e['ts']}  {e.get('tool') or '-':<32} "
+                f"+{counts['add']} ~{counts['update']} -{counts['delete']}{extra}{squashed}"
+            )
+    elif args.cmd == "restore":
+        store = EventStore.load(Path(args.events))
+        journal = Journal(journal_path(store.path))
+        try:
+            data = journal.reconstruct(store.data, args.rev, content_hash=canonical_hash)
+        except ValueError as e:
+            raise SystemExit(f"cannot restore: {e}")
+        if args.output:
+            EventStore(data, Path(args.output)).save(use_cache=False)
+            print(f"rev {args.rev}: {len(data.get('events') or [])} events -> {args.output}")
+        else:
+            store.data = data
+            store.invalidate()
+            store.save()
+            print(f"restored rev {args.rev} into {store.path} (journal rev {store.last_revision})")
+    elif args.cmd == "ids":
+        store = EventStore.load(Path(args.events))
+        events = list(store)
+        rep = id_report(events, id_references())
+        print(f"{rep['events']} events, {len(store.by_id)} distinct ids")
+        for scheme, n in rep["schemes"].items():
+            print(f"  {scheme:<18} {n}")
+        print(f"missing ids: {len(rep['missing'])}, duplicate ids: {len(rep['duplicates'])}")
+        for eid, n in rep["duplicates"].items():
+            print(f"  {eid} x{n}")
+        print(f"script references: {sum(rep['references'].values())} in {len(rep['references'])} files")
+        for name, ids in rep["unresolved"].items():
+            print(f"  unresolved in {name}: {', '.join(ids)}")
+        if args.fix and (rep["missing"] or rep["duplicates"]):
+            taken, seen = set(store.by_id), set()
+            for ev in events:
+                eid = str(ev.get("id") or "")
+                if not eid or eid in seen:
+                    ev["id"] = event_content_id(ev, taken)
+                    taken.add(ev["id"])
+                    print(f"  {eid or '(none)'} -> {ev['id']}: {ev.get('title')}")
+                seen.add(str(ev["id"]))
+            store.invalidate()
+            store.save()
+    else:
+        store = EventStore.load(Path(args.events))
+        journal = Journal(journal_path(store.path))
+        removed = journal.compact(store.data, args.keep)
+        print(f"compacted: {removed} revisions squashed, {journal.path.stat().st_size if journal.path.exists() else 0} bytes")
+
+
+if __name__ == "__main__":
+    main()
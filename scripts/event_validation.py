@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Rule-based validation of events.json with a per-event result cache.
+
+Why:
+- `check_events_consistency.py` re-validated every event on every run, and the other checks
+  (0,0 coordinates, contextless stubs, wiki URL shape) only lived inside the scripts that fix them.
+- Rules are compiled once into a `Validator` (lookup sets/dicts built up front). Results are
+  cached under `.cache/validation.pickle` per event content hash, so a run after a small edit
+  only re-checks the events that changed. The cache is dropped when the rules, this module or
+  the reference data (country mappings, categories, data/event_rules.json) change.
+
+Per-event rules (`EVENT_RULES`) see one event plus the shared context; dataset rules
+(`DATASET_RULES`) look across events (duplicates) and are cheap index lookups.
+Severity `error` fails the check; `warning` is reported only (unless --strict).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from event_rules import RULES_PATH, RuleEngine
+from event_store import BASE_DIR, event_signature
+from fix_wiki import _parse_wikipedia_url
+from remove_contextless_events import _should_remove as _is_contextless
+
+
+CACHE_PATH = BASE_DIR / ".cache" / "validation.pickle"
+
+# Bump when rule semantics change without a code change in this module (e.g. a helper's data).
+RULES_VERSION = 1
+
+ERROR = "error"
+WARNING = "warning"
+
+
+class Issue(NamedTuple):
+    rule: str
+    severity: str
+    index: int
+    event_id: str
+    message: str
+
+
+# (rule, severity, message) per issue found on one event.
+Found = List[Tuple[str, str, str]]
+
+
+class Context(NamedTuple):
+    iso_by_name: Dict[str, str]
+    categories: Dict[str, Any]
+
+
+class Rule(NamedTuple):
+    name: str
+    severity: str
+    check: Callable[[Dict[str, Any], Context], Optional[str]]
+    doc: str
+
+
+def _check_country_name(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    name = (ev.get("country_name") or "").strip()
+    if not name or name not in ctx.iso_by_name:
+        return f"non-canonical country_name {name!r}"
+    return None
+
+
+def _check_country_code(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    name = (ev.get("country_name") or "").strip()
+    expected = ctx.iso_by_name.get(name, "")
+    code = (ev.get("country_code") or "").strip().upper()
+    if expected and code != expected:
+        return f"{name} code={code!r} expected={expected!r}"
+    return None
+
+
+def _check_category(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    category = (ev.get("category") or "").strip()
+    if category and category not in ctx.categories:
+        return f"category {category!r} missing from top-level `categories`"
+    return None
+
+
+def _check_decade(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    try:
+        year = int(ev.get("year"))
+    except (TypeError, ValueError):
+        return None
+    expected = f"{(year // 10) * 10}s"
+    decade = (ev.get("decade") or "").strip()
+    if decade != expected:
+        return f"year={year} decade={decade!r} expected={expected!r}"
+    return None
+
+
+def _check_coordinates(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    lat, lon = ev.get("lat"), ev.get("lon")
+    if not isinstance(lat, (int, float)) or not isinstance(lon, (int, float)):
+        return f"lat/lon not numeric ({lat!r}, {lon!r})"
+    if lat == 0 and lon == 0:
+        return "coordinates are 0,0"
+    if not (-90 <= lat <= 90 and -180 <= lon <= 180):
+        return f"coordinates out of range ({lat}, {lon})"
+    return None
+
+
+def _check_contextless(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    if _is_contextless(ev, None):
+        return f"contextless stub title={ev.get('title')!r} description={ev.get('description')!r}"
+    return None
+
+
+def _check_wiki_url(ev: Dict[str, Any], ctx: Context) -> Optional[str]:
+    url = (ev.get("wikipedia_url") or "").strip()
+    if not url:
+        return None
+    parsed = _parse_wikipedia_url(url)
+    if not parsed:
+        return f"not a Wikipedia URL: {url}"
+    if parsed[1] != "page":
+        return f"search link instead of an article: {url}"
+    return None
+
+
+EVENT_RULES: Tuple[Rule, ...] = (
+    Rule("country_name", ERROR, _check_country_name, "country_name is a canonical Turkish name"),
+    Rule("country_code", ERROR, _check_country_code, "country_code matches the mapping's iso2"),
+    Rule("category", ERROR, _check_category, "category has a definition in `categories`"),
+    Rule("decade", ERROR, _check_decade, "decade matches the year"),
+    Rule("coordinates", WARNING, _check_coordinates, "lat/lon are numeric, in range and not 0,0"),
+    Rule("contextless", WARNING, _check_contextless, "not a contextless stub (remove_contextless_events)"),
+    Rule("wiki_url", ERROR, _check_wiki_url, "wikipedia_url is a direct article link"),
+)
+
+
+def _duplicate_signatures(events: List[Any]) -> Iterable[Issue]:
+    groups: Dict[Any, List[int]] = defaultdict(list)
+    for i, ev in enumerate(events):
+        if isinstance(ev, dict):
+            groups[event_signature(ev)].append(i)
+    for (name, year, title), idxs in groups.items():
+        if len(idxs) > 1:
+            for i in idxs:
+                yield Issue("duplicate", ERROR, i, str(events[i].get("id") or ""), f"{name} {year} {title} -> indices {idxs[:10]}")
+
+
+def _duplicate_ids(events: List[Any]) -> Iterable[Issue]:
+    seen: Dict[str, int] = {}
+    for i, ev in enumerate(events):
+        if not isinstance(ev, dict) or not ev.get("id"):
+            continue
+        eid = str(ev["id"])
+        if eid in seen:
+            yield Issue("duplicate_id", ERROR, i, eid, f"id also used at index {seen[eid]}")
+        else:
+            seen[eid] = i
+
+
+DATASET_RULES: Tuple[Tuple[str, Callable[[List[Any]], Iterable[Issue]]], ...] = (
+    ("duplicate", _duplicate_signatures),
+    ("duplicate_id", _duplicate_ids),
+)
+
+
+def build_context(country_mappings: List[Dict[str, Any]], categories: Dict[str, Any]) -> Context:
+    iso_by_name = {
+        (c.get("turkish") or "").strip(): (c.get("iso2") or "").strip().upper()
+        for c in country_mappings
+        if (c.get("turkish") or "").strip()
+    }
+    return Context(iso_by_name, categories if isinstance(categories, dict) else {})
+
+
+def _event_hash(ev: Any) -> str:
+    return hashlib.sha1(json.dumps(ev, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class Validator:
+    """EVENT_RULES bound to one context; `validate()` reuses cached per-event results."""
+
+    def __init__(self, ctx: Context, rules: Tuple[Rule, ...] = EVENT_RULES, cache_path: Optional[Path] = CACHE_PATH) -> None:
+        self.ctx = ctx
+        self.rules = rules
+        self.cache_path = cache_path
+        h = hashlib.sha256(f"{RULES_VERSION}\n".encode("utf-8"))
+        for module_file in (
+            __file__,
+            _parse_wikipedia_url.__code__.co_filename,
+            _is_contextless.__code__.co_filename,
+            RuleEngine.load.__code__.co_filename,
+            RULES_PATH,
+        ):
+            h.update(Path(module_file).read_bytes())
+        h.update(json.dumps([ctx.iso_by_name, ctx.categories], ensure_ascii=False, sort_keys=True).encode("utf-8"))
+        self.key = h.hexdigest()
+        self.checked = 0
+        self.reused = 0
+
+    def check_event(self, ev: Dict[str, Any]) -> Found:
+        """[(rule, severity, message)] for one event."""
+        found = []
+        for rule in self.rules:
+            message = rule.check(ev, self.ctx)
+            if message:
+                found.append((rule.name, rule.severity, message))
+        return found
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, "rb") as f:
+                stored = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return {}
+        return stored if stored.get("key") == self.key else {}
+
+    def _save_cache(self, results: Dict[str, Found], by_index: List[Found], content_hash: str) -> None:
+        if self.cache_path is None:
+            return
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.cache_path.with_suffix(".tmp")
+            with open(tmp, "wb") as f:
+                stored = {"key": self.key, "content_hash": content_hash, "results": results, "by_index": by_index}
+                pickle.dump(stored, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(self.cache_path)
+        except OSError:
+            pass
+
+    def validate(self, events: List[Any], content_hash: str = "") -> List[Issue]:
+        """All issues; `content_hash` (EventStore.content_hash) lets an unchanged file skip per-event hashing."""
+        stored = self._load_cache()
+        by_index: List[Found] = []
+        if content_hash and stored.get("content_hash") == content_hash and len(stored.get("by_index", [])) == len(events):
+            by_index = stored["by_index"]
+            self.reused = sum(1 for ev in events if isinstance(ev, dict))
+        else:
+            cached: Dict[str, Found] = stored.get("results", {})
+            results: Dict[str, Found] = {}
+            for ev in events:
+                if not isinstance(ev, dict):
+                    by_index.append([])
+                    continue
+                h = _event_hash(ev)
+                found = cached.get(h)
+                if found is None:
+                    found = self.check_event(ev)
+                    self.checked += 1
+                else:
+                    self.reused += 1
+                results[h] = found
+                by_index.append(found)
+            self._save_cache(results, by_index, content_hash)
+
+        issues: List[Issue] = []
+        for i, found in enumerate(by_index):
+            if found:
+                eid = str(events[i].get("id") or "")
+                issues.extend(Issue(rule, severity, i, eid, message) for rule, severity, message in found)
+        for _name, rule in DATASET_RULES:
+            issues.extend(rule(events))
+        return issues
+
+
+def report(issues: List[Issue], events: List[Any], validator: Validator) -> Dict[str, Any]:
+    """Machine-readable report (stable field names; issues sorted by rule then index)."""
+    counts: Dict[str, int] = defaultdict(int)
+    for issue in issues:
+        counts[issue.rule] += 1
+    rows = []
+    for issue in sorted(issues, key=lambda x: (x.rule, x.index)):
+        ev = events[issue.index] if 0 <= issue.index < len(events) else {}
+        rows.append(
+            {
+                "rule": issue.rule,
+                "severity": issue.severity,
+                "index": issue.index,
+                "id": issue.event_id,
+                "country_name": ev.get("country_name"),
+                "year": ev.get("year"),
+                "title": ev.get("title"),
+                "message": issue.message,
+            }
+        )
+    return {
+        "ok": not any(i.severity == ERROR for i in issues),
+        "events": len(events),
+        "checked": validator.checked,
+        "reused": validator.reused,
+        "rules": {r.name: {"severity": r.severity, "doc": r.doc} for r in validator.rules},
+        "counts": dict(sorted(counts.items())),
+        "issues": rows,
+    }
@@ -9,7 +9,7 @@ This script:
 1) Normalizes a few legacy category names so all events use known keys.
 2) Adds a 'diplomacy' category.
 3) Removes a known duplicate Turkey event (12 Eylul coup duplicate entry).
-4) Appends the curated Turkey events list (id-stable).
+4) Appends the curated Turkey events list via event_ingest.py (id-stable, deduped).
 5) Fills missing Wikipedia links for Turkey events (TR preferred, EN fallback).
 6) Regenerates offline admin embeds (admin/data.js, admin/country_mappings.js).
 """
@@ -20,10 +20,14 @@ import json
 import time
 import urllib.parse
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
 
+from country_index import CountryIndex
+from event_ingest import ingest_events
+from event_store import EventStore
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -711,18 +715,13 @@ def _regen_admin_embeds(data: Dict[str, Any]) -> None:
         "window.__EVENTS_DATA__ = " + json.dumps(data, ensure_ascii=False) + ";\n",
         encoding="utf-8",
     )
-    mappings = json.loads(COUNTRY_MAPPINGS_PATH.read_text(encoding="utf-8"))
-    ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.write_text(
-        "window.__COUNTRY_MAPPINGS__ = "
-        + json.dumps(mappings.get("countries") or [], ensure_ascii=False)
-        + ";\n",
-        encoding="utf-8",
-    )
+    ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.write_text(CountryIndex.load(COUNTRY_MAPPINGS_PATH).admin_embed(), encoding="utf-8")
 
 
 def main() -> None:
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events: List[Dict[str, Any]] = data.get("events") or []
+    store = EventStore.load(EVENTS_PATH)
+    data = store.data
+    events: List[Dict[str, Any]] = store.events
     categories: Dict[str, Any] = data.get("categories") or {}
 
     # 1) Ensure 'diplomacy' category exists (used across dataset).
@@ -746,52 +745,28 @@ def main() -> None:
     # 3) Remove a known duplicate Turkey event (keep the richer one with wiki link).
     # Duplicate pair: ev029 vs ev_1980_31. Keep ev029; drop ev_1980_31.
     before = len(events)
-    events = [e for e in events if e.get("id") != "ev_1980_31"]
-    removed = before - len(events)
-
-    # 4) Append new Turkey events if not already present.
-    existing_ids: Set[str] = {str(e.get("id") or "") for e in events}
-    existing_key: Set[Tuple[str, int, str]] = set()
-    for e in events:
-        cc = (e.get("country_code") or "").strip().upper()
-        y = int(e.get("year") or 0)
-        t = (e.get("title") or "").strip()
-        if cc and y and t:
-            existing_key.add((cc, y, t))
-
-    added = 0
-    for ev in NEW_TR_EVENTS:
-        ev = dict(ev)  # copy
-        ev.setdefault("country_code", TR_COUNTRY_CODE)
-        ev.setdefault("country_name", TR_COUNTRY_NAME)
-        ev.setdefault("lat", TR_LAT)
-        ev.setdefault("lon", TR_LON)
-        ev.setdefault("wikipedia_url", "")
-        ev.setdefault("casualties", None)
-        ev.setdefault("key_figures", [])
-
-        # Basic validation
-        ev_id = str(ev.get("id") or "").strip()
-        if not ev_id:
-            raise SystemExit("New event id is missing")
-        if ev_id in existing_ids:
-            # Already applied in a previous run.
-            continue
-        cc = (ev.get("country_code") or "").strip().upper()
-        if cc != TR_COUNTRY_CODE:
-            raise SystemExit(f"Unexpected country_code in new event {ev_id}: {cc}")
-        key = (cc, int(ev.get("year") or 0), (ev.get("title") or "").strip())
-        if key in existing_key:
-            # Skip if already exists (id-stable behavior across reruns).
-            continue
-        events.append(ev)
-        existing_ids.add(ev_id)
-        existing_key.add(key)
-        added += 1
+    store.events = [e for e in events if e.get("id") != "ev_1980_31"]
+    removed = before - len(store)
 
-    # Persist category changes
+    # Persist category changes (the ingest below resolves 'diplomacy' against them)
     data["categories"] = categories
-    data["events"] = events
+
+    # 4) Append new Turkey events through event_ingest.py (canonical country, (country, year,
+    # title) dedupe). An id that is already in the dataset was applied by a previous run.
+    new_events = [
+        {
+            **ev,
+            "country_code": TR_COUNTRY_CODE,
+            "country_name": TR_COUNTRY_NAME,
+            "lat": TR_LAT,
+            "lon": TR_LON,
+        }
+        for ev in NEW_TR_EVENTS
+        if ev["id"] not in store.by_id
+    ]
+    ingest = ingest_events(store, new_events, source="expand_turkey_events.py")
+    added = ingest.stats.summary()["inserted"]
+    events = store.events
 
     # 5) Fix/Fill Wikipedia links for Turkey events (TR preferred, EN fallback).
     resolver = WikiResolver()
@@ -823,7 +798,7 @@ def main() -> None:
             unresolved.append(f"{ev.get('year')} {title}")
 
     # Write back events.json
-    EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    store.save()
 
     # Regenerate admin embeds
     _regen_admin_embeds(data)
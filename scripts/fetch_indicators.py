@@ -9,23 +9,31 @@ Datasets:
 - G8 country list (static; canonicalized via country_mappings.json)
 
 Output is keyed by the project's canonical Turkish country names from data/country_mappings.json.
+
+Downloads go through `http_cache.py`: conditional GETs against recorded responses by default,
+`--http-cache offline` replays them without network access (e.g. reproducible/offline builds).
+The three sources are fetched concurrently; only the first `wikitable` of each Wikipedia page is
+parsed, and the Big Mac CSV is read in one streaming pass.
 """
 
 from __future__ import annotations
 
+import argparse
 import csv
 import io
 import json
 import re
 import sys
-import urllib.request
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 from bs4 import BeautifulSoup
 
+import http_cache
+from country_index import Country, CountryIndex
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 COUNTRY_MAPPINGS_PATH = BASE_DIR / "data" / "country_mappings.json"
@@ -42,87 +50,28 @@ BIGMAC_CSV_URL = (
 )
 
 
-_TR_TRANSLATE = str.maketrans(
-    {
-        "ı": "i",
-        "İ": "i",
-        "ş": "s",
-        "Ş": "s",
-        "ğ": "g",
-        "Ğ": "g",
-        "ü": "u",
-        "Ü": "u",
-        "ö": "o",
-        "Ö": "o",
-        "ç": "c",
-        "Ç": "c",
-        "â": "a",
-        "Â": "a",
-        "î": "i",
-        "Î": "i",
-        "û": "u",
-        "Û": "u",
-    }
-)
-
-
-def _normalize_lookup_key(value: str) -> str:
-    if value is None:
-        return ""
-    s = str(value).strip()
-    s = (
-        s.replace("\u2019", "'")
-        .replace("\u2018", "'")
-        .replace("\u201B", "'")
-        .replace("\u02BC", "'")
-        .replace("’", "'")
-        .replace("‘", "'")
-    )
-    s = " ".join(s.split()).lower()
-    s = s.translate(_TR_TRANSLATE)
-    return s
-
-
-@dataclass(frozen=True)
-class CountryCanon:
-    turkish: str
-    iso2: str  # uppercased
-
-
-def _load_country_index() -> Tuple[Dict[str, CountryCanon], Dict[str, CountryCanon]]:
-    with open(COUNTRY_MAPPINGS_PATH, "r", encoding="utf-8") as f:
-        mappings = json.load(f).get("countries", [])
-
-    lookup: Dict[str, CountryCanon] = {}
-    by_turkish: Dict[str, CountryCanon] = {}
-
-    for entry in mappings:
-        tr = (entry.get("turkish") or "").strip()
-        iso2 = (entry.get("iso2") or "").strip().upper()
-        if not tr:
-            continue
-        canon = CountryCanon(turkish=tr, iso2=iso2)
-        by_turkish[tr] = canon
-
-        keys: List[str] = []
-        if entry.get("turkish"):
-            keys.append(entry["turkish"])
-        if entry.get("english"):
-            keys.append(entry["english"])
-        keys.extend(entry.get("aliases") or [])
+def _fetch(url: str) -> bytes:
+    return http_cache.fetch(url, headers={"User-Agent": USER_AGENT}, timeout=30)
 
-        for k in keys:
-            nk = _normalize_lookup_key(k)
-            if nk:
-                lookup.setdefault(nk, canon)
 
-    return lookup, by_turkish
+_WIKITABLE_START_RE = re.compile(r"<table\b[^>]*\bclass=\"[^\"]*\bwikitable\b", re.IGNORECASE)
+_TABLE_TAG_RE = re.compile(r"<(/?)table\b", re.IGNORECASE)
 
 
-def _fetch(url: str) -> bytes:
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.read()
+def _first_wikitable(html: str) -> Optional[Any]:
+    """Parse only the first `table.wikitable` (incl. nested tables) instead of the whole page."""
+    m = _WIKITABLE_START_RE.search(html)
+    if not m:
+        return None
+    depth = 0
+    end = len(html)
+    for tag in _TABLE_TAG_RE.finditer(html, m.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            end = html.find(">", tag.end()) + 1 or len(html)
+            break
+    soup = BeautifulSoup(html[m.start():end], "html.parser")
+    return soup.find("table")
 
 
 def _parse_float(value: str) -> Optional[float]:
@@ -187,17 +136,13 @@ def _clean_country_name(value: str) -> str:
     return s
 
 
-def _canonicalize(lookup: Dict[str, CountryCanon], name: str) -> Optional[CountryCanon]:
-    nk = _normalize_lookup_key(_clean_country_name(name))
-    if not nk:
-        return None
-    return lookup.get(nk)
+def _canonicalize(lookup: CountryIndex, name: str) -> Optional[Country]:
+    return lookup.resolve(_clean_country_name(name))
 
 
-def fetch_nato_members(lookup: Dict[str, CountryCanon]) -> Tuple[List[str], List[str]]:
+def fetch_nato_members(lookup: CountryIndex) -> Tuple[List[str], List[str]]:
     html = _fetch(WIKI_NATO_URL).decode("utf-8", "ignore")
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.select_one("table.wikitable")
+    table = _first_wikitable(html)
     if not table:
         raise RuntimeError("NATO table not found on Wikipedia page")
 
@@ -225,20 +170,17 @@ def fetch_nato_members(lookup: Dict[str, CountryCanon]) -> Tuple[List[str], List
     return out, unknown
 
 
-def fetch_minimum_wage(lookup: Dict[str, CountryCanon]) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+def fetch_minimum_wage(lookup: CountryIndex) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
     """
     Returns:
     - by_country: canonical Turkish -> details {hourly_usd_nominal, annual_usd_nominal, effective_date}
     - unknown country names (not in mappings)
     """
     html = _fetch(WIKI_MIN_WAGE_URL).decode("utf-8", "ignore")
-    soup = BeautifulSoup(html, "html.parser")
-    tables = soup.select("table.wikitable")
-    if not tables:
-        raise RuntimeError("Minimum wage tables not found on Wikipedia page")
-
     # The first table is the global minimum wages by country.
-    table = tables[0]
+    table = _first_wikitable(html)
+    if not table:
+        raise RuntimeError("Minimum wage tables not found on Wikipedia page")
 
     by_country: Dict[str, Dict[str, Any]] = {}
     unknown: List[str] = []
@@ -318,24 +260,26 @@ def fetch_minimum_wage(lookup: Dict[str, CountryCanon]) -> Tuple[Dict[str, Dict[
     return by_country, unknown
 
 
-def fetch_big_mac_index(lookup: Dict[str, CountryCanon]) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], List[str]]:
+def fetch_big_mac_index(lookup: CountryIndex) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any], List[str]]:
     csv_bytes = _fetch(BIGMAC_CSV_URL)
-    text = csv_bytes.decode("utf-8", "ignore")
-    reader = csv.DictReader(io.StringIO(text))
-
-    rows = list(reader)
-    if not rows:
-        raise RuntimeError("Big Mac CSV contains no rows")
-
-    # Latest date in dataset
-    dates = sorted({r.get("date", "") for r in rows if r.get("date")})
-    latest_date = dates[-1] if dates else ""
+    text = io.TextIOWrapper(io.BytesIO(csv_bytes), encoding="utf-8", errors="ignore", newline="")
+    reader = csv.DictReader(text)
 
+    # Single streaming pass: only rows of the latest date seen so far are kept (ISO dates compare
+    # as strings); a newer date discards what was collected for the older one.
+    latest_date = ""
+    saw_rows = False
     by_country: Dict[str, Dict[str, Any]] = {}
     unknown: List[str] = []
 
-    for r in rows:
-        if latest_date and r.get("date") != latest_date:
+    for r in reader:
+        saw_rows = True
+        date = r.get("date") or ""
+        if date > latest_date:
+            latest_date = date
+            by_country = {}
+            unknown = []
+        elif date != latest_date:
             continue
         name = r.get("name") or ""
         canon = _canonicalize(lookup, name)
@@ -352,19 +296,35 @@ def fetch_big_mac_index(lookup: Dict[str, CountryCanon]) -> Tuple[Dict[str, Dict
             "usd_raw": _parse_float(r.get("USD_raw")),
         }
 
+    if not saw_rows:
+        raise RuntimeError("Big Mac CSV contains no rows")
+
     meta = {"latest_date": latest_date, "rows_latest_date": len(by_country)}
     return by_country, meta, unknown
 
 
 def main() -> None:
-    lookup, _by_tr = _load_country_index()
-    now_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
-
-    nato_members, nato_unknown = fetch_nato_members(lookup)
+    parser = argparse.ArgumentParser(description="Fetch external datasets into data/indicators.json")
+    parser.add_argument(
+        "--http-cache",
+        choices=http_cache.MODES,
+        default=http_cache.get_mode(),
+        help="refresh: conditional GET with recorded fallback; offline: replay only; bypass: no store",
+    )
+    args = parser.parse_args()
+    http_cache.set_mode(args.http_cache)
 
-    min_wage_by_country, min_wage_unknown = fetch_minimum_wage(lookup)
+    lookup = CountryIndex.load(COUNTRY_MAPPINGS_PATH)
+    now_utc = datetime.now(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
-    bigmac_by_country, bigmac_meta, bigmac_unknown = fetch_big_mac_index(lookup)
+    # Independent, network-bound sources: fetch concurrently (errors re-raise from .result()).
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        nato_job = pool.submit(fetch_nato_members, lookup)
+        min_wage_job = pool.submit(fetch_minimum_wage, lookup)
+        bigmac_job = pool.submit(fetch_big_mac_index, lookup)
+        nato_members, nato_unknown = nato_job.result()
+        min_wage_by_country, min_wage_unknown = min_wage_job.result()
+        bigmac_by_country, bigmac_meta, bigmac_unknown = bigmac_job.result()
 
     # Static BRICS+ list (as of Jan 2025 expansion, incl. Indonesia; canonicalized via mappings)
     # Source: brics.br (Brazilian BRICS presidency comms).
@@ -444,6 +404,7 @@ def main() -> None:
     print("- BRICS+ members:", len(brics_plus))
     print("- Min wage countries:", len(min_wage_by_country), "(unknown:", len(min_wage_unknown), ")")
     print("- Big Mac countries:", len(bigmac_by_country), "as of", bigmac_meta.get("latest_date"))
+    print("- HTTP:", http_cache.summary())
 
     # Exit non-zero only if critical datasets are empty.
     if not nato_members or not bigmac_by_country:
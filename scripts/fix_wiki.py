@@ -7,20 +7,33 @@ Goals:
 - Replace legacy Google-Translate + Special:Search links with direct article URLs.
 - Store the resolved link in `wikipedia_url` and remove `[Wikipedia](...)` from descriptions.
 - Regenerate offline Admin embeds (admin/data.js, admin/country_mappings.js).
+
+Resolution is batched: langlinks are looked up 50 titles per API call and searches run on a
+small thread pool under one global rate limit. `--api-url` (or WIKI_API_URL) points the
+resolver at another MediaWiki endpoint, e.g. a local stub server for tests. Results persist
+across runs in the SQLite cache from `wiki_cache.py` (`--cache`, `--no-cache`).
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import requests
 
+import http_cache
+from country_index import CountryIndex
+from event_store import EventStore
+from wiki_cache import DEFAULT_CACHE_PATH, LANGLINK, SEARCH, WikiCache
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 DEFAULT_EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -31,6 +44,14 @@ COUNTRY_MAPPINGS_PATH = BASE_DIR / "data" / "country_mappings.json"
 
 USER_AGENT = "Mozilla/5.0 (HaritaBot/1.0; +https://jeopolitik.com.tr)"
 
+# MediaWiki API endpoint; "{lang}" is substituted. Override for a local stub server.
+DEFAULT_API_URL = os.environ.get("WIKI_API_URL") or "https://{lang}.wikipedia.org/w/api.php"
+# MediaWiki accepts up to 50 titles per query for anonymous clients.
+TITLES_PER_REQUEST = 50
+DEFAULT_MAX_WORKERS = 8
+# Global cap across all worker threads (the old serial loop slept 50ms between calls).
+DEFAULT_REQUESTS_PER_SECOND = 20.0
+
 
 WIKI_MD_RE = re.compile(r"\[Wikipedia\]\(([^)]+)\)")
 
@@ -121,94 +142,179 @@ def _wiki_url(lang: str, title: str) -> str:
     return f"https://{lang}.wikipedia.org/wiki/{urllib.parse.quote(t)}"
 
 
+class RateLimiter:
+    """Global requests-per-second cap shared by all worker threads."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
 class WikiResolver:
-    def __init__(self) -> None:
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": USER_AGENT})
+    def __init__(
+        self,
+        api_url: str = DEFAULT_API_URL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        cache: Optional[WikiCache] = None,
+    ) -> None:
+        self.api_url = api_url
+        self.cache = cache
+        self.max_workers = max(1, int(max_workers))
+        self.limiter = RateLimiter(requests_per_second)
+        self._local = threading.local()
         self.search_cache: Dict[Tuple[str, str], str] = {}
         self.langlink_cache: Dict[Tuple[str, str, str], str] = {}
-        self._last_req = 0.0
+        self.requests_made = 0
+        self._count_lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        # requests.Session is not guaranteed thread-safe: one per worker thread.
+        sess = getattr(self._local, "session", None)
+        if sess is None:
+            sess = requests.Session()
+            sess.headers.update({"User-Agent": USER_AGENT})
+            self._local.session = sess
+        return sess
+
+    def _api_get(self, lang: str, params: Dict[str, object]) -> Optional[dict]:
+        """One rate-limited API call (via http_cache); None on HTTP/network/JSON errors."""
+        if http_cache.get_mode() != "offline":
+            self.limiter.wait()
+            with self._count_lock:
+                self.requests_made += 1
+        try:
+            return http_cache.fetch_json(self.api_url.format(lang=lang), params=params, timeout=10, session=self.session)
+        except Exception:
+            return None
+
+    def _cached(self, memory: dict, kind: str, key: tuple) -> Optional[str]:
+        """Run-local dict first, then the persistent cache (copied into the dict)."""
+        if key in memory:
+            return memory[key]
+        if self.cache is not None:
+            value = self.cache.get(kind, key)
+            if value is not None:
+                memory[key] = value
+                return value
+        return None
 
-    def _throttle(self) -> None:
-        # Be kind: tiny delay between API calls.
-        now = time.time()
-        if now - self._last_req < 0.05:
-            time.sleep(0.05 - (now - self._last_req))
-        self._last_req = time.time()
+    def _remember(self, memory: dict, kind: str, key: tuple, value: str, ok: bool) -> None:
+        # Failed requests are only remembered for this run, never persisted.
+        memory[key] = value
+        if ok and self.cache is not None:
+            self.cache.put(kind, key, value)
 
     def search_title(self, query: str, lang: str) -> str:
         q = (query or "").strip()
         if not q:
             return ""
-        key = (lang, q)
-        if key in self.search_cache:
-            return self.search_cache[key]
-
-        self._throttle()
-        try:
-            r = self.session.get(
-                f"https://{lang}.wikipedia.org/w/api.php",
-                params={
-                    "action": "query",
-                    "list": "search",
-                    "srsearch": q,
-                    "srlimit": 1,
-                    "format": "json",
-                    "utf8": 1,
-                },
-                timeout=10,
-            )
-            if r.status_code != 200:
-                self.search_cache[key] = ""
-                return ""
-            data = r.json()
+        cached = self._cached(self.search_cache, SEARCH, (lang, q))
+        if cached is not None:
+            return cached
+        return self._search_remote(q, lang)
+
+    def _search_remote(self, q: str, lang: str) -> str:
+        """API search for a query already known to be uncached (so the cache is probed once)."""
+        data = self._api_get(
+            lang,
+            {
+                "action": "query",
+                "list": "search",
+                "srsearch": q,
+                "srlimit": 1,
+                "format": "json",
+                "utf8": 1,
+            },
+        )
+        title = ""
+        if data:
             hits = (data.get("query") or {}).get("search") or []
             title = (hits[0].get("title") if hits else "") or ""
-            self.search_cache[key] = title
-            return title
-        except Exception:
-            self.search_cache[key] = ""
-            return ""
+        self._remember(self.search_cache, SEARCH, (lang, q), title, data is not None)
+        return title
+
+    def search_titles(self, queries: Iterable[str], lang: str) -> Dict[str, str]:
+        """Search many queries concurrently (bounded by max_workers, global rate limit)."""
+        queries = list(queries)  # iterated twice; a generator would be empty the second time
+        distinct = dict.fromkeys(q for q in ((q or "").strip() for q in queries) if q)
+        wanted = [q for q in distinct if self._cached(self.search_cache, SEARCH, (lang, q)) is None]
+        if wanted:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(lambda q: self._search_remote(q, lang), wanted))
+        return {q: self.search_cache.get((lang, (q or "").strip()), "") for q in queries}
 
     def langlink_title(self, from_title: str, from_lang: str, to_lang: str) -> str:
         title = (from_title or "").strip()
         if not title:
             return ""
-        key = (from_lang, to_lang, title)
-        if key in self.langlink_cache:
-            return self.langlink_cache[key]
-
-        self._throttle()
-        try:
-            r = self.session.get(
-                f"https://{from_lang}.wikipedia.org/w/api.php",
-                params={
-                    "action": "query",
-                    "prop": "langlinks",
-                    "titles": title,
-                    "redirects": 1,
-                    "lllang": to_lang,
-                    "format": "json",
-                    "utf8": 1,
-                },
-                timeout=10,
-            )
-            if r.status_code != 200:
-                self.langlink_cache[key] = ""
-                return ""
-            data = r.json()
-            pages = (data.get("query") or {}).get("pages") or {}
-            out = ""
-            for page in pages.values():
-                ll = page.get("langlinks") or []
-                if ll:
-                    out = (ll[0].get("*") or ll[0].get("title") or "").strip()
+        return self.langlink_titles([title], from_lang, to_lang).get(title, "")
+
+    def langlink_titles(self, titles: Iterable[str], from_lang: str, to_lang: str) -> Dict[str, str]:
+        """Interlanguage titles for many pages, TITLES_PER_REQUEST titles per API call."""
+        titles = list(titles)  # iterated twice; a generator would be empty the second time
+        distinct = dict.fromkeys(t for t in ((t or "").strip() for t in titles) if t)
+        wanted = [t for t in distinct if self._cached(self.langlink_cache, LANGLINK, (from_lang, to_lang, t)) is None]
+
+        batches = [wanted[i:i + TITLES_PER_REQUEST] for i in range(0, len(wanted), TITLES_PER_REQUEST)]
+        if batches:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(lambda b: self._langlink_batch(b, from_lang, to_lang), batches))
+
+        out: Dict[str, str] = {}
+        for t in titles:
+            t = (t or "").strip()
+            if t:
+                out[t] = self.langlink_cache.get((from_lang, to_lang, t), "")
+        return out
+
+    def _langlink_batch(self, titles: Sequence[str], from_lang: str, to_lang: str) -> None:
+        data = self._api_get(
+            from_lang,
+            {
+                "action": "query",
+                "prop": "langlinks",
+                "titles": "|".join(titles),
+                "redirects": 1,
+                "lllang": to_lang,
+                "lllimit": "max",
+                "format": "json",
+                "utf8": 1,
+            },
+        )
+        query = (data or {}).get("query") or {}
+
+        # Follow title normalization ("foo" -> "Foo") and redirects back to the requested titles.
+        renames: Dict[str, str] = {}
+        for step in (query.get("normalized") or []) + (query.get("redirects") or []):
+            if step.get("from") and step.get("to"):
+                renames[step["from"]] = step["to"]
+
+        by_page_title: Dict[str, str] = {}
+        for page in (query.get("pages") or {}).values():
+            ll = page.get("langlinks") or []
+            if ll and page.get("title"):
+                by_page_title[page["title"]] = (ll[0].get("*") or ll[0].get("title") or "").strip()
+
+        for t in titles:
+            final = t
+            for _ in range(3):  # normalized -> redirect (-> normalized redirect target)
+                if final not in renames:
                     break
-            self.langlink_cache[key] = out
-            return out
-        except Exception:
-            self.langlink_cache[key] = ""
-            return ""
+                final = renames[final]
+            self._remember(
+                self.langlink_cache, LANGLINK, (from_lang, to_lang, t), by_page_title.get(final, ""), data is not None
+            )
 
     def resolve_prefer_tr(self, url_or_title: str, from_lang: str = "en") -> str:
         """
@@ -265,12 +371,54 @@ class WikiResolver:
 
         return ""
 
+    def resolve_by_queries(self, items: Sequence[Tuple[str, str]]) -> List[str]:
+        """Batch form of resolve_by_query for (query, country) pairs; same priority order.
+
+        Each fallback stage (TR with country, TR, EN with country, EN) only searches the items
+        still unresolved, concurrently; EN hits are then mapped to TR with batched langlinks.
+        """
+        stages: List[List[Tuple[str, str]]] = []
+        for q, c in items:
+            q = (q or "").strip()
+            c = (c or "").strip()
+            variants = [f"{c} {q}", q] if c else [q]
+            stages.append([("tr", v) for v in variants] + [("en", v) for v in variants] if q else [])
+
+        hits: List[Optional[Tuple[str, str]]] = [None] * len(items)  # (lang, title)
+        depth = max((len(st) for st in stages), default=0)
+        for step in range(depth):
+            todo = [i for i, st in enumerate(stages) if hits[i] is None and step < len(st)]
+            for lang in ("tr", "en"):
+                batch = [i for i in todo if stages[i][step][0] == lang]
+                if not batch:
+                    continue
+                found = self.search_titles([stages[i][step][1] for i in batch], lang)
+                for i in batch:
+                    title = found.get(stages[i][step][1], "")
+                    if title:
+                        hits[i] = (lang, title)
+
+        en_titles = [h[1] for h in hits if h and h[0] == "en"]
+        tr_for_en = self.langlink_titles(en_titles, "en", "tr") if en_titles else {}
+
+        out: List[str] = []
+        for h in hits:
+            if not h:
+                out.append("")
+            elif h[0] == "tr":
+                out.append(_wiki_url("tr", h[1]))
+            else:
+                tr_title = tr_for_en.get(h[1], "")
+                out.append(_wiki_url("tr", tr_title) if tr_title else _wiki_url("en", h[1]))
+        return out
+
 
-def fix_wiki_links(events_path: Path) -> None:
-    data = json.loads(events_path.read_text(encoding="utf-8"))
-    events = data.get("events") or []
+def fix_wiki_links(events_path: Path, resolver: Optional[WikiResolver] = None) -> None:
+    store = EventStore.load(events_path)
+    data = store.data
+    events = store.events
 
-    resolver = WikiResolver()
+    resolver = resolver or WikiResolver()
 
     updated_desc = 0
     updated_wiki = 0
@@ -278,6 +426,9 @@ def fix_wiki_links(events_path: Path) -> None:
     kept_wiki = 0
     unresolved = 0
 
+    # Pass 1: clean descriptions and decide how each event's link gets resolved.
+    # plan entry: (event, old_url, kind, value, country); kind: "url" | "en_title" | "query" | None
+    plans = []
     for ev in events:
         if not isinstance(ev, dict):
             continue
@@ -296,27 +447,46 @@ def fix_wiki_links(events_path: Path) -> None:
         old_url = (ev.get("wikipedia_url") or "").strip()
         candidate_url = _unwrap_translate(old_url or desc_url)
 
-        new_url = ""
+        kind, value = None, ""
 
         has_hint = bool(old_url) or bool(desc_url) or desc_has_wiki
 
         if has_hint:
             parsed = _parse_wikipedia_url(candidate_url)
             if parsed:
-                lang, kind, value = parsed
-                if kind == "page":
+                lang, pkind, pvalue = parsed
+                if pkind == "page":
                     if lang == "tr":
-                        new_url = _wiki_url("tr", value)
+                        kind, value = "url", _wiki_url("tr", pvalue)
                     elif lang == "en":
-                        new_url = resolver.resolve_prefer_tr(value, from_lang="en")
+                        kind, value = "en_title", pvalue.replace("_", " ").strip()
                     else:
-                        new_url = _wiki_url(lang, value)
-                elif kind == "search":
-                    query = value or title
-                    new_url = resolver.resolve_by_query(query, country=country)
+                        kind, value = "url", _wiki_url(lang, pvalue)
+                elif pkind == "search":
+                    kind, value = "query", pvalue or title
             else:
                 # No usable URL: resolve from the event's title (only when we had a wiki hint).
-                new_url = resolver.resolve_by_query(title, country=country)
+                kind, value = "query", title
+
+        plans.append((ev, old_url, kind, value, country))
+
+    # Pass 2: resolve everything that needs the API in batches.
+    en_titles = [value for _, _, kind, value, _ in plans if kind == "en_title"]
+    tr_for_en = resolver.langlink_titles(en_titles, "en", "tr") if en_titles else {}
+    query_plans = [i for i, p in enumerate(plans) if p[2] == "query"]
+    query_urls = resolver.resolve_by_queries([(plans[i][3], plans[i][4]) for i in query_plans])
+    url_for_query = dict(zip(query_plans, query_urls))
+
+    # Pass 3: apply.
+    for i, (ev, old_url, kind, value, _country) in enumerate(plans):
+        new_url = ""
+        if kind == "url":
+            new_url = value
+        elif kind == "en_title" and value:
+            tr_title = tr_for_en.get(value, "")
+            new_url = _wiki_url("tr", tr_title) if tr_title else _wiki_url("en", value)
+        elif kind == "query":
+            new_url = url_for_query.get(i, "")
 
         if new_url:
             if not old_url:
@@ -334,20 +504,14 @@ def fix_wiki_links(events_path: Path) -> None:
             else:
                 unresolved += 1
 
-    events_path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    store.save()
 
     # Regenerate offline Admin embeds
     ADMIN_EVENTS_EMBED_PATH.write_text(
         "window.__EVENTS_DATA__ = " + json.dumps(data, ensure_ascii=False) + ";\n",
         encoding="utf-8",
     )
-    country_mappings = json.loads(COUNTRY_MAPPINGS_PATH.read_text(encoding="utf-8"))
-    ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.write_text(
-        "window.__COUNTRY_MAPPINGS__ = "
-        + json.dumps(country_mappings.get("countries") or [], ensure_ascii=False)
-        + ";\n",
-        encoding="utf-8",
-    )
+    ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.write_text(CountryIndex.load(COUNTRY_MAPPINGS_PATH).admin_embed(), encoding="utf-8")
 
     print("Wiki normalization complete.")
     print(f"- Description wiki links removed: {updated_desc}")
@@ -355,15 +519,32 @@ def fix_wiki_links(events_path: Path) -> None:
     print(f"- wikipedia_url updated (existing changed): {updated_wiki}")
     print(f"- wikipedia_url unchanged: {kept_wiki}")
     print(f"- unresolved (still empty): {unresolved}")
-    print(f"- wrote: {events_path}")
+    print(f"- API requests: {resolver.requests_made}")
+    if resolver.cache is not None:
+        resolver.cache.flush()
+        print(f"- wiki cache: {resolver.cache.summary()}")
+    print(f"- wrote: {store.path}")
     print(f"- admin embeds: {ADMIN_EVENTS_EMBED_PATH}, {ADMIN_COUNTRY_MAPPINGS_EMBED_PATH}")
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--events", default=str(DEFAULT_EVENTS_PATH), help="Path to events.json")
+    parser.add_argument("--api-url", default=DEFAULT_API_URL, help="MediaWiki API URL template ({lang} is substituted)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS, help="Concurrent search requests")
+    parser.add_argument("--rps", type=float, default=DEFAULT_REQUESTS_PER_SECOND, help="Global API requests per second")
+    parser.add_argument("--cache", default=str(DEFAULT_CACHE_PATH), help="SQLite lookup cache path")
+    parser.add_argument("--no-cache", action="store_true", help="Do not read or write the persistent lookup cache")
+    parser.add_argument("--http-cache", choices=http_cache.MODES, default=http_cache.get_mode(), help="HTTP record/replay mode")
     args = parser.parse_args()
-    fix_wiki_links(Path(args.events))
+    http_cache.set_mode(args.http_cache)
+    cache = None if args.no_cache else WikiCache(Path(args.cache))
+    resolver = WikiResolver(api_url=args.api_url, max_workers=args.workers, requests_per_second=args.rps, cache=cache)
+    try:
+        fix_wiki_links(Path(args.events), resolver=resolver)
+    finally:
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -11,6 +11,16 @@ Safety rules (high confidence only):
 - Always merges if wikipedia_url matches (non-empty) within the same country+year.
 - Otherwise requires high title similarity; for borderline similarity, requires same category.
 
+Candidate blocking (`--blocking lsh`):
+- MinHash/LSH over title character shingles plus exact wikipedia_url blocking propose pairs
+  in near-linear time, across neighbouring years (`--year-window`) and country spelling
+  variants (same folded name or same country_code).
+- The same `_is_probable_duplicate` rules confirm candidates; across years the
+  wikipedia_url shortcut is not used (one article often covers several yearly events),
+  and titles with fewer than 3 content tokens must share the year ('Mao' 1939 and 'Mao' 1940
+  are different events).
+- `--compare` reports recall of LSH blocking against the bucketed (country, year) pass.
+
 When duplicates are found:
 - Keep the "best" record (richest fields) and merge data from others.
 - Remove the extra records.
@@ -19,13 +29,19 @@ When duplicates are found:
 from __future__ import annotations
 
 import argparse
-import json
+import random
 import re
+import time
 import unicodedata
+import zlib
 from dataclasses import dataclass
 from difflib import SequenceMatcher
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from event_store import EventStore
+from text_matcher import fold_ascii
 
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -73,6 +89,7 @@ STOPWORDS = {
 }
 
 
+@lru_cache(maxsize=None)
 def _norm_title(s: str) -> str:
     if not s:
         return ""
@@ -86,7 +103,8 @@ def _norm_title(s: str) -> str:
     return s
 
 
-def _tokens(s: str) -> set[str]:
+@lru_cache(maxsize=None)
+def _tokens(s: str) -> frozenset[str]:
     ns = _norm_title(s)
     parts = re.split(r"[\s\-:]+", ns)
     out = set()
@@ -98,10 +116,10 @@ def _tokens(s: str) -> set[str]:
         if len(p) <= 2:
             continue
         out.add(p)
-    return out
+    return frozenset(out)
 
 
-def _jaccard(a: set[str], b: set[str]) -> float:
+def _jaccard(a: frozenset[str], b: frozenset[str]) -> float:
     if not a or not b:
         return 0.0
     return len(a & b) / len(a | b)
@@ -117,10 +135,10 @@ def _title_sim(a: str, b: str) -> Tuple[float, float]:
     return r, j
 
 
-def _is_probable_duplicate(e1: Dict[str, Any], e2: Dict[str, Any]) -> bool:
+def _is_probable_duplicate(e1: Dict[str, Any], e2: Dict[str, Any], wiki_shortcut: bool = True) -> bool:
     w1 = (e1.get("wikipedia_url") or "").strip()
     w2 = (e2.get("wikipedia_url") or "").strip()
-    if w1 and w2 and w1 == w2:
+    if wiki_shortcut and w1 and w2 and w1 == w2:
         return True
 
     t1 = (e1.get("title") or "").strip()
@@ -214,9 +232,8 @@ class DedupeResult:
     removed: int = 0
 
 
-def _dedupe(events: List[Dict[str, Any]], countries_filter: set[str] | None) -> Tuple[List[Dict[str, Any]], Dict[str, DedupeResult]]:
-    # Group indices by (country, year)
-    buckets: Dict[Tuple[str, int], List[int]] = {}
+def _eligible(events: List[Dict[str, Any]], countries_filter: set[str] | None) -> List[int]:
+    out = []
     for i, ev in enumerate(events):
         if not isinstance(ev, dict):
             continue
@@ -226,98 +243,246 @@ def _dedupe(events: List[Dict[str, Any]], countries_filter: set[str] | None) ->
             continue
         if countries_filter and c not in countries_filter:
             continue
-        buckets.setdefault((c, y), []).append(i)
+        out.append(i)
+    return out
+
+
+def _bucket_pairs(events: List[Dict[str, Any]], idxs: List[int]) -> Tuple[Set[Tuple[int, int]], int]:
+    """Confirmed duplicate pairs from the all-pairs pass inside each (country, year) bucket."""
+    buckets: Dict[Tuple[str, int], List[int]] = {}
+    for i in idxs:
+        ev = events[i]
+        buckets.setdefault(((ev.get("country_name") or "").strip(), ev["year"]), []).append(i)
+
+    pairs: Set[Tuple[int, int]] = set()
+    compared = 0
+    for bucket in buckets.values():
+        for ii in range(len(bucket)):
+            for jj in range(ii + 1, len(bucket)):
+                i = bucket[ii]
+                j = bucket[jj]
+                compared += 1
+                if _is_probable_duplicate(events[i], events[j]):
+                    pairs.add((i, j))
+    return pairs, compared
+
+
+# MinHash/LSH parameters: 16 bands x 2 rows -> pairs with shingle Jaccard >= ~0.25 collide
+# in at least one band with high probability (near-duplicates sit far above that).
+LSH_BANDS = 16
+LSH_ROWS = 2
+# Short titles ('Mao', 'Afganistan', 'Trump İmpeachment') recur as distinct events in
+# consecutive years; below this many content tokens a pair must share the year.
+CROSS_YEAR_MIN_TOKENS = 3
+_MINHASH_PRIME = (1 << 61) - 1
+_MINHASH_PARAMS = [
+    (rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME))
+    for rng in [random.Random(20240601)]
+    for _ in range(LSH_BANDS * LSH_ROWS)
+]
+
+
+def _shingles(title: str, k: int = 3) -> Set[int]:
+    s = _norm_title(title)
+    if len(s) <= k:
+        return {zlib.crc32(s.encode("utf-8"))} if s else set()
+    return {zlib.crc32(s[i:i + k].encode("utf-8")) for i in range(len(s) - k + 1)}
+
+
+def _minhash(hashes: Set[int]) -> Tuple[int, ...]:
+    return tuple(min((a * h + b) % _MINHASH_PRIME for h in hashes) for a, b in _MINHASH_PARAMS)
 
-    keep = [True] * len(events)
-    per_country: Dict[str, DedupeResult] = {}
 
-    # For each bucket, build connected components of duplicates.
-    for (country, year), idxs in buckets.items():
-        if len(idxs) <= 1:
+def _country_key(ev: Dict[str, Any]) -> str:
+    return fold_ascii(ev.get("country_name") or "")
+
+
+def _same_country(e1: Dict[str, Any], e2: Dict[str, Any]) -> bool:
+    if _country_key(e1) == _country_key(e2):
+        return True
+    c1 = (e1.get("country_code") or "").strip().lower()
+    c2 = (e2.get("country_code") or "").strip().lower()
+    return bool(c1) and c1 == c2
+
+
+def _lsh_candidates(events: List[Dict[str, Any]], idxs: List[int], year_window: int) -> Set[Tuple[int, int]]:
+    """Candidate pairs from MinHash band collisions and identical wikipedia_url, pre-filtered
+    to neighbouring years and the same country (spelling-insensitive)."""
+    blocks: Dict[Tuple[Any, ...], List[int]] = {}
+    for i in idxs:
+        ev = events[i]
+        hashes = _shingles(ev.get("title") or "")
+        if hashes:
+            sig = _minhash(hashes)
+            for b in range(LSH_BANDS):
+                blocks.setdefault(("band", b, sig[b * LSH_ROWS:(b + 1) * LSH_ROWS]), []).append(i)
+        wiki = (ev.get("wikipedia_url") or "").strip()
+        if wiki:
+            blocks.setdefault(("wiki", wiki), []).append(i)
+
+    candidates: Set[Tuple[int, int]] = set()
+    for members in blocks.values():
+        if len(members) <= 1:
+            continue
+        for ii in range(len(members)):
+            for jj in range(ii + 1, len(members)):
+                i, j = members[ii], members[jj]
+                if i > j:
+                    i, j = j, i
+                if (i, j) in candidates:
+                    continue
+                e1, e2 = events[i], events[j]
+                if abs(e1["year"] - e2["year"]) > year_window or not _same_country(e1, e2):
+                    continue
+                candidates.add((i, j))
+    return candidates
+
+
+def _lsh_pairs(events: List[Dict[str, Any]], idxs: List[int], year_window: int) -> Tuple[Set[Tuple[int, int]], int]:
+    """Confirmed duplicate pairs among LSH candidates."""
+    candidates = _lsh_candidates(events, idxs, year_window)
+    pairs: Set[Tuple[int, int]] = set()
+    for i, j in candidates:
+        e1, e2 = events[i], events[j]
+        if e1["year"] != e2["year"] and min(
+            len(_tokens(e1.get("title") or "")), len(_tokens(e2.get("title") or ""))
+        ) < CROSS_YEAR_MIN_TOKENS:
             continue
+        same_bucket = e1["year"] == e2["year"] and (e1.get("country_name") or "").strip() == (e2.get("country_name") or "").strip()
+        if _is_probable_duplicate(e1, e2, wiki_shortcut=same_bucket):
+            pairs.add((i, j))
+    return pairs, len(candidates)
 
-        parent = {i: i for i in idxs}
 
-        def find(x: int) -> int:
-            while parent[x] != x:
-                parent[x] = parent[parent[x]]
-                x = parent[x]
-            return x
+def _merge_components(events: List[Dict[str, Any]], pairs: Iterable[Tuple[int, int]]) -> Tuple[List[Dict[str, Any]], Dict[str, DedupeResult]]:
+    parent: Dict[int, int] = {}
 
-        def union(a: int, b: int) -> None:
-            ra, rb = find(a), find(b)
-            if ra != rb:
-                parent[rb] = ra
+    def find(x: int) -> int:
+        parent.setdefault(x, x)
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
-        for ii in range(len(idxs)):
-            for jj in range(ii + 1, len(idxs)):
-                i = idxs[ii]
-                j = idxs[jj]
-                if _is_probable_duplicate(events[i], events[j]):
-                    union(i, j)
+    def union(a: int, b: int) -> None:
+        ra, rb = find(a), find(b)
+        if ra != rb:
+            parent[rb] = ra
+
+    for i, j in sorted(pairs):
+        union(i, j)
 
-        comps: Dict[int, List[int]] = {}
-        for i in idxs:
-            r = find(i)
-            comps.setdefault(r, []).append(i)
+    comps: Dict[int, List[int]] = {}
+    for i in sorted(parent):
+        comps.setdefault(find(i), []).append(i)
 
-        for comp in comps.values():
-            if len(comp) <= 1:
+    keep = [True] * len(events)
+    per_country: Dict[str, DedupeResult] = {}
+    for comp in comps.values():
+        if len(comp) <= 1:
+            continue
+        # pick best
+        best_i = comp[0]
+        best_s = _score(events[best_i])
+        for i in comp[1:]:
+            sc = _score(events[i])
+            if sc > best_s:
+                best_i = i
+                best_s = sc
+        best = events[best_i]
+        country = (best.get("country_name") or "").strip()
+        per_country.setdefault(country, DedupeResult()).groups += 1
+        # merge others into best, remove others
+        for i in comp:
+            if i == best_i:
                 continue
-            per_country.setdefault(country, DedupeResult()).groups += 1
-            # pick best
-            best_i = comp[0]
-            best_s = _score(events[best_i])
-            for i in comp[1:]:
-                sc = _score(events[i])
-                if sc > best_s:
-                    best_i = i
-                    best_s = sc
-            # merge others into best, remove others
-            best = events[best_i]
-            for i in comp:
-                if i == best_i:
-                    continue
-                _merge_into(best, events[i])
-                keep[i] = False
-                per_country[country].removed += 1
+            _merge_into(best, events[i])
+            keep[i] = False
+            per_country[country].removed += 1
 
     new_events = [ev for i, ev in enumerate(events) if keep[i]]
     return new_events, per_country
 
 
+def _dedupe(
+    events: List[Dict[str, Any]],
+    countries_filter: set[str] | None,
+    blocking: str = "bucket",
+    year_window: int = 1,
+) -> Tuple[List[Dict[str, Any]], Dict[str, DedupeResult]]:
+    idxs = _eligible(events, countries_filter)
+    if blocking == "lsh":
+        pairs, _ = _lsh_pairs(events, idxs, year_window)
+    else:
+        pairs, _ = _bucket_pairs(events, idxs)
+    return _merge_components(events, pairs)
+
+
+def _compare_blocking(events: List[Dict[str, Any]], countries_filter: set[str] | None, year_window: int) -> None:
+    """Print recall of LSH blocking vs. the bucketed pass (pairs confirmed by the same rules)."""
+    idxs = _eligible(events, countries_filter)
+    t0 = time.perf_counter()
+    bucket, bucket_compared = _bucket_pairs(events, idxs)
+    t1 = time.perf_counter()
+    lsh, lsh_candidates = _lsh_pairs(events, idxs, year_window)
+    t2 = time.perf_counter()
+
+    both = bucket & lsh
+    recall = len(both) / len(bucket) if bucket else 1.0
+    print(f"blocking compare (year_window={year_window}):")
+    print(f"- bucket: comparisons={bucket_compared} pairs={len(bucket)} time={t1 - t0:.2f}s")
+    print(f"- lsh:    candidates={lsh_candidates} pairs={len(lsh)} time={t2 - t1:.2f}s")
+    print(f"- recall of lsh vs bucket: {recall:.3f} ({len(both)}/{len(bucket)})")
+    missed = sorted(bucket - lsh)
+    extra = sorted(lsh - bucket)
+    if missed:
+        print(f"- missed by lsh: {len(missed)}")
+        for i, j in missed[:20]:
+            print(f"  - {events[i].get('country_name')} {events[i].get('year')}: {events[i].get('title')!r} ~ {events[j].get('title')!r}")
+    if extra:
+        print(f"- found only by lsh (cross-year / spelling variants): {len(extra)}")
+        for i, j in extra[:20]:
+            e1, e2 = events[i], events[j]
+            print(f"  - {e1.get('country_name')} {e1.get('year')} {e1.get('title')!r} ~ {e2.get('country_name')} {e2.get('year')} {e2.get('title')!r}")
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--apply", action="store_true", help="Write changes to data/events.json")
     ap.add_argument("--countries", default="", help="Comma-separated Turkish country names to restrict (e.g. 'Çin,ABD')")
+    ap.add_argument("--blocking", choices=["bucket", "lsh"], default="bucket", help="Candidate generation: (country, year) buckets or MinHash/LSH")
+    ap.add_argument("--year-window", type=int, default=1, help="LSH: max year difference between candidates (default 1)")
+    ap.add_argument("--compare", action="store_true", help="Report LSH recall vs. bucketed blocking and exit")
     args = ap.parse_args()
 
     if not EVENTS_PATH.exists():
         print(f"ERROR: not found: {EVENTS_PATH}")
         return 2
 
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events", [])
-    if not isinstance(events, list):
-        print("ERROR: events.json: `events` must be a list")
-        return 2
+    store = EventStore.load(EVENTS_PATH)
+    events = store.events
 
     countries_filter = None
     if args.countries.strip():
         countries_filter = {c.strip() for c in args.countries.split(",") if c.strip()}
 
-    new_events, per_country = _dedupe([e for e in events if isinstance(e, dict)], countries_filter)
+    events = [e for e in events if isinstance(e, dict)]
+    if args.compare:
+        _compare_blocking(events, countries_filter, args.year_window)
+        return 0
+
+    new_events, per_country = _dedupe(events, countries_filter, blocking=args.blocking, year_window=args.year_window)
 
     total_groups = sum(r.groups for r in per_country.values())
     total_removed = sum(r.removed for r in per_country.values())
-    print(f"fuzzy_dedupe: groups={total_groups} removed={total_removed} events_before={len(events)} events_after={len(new_events)}")
+    print(f"fuzzy_dedupe[{args.blocking}]: groups={total_groups} removed={total_removed} events_before={len(events)} events_after={len(new_events)}")
     for c in sorted(per_country.keys()):
         r = per_country[c]
         print(f"- {c}: groups={r.groups} removed={r.removed}")
 
     if args.apply and total_removed:
-        data["events"] = new_events
-        EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        store.events = new_events
+        store.save()
         print(f"wrote: {EVENTS_PATH}")
 
     return 0
@@ -3,14 +3,135 @@
 Geopolitical History Map - Interactive world map showing major events from the last 100 years.
 """
 
+import hashlib
 import json
 import os
+import re
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List
 
-import folium
-from folium.plugins import MarkerCluster
-import branca
+from country_index import COUNTRY_LOOKUP_JS, CountryIndex
+from coverage_cube import CoverageCube, load_regions
+from disaster_summary import DISASTER_DIR_NAME, split_metadata, write_country_files
+from event_store import EventStore, shard_file_name
+from text_matcher import AhoCorasick, casefold_tr
+
+# folium/branca/jinja2 are imported lazily by the folium renderer only; the direct renderer
+# writes the page itself and does not pay their import cost.
+
+
+def _compile_template(text: str) -> List[tuple]:
+    """Split a page template into (literal, slot) pairs once, at import time."""
+    parts = re.split(r"\{\{(\w+)\}\}", text)
+    parts.append(None)
+    return [(parts[i], parts[i + 1]) for i in range(0, len(parts) - 1, 2)]
+
+
+# Page skeleton for the direct (folium-free) renderer. Mirrors the markup folium emits for
+# folium.Map(tiles='CartoDB positron', prefer_canvas=True) + AwesomeMarkers icons.
+DIRECT_PAGE_TEMPLATE = _compile_template('''<!DOCTYPE html>
+<html>
+<head>
+    <meta http-equiv="content-type" content="text/html; charset=UTF-8" />
+    <script src="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.js"></script>
+    <script src="https://code.jquery.com/jquery-3.7.1.min.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.2.2/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.js"></script>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/leaflet@1.9.3/dist/leaflet.css"/>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/bootstrap@5.2.2/dist/css/bootstrap.min.css"/>
+    <link rel="stylesheet" href="https://netdna.bootstrapcdn.com/bootstrap/3.0.0/css/bootstrap-glyphicons.css"/>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/npm/@fortawesome/fontawesome-free@6.2.0/css/all.min.css"/>
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/Leaflet.awesome-markers/2.0.2/leaflet.awesome-markers.css"/>
+    <link rel="stylesheet" href="https://cdn.jsdelivr.net/gh/python-visualization/folium/folium/templates/leaflet.awesome.rotate.min.css"/>
+    <meta name="viewport" content="width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no" />
+    <style>
+        #geo_map {
+            position: relative;
+            width: 100.0%;
+            height: 100.0%;
+            left: 0.0%;
+            top: 0.0%;
+        }
+        .leaflet-container { font-size: 1rem; }
+    </style>
+    <style>html, body {
+        width: 100%;
+        height: 100%;
+        margin: 0;
+        padding: 0;
+    }
+    </style>
+    <style>#map {
+        position:absolute;
+        top:0;
+        bottom:0;
+        right:0;
+        left:0;
+        }
+    </style>
+    <script>
+        L_NO_TOUCH = false;
+        L_DISABLE_3D = false;
+    </script>
+</head>
+<body>
+{{custom_css_js}}
+<div class="folium-map" id="geo_map"></div>
+<script>
+var geo_map = L.map("geo_map", {
+    center: [30.0, 20.0],
+    crs: L.CRS.EPSG3857,
+    zoom: 3,
+    zoomControl: true,
+    preferCanvas: true
+});
+L.tileLayer("https://{s}.basemaps.cartocdn.com/light_all/{z}/{x}/{y}{r}.png", {
+    minZoom: 0,
+    maxZoom: 20,
+    maxNativeZoom: 20,
+    noWrap: false,
+    attribution: "&copy; <a href=\\"https://www.openstreetmap.org/copyright\\">OpenStreetMap</a> contributors &copy; <a href=\\"https://carto.com/attributions\\">CARTO</a>",
+    subdomains: "abcd",
+    detectRetina: false,
+    tms: false,
+    opacity: 1
+}).addTo(geo_map);
+// [lat, lon, tooltip, popupHtml, markerColor, icon]
+const geoMapMarkers = [
+{{markers}}];
+geoMapMarkers.forEach(function(m) {
+    L.marker([m[0], m[1]], {})
+        .addTo(geo_map)
+        .bindPopup(L.popup({ maxWidth: 350 }).setContent(
+            '<div style="width: 100.0%; height: 100.0%;">' + m[3] + '</div>'))
+        .bindTooltip('<div>' + m[2] + '</div>', { sticky: true })
+        .setIcon(L.AwesomeMarkers.icon({
+            markerColor: m[4],
+            iconColor: "white",
+            icon: m[5],
+            prefix: "fa",
+            extraClasses: "fa-rotate-0"
+        }));
+});
+</script>
+{{marker_tracking}}
+</body>
+</html>
+''')
+
+
+# Dataset payloads are written with an incremental encoder so no full JSON string of a dataset
+# (events, GeoJSON, metadata...) is ever materialized; see GeopoliticalMap._iter_template.
+_JSON_STREAM_ENCODER = json.JSONEncoder(ensure_ascii=False)
+# Marks where a payload goes inside an otherwise small CSS/JS template string.
+_PAYLOAD_SLOT = "\x00{}\x00"
+_PAYLOAD_SLOT_RE = re.compile("\x00(\\w+)\x00")
+
+
+def _js_literal(value) -> str:
+    """JSON-encode a value for inlining into a <script> block."""
+    return json.dumps(value, ensure_ascii=False).replace("</", "<\\/")
 
 
 class GeopoliticalMap:
@@ -18,13 +139,17 @@ class GeopoliticalMap:
 
     DECADES = ["1920s", "1930s", "1940s", "1950s", "1960s", "1970s", "1980s", "1990s", "2000s", "2010s", "2020s"]
 
-    def __init__(self, data_path: str = None):
+    def __init__(self, data_path: str = None, deterministic: bool = False):
         self.base_dir = Path(__file__).parent.parent
         self.data_path = data_path or self.base_dir / "data" / "events.json"
         self.output_dir = self.base_dir / "output"
+        # Deterministic mode: output bytes depend only on input data + code (stable element ids,
+        # no wall-clock time in the HTML). See create_map().
+        self.deterministic = deterministic
         self.events = []
         self.categories = {}
         self.build_info = {}
+        self.shard_hashes = {}
         self._load_data()
 
     # Mapping of specific events to 32. Gün YouTube video IDs
@@ -46,10 +171,11 @@ class GeopoliticalMap:
     }
 
     def _load_data(self):
-        with open(self.data_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            self.events = data.get('events', [])
-            self.categories = data.get('categories', {})
+        store = EventStore.load(Path(self.data_path))
+        # Sharded layout: per-country shard hashes let unchanged countries reuse cached markers.
+        self.shard_hashes = store.shard_hashes
+        self.events = store.events
+        self.categories = store.data.get('categories', {})
 
         # Keep Admin + Map aligned: normalize decade from year and ensure every used category
         # has a definition (some datasets include categories that were not added to `categories`).
@@ -116,36 +242,13 @@ class GeopoliticalMap:
         if metadata_path.exists():
             with open(metadata_path, 'r', encoding='utf-8') as f:
                 self.country_metadata = json.load(f)
+        # The page only gets disaster summaries; full lists become lazily fetched per-country files.
+        self.page_country_metadata, self.disaster_files = split_metadata(self.country_metadata)
 
-        # Load Master Country Mappings
+        # Load Master Country Mappings (one folded name/alias index, shared with the page)
         mappings_path = self.base_dir / "data" / "country_mappings.json"
-        self.country_mappings = []
-        self.turkish_to_english = {}
-        self.english_to_turkish = {}
-        self.turkish_to_iso = {}
-        if mappings_path.exists():
-            with open(mappings_path, 'r', encoding='utf-8') as f:
-                mappings_data = json.load(f)
-                self.country_mappings = mappings_data.get('countries', [])
-                # Build lookup dictionaries
-                for c in self.country_mappings:
-                    tr = c.get('turkish', '')
-                    en = c.get('english', '')
-                    iso = c.get('iso2', '')
-                    aliases = c.get('aliases', [])
-                    
-                    if tr and en:
-                        self.turkish_to_english[tr] = en
-                        self.english_to_turkish[en] = tr
-                    if tr and iso:
-                        self.turkish_to_iso[tr] = iso
-                    # Handle aliases
-                    for alias in aliases:
-                        if alias and en:
-                            self.english_to_turkish[alias] = tr
-                            self.turkish_to_english[alias] = en
-                        if alias and iso:
-                            self.turkish_to_iso[alias] = iso
+        self.country_index = CountryIndex.load(mappings_path)
+        self.country_mappings = self.country_index.mappings
 
         # Load external indicators/groups (NATO, G8, minimum wage, Big Mac, etc.)
         indicators_path = self.base_dir / "data" / "indicators.json"
@@ -158,21 +261,34 @@ class GeopoliticalMap:
                 print(f"WARNING: Failed to load indicators.json: {e}")
                 self.indicators = {}
 
+        # Region groupings for the coverage cube (event density shading)
+        self.regions = load_regions(self.base_dir / "data" / "regions.json", self.country_index)
+
         # Enrich events with video links (32. Gün vb.)
+        # Exact title first, then the first mapping key (declaration order) contained in the title.
+        video_keys = list(self.VIDEO_MAPPINGS)
+        video_matcher = self._video_matcher()
         for event in self.events:
             title = event.get('title', '')
             vid_id = self.VIDEO_MAPPINGS.get(title)
             if not vid_id:
-                title_lower = title.lower()
-                for key, vid in self.VIDEO_MAPPINGS.items():
-                    if key.lower() in title_lower:
-                        vid_id = vid
-                        break
+                pid = video_matcher.first(title)
+                if pid is not None:
+                    vid_id = self.VIDEO_MAPPINGS[video_keys[pid]]
             if vid_id:
                 event['youtube_video_id'] = vid_id
         # Mükerrer azalt: aynı (ülke, video) en fazla bir olayda kalsın; en uygun olayda tut
         self._deduplicate_youtube_per_country()
 
+    _VIDEO_MATCHER = None
+
+    @classmethod
+    def _video_matcher(cls) -> AhoCorasick:
+        """Aho–Corasick automaton over VIDEO_MAPPINGS keys (casefold_tr, like the video scripts), compiled once."""
+        if cls._VIDEO_MATCHER is None:
+            cls._VIDEO_MATCHER = AhoCorasick(cls.VIDEO_MAPPINGS, normalize=casefold_tr)
+        return cls._VIDEO_MATCHER
+
     def _deduplicate_youtube_per_country(self) -> None:
         """Aynı (ülke, video) birden fazla olayda varsa videoyu sadece en uygun olayda bırakır."""
         from collections import defaultdict
@@ -282,11 +398,35 @@ class GeopoliticalMap:
             }
         )
 
+    @staticmethod
+    def _iter_template(template: str, payloads: dict):
+        """Yield template text, streaming each payload slot through the incremental JSON encoder."""
+        parts = _PAYLOAD_SLOT_RE.split(template)
+        for i, part in enumerate(parts):
+            if i % 2 == 0:
+                yield part
+            else:
+                yield from _JSON_STREAM_ENCODER.iterencode(payloads[part])
+
     def _get_custom_css_js(self) -> str:
         """Get custom CSS and JavaScript for the map."""
-        events_json = json.dumps(self.events, ensure_ascii=False)
-        categories_json = json.dumps(self.categories, ensure_ascii=False)
-        geojson_json = json.dumps(self.geojson_data, ensure_ascii=False) if self.geojson_data else 'null'
+        return "".join(self._iter_custom_css_js())
+
+    def _iter_custom_css_js(self):
+        """Custom CSS and JavaScript for the map, in chunks (datasets are streamed, not pre-serialized)."""
+        payloads = {
+            "events": self.events,
+            "categories": self.categories,
+            "geojson": self.geojson_data or None,
+            "country_metadata": self.page_country_metadata,
+            "indicators": getattr(self, 'indicators', {}),
+            "country_index": self.country_index.js_table(),
+            "coverage": CoverageCube.build(self.events, self.country_index, list(self.categories), self.regions).to_compact(),
+        }
+        slot = {name: _PAYLOAD_SLOT.format(name) for name in payloads}
+        events_json = slot["events"]
+        categories_json = slot["categories"]
+        geojson_json = slot["geojson"]
 
         # Decades are part of the UI filter; derive from data (do not hardcode).
         decades_set = {
@@ -305,16 +445,15 @@ class GeopoliticalMap:
 
         decades_json = json.dumps(sorted(decades_set, key=_decade_sort_key), ensure_ascii=False)
         
-        # Safe serialization for metadata
-        country_metadata_json = json.dumps(self.country_metadata, ensure_ascii=False) if hasattr(self, 'country_metadata') else '{}'
+        # Metadata, external indicators/groups (NATO, G8, min wage, Big Mac etc.)
+        country_metadata_json = slot["country_metadata"]
+        indicators_json = slot["indicators"]
 
-        # External indicators/groups (NATO, G8, min wage, Big Mac etc.)
-        indicators_json = json.dumps(self.indicators, ensure_ascii=False) if hasattr(self, 'indicators') else '{}'
-        
-        # Serialize master mappings for JavaScript
-        turkish_to_english_json = json.dumps(self.turkish_to_english, ensure_ascii=False)
-        english_to_turkish_json = json.dumps(self.english_to_turkish, ensure_ascii=False)
-        turkish_to_iso_json = json.dumps(self.turkish_to_iso, ensure_ascii=False)
+        # Master mappings for JavaScript (countryIndex + resolveCountry(), see country_index.py)
+        country_index_json = slot["country_index"]
+
+        # Country × decade × category counts for the "Olay yoğunluğu" overlay (coverage_cube.py)
+        coverage_json = slot["coverage"]
 
         parse_md_js = r'''
 function parseMarkdownLinks(text) {
@@ -323,7 +462,7 @@ function parseMarkdownLinks(text) {
 }
 '''
 
-        return f'''
+        template = f'''
 <title>Jeopolitik Tarih Haritası | Son 100 Yılın Önemli Olayları</title>
 <meta charset="UTF-8">
 <meta name="description" content="Son 100 yılın dünya tarihindeki en önemli jeopolitik olaylarını interaktif harita üzerinde keşfedin. Savaşlar, antlaşmalar ve krizler.">
@@ -785,6 +924,11 @@ function parseMarkdownLinks(text) {
         color: #b2bec3;
     }}
     .meta-row {{ margin-bottom: 8px; }}
+    .disaster-table {{ width: 100%; border-collapse: collapse; font-size: 12px; }}
+    .disaster-table th, .disaster-table td {{ padding: 2px 4px; text-align: right; border-bottom: 1px solid #333; }}
+    .disaster-table th:first-child, .disaster-table td:first-child {{ text-align: left; }}
+    .disaster-list {{ max-height: 240px; overflow-y: auto; font-size: 12px; }}
+    .disaster-load-btn {{ background: #2d3436; color: #dfe6e9; border: 1px solid #555; border-radius: 4px; padding: 4px 8px; cursor: pointer; }}
     .meta-label {{ color: #636e72; font-size: 11px; text-transform: uppercase; letter-spacing: 0.5px; display: block; margin-bottom: 2px; }}
 
     /* Country Flag Overlay */
@@ -1163,6 +1307,7 @@ function parseMarkdownLinks(text) {
                 <option value="">Gösterge kapalı</option>
                 <option value="min_wage">Asgari Ücret (USD/saat)</option>
                 <option value="bigmac">Big Mac Endeksi (USD)</option>
+                <option value="coverage">Olay yoğunluğu (seçili filtreler)</option>
             </select>
             <div class="indicator-legend" id="indicatorLegend" style="display:none;"></div>
         </div>
@@ -1175,7 +1320,7 @@ function parseMarkdownLinks(text) {
 </div>
 
 <div class="build-info" id="buildInfo">
-    Build: {self.build_info.get("build_time_utc", "unknown")}
+    Build: <span id="buildTime">{self._build_label()}</span>
     <a href="/healthz.json" target="_blank" rel="noopener">health</a>
     <div id="indicatorHoverInfo" style="margin-top:2px; color:#bdc3c7;"></div>
 </div>
@@ -1188,9 +1333,18 @@ function parseMarkdownLinks(text) {
 
 <script>
 {parse_md_js}
+{self._build_time_loader_js()}
 // Data
 const allEvents = {events_json};
 const countryMeta = {country_metadata_json};
+// Country names: every variant (English/GeoJSON, aliases, ASCII spellings) -> one folded-key lookup
+const countryIndex = {country_index_json};
+{COUNTRY_LOOKUP_JS}
+// Canonical Turkish name for any variant; unknown names are returned unchanged
+function canonicalCountry(name) {{
+    const c = resolveCountry(name);
+    return c ? c[0] : name;
+}}
 // Filter out special categories from standard list if needed, or handle in toggleCategory
 const categories = {categories_json};
 const decades = {decades_json};
@@ -1208,7 +1362,13 @@ const externalIndicators = (externalData && externalData.indicators) ? externalD
 window.countryGroups = countryGroups;
 window.externalIndicators = externalIndicators;
 window.activeCountryGroup = null; // 'g8' | 'nato' | 'brics_plus' | null
-window.activeIndicator = ''; // 'min_wage' | 'bigmac' | ''
+window.activeIndicator = ''; // 'min_wage' | 'bigmac' | 'coverage' | ''
+
+// Event counts as flat [country, decade, category, count] cells (coverage_cube.py to_compact())
+const coverageCube = {coverage_json};
+const coverageCountries = new Set(coverageCube.countries);
+const coverageIndicator = {{ label: 'Olay yoğunluğu', unit: 'olay' }};
+let coverageCache = {{ key: null, totals: {{}}, max: 0 }};
 
 // State
 let selectedDecades = new Set(decades);
@@ -1293,6 +1453,26 @@ function formatUsd(value, suffix = '') {{
     return '$' + value.toFixed(2) + suffix;
 }}
 
+// Per-country event totals for the decades/categories currently selected (cached per filter state).
+function coverageTotals() {{
+    const key = [...selectedDecades].sort().join(',') + '|' + [...selectedCategories].sort().join(',') + '|' + showTime100;
+    if (coverageCache.key === key) return coverageCache;
+    const decadeOn = coverageCube.decades.map(d => selectedDecades.has(d));
+    const categoryOn = coverageCube.categories.map(c => (c === 'time_100') ? showTime100 : selectedCategories.has(c));
+    const cells = coverageCube.cells;
+    const totals = {{}};
+    let max = 0;
+    for (let j = 0; j < cells.length; j += 4) {{
+        if (!decadeOn[cells[j + 1]] || !categoryOn[cells[j + 2]]) continue;
+        const name = coverageCube.countries[cells[j]];
+        const n = (totals[name] || 0) + cells[j + 3];
+        totals[name] = n;
+        if (n > max) max = n;
+    }}
+    coverageCache = {{ key, totals, max }};
+    return coverageCache;
+}}
+
 function getIndicatorDetails(countryName, indicatorKey) {{
     const ind = externalIndicators[indicatorKey];
     if (!ind || !ind.by_country) return null;
@@ -1300,6 +1480,10 @@ function getIndicatorDetails(countryName, indicatorKey) {{
 }}
 
 function getIndicatorValue(countryName, indicatorKey) {{
+    if (indicatorKey === 'coverage') {{
+        // Countries without events count as 0 (that is the gap to see); unknown shapes stay blank.
+        return coverageCountries.has(countryName) ? (coverageTotals().totals[countryName] || 0) : null;
+    }}
     const d = getIndicatorDetails(countryName, indicatorKey);
     if (!d) return null;
     if (indicatorKey === 'min_wage') return d.hourly_usd_nominal;
@@ -1308,6 +1492,9 @@ function getIndicatorValue(countryName, indicatorKey) {{
 }}
 
 function computeIndicatorStats(indicatorKey) {{
+    if (indicatorKey === 'coverage') {{
+        return {{ min: 0, max: coverageTotals().max, count: coverageCountries.size }};
+    }}
     const ind = externalIndicators[indicatorKey];
     if (!ind || !ind.by_country) return null;
     const values = [];
@@ -1359,6 +1546,7 @@ function lerpColor(c1, c2, t) {{
 
 function getIndicatorGradient(indicatorKey) {{
     if (indicatorKey === 'bigmac') return ['#fff3e0', '#e65100'];
+    if (indicatorKey === 'coverage') return ['#fff7bc', '#4a148c'];
     // default: min_wage
     return ['#e8f5e9', '#1b5e20'];
 }}
@@ -1370,7 +1558,7 @@ function indicatorStyle(feature) {{
     }}
 
     const geoName = (feature.properties && (feature.properties.name || feature.properties.NAME)) || '';
-    const canon = reverseNameMap[geoName] || geoName;
+    const canon = canonicalCountry(geoName);
     const v = getIndicatorValue(canon, key);
     if (typeof v !== 'number' || Number.isNaN(v)) {{
         return {{ fillOpacity: 0, opacity: 0, weight: 0, color: 'transparent' }};
@@ -1382,7 +1570,10 @@ function indicatorStyle(feature) {{
     }}
 
     const denom = (stats.max - stats.min) || 1;
-    const t = (v - stats.min) / denom;
+    // Event counts are heavily skewed (ABD has hundreds), so density uses a log scale.
+    const t = (key === 'coverage')
+        ? Math.log1p(v) / (Math.log1p(stats.max) || 1)
+        : (v - stats.min) / denom;
     const [c1, c2] = getIndicatorGradient(key);
     const fill = lerpColor(c1, c2, t);
     return {{
@@ -1404,7 +1595,7 @@ function groupStyle(feature) {{
         return {{ fillOpacity: 0, opacity: 0, weight: 0, color: 'transparent' }};
     }}
     const geoName = (feature.properties && (feature.properties.name || feature.properties.NAME)) || '';
-    const canon = reverseNameMap[geoName] || geoName;
+    const canon = canonicalCountry(geoName);
     if (!set.has(canon)) {{
         return {{ fillOpacity: 0, opacity: 0, weight: 0, color: 'transparent' }};
     }}
@@ -1450,7 +1641,7 @@ function updateIndicatorLegend() {{
         return;
     }}
 
-    const ind = externalIndicators[key];
+    const ind = (key === 'coverage') ? coverageIndicator : externalIndicators[key];
     const stats = computeIndicatorStats(key);
     if (!ind || !stats) {{
         el.style.display = 'none';
@@ -1462,16 +1653,19 @@ function updateIndicatorLegend() {{
     const label = ind.label || key;
     const [c1, c2] = getIndicatorGradient(key);
     const source = ind.source || {{}};
-    const note = (key === 'bigmac' && source.latest_date) ? `veri tarihi: ${{source.latest_date}}` : '';
-    const fetched = externalData.fetched_at_utc ? `çekildi: ${{externalData.fetched_at_utc}}` : '';
+    const note = (key === 'bigmac' && source.latest_date)
+        ? `veri tarihi: ${{source.latest_date}}`
+        : (key === 'coverage') ? 'logaritmik ölçek; seçili on yıllar ve kategoriler' : '';
+    const fetched = (key !== 'coverage' && externalData.fetched_at_utc) ? `çekildi: ${{externalData.fetched_at_utc}}` : '';
+    const fmt = (x) => (key === 'coverage') ? String(x) : x.toFixed(2);
 
     el.style.display = '';
     el.innerHTML = `
         <div style="font-weight:700; margin-bottom:2px;">${{label}}</div>
         <div class="legend-bar" style="background: linear-gradient(90deg, ${{c1}} 0%, ${{c2}} 100%);"></div>
         <div class="legend-row">
-            <span>${{stats.min.toFixed(2)}} ${{unit}}</span>
-            <span>${{stats.max.toFixed(2)}} ${{unit}}</span>
+            <span>${{fmt(stats.min)}} ${{unit}}</span>
+            <span>${{fmt(stats.max)}} ${{unit}}</span>
         </div>
         <div style="margin-top:6px; font-size:10px; color:#6c757d;">
             ${{note}} ${{fetched}}
@@ -1502,6 +1696,10 @@ function updateIndicatorHoverInfo(countryName) {{
         el.textContent = `${{countryName}}: ${{formatUsd(v, '/saat')}}`;
         return;
     }}
+    if (key === 'coverage') {{
+        el.textContent = `${{countryName}}: ${{v}} olay`;
+        return;
+    }}
     el.textContent = `${{countryName}}: ${{formatUsd(v)}}`;
 }}
 
@@ -1604,6 +1802,8 @@ function updateVisibleCount() {{
         return isEventVisibleByFilters(e);
     }}).length;
     document.getElementById('visibleCount').textContent = count;
+    // Density shading follows the decade/category filters.
+    if (window.activeIndicator === 'coverage') updateExternalOverlays();
 }}
 
 // Track markers by country for filtering
@@ -1708,49 +1908,28 @@ function initFlagOverlaySingleton() {{
     // Map Events for Repositioning
     function updateOverlayPosition() {{
         if (!window.flagOverlayLayer || !window.currentFlagCountry) return;
-        
-        const feature = findCountryFeature(window.currentFlagCountry);
-        if (!feature) return;
 
-        const bounds = L.geoJSON(feature).getBounds();
         const map = window.geoMap;
+        const clip = getFlagClipPath(window.currentFlagCountry, map.getZoom());
+        if (!clip) return;
+
+        // Clip paths are cached in world pixel coordinates relative to their own box,
+        // so a pan only needs to translate the SVG; the path string is reused as-is.
+        const origin = map.getPixelOrigin();
+        const minX = clip.minX - origin.x;
+        const minY = clip.minY - origin.y;
+        const w = clip.w;
+        const h = clip.h;
 
-        const p1 = map.latLngToLayerPoint(bounds.getNorthWest());
-        const p2 = map.latLngToLayerPoint(bounds.getSouthEast());
-        
-        const margin = 50;
-        const minX = Math.min(p1.x, p2.x) - margin;
-        const minY = Math.min(p1.y, p2.y) - margin;
-        const w = Math.abs(p1.x - p2.x) + margin*2;
-        const h = Math.abs(p1.y - p2.y) + margin*2;
-        
         svg.style.left = minX + 'px';
         svg.style.top = minY + 'px';
         svg.style.width = w + 'px';
         svg.style.height = h + 'px';
         svg.setAttribute('viewBox', `0 0 ${{w}} ${{h}}`);
-        
-        // Project Points
-        function project(latlng) {{
-            const p = map.latLngToLayerPoint(L.latLng(latlng[1], latlng[0]));
-            return [p.x - minX, p.y - minY];
-        }}
-        
-        let pathData = "";
-        const geom = feature.geometry;
-        const coords = geom.coordinates;
-        
-        function ringToPath(ring) {{
-             return "M" + ring.map(c => project(c).join(",")).join("L") + "Z";
-        }}
-        
-        if (geom.type === 'Polygon') {{
-            pathData = coords.map(ringToPath).join(" ");
-        }} else if (geom.type === 'MultiPolygon') {{
-            pathData = coords.map(poly => poly.map(ringToPath).join(" ")).join(" ");
+
+        if (path.getAttribute("d") !== clip.d) {{
+            path.setAttribute("d", clip.d);
         }}
-        
-        path.setAttribute("d", pathData);
         img.setAttribute("x", 0);
         img.setAttribute("y", 0);
         img.setAttribute("width", w);
@@ -1762,12 +1941,140 @@ function initFlagOverlaySingleton() {{
     window.updateFlagOverlayPosition = updateOverlayPosition;
 }}
 
+// Flag clip-path cache: projected SVG paths keyed by (country, zoom), least recently used evicted.
+// Entries are stored in world pixel coordinates (map.project at that zoom), so they stay valid
+// while panning and are naturally invalidated when the zoom level changes.
+const FLAG_CLIP_CACHE_SIZE = 48;
+const flagClipCache = new Map();
+const flagBoundsCache = new Map();
+
+function getFlagClipPath(countryName, zoom) {{
+    const key = countryName + '|' + zoom;
+    const hit = flagClipCache.get(key);
+    if (hit) {{
+        // Refresh recency
+        flagClipCache.delete(key);
+        flagClipCache.set(key, hit);
+        return hit;
+    }}
+
+    const feature = findCountryFeature(countryName);
+    if (!feature) return null;
+
+    const map = window.geoMap;
+    let bounds = flagBoundsCache.get(feature);
+    if (!bounds) {{
+        bounds = L.geoJSON(feature).getBounds();
+        flagBoundsCache.set(feature, bounds);
+    }}
+
+    const p1 = map.project(bounds.getNorthWest(), zoom).round();
+    const p2 = map.project(bounds.getSouthEast(), zoom).round();
+
+    const margin = 50;
+    const minX = Math.min(p1.x, p2.x) - margin;
+    const minY = Math.min(p1.y, p2.y) - margin;
+    const w = Math.abs(p1.x - p2.x) + margin*2;
+    const h = Math.abs(p1.y - p2.y) + margin*2;
+
+    // Project Points
+    function project(latlng) {{
+        const p = map.project(L.latLng(latlng[1], latlng[0]), zoom).round();
+        return [p.x - minX, p.y - minY];
+    }}
+
+    function ringToPath(ring) {{
+         return "M" + ring.map(c => project(c).join(",")).join("L") + "Z";
+    }}
+
+    let pathData = "";
+    const geom = feature.geometry;
+    const coords = geom.coordinates;
+    if (geom.type === 'Polygon') {{
+        pathData = coords.map(ringToPath).join(" ");
+    }} else if (geom.type === 'MultiPolygon') {{
+        pathData = coords.map(poly => poly.map(ringToPath).join(" ")).join(" ");
+    }}
+
+    const entry = {{ minX: minX, minY: minY, w: w, h: h, d: pathData }};
+    flagClipCache.set(key, entry);
+    if (flagClipCache.size > FLAG_CLIP_CACHE_SIZE) {{
+        flagClipCache.delete(flagClipCache.keys().next().value);
+    }}
+    return entry;
+}}
+
+// ISO Alpha-3 -> Alpha-2 for countryMeta codes (hoisted; previously rebuilt on every hover)
+const FLAG_ISO3_TO_ISO2 = {{
+    "TUR": "tr", "GRC": "gr", "USA": "us", "RUS": "ru", "UKR": "ua",
+    "DEU": "de", "FRA": "fr", "GBR": "gb", "CHN": "cn", "IRN": "ir",
+    "IRQ": "iq", "SYR": "sy", "AZE": "az", "ARM": "am", "ISR": "il",
+    "CYP": "cy", "EGY": "eg", "ITA": "it"
+}};
+const NATO_FLAG_URL = 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Flag_of_NATO.svg/640px-Flag_of_NATO.svg.png';
+
+// Resolved flag URL per country (null when no flag is available). Filled ahead of time by
+// precomputeFlagUrls() and lazily for names that only resolve through their GeoJSON feature.
+const flagUrlByCountry = new Map();
+
+function resolveFlagUrl(countryName, feature) {{
+    let flagCode = null;
+    let flagUrl = null;
+
+    // Special Case: Manual Overrides / Special Territories
+    if (specialFlagUrls[countryName]) {{
+        flagUrl = specialFlagUrls[countryName];
+    }}
+    // Strategy A: Check countryCodeMap (name -> iso) which is the source of truth for this project
+    else if (window.countryCodeMap && window.countryCodeMap[countryName]) {{
+        flagCode = window.countryCodeMap[countryName];
+    }}
+    // Strategy B: Check Meta (if available) - converting 3-char code if needed
+    else if (countryMeta[countryName] && countryMeta[countryName].code) {{
+        const c = countryMeta[countryName].code;
+        if (c.length === 2) flagCode = c.toLowerCase();
+        else if (c.length === 3) flagCode = FLAG_ISO3_TO_ISO2[c] || c.substring(0,2).toLowerCase();
+    }}
+    // Strategy C: Check Feature Properties directly (often has ISO codes)
+    else if (feature && feature.properties && feature.properties['ISO3166-1-Alpha-2']) {{
+        const iso = feature.properties['ISO3166-1-Alpha-2'];
+        if (iso && iso !== '-99') flagCode = iso.toLowerCase();
+    }}
+
+    // Construct URL if code found
+    if (flagCode && !flagUrl) {{
+        flagUrl = `https://flagcdn.com/w640/${{flagCode}}.png`;
+    }}
+    return flagUrl || null;
+}}
+
+function precomputeFlagUrls() {{
+    // Strategies that do not need the GeoJSON feature can be resolved once up front.
+    const names = new Set([
+        ...Object.keys(specialFlagUrls),
+        ...Object.keys(countryMeta || {{}}),
+        ...Object.keys(window.countryCodeMap || {{}})
+    ]);
+    names.forEach(name => {{
+        const url = resolveFlagUrl(name, null);
+        if (url) flagUrlByCountry.set(name, url);
+    }});
+}}
+
+function getFlagUrl(countryName, feature) {{
+    if (flagUrlByCountry.has(countryName)) return flagUrlByCountry.get(countryName);
+    const url = resolveFlagUrl(countryName, feature);
+    flagUrlByCountry.set(countryName, url);
+    return url;
+}}
+
 function highlightCountryWithFlag(countryName) {{
     if (!window.geoMap) return;
     
     // Ensure Singleton Exists
     if (!window.flagOverlayLayer) {{
         initFlagOverlaySingleton();
+        precomputeFlagUrls();
     }}
     
     // If same country, just show
@@ -1784,46 +2091,12 @@ function highlightCountryWithFlag(countryName) {{
     }}
     
     // 2. Determine Flag URL
-    let flagCode = null;
-    let flagUrl = null;
-
     // Group override: show NATO flag when NATO group is active and the country is a NATO member.
-    const NATO_FLAG_URL = 'https://upload.wikimedia.org/wikipedia/commons/thumb/5/5d/Flag_of_NATO.svg/640px-Flag_of_NATO.svg.png';
+    let flagUrl = null;
     if (window.activeCountryGroup === 'nato' && countryGroups && countryGroups.nato && countryGroups.nato.has(countryName)) {{
         flagUrl = NATO_FLAG_URL;
-    }}
-
-    // Special Case: Manual Overrides / Special Territories
-    if (!flagUrl && specialFlagUrls[countryName]) {{
-        flagUrl = specialFlagUrls[countryName];
-    }} 
-    // Strategy A: Check countryCodeMap (name -> iso) which is the source of truth for this project
-    else if (!flagUrl && window.countryCodeMap && window.countryCodeMap[countryName]) {{
-        flagCode = window.countryCodeMap[countryName];
-    }}
-    // Strategy B: Check Meta (if available) - converting 3-char code if needed
-    else if (!flagUrl && countryMeta[countryName] && countryMeta[countryName].code) {{
-        const c = countryMeta[countryName].code;
-        if (c.length === 2) flagCode = c.toLowerCase();
-        else if (c.length === 3) {{
-             const map3to2 = {{
-                "TUR": "tr", "GRC": "gr", "USA": "us", "RUS": "ru", "UKR": "ua", 
-                "DEU": "de", "FRA": "fr", "GBR": "gb", "CHN": "cn", "IRN": "ir",
-                "IRQ": "iq", "SYR": "sy", "AZE": "az", "ARM": "am", "ISR": "il",
-                "CYP": "cy", "EGY": "eg", "ITA": "it"
-            }};
-            flagCode = map3to2[c] || c.substring(0,2).toLowerCase();
-        }}
-    }}
-    // Strategy C: Check Feature Properties directly (often has ISO codes)
-    else if (!flagUrl && feature.properties && feature.properties['ISO3166-1-Alpha-2']) {{
-        const iso = feature.properties['ISO3166-1-Alpha-2'];
-        if (iso && iso !== '-99') flagCode = iso.toLowerCase();
-    }}
-
-    // Construct URL if code found
-    if (flagCode && !flagUrl) {{
-        flagUrl = `https://flagcdn.com/w640/${{flagCode}}.png`;
+    }} else {{
+        flagUrl = getFlagUrl(countryName, feature);
     }}
 
     if (!flagUrl) {{
@@ -1834,7 +2107,9 @@ function highlightCountryWithFlag(countryName) {{
 
     // 3. Update Singleton
     window.currentFlagCountry = countryName;
-    window.flagOverlayImage.setAttribute("href", flagUrl);
+    if (window.flagOverlayImage.getAttribute("href") !== flagUrl) {{
+        window.flagOverlayImage.setAttribute("href", flagUrl);
+    }}
     
     // Update Position & Shape
     window.updateFlagOverlayPosition();
@@ -1846,6 +2121,78 @@ function highlightCountryWithFlag(countryName) {{
 
 // Sidebar functions
 
+function escapeDisasterText(value) {{
+    return String(value == null ? '' : value)
+        .replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+}}
+
+function formatDisasterDamage(damage) {{
+    // damage is in million USD
+    return damage ? '$' + Math.round(damage).toLocaleString('tr-TR') + 'M' : '-';
+}}
+
+function formatDisasterRow(label, count, deaths, damage) {{
+    return `<tr><td>${{escapeDisasterText(label)}}</td><td>${{count}}</td><td>${{deaths.toLocaleString('tr-TR')}}</td>`
+        + `<td>${{formatDisasterDamage(damage)}}</td></tr>`;
+}}
+
+// Precomputed summary (felaket_ozet); the full list is fetched only when requested.
+function buildDisasterHtml(meta) {{
+    const s = meta && meta.felaket_ozet;
+    if (!s || !s.count) return '';
+    const head = '<tr><th></th><th>Adet</th><th>Ölü</th><th>Hasar</th></tr>';
+    const table = rows => `<table class="disaster-table">${{head}}${{rows.map(r => formatDisasterRow(r[0], r[1], r[2], r[3])).join('')}}</table>`;
+    const top = (s.top || []).map(t =>
+        `<div>${{t[0]}} · ${{escapeDisasterText(t[1])}}${{t[2] ? ' (' + escapeDisasterText(t[2]) + ')' : ''}} — ${{Number(t[3]).toLocaleString('tr-TR')}} ölü</div>`
+    ).join('');
+    return `
+        <details class="country-meta-card">
+            <summary>
+                <span>▼ Doğal Afetler & Kazalar (${{s.count}})</span>
+            </summary>
+            <div class="country-meta-content">
+                <div class="meta-row">
+                    <span class="meta-label">Toplam</span>
+                    <div>${{s.count}} olay · ${{s.deaths.toLocaleString('tr-TR')}} ölü · ${{formatDisasterDamage(s.damage_usd_millions)}} hasar</div>
+                </div>
+                <div class="meta-row"><span class="meta-label">En Ağır</span>${{top}}</div>
+                <div class="meta-row"><span class="meta-label">On Yıllara Göre</span>${{table(s.by_decade || [])}}</div>
+                <div class="meta-row"><span class="meta-label">Türe Göre</span>${{table(s.by_type || [])}}</div>
+                <div class="meta-row disaster-full" data-file="${{escapeDisasterText(s.file || '')}}">
+                    <button type="button" class="disaster-load-btn" onclick="loadDisasterList(this)">Tüm listeyi göster</button>
+                </div>
+            </div>
+        </details>
+    `;
+}}
+
+const disasterListCache = new Map();
+
+function loadDisasterList(btn) {{
+    const box = btn.parentElement;
+    const file = box && box.dataset.file;
+    if (!file) return;
+    btn.disabled = true;
+    btn.textContent = 'Yükleniyor…';
+    if (!disasterListCache.has(file)) {{
+        disasterListCache.set(file, fetch(file).then(r => {{
+            if (!r.ok) throw new Error('HTTP ' + r.status);
+            return r.json();
+        }}));
+    }}
+    disasterListCache.get(file).then(rows => {{
+        box.innerHTML = '<div class="disaster-list">' + rows
+            .slice()
+            .sort((a, b) => (b.year || 0) - (a.year || 0))
+            .map(d => `<div>${{d.year}} · ${{escapeDisasterText(d.subtype || d.type)}}${{d.name ? ' (' + escapeDisasterText(d.name) + ')' : ''}} — ${{(d.deaths || 0).toLocaleString('tr-TR')}} ölü</div>`)
+            .join('') + '</div>';
+    }}).catch(() => {{
+        disasterListCache.delete(file);
+        btn.disabled = false;
+        btn.textContent = 'Tekrar dene';
+    }});
+}}
+
 function buildEconomyHtml(countryName) {{
     const badges = [];
     if (countryGroups.g8 && countryGroups.g8.has(countryName)) {{
@@ -2088,29 +2435,9 @@ function openSidebar(countryName) {{
     function findCountryMeta(name) {{
         // Direct lookup
         if (countryMeta[name]) return {{ meta: countryMeta[name], key: name }};
-        
-        // Try Turkish name via reverseNameMap (English -> Turkish)
-        const turkishName = reverseNameMap[name];
-        if (turkishName && countryMeta[turkishName]) return {{ meta: countryMeta[turkishName], key: turkishName }};
-        
-        // Try geoJSONNameMap reverse (if name is Turkish, find English then meta)
-        const englishName = geoJSONNameMap[name];
-        if (englishName && countryMeta[englishName]) return {{ meta: countryMeta[englishName], key: englishName }};
-        
-        // Special case variants
-        const variants = [
-            name.replace('ı', 'i').replace('İ', 'I'),
-            name.replace('ü', 'u').replace('Ü', 'U'),
-            name.replace('ö', 'o').replace('Ö', 'O'),
-            name.replace('ş', 's').replace('Ş', 'S'),
-            name.replace('ğ', 'g').replace('Ğ', 'G'),
-            name.replace('ç', 'c').replace('Ç', 'C'),
-        ];
-        for (const v of variants) {{
-            if (countryMeta[v]) return {{ meta: countryMeta[v], key: v }};
-        }}
-        
-        return null;
+        // Any metadata key naming the same country (English names, ASCII variants, aliases)
+        const key = countryMetaKeys()[canonicalCountry(name)];
+        return key ? {{ meta: countryMeta[key], key: key }} : null;
     }}
     
     const metaResult = findCountryMeta(countryName);
@@ -2175,7 +2502,7 @@ function openSidebar(countryName) {{
                 </div>
             </details>
         `;
-        metaContainer.innerHTML += econHtml;
+        metaContainer.innerHTML += econHtml + buildDisasterHtml(meta);
         
         // 4. Draw Arrows
         if (meta.rivalries) {{
@@ -2237,9 +2564,11 @@ function toggleDecadeSection(header) {{
     events.classList.toggle('open');
 }}
 
-// Country code mapping for flags (country_name -> ISO Alpha-2)
-// Dynamically generated from master country_mappings.json
-const countryCodeMap = {turkish_to_iso_json};
+// Country code mapping for flags (canonical country_name -> ISO Alpha-2), from countryIndex
+const countryCodeMap = {{}};
+countryIndex.c.forEach(c => {{
+    if (c[2] && !countryCodeMap[c[0]]) countryCodeMap[c[0]] = c[2];
+}});
 
 // Also add from events data (fallback for missing entries)
 allEvents.forEach(e => {{
@@ -2260,23 +2589,33 @@ if (countriesGeoJSON) {{
     console.error('GeoJSON data not available');
 }}
 
-// GeoJSON name mapping (Turkish names -> English GeoJSON names)
-// Dynamically generated from master country_mappings.json
-const geoJSONNameMap = {turkish_to_english_json};
-
-// Reverse mapping (English GeoJSON names -> Turkish canonical names)
-// Also dynamically generated from master country_mappings.json
-const reverseNameMap = {english_to_turkish_json};
+// countryMeta key per canonical country name (built on first use; an exact canonical key wins)
+let countryMetaKeysCache = null;
+function countryMetaKeys() {{
+    if (countryMetaKeysCache) return countryMetaKeysCache;
+    countryMetaKeysCache = {{}};
+    Object.keys(countryMeta).forEach(key => {{
+        const canon = canonicalCountry(key);
+        if (!countryMetaKeysCache[canon] || key === canon) countryMetaKeysCache[canon] = key;
+    }});
+    return countryMetaKeysCache;
+}}
 
 // Find country feature in GeoJSON by name or code
+// Results (including misses) are memoized: the embedded GeoJSON never changes after load.
+const countryFeatureCache = new Map();
 function findCountryFeature(countryName) {{
     if (!countriesGeoJSON) {{
         console.error('GeoJSON not loaded!');
         return null;
     }}
+    if (countryFeatureCache.has(countryName)) {{
+        return countryFeatureCache.get(countryName);
+    }}
 
-    const countryCode = countryCodeMap[countryName];
-    const geoJSONName = geoJSONNameMap[countryName] || countryName;
+    const resolved = resolveCountry(countryName);
+    const countryCode = resolved ? resolved[2] : countryCodeMap[countryName];
+    const geoJSONName = (resolved && resolved[1]) || countryName;
 
     console.log('Looking for:', countryName, '-> GeoJSON name:', geoJSONName, '-> ISO:', countryCode);
 
@@ -2303,6 +2642,7 @@ function findCountryFeature(countryName) {{
         console.warn('Country not found in GeoJSON:', countryName, '(mapped:', geoJSONName, ')');
     }}
 
+    countryFeatureCache.set(countryName, found || null);
     return found;
 }}
 
@@ -2395,6 +2735,70 @@ window.addEventListener('load', function() {{
 
 </script>
 '''
+        yield from self._iter_template(template, payloads)
+
+    def _build_label(self) -> str:
+        """Build line shown in the page footer. Deterministic builds keep wall-clock time out of the HTML."""
+        if self.deterministic:
+            return self.build_info.get("content_hash", "unknown")
+        return self.build_info.get("build_time_utc", "unknown")
+
+    def _build_time_loader_js(self) -> str:
+        """In deterministic mode the build time lives in build-info.json and is fetched at runtime."""
+        if not self.deterministic:
+            return ""
+        return '''
+// Build time is not embedded (deterministic build); read it from build-info.json instead.
+document.addEventListener('DOMContentLoaded', function() {
+    fetch('/build-info.json', { cache: 'no-cache' })
+        .then(r => r.ok ? r.json() : null)
+        .then(info => {
+            const el = document.getElementById('buildTime');
+            if (el && info && info.build_time_utc) el.textContent = info.build_time_utc;
+        })
+        .catch(() => {});
+});
+'''
+
+    def _input_hash(self) -> str:
+        """Short content hash of every input that ends up in the page."""
+        h = hashlib.sha256()
+        encoder = json.JSONEncoder(ensure_ascii=False, sort_keys=True)
+        for payload in (
+            self.events,
+            self.categories,
+            self.geojson_data,
+            self.country_metadata,
+            self.indicators,
+            self.country_mappings,
+            self.regions,
+        ):
+            for chunk in encoder.iterencode(payload):
+                h.update(chunk.encode("utf-8"))
+        h.update(Path(__file__).read_bytes())
+        return h.hexdigest()[:12]
+
+    @staticmethod
+    def _stabilize_element_ids(root) -> None:
+        """Replace folium/branca's random element ids with sequential ones (tree order)."""
+        from branca.element import Element
+
+        visited = []
+        stack = [root]
+        while stack:
+            el = stack.pop()
+            el._id = f"{len(visited):032x}"
+            visited.append(el)
+            children = list(el._children.values())
+            # Figure/Popup keep their header/html/script sections outside _children.
+            for attr in ("header", "html", "script"):
+                sub = getattr(el, attr, None)
+                if isinstance(sub, Element):
+                    children.append(sub)
+            stack.extend(reversed(children))
+        # _children is keyed by get_name() (which embeds the id) and some templates render the keys.
+        for el in visited:
+            el._children = OrderedDict((child.get_name(), child) for child in el._children.values())
 
     def _create_popup_content(self, country_name: str, country_events: List[dict]) -> str:
         """Create HTML popup content with 3 event preview."""
@@ -2432,8 +2836,8 @@ window.addEventListener('load', function() {{
         </div>
         '''
 
-    def _get_marker_icon(self, category: str) -> folium.Icon:
-        """Get marker icon based on category."""
+    def _marker_icon_style(self, category: str) -> tuple:
+        """(AwesomeMarkers color, Font Awesome icon) for a category."""
         cat = self.categories.get(category, {})
         icon = cat.get('icon', 'fa-info')
         color_map = {
@@ -2449,18 +2853,32 @@ window.addEventListener('load', function() {{
             '#e84393': 'pink',  # music
         }
         color = color_map.get(cat.get('color', '#3498db'), 'blue')
-        return folium.Icon(color=color, icon=icon, prefix='fa')
+        return color, icon
 
-    def create_map(self, output_path: str = None) -> str:
-        """Create the interactive geopolitical map."""
+    def create_map(self, output_path: str = None, renderer: str = "folium") -> str:
+        """Create the interactive geopolitical map.
+
+        renderer: "folium" (folium.Map + m.save) or "direct" (single streaming pass over
+        DIRECT_PAGE_TEMPLATE, Leaflet only, no folium import).
+        """
+        if renderer not in ("folium", "direct"):
+            raise ValueError(f"unknown renderer: {renderer}")
         output_path = output_path or self.output_dir / "geopolitical_map.html"
         import datetime
 
-        build_time_utc = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+        # SOURCE_DATE_EPOCH (reproducible-builds.org) pins the build time for byte-identical metadata.
+        source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+        if source_date_epoch:
+            build_dt = datetime.datetime.utcfromtimestamp(int(source_date_epoch))
+        else:
+            build_dt = datetime.datetime.utcnow()
+        build_time_utc = build_dt.replace(microsecond=0).isoformat() + "Z"
         self.build_info = {
             "build_time_utc": build_time_utc,
             "events": len(self.events),
         }
+        if self.deterministic:
+            self.build_info["content_hash"] = self._input_hash()
         git_sha = os.environ.get("GIT_SHA") or os.environ.get("COMMIT_SHA")
         if not git_sha:
             head_path = self.base_dir / ".git" / "HEAD"
@@ -2475,16 +2893,6 @@ window.addEventListener('load', function() {{
         if git_sha:
             self.build_info["git_sha"] = git_sha[:12]
 
-        m = folium.Map(
-            location=[30, 20],
-            zoom_start=3,
-            tiles='CartoDB positron',
-            prefer_canvas=True
-        )
-
-        # Add custom CSS and JS
-        m.get_root().html.add_child(folium.Element(self._get_custom_css_js()))
-
         # Group events by country
         by_country = {}
         for event in self.events:
@@ -2493,33 +2901,13 @@ window.addEventListener('load', function() {{
                 by_country[country] = []
             by_country[country].append(event)
 
-        # Add one marker per country (at the location of most recent event)
-        for country, events in by_country.items():
-            # Use the most recent event's location
-            latest = max(events, key=lambda x: x['year'])
-
-            # Determine dominant category for icon
-            cat_counts = {}
-            for e in events:
-                cat_counts[e['category']] = cat_counts.get(e['category'], 0) + 1
-            dominant_cat = max(cat_counts, key=cat_counts.get)
-
-            popup_content = self._create_popup_content(country, events)
-            icon = self._get_marker_icon(dominant_cat)
-
-            marker = folium.Marker(
-                location=[latest['lat'], latest['lon']],
-                popup=folium.Popup(popup_content, max_width=350),
-                tooltip=f"{country} ({len(events)} olay)",
-                icon=icon
-            )
-            marker.add_to(m)
-
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        m.save(str(output_path))
-        
-        # Post-process HTML to add marker tracking for filtering        
-        self._inject_marker_tracking(output_path, by_country)
+        if renderer == "direct":
+            self._render_direct(output_path, by_country)
+        else:
+            self._render_folium(output_path, by_country)
+
+        write_country_files(self.disaster_files, Path(output_path).parent / DISASTER_DIR_NAME)
 
         # Create robots.txt
         robots_path = Path(output_path).parent / "robots.txt"
@@ -2528,13 +2916,15 @@ window.addEventListener('load', function() {{
             
         # Create sitemap.xml
         sitemap_path = Path(output_path).parent / "sitemap.xml"
-        now = datetime.datetime.now().strftime("%Y-%m-%d")
+        # Deterministic builds only stamp lastmod when the build time is pinned.
+        now = build_dt.strftime("%Y-%m-%d") if (source_date_epoch or not self.deterministic) else None
         with open(sitemap_path, "w") as f:
             f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n')
             f.write(f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n')
             f.write(f'  <url>\n')
             f.write(f'    <loc>https://jeopolitik.com.tr/</loc>\n')
-            f.write(f'    <lastmod>{now}</lastmod>\n')
+            if now:
+                f.write(f'    <lastmod>{now}</lastmod>\n')
             f.write(f'    <priority>1.0</priority>\n')
             f.write(f'  </url>\n')
             f.write(f'</urlset>')
@@ -2556,22 +2946,148 @@ window.addEventListener('load', function() {{
         print(f"Harita oluşturuldu: {output_path}")
         print(f"SEO dosyaları oluşturuldu: robots.txt, sitemap.xml")
         print(f"Build info oluşturuldu: build-info.json, healthz.json")
+        print(f"Felaket listeleri: {len(self.disaster_files)} ülke dosyası ({DISASTER_DIR_NAME}/)")
         print(f"Toplam {len(self.events)} olay, {len(by_country)} ülke")
         return str(output_path)
     
+    def _iter_country_markers(self, by_country: dict):
+        """Yield (country, latest_event, events, dominant_category) per country marker."""
+        for country, events in by_country.items():
+            # Use the most recent event's location
+            latest = max(events, key=lambda x: x['year'])
+
+            # Determine dominant category for icon
+            cat_counts = {}
+            for e in events:
+                cat_counts[e['category']] = cat_counts.get(e['category'], 0) + 1
+            dominant_cat = max(cat_counts, key=cat_counts.get)
+            yield country, latest, events, dominant_cat
+
+    def _marker_row(self, country: str, latest: dict, events: List[dict], dominant_cat: str) -> list:
+        """[lat, lon, tooltip, popup_html, color, icon] for one country marker."""
+        color, icon = self._marker_icon_style(dominant_cat)
+        return [
+            latest['lat'],
+            latest['lon'],
+            f"{country} ({len(events)} olay)",
+            self._create_popup_content(country, events),
+            color,
+            icon,
+        ]
+
+    def _country_marker_rows(self, by_country: dict) -> List[list]:
+        """Marker rows in by_country order; with sharded data, unchanged shards reuse the cached row."""
+        if not self.shard_hashes:
+            return [self._marker_row(*item) for item in self._iter_country_markers(by_country)]
+
+        cache_path = self.base_dir / ".cache" / "map" / "markers.json"
+        render_key = hashlib.sha256(
+            Path(__file__).read_bytes() + json.dumps(self.categories, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        cached = {}
+        try:
+            stored = json.loads(cache_path.read_text(encoding="utf-8"))
+            if stored.get("render_key") == render_key:
+                cached = stored.get("rows") or {}
+        except (OSError, ValueError):
+            pass
+
+        rows, fresh, rebuilt = [], {}, 0
+        for country, latest, events, dominant_cat in self._iter_country_markers(by_country):
+            shard_hash = self.shard_hashes.get(shard_file_name(country), "")
+            hit = cached.get(country)
+            if hit and hit[0] == shard_hash:
+                row = hit[1]
+            else:
+                row = self._marker_row(country, latest, events, dominant_cat)
+                rebuilt += 1
+            fresh[country] = [shard_hash, row]
+            rows.append(row)
+
+        if rebuilt or len(fresh) != len(cached):
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"render_key": render_key, "rows": fresh}, ensure_ascii=False), encoding="utf-8")
+        print(f"Ülke işaretçileri: {rebuilt} yeniden oluşturuldu, {len(rows) - rebuilt} önbellekten")
+        return rows
+
+    def _render_folium(self, output_path, by_country: dict) -> None:
+        """Render via folium.Map/m.save, then inject marker tracking into the saved file."""
+        import folium
+
+        m = folium.Map(
+            location=[30, 20],
+            zoom_start=3,
+            tiles='CartoDB positron',
+            prefer_canvas=True
+        )
+
+        # Add custom CSS and JS
+        m.get_root().html.add_child(folium.Element(self._get_custom_css_js()))
+
+        # Add one marker per country (at the location of most recent event)
+        for lat, lon, tooltip, popup_content, color, icon in self._country_marker_rows(by_country):
+            marker = folium.Marker(
+                location=[lat, lon],
+                popup=folium.Popup(popup_content, max_width=350),
+                tooltip=tooltip,
+                icon=folium.Icon(color=color, icon=icon, prefix='fa')
+            )
+            marker.add_to(m)
+
+        if self.deterministic:
+            self._stabilize_element_ids(m.get_root())
+
+        m.save(str(output_path))
+
+        # Post-process HTML to add marker tracking for filtering
+        self._inject_marker_tracking(output_path, by_country)
+
+    def _render_direct(self, output_path, by_country: dict) -> None:
+        """Write the page in one streaming pass from DIRECT_PAGE_TEMPLATE (no folium, no read-back).
+
+        Element ids are fixed (geo_map), so this renderer is deterministic by construction.
+        """
+        def write_markers(f):
+            for row in self._country_marker_rows(by_country):
+                f.write(_js_literal(row))
+                f.write(",\n")
+
+        slots = {
+            "custom_css_js": lambda f: f.writelines(self._iter_custom_css_js()),
+            "markers": write_markers,
+            "marker_tracking": lambda f: f.writelines(self._iter_marker_tracking_script(by_country)),
+        }
+        with open(output_path, 'w', encoding='utf-8') as f:
+            for literal, slot in DIRECT_PAGE_TEMPLATE:
+                f.write(literal)
+                if slot:
+                    slots[slot](f)
+
     def _inject_marker_tracking(self, output_path: str, by_country: dict):
         """Inject JavaScript to track markers for filtering using robust Leaflet discovery."""
         with open(output_path, 'r', encoding='utf-8') as f:
             html = f.read()
-            
+
+        html = html.replace('</body>', self._marker_tracking_script(by_country) + '</body>')
+
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+
+    def _marker_tracking_script(self, by_country: dict) -> str:
+        """Marker tracking/filtering script shared by both renderers."""
+        return "".join(self._iter_marker_tracking_script(by_country))
+
+    def _iter_marker_tracking_script(self, by_country: dict):
+        """Marker tracking/filtering script in chunks (country metadata is streamed)."""
         # Build marker data JSON
         marker_data = {}
         for country, events in by_country.items():
             decades = set(e['decade'] for e in events)
             categories = set(e['category'] for e in events)
+            # Sorted: set order varies with PYTHONHASHSEED and would make builds non-reproducible.
             marker_data[country] = {
-                'decades': list(decades),
-                'categories': list(categories)
+                'decades': sorted(decades),
+                'categories': sorted(categories)
             }
         
         # Inject filtering logic
@@ -2653,15 +3169,14 @@ window.addEventListener('load', function() {{
         // --- NEW: Add territory click handlers for ALL countries ---
         console.log("Adding territory click handlers for all countries...");
         
-        // Use global reverseNameMap (generated from country_mappings.json)
+        // Use global canonicalCountry() (countryIndex, generated from country_mappings.json)
 
         if (typeof countriesGeoJSON !== 'undefined' && countriesGeoJSON) {{
             countriesGeoJSON.features.forEach(feature => {{
                 const geoName = feature.properties.name || feature.properties.NAME;
-                // Try to find Turkish name using global reverseNameMap, otherwise fallback to GeoJSON name
-                let countryKey = reverseNameMap[geoName] || geoName;
+                // Canonical Turkish name (e.g., Turkey -> Türkiye), otherwise fallback to GeoJSON name
+                let countryKey = canonicalCountry(geoName);
                 
-                // reverseNameMap already normalizes to canonical Turkish names (e.g., Turkey -> Türkiye)
                 if (geoName === 'China') {{
                     feature.properties['ISO3166-1-Alpha-2'] = 'cn';
                 }}
@@ -3346,56 +3861,11 @@ L.Hoi4Overlay = L.Layer.extend({{
         # Injection of data
         inject_script += f'''
 <script>
-window.countryMeta = {json.dumps(self.country_metadata, ensure_ascii=False)};
-window.countryIsoMap = {{
-    "Turkiye": "tr", "Türkiye": "tr", "Almanya": "de", "Rusya": "ru", "Ukrayna": "ua", 
-    "Fransa": "fr", "Birleşik Krallık": "gb", "ABD": "us", "Çin": "cn",
-    "Misir": "eg", "Libya": "ly", "Tunus": "tn", "Cezayir": "dz", "Fas": "ma",
-    "Yunanistan": "gr", "Bulgaristan": "bg", "Sırbistan": "rs", "Hırvatistan": "hr",
-    "Bosna Hersek": "ba", "Karadağ": "me", "Kosova": "xk", "Makedonya": "mk",
-    "Arnavutluk": "al", "Romanya": "ro", "Polonya": "pl", "İtalya": "it",
-    "İspanya": "es", "Portekiz": "pt", "Hollanda": "nl", "Belçika": "be",
-    "Avusturya": "at", "Macaristan": "hu", "Çekya": "cz", "Slovakya": "sk",
-    "İsveç": "se", "Norveç": "no", "Danimarka": "dk", "Finlandiya": "fi",
-    "İran": "ir", "Irak": "iq", "Suriye": "sy", "Lübnan": "lb", "Ürdün": "jo",
-    "İsrail": "il", "Filistin": "ps", "Suudi Arabistan": "sa", "Yemen": "ye",
-    "Umman": "om", "BAE": "ae", "Katar": "qa", "Kuveyt": "kw", "Bahreyn": "bh",
-    "Azerbaycan": "az", "Ermenistan": "am", "Gürcistan": "ge",
-    "Hindistan": "in", "Pakistan": "pk", "Japonya": "jp", "Güney Kore": "kr", "Kuzey Kore": "kp",
-    "Malavi": "mw", "Benin": "bj", "Togo": "tg", "Gana": "gh", "Fildisi Sahili": "ci",
-    "Liberya": "lr", "Sierra Leone": "sl", "Gine": "gn", "Gine-Bissau": "gw",
-    "Gambiya": "gm", "Senegal": "sn", "Mali": "ml", "Moritanya": "mr",
-    "Nijer": "ne", "Nijerya": "ng", "Çad": "td", "Kamerun": "cm",
-    "Orta Afrika Cumhuriyeti": "cf", "Ekvator Ginesi": "gq", "Gabon": "ga",
-    "Kongo": "cg", "Demokratik Kongo Cumhuriyeti": "cd", "Angola": "ao",
-    "Namibya": "na", "Guney Afrika": "za", "Lesoto": "ls", "Esvatini": "sz",
-    "Botsvana": "bw", "Zambiya": "zm", "Zimbabve": "zw", "Mozambik": "mz",
-    "Madagaskar": "mg", "Komorlar": "km", "Seyseller": "sc", "Mauritius": "mu",
-    "Cibuti": "dj", "Eritre": "er", "Etiyopya": "et", "Somali": "so",
-    "Kenya": "ke", "Uganda": "ug", "Ruanda": "rw", "Burundi": "bi",
-    "Tanzanya": "tz", "Guney Sudan": "ss", "Sudan": "sd", "Yesil Burun Adalari": "cv",
-    "Sao Tome ve Principe": "st", "Burkina Faso": "bf",
-    "Kanada": "ca", "Brezilya": "br", "Arjantin": "ar", "Meksika": "mx",
-    "Kolombiya": "co", "Venezuela": "ve", "Sili": "cl", "Peru": "pe",
-    "Ekvador": "ec", "Bolivya": "bo", "Kuba": "cu", "Jamaika": "jm",
-    "Haiti": "ht", "Dominik Cumhuriyeti": "do", "Endonezya": "id",
-    "Malezya": "my", "Filipinler": "ph", "Vietnam": "vn", "Tayland": "th",
-    "Myanmar": "mm", "Kambocya": "kh", "Laos": "la", "Mogolistan": "mn",
-    "Avustralya": "au", "Yeni Zelanda": "nz", "Isvicre": "ch", "Isvec": "se",
-    "Norvec": "no", "Izlanda": "is", "Belcika": "be", "Avusturya": "at",
-    "Surinam": "sr", "Guyana": "gy", "Uruguay": "uy", "Paraguay": "py"
-}};
+window.countryMeta = {_PAYLOAD_SLOT.format("country_metadata")};
 </script>
 '''
-        
-        html = html.replace('</body>', inject_script + '</body>')
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
 
-
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+        yield from self._iter_template(inject_script, {"country_metadata": self.page_country_metadata})
 
 
 def main():
@@ -3403,10 +3873,17 @@ def main():
     parser = argparse.ArgumentParser(description='Create geopolitical history map')
     parser.add_argument('--data', '-d', help='Path to events.json')
     parser.add_argument('--output', '-o', help='Output HTML file')
+    parser.add_argument('--renderer', choices=['folium', 'direct'],
+                        default=os.environ.get('MAP_RENDERER', 'folium'),
+                        help='folium (default) or direct: folium-free single-pass Leaflet page writer')
+    parser.add_argument('--deterministic', action='store_true',
+                        default=os.environ.get('DETERMINISTIC_BUILD') == '1',
+                        help='Reproducible output: stable element ids, no build time in the HTML '
+                             '(also enabled by DETERMINISTIC_BUILD=1; set SOURCE_DATE_EPOCH to pin metadata too)')
     args = parser.parse_args()
 
-    geo_map = GeopoliticalMap(data_path=args.data)
-    geo_map.create_map(output_path=args.output)
+    geo_map = GeopoliticalMap(data_path=args.data, deterministic=args.deterministic)
+    geo_map.create_map(output_path=args.output, renderer=args.renderer)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Shared record/replay HTTP layer for the network-bound data fetchers.
+
+Why:
+- `fetch_indicators.py`, `fix_wiki.py` and `add_more_channel_videos.py` hit the network directly,
+  so every run (and every Docker build) re-downloaded everything and failed when a source was down.
+
+How:
+- Each response body is stored under `.cache/http/` (override: HTTP_CACHE_DIR) next to a small JSON
+  sidecar with the URL, ETag, Last-Modified and fetch time.
+- Modes (HTTP_CACHE_MODE or `set_mode()`):
+  - `refresh` (default): conditional GET (If-None-Match / If-Modified-Since); a 304 reuses the stored
+    body, and a network/HTTP failure falls back to the stored body when there is one.
+  - `offline`: never touch the network; replay stored responses, fail on anything not recorded.
+  - `bypass`: plain network access, nothing read or written (previous behavior).
+- `recorded()` applies the same store/replay policy to non-HTTP producers (e.g. yt-dlp output).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_STORE_DIR = Path(os.environ.get("HTTP_CACHE_DIR") or (BASE_DIR / ".cache" / "http"))
+
+MODES = ("refresh", "offline", "bypass")
+
+_mode = os.environ.get("HTTP_CACHE_MODE") or "refresh"
+_store_dir = DEFAULT_STORE_DIR
+_stats_lock = threading.Lock()
+stats: Dict[str, int] = {"network": 0, "not_modified": 0, "replayed": 0, "stale_fallback": 0}
+
+
+class OfflineMiss(LookupError):
+    """Raised in offline mode when a response was never recorded."""
+
+
+def set_mode(mode: str) -> None:
+    global _mode
+    if mode not in MODES:
+        raise ValueError(f"unknown HTTP cache mode {mode!r} (expected one of {', '.join(MODES)})")
+    _mode = mode
+
+
+def get_mode() -> str:
+    return _mode
+
+
+def set_store_dir(path: Path) -> None:
+    global _store_dir
+    _store_dir = Path(path)
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        stats[name] += 1
+
+
+def summary() -> str:
+    return ", ".join(f"{k} {v}" for k, v in stats.items())
+
+
+def build_url(url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """URL with params in sorted order, so the same request always maps to the same entry."""
+    if not params:
+        return url
+    query = urllib.parse.urlencode(sorted((k, str(v)) for k, v in params.items()))
+    return f"{url}{'&' if '?' in url else '?'}{query}"
+
+
+def _paths(key: str) -> Tuple[Path, Path]:
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    base = _store_dir / digest[:2] / digest
+    return base.with_suffix(".body"), base.with_suffix(".json")
+
+
+def _load(key: str) -> Tuple[Optional[bytes], Dict[str, Any]]:
+    body_path, meta_path = _paths(key)
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        return body_path.read_bytes(), meta
+    except (OSError, ValueError):
+        return None, {}
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _save(key: str, body: bytes, meta: Dict[str, Any]) -> None:
+    body_path, meta_path = _paths(key)
+    meta = dict(meta, key=key, fetched_at=time.time(), sha256=hashlib.sha256(body).hexdigest())
+    # Body first: a sidecar never points at a body that is not there yet.
+    _atomic_write(body_path, body)
+    _atomic_write(meta_path, (json.dumps(meta, ensure_ascii=False, indent=2) + "\n").encode("utf-8"))
+
+
+def _urllib_get(url: str, headers: Dict[str, str], timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, dict(resp.headers.items()), resp.read()
+    except urllib.error.HTTPError as e:
+        # 304 Not Modified surfaces as an HTTPError in urllib.
+        return e.code, dict(e.headers.items()) if e.headers else {}, b""
+
+
+def fetch(
+    url: str,
+    params: Optional[Mapping[str, Any]] = None,
+    headers: Optional[Mapping[str, str]] = None,
+    timeout: float = 30,
+    session: Any = None,
+) -> bytes:
+    """GET url through the store. `session` (a requests.Session) is used instead of urllib if given.
+
+    Raises OfflineMiss (offline mode, not recorded) or the transport/HTTP error when nothing
+    stored can stand in for the response.
+    """
+    full_url = build_url(url, params)
+    if _mode == "bypass":
+        _count("network")
+        return _get(full_url, dict(headers or {}), timeout, session, ok_only=True)[2]
+
+    body, meta = _load(full_url)
+    if _mode == "offline":
+        if body is None:
+            raise OfflineMiss(f"not recorded: {full_url}")
+        _count("replayed")
+        return body
+
+    req_headers = dict(headers or {})
+    if body is not None:
+        if meta.get("etag"):
+            req_headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            req_headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        _count("network")
+        status, resp_headers, resp_body = _get(full_url, req_headers, timeout, session, ok_only=False)
+    except Exception:
+        if body is not None:
+            _count("stale_fallback")
+            return body
+        raise
+
+    if status == 304 and body is not None:
+        _count("not_modified")
+        return body
+    if status != 200:
+        if body is not None:
+            _count("stale_fallback")
+            return body
+        raise urllib.error.HTTPError(full_url, status, f"HTTP {status}", None, None)
+
+    lower = {k.lower(): v for k, v in resp_headers.items()}
+    _save(
+        full_url,
+        resp_body,
+        {
+            "url": full_url,
+            "status": status,
+            "etag": lower.get("etag", ""),
+            "last_modified": lower.get("last-modified", ""),
+            "content_type": lower.get("content-type", ""),
+        },
+    )
+    return resp_body
+
+
+def _get(
+    url: str, headers: Dict[str, str], timeout: float, session: Any, ok_only: bool
+) -> Tuple[int, Dict[str, str], bytes]:
+    if session is not None:
+        r = session.get(url, headers=headers, timeout=timeout)
+        result = (r.status_code, dict(r.headers), r.content)
+    else:
+        result = _urllib_get(url, headers, timeout)
+    if ok_only and result[0] != 200:
+        raise urllib.error.HTTPError(url, result[0], f"HTTP {result[0]}", None, None)
+    return result
+
+
+def fetch_json(url: str, params: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Any:
+    return json.loads(fetch(url, params=params, **kwargs).decode("utf-8"))
+
+
+def recorded(key: str, produce: Callable[[], bytes]) -> bytes:
+    """Store/replay for non-HTTP producers: an empty or failed result falls back to the recording."""
+    if _mode == "bypass":
+        return produce()
+    store_key = f"recorded:{key}"
+    body, _meta = _load(store_key)
+    if _mode == "offline":
+        if body is None:
+            raise OfflineMiss(f"not recorded: {key}")
+        _count("replayed")
+        return body
+    try:
+        fresh = produce()
+    except Exception:
+        fresh = b""
+    if fresh:
+        _save(store_key, fresh, {"url": key, "status": 200})
+        return fresh
+    if body is not None:
+        _count("stale_fallback")
+        return body
+    return fresh
@@ -3,12 +3,15 @@
 Merge geopolitical events from CSV file with existing events.json
 """
 
-import json
 import csv
 import os
 from pathlib import Path
 from typing import Dict, List
 
+from country_index import CountryIndex
+from event_ids import event_content_id
+from event_store import EventStore
+
 
 # Category mapping from Turkish to English keys
 CATEGORY_MAP = {
@@ -61,83 +64,10 @@ COUNTRY_COORDS = {
     "İsrail": (31.0461, 34.8516)
 }
 
-# Country name normalization (English -> Turkish)
-COUNTRY_NAME_MAP = {
-    "South Africa": "Güney Afrika",
-    "Egypt": "Mısır",
-    "Morocco": "Fas",
-    "Algeria": "Cezayir",
-    "Greece": "Yunanistan",
-    "Saudi Arabia": "Suudi Arabistan",
-    "Iraq": "Irak",
-    "Iran": "İran",
-    "Syria": "Suriye",
-    "Jordan": "Ürdün",
-    "Lebanon": "Lübnan",
-    "Estonia": "Estonya",
-    "Latvia": "Letonya",
-    "Lithuania": "Litvanya",
-    "Belarus": "Belarus",
-    "Kuwait": "Kuveyt",
-    "Qatar": "Katar",
-    "United Arab Emirates": "Birleşik Arap Emirlikleri",
-    "UAE": "Birleşik Arap Emirlikleri",
-    "Denmark": "Danimarka",
-    "Finland": "Finlandiya",
-    "Iceland": "İzlanda",
-    "Afghanistan": "Afganistan",
-    "Vietnam": "Vietnam",
-    "Philippines": "Filipinler",
-    "Thailand": "Tayland",
-    "Malaysia": "Malezya",
-    "South Korea": "Güney Kore",
-    "Nigeria": "Nijerya",
-    "Kenya": "Kenya",
-    "Ethiopia": "Etiyopya",
-    "Tanzania": "Tanzanya",
-    "Tunisia": "Tunus",
-    "Libya": "Libya",
-    "Canada": "Kanada",
-    "Peru": "Peru",
-    "Venezuela": "Venezüela",
-    "Bolivia": "Bolivya",
-    "Cuba": "Küba",
-    "Haiti": "Haiti",
-    "Italy": "İtalya",
-    "Germany": "Almanya",
-    "United Kingdom": "Birleşik Krallık",
-    "UK": "Birleşik Krallık",
-    "Pakistan": "Pakistan",
-    "India": "Hindistan",
-    "Russia": "Rusya",
-    "Ukraine": "Ukrayna",
-    "China": "Çin",
-    "Japan": "Japonya",
-    "Indonesia": "Endonezya",
-    "New Zealand": "Yeni Zelanda",
-    "Papua New Guinea": "Papua Yeni Gine",
-    "Mongolia": "Moğolistan",
-    "Mexico": "Meksika",
-    "Brazil": "Brezilya",
-    "Argentina": "Arjantin",
-    "Chile": "Şili",
-    "Colombia": "Kolombiya",
-    "Spain": "İspanya",
-    "Portugal": "Portekiz",
-    "France": "Fransa",
-    "Belgium": "Belçika",
-    "Netherlands": "Hollanda",
-    "Switzerland": "İsviçre",
-    "Austria": "Avusturya",
-    "Sweden": "İsveç",
-    "Norway": "Norveç",
-    "Poland": "Polonya",
-    "Hungary": "Macaristan",
-    "Romania": "Romanya",
-    "Bulgaria": "Bulgaristan",
-    "Ireland": "İrlanda",
-    "Luxembourg": "Lüksemburg"
-}
+def _canonical_country(name: str) -> str:
+    """Canonical Turkish name via data/country_mappings.json (unknown names are kept as-is)."""
+    name = (name or "").strip()
+    return CountryIndex.load().canonical(name, name)
 
 
 def load_csv_events(csv_path: str) -> List[dict]:
@@ -151,8 +81,7 @@ def load_csv_events(csv_path: str) -> List[dict]:
             category = CATEGORY_MAP.get(row['category'], 'war')
             
             # Get coordinates (use default if not in dictionary)
-            country_raw = row['country'].strip()
-            country = COUNTRY_NAME_MAP.get(country_raw, country_raw)
+            country = _canonical_country(row['country'])
             lat, lon = COUNTRY_COORDS.get(country, (0, 0))
             
             # Parse year
@@ -189,20 +118,12 @@ def load_csv_events(csv_path: str) -> List[dict]:
     return events
 
 
-def load_existing_events(json_path: str) -> tuple:
-    """Load existing events.json and return categories and events."""
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    return data.get('categories', {}), data.get('events', [])
-
-
 def _normalize_existing_events(events: List[dict]):
-    """Normalize country names in existing events list using global COUNTRY_NAME_MAP."""
+    """Normalize country names in existing events list to canonical Turkish names."""
     for event in events:
         c_raw = event.get('country_name', '').strip()
-        if c_raw in COUNTRY_NAME_MAP:
-            event['country_name'] = COUNTRY_NAME_MAP[c_raw]
+        if c_raw:
+            event['country_name'] = _canonical_country(c_raw)
             # Update ID? No, ID is independent of country usually, but better keep as is.
 
 
@@ -232,20 +153,11 @@ def merge_events(existing_events: List[dict], csv_events: List[dict]) -> List[di
         if signature not in existing_signatures:
             new_events.append(event)
     
-    # Assign IDs to new events
-    # Find the highest existing ID
-    max_id = 0
-    for event in existing_events:
-        if 'id' in event:
-            try:
-                id_num = int(event['id'].replace('ev', ''))
-                max_id = max(max_id, id_num)
-            except (ValueError, AttributeError):
-                pass
-    
-    # Assign new IDs
-    for i, event in enumerate(new_events, start=max_id + 1):
-        event['id'] = f"ev{i:03d}"
+    # Assign content-derived IDs to new events (stable across re-runs, see event_ids.py)
+    taken = {event['id'] for event in existing_events if event.get('id')}
+    for event in new_events:
+        event['id'] = event_content_id(event, taken)
+        taken.add(event['id'])
     
     # Merge and sort by year
     all_events = existing_events + new_events
@@ -307,7 +219,7 @@ def load_all_csv_events(base_dir: Path, category_map: dict) -> List[dict]:
                     title = row['event']
                     desc = row['summary']
                     year_str = row['year']
-                    country = row['country']
+                    country = _canonical_country(row['country'])
                     cat_raw = row['category']
                     
                     if cat_raw == 'Time 100':
@@ -318,13 +230,13 @@ def load_all_csv_events(base_dir: Path, category_map: dict) -> List[dict]:
                 elif 'event_title' in row:  # jeopolitik format
                     # ... existing logic ...
                     category = category_map.get(row['category'], 'war')
-                    country = row['country']
+                    country = _canonical_country(row['country'])
                     title = row['event_title']
                     year_str = row.get('year_start', row.get('year', ''))
                     desc = row.get('description_tr', '')
                 elif 'event' in row:  # geopolitik format  
                     category = category_map.get(row['category'], 'war')
-                    country = row['country']
+                    country = _canonical_country(row['country'])
                     title = row['event']
                     year_str = row.get('year', '')
                     desc = row.get('summary', '')
@@ -414,7 +326,8 @@ def main():
     
     print(f"\n2. Loading existing Wikipedia events from: {base_dir / 'data' / 'events.json'}")
     json_path = base_dir / "data" / "events.json"
-    categories, existing_events = load_existing_events(str(json_path))
+    store = EventStore.load(json_path)
+    categories, existing_events = store.categories, store.events
     _normalize_existing_events(existing_events)
     print(f"   Found {len(existing_events)} existing events")
     
@@ -456,20 +369,12 @@ def main():
         added = after - before
         print(f"   {cat_info['label']:30s}: {before:3d} -> {after:3d} (+{added})")
     
-    # Save merged data
-    output_data = {
-        "categories": categories,
-        "events": merged_events
-    }
-    
-    backup_path = str(json_path) + ".backup"
-    print(f"\n5. Creating backup at: {backup_path}")
-    with open(backup_path, 'w', encoding='utf-8') as f:
-        json.dump({"categories": categories, "events": existing_events}, f, ensure_ascii=False, indent=2)
-    
-    print(f"6. Writing merged data to: {json_path}")
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    # Save merged data (atomic; the journal replaces the old events.json.backup copy)
+    print(f"\n5. Writing merged data to: {json_path}")
+    store.events = merged_events
+    store.save()
+    if store.last_revision:
+        print(f"   Journal revision: {store.last_revision} (undo: python3 scripts/event_store.py restore {store.last_revision - 1})")
     
     # Print statistics
     countries = set(e['country_name'] for e in merged_events)
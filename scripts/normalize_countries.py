@@ -1,6 +1,9 @@
-import json
+from pathlib import Path
 
-EVENTS_PATH = '/Users/gurursonmez/Documents/Harita/data/events.json'
+from event_store import EventStore
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+EVENTS_PATH = BASE_DIR / "data" / "events.json"
 
 MAPPING = {
     # Africa
@@ -180,13 +183,12 @@ MAPPING = {
 }
 
 def normalize():
-    with open(EVENTS_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = EventStore.load(EVENTS_PATH)
     
     changed_count = 0
     counts = {}
     
-    for ev in data['events']:
+    for ev in store.events:
         c = ev.get('country_name')
         if not c: continue
         
@@ -216,8 +218,7 @@ def normalize():
     if low_counts == 0:
         print("All countries have >= 10 events!")
 
-    with open(EVENTS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.save()
 
 if __name__ == "__main__":
     normalize()
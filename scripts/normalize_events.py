@@ -15,12 +15,12 @@ Rules:
 from __future__ import annotations
 
 import json
-from collections import defaultdict
-from dataclasses import dataclass
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from country_index import CountryIndex
+from event_store import EventStore
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -31,100 +31,6 @@ ADMIN_EVENTS_EMBED_PATH = ADMIN_DIR / "data.js"
 ADMIN_COUNTRY_MAPPINGS_EMBED_PATH = ADMIN_DIR / "country_mappings.js"
 
 
-_TR_TRANSLATE = str.maketrans(
-    {
-        # Turkish diacritics -> ASCII for matching
-        "ı": "i",
-        "İ": "i",
-        "ş": "s",
-        "Ş": "s",
-        "ğ": "g",
-        "Ğ": "g",
-        "ü": "u",
-        "Ü": "u",
-        "ö": "o",
-        "Ö": "o",
-        "ç": "c",
-        "Ç": "c",
-        # Common circumflex variants
-        "â": "a",
-        "Â": "a",
-        "î": "i",
-        "Î": "i",
-        "û": "u",
-        "Û": "u",
-    }
-)
-
-
-def _normalize_lookup_key(value: str) -> str:
-    """
-    Normalize a country name for robust matching across:
-    - casing differences
-    - Turkish diacritics
-    - curly apostrophes
-    - extra whitespace
-    """
-    if value is None:
-        return ""
-    s = str(value).strip()
-    # Normalize curly apostrophes/quotes to ASCII
-    s = (
-        s.replace("\u2019", "'")
-        .replace("\u2018", "'")
-        .replace("\u201B", "'")
-        .replace("\u02BC", "'")
-        .replace("’", "'")
-        .replace("‘", "'")
-    )
-    s = " ".join(s.split())
-    s = s.lower()
-    s = s.translate(_TR_TRANSLATE)
-    return s
-
-
-@dataclass(frozen=True)
-class CountryCanon:
-    turkish: str
-    iso2: str  # lower-case in mappings
-
-
-def _load_country_index() -> Tuple[Dict[str, CountryCanon], Dict[str, CountryCanon]]:
-    """
-    Returns:
-    - lookup: normalized string -> CountryCanon
-    - by_turkish: canonical Turkish name -> CountryCanon
-    """
-    with open(COUNTRY_MAPPINGS_PATH, "r", encoding="utf-8") as f:
-        mappings = json.load(f).get("countries", [])
-
-    lookup: Dict[str, CountryCanon] = {}
-    by_turkish: Dict[str, CountryCanon] = {}
-
-    for entry in mappings:
-        tr = (entry.get("turkish") or "").strip()
-        iso2 = (entry.get("iso2") or "").strip().lower()
-        if not tr:
-            continue
-        canon = CountryCanon(turkish=tr, iso2=iso2)
-        by_turkish[tr] = canon
-
-        keys: List[str] = []
-        for k in [entry.get("turkish"), entry.get("english")]:
-            if k:
-                keys.append(k)
-        keys.extend(entry.get("aliases") or [])
-
-        for k in keys:
-            nk = _normalize_lookup_key(k)
-            if not nk:
-                continue
-            # If a collision exists, keep the first one deterministically.
-            lookup.setdefault(nk, canon)
-
-    return lookup, by_turkish
-
-
 def _event_rank(e: Dict[str, Any]) -> Tuple[int, int, int, int, int, int, str]:
     """Ranking for selecting the best event among duplicates."""
     event_id = str(e.get("id") or "")
@@ -206,14 +112,11 @@ def _merge_event_fields(target: Dict[str, Any], source: Dict[str, Any]) -> bool:
 
 
 def normalize_events() -> None:
-    lookup, by_turkish = _load_country_index()
-
-    with open(EVENTS_PATH, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    countries = CountryIndex.load(COUNTRY_MAPPINGS_PATH)
 
-    events = data.get("events") or []
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
+    store = EventStore.load(EVENTS_PATH)
+    data = store.data
+    events = store.events
 
     changed_country = 0
     filled_codes = 0
@@ -225,7 +128,7 @@ def normalize_events() -> None:
             continue
         raw_name = (ev.get("country_name") or "").strip()
         if raw_name:
-            canon = lookup.get(_normalize_lookup_key(raw_name))
+            canon = countries.resolve(raw_name)
             if canon and canon.turkish and canon.turkish != raw_name:
                 ev["country_name"] = canon.turkish
                 changed_country += 1
@@ -233,7 +136,7 @@ def normalize_events() -> None:
 
         # Standardize country_code to ISO2 when possible
         iso2 = ""
-        canon_by_tr = by_turkish.get(raw_name) if raw_name else None
+        canon_by_tr = countries.by_turkish.get(raw_name) if raw_name else None
         if canon_by_tr and canon_by_tr.iso2:
             iso2 = canon_by_tr.iso2.upper()
 
@@ -311,12 +214,8 @@ def normalize_events() -> None:
     added_categories = len(set(categories.keys()) - before_cats)
 
     # Remove duplicates created by canonicalization: same (country_name, year, title)
-    grouped: Dict[Tuple[str, Any, str], List[Dict[str, Any]]] = defaultdict(list)
-    for ev in events:
-        c = (ev.get("country_name") or "").strip()
-        y = ev.get("year")
-        t = (ev.get("title") or "").strip()
-        grouped[(c, y, t)].append(ev)
+    store.invalidate()  # country names were rewritten above
+    grouped = store.by_signature
 
     unique_events: List[Dict[str, Any]] = []
     removed = 0
@@ -337,25 +236,17 @@ def normalize_events() -> None:
         unique_events.append(best)
         removed += len(group) - 1
 
-    data["events"] = unique_events
+    store.events = unique_events
 
-    # Backup + write
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    backup_path = EVENTS_PATH.with_suffix(f".json.bak.{ts}")
-    backup_path.write_text(EVENTS_PATH.read_text(encoding="utf-8"), encoding="utf-8")
-    EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    # Write (the journal keeps the per-event changes; see `event_store.py log|restore`)
+    store.save()
 
     # Regenerate offline Admin embeds
     ADMIN_EVENTS_EMBED_PATH.write_text(
         "window.__EVENTS_DATA__ = " + json.dumps(data, ensure_ascii=False) + ";\n",
         encoding="utf-8",
     )
-    with open(COUNTRY_MAPPINGS_PATH, "r", encoding="utf-8") as f:
-        country_mappings = json.load(f)
-    ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.write_text(
-        "window.__COUNTRY_MAPPINGS__ = " + json.dumps(country_mappings.get("countries", []), ensure_ascii=False) + ";\n",
-        encoding="utf-8",
-    )
+    ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.write_text(countries.admin_embed(), encoding="utf-8")
 
     print("Normalization complete.")
     print(f"- Country name changes: {changed_country}")
@@ -365,7 +256,8 @@ def normalize_events() -> None:
     print(f"- Category definitions added: {added_categories}")
     print(f"- Duplicate events removed (country+year+title): {removed}")
     print(f"- Duplicate merge operations (filled/updated fields): {merged_fields}")
-    print(f"- Backup: {backup_path}")
+    if store.last_revision:
+        print(f"- Journal revision: {store.last_revision} (undo: python3 scripts/event_store.py restore {store.last_revision - 1})")
     print(f"- Admin embeds: {ADMIN_EVENTS_EMBED_PATH.name}, {ADMIN_COUNTRY_MAPPINGS_EMBED_PATH.name}")
     print(f"- Final event count: {len(unique_events)}")
 
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Build pipeline: the update procedure as a DAG of stages with content-hash skipping.
+
+Why:
+- The update procedure (normalize -> check -> fetch indicators -> map -> precompress, plus the
+  optional reclassify / fuzzy dedupe / wiki fixes) was a manual sequence, and every step re-ran
+  and re-parsed everything even when nothing it reads had changed.
+
+How:
+- Each `Stage` declares its command, input and output paths and the stages it must run after.
+- A stage is skipped when its key (the stage's script and the sibling modules it imports,
+  its command, selected env vars and the content of its inputs) matches the last successful
+  run and its outputs still have the recorded content (`.cache/pipeline/state.json`).
+- Stages whose dependencies are done run in parallel (`--jobs`); a failure blocks only the
+  stages downstream of it.
+- Per-stage status and timing are printed at the end.
+
+Usage:
+  python scripts/pipeline.py                      # default stages
+  python scripts/pipeline.py --with fix_wiki      # + optional stages
+  python scripts/pipeline.py map                  # `map` and what it depends on
+  python scripts/pipeline.py --force --jobs 1
+  python scripts/pipeline.py --skip indicators    # offline: keep data/indicators.json as is
+  python scripts/pipeline.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = BASE_DIR / "scripts"
+STATE_PATH = BASE_DIR / ".cache" / "pipeline" / "state.json"
+
+DEFAULT_MAP_OUTPUT = "output/geopolitical_map.html"
+DAY = 24 * 3600
+
+# The dataset in either layout (events.json or the per-country shard directory).
+EVENTS = ("data/events.json", "data/events")
+MAPPINGS = "data/country_mappings.json"
+RULES = "data/event_rules.json"
+REGIONS = "data/regions.json"
+COVERAGE = "output/coverage.json"
+ADMIN_EMBEDS = ("admin/data.js", "admin/country_mappings.js")
+SITE_FILES = ("output/build-info.json", "output/healthz.json", "output/robots.txt", "output/sitemap.xml", "output/disasters/*.json")
+
+
+class Stage(NamedTuple):
+    name: str
+    args: Tuple[str, ...]  # script (in scripts/) + arguments
+    inputs: Tuple[str, ...] = ()
+    outputs: Tuple[str, ...] = ()
+    after: Tuple[str, ...] = ()
+    env: Tuple[str, ...] = ()  # env vars that change the result
+    optional: bool = False
+    # For stages whose real input is the network: re-run once the last run is older than this.
+    ttl: Optional[float] = None
+    doc: str = ""
+
+
+def build_stages(map_output: str = DEFAULT_MAP_OUTPUT) -> Dict[str, Stage]:
+    stages = (
+        Stage(
+            "reclassify_media",
+            ("reclassify_culture_media.py",),
+            inputs=(*EVENTS, RULES),
+            outputs=EVENTS,
+            optional=True,
+            doc="culture -> cinema/music",
+        ),
+        Stage(
+            "fuzzy_dedupe",
+            ("fuzzy_dedupe_events.py", "--apply"),
+            inputs=EVENTS,
+            outputs=EVENTS,
+            after=("reclassify_media",),
+            optional=True,
+            doc="near-duplicate removal",
+        ),
+        Stage(
+            "fix_wiki",
+            ("fix_wiki.py",),
+            inputs=(*EVENTS, MAPPINGS),
+            outputs=(*EVENTS, *ADMIN_EMBEDS),
+            after=("fuzzy_dedupe",),
+            env=("HTTP_CACHE_MODE", "WIKI_API_URL"),
+            optional=True,
+            ttl=DAY,
+            doc="Wikipedia link normalization (network)",
+        ),
+        Stage(
+            "normalize",
+            ("normalize_events.py",),
+            inputs=(*EVENTS, MAPPINGS),
+            outputs=(*EVENTS, *ADMIN_EMBEDS),
+            after=("fix_wiki",),
+            doc="canonical countries/decades/categories + admin embeds",
+        ),
+        Stage(
+            "check",
+            ("check_events_consistency.py", "--quiet"),
+            inputs=(*EVENTS, MAPPINGS, RULES),
+            after=("normalize",),
+            doc="validation gate",
+        ),
+        Stage(
+            "coverage",
+            ("coverage_cube.py", "--json", COVERAGE, "--quiet"),
+            inputs=(*EVENTS, MAPPINGS, REGIONS),
+            outputs=(COVERAGE,),
+            after=("check",),
+            doc="country × decade × category counts",
+        ),
+        Stage(
+            "indicators",
+            ("fetch_indicators.py",),
+            inputs=(MAPPINGS,),
+            outputs=("data/indicators.json",),
+            env=("HTTP_CACHE_MODE",),
+            ttl=DAY,
+            doc="NATO / G8 / minimum wage / Big Mac (network)",
+        ),
+        Stage(
+            "map",
+            ("geopolitical_map.py", "--output", map_output),
+            inputs=(
+                *EVENTS,
+                MAPPINGS,
+                REGIONS,
+                "data/country_metadata.json",
+                "data/indicators.json",
+                "data/countries.geojson",
+                "data/france_metropolitan.geojson",
+            ),
+            outputs=(map_output, *SITE_FILES),
+            after=("check", "indicators"),
+            env=("MAP_RENDERER", "DETERMINISTIC_BUILD", "SOURCE_DATE_EPOCH", "GIT_SHA", "COMMIT_SHA"),
+            doc="map page + site files",
+        ),
+        Stage(
+            "precompress",
+            ("precompress_output.py",),
+            inputs=(map_output, *SITE_FILES, COVERAGE),
+            outputs=("output/**/*.gz",),
+            after=("map", "coverage"),
+            doc="gzip sidecars",
+        ),
+    )
+    return {s.name: s for s in stages}
+
+
+# ---- hashing ---------------------------------------------------------------------------------
+
+_IMPORT_RE = re.compile(r"^\s*(?:from\s+(\w+)\s+import|import\s+(\w+))", re.MULTILINE)
+
+
+def _local_modules(script: str) -> List[Path]:
+    """The script plus every sibling module it (transitively) imports."""
+    seen: Dict[str, Path] = {}
+    todo = [Path(script).stem]
+    while todo:
+        name = todo.pop()
+        path = SCRIPTS_DIR / f"{name}.py"
+        if name in seen or not path.exists():
+            continue
+        seen[name] = path
+        for m in _IMPORT_RE.finditer(path.read_text(encoding="utf-8")):
+            todo.append(m.group(1) or m.group(2))
+    return [seen[k] for k in sorted(seen)]
+
+
+def _expand(spec: str) -> List[Path]:
+    if any(ch in spec for ch in "*?["):
+        return sorted(p for p in BASE_DIR.glob(spec) if p.is_file())
+    path = BASE_DIR / spec
+    if path.is_dir():
+        return sorted(p for p in path.rglob("*") if p.is_file())
+    return [path]
+
+
+def hash_paths(specs: Iterable[str]) -> str:
+    """Content hash over files named by specs (files, directories, globs); missing files count too."""
+    h = hashlib.sha256()
+    for spec in specs:
+        for path in _expand(spec):
+            h.update(str(path.relative_to(BASE_DIR)).encode("utf-8") + b"\0")
+            try:
+                with open(path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1 << 20), b""):
+                        h.update(chunk)
+            except OSError:
+                h.update(b"<missing>")
+            h.update(b"\0")
+    return h.hexdigest()
+
+
+def stage_key(stage: Stage) -> str:
+    h = hashlib.sha256()
+    h.update(json.dumps([stage.args, {k: os.environ.get(k, "") for k in stage.env}]).encode("utf-8"))
+    for module in _local_modules(stage.args[0]):
+        h.update(module.read_bytes())
+    h.update(hash_paths(stage.inputs).encode("utf-8"))
+    return h.hexdigest()
+
+
+# ---- runner ----------------------------------------------------------------------------------
+
+
+class Result(NamedTuple):
+    status: str  # ran | skipped | failed | blocked
+    seconds: float
+    note: str = ""
+
+
+class Pipeline:
+    def __init__(self, stages: Dict[str, Stage], jobs: int = 4, force: bool = False, dry_run: bool = False) -> None:
+        self.stages = stages
+        self.jobs = max(1, jobs)
+        self.force = force
+        self.dry_run = dry_run
+        self._lock = threading.Lock()
+        try:
+            self.state: Dict[str, dict] = json.loads(STATE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.state = {}
+
+    def select(self, targets: Sequence[str], with_optional: Sequence[str]) -> List[str]:
+        """Targets (default: every non-optional stage) plus the stages they depend on, in declared order."""
+        unknown = [n for n in [*targets, *with_optional] if n not in self.stages]
+        if unknown:
+            raise SystemExit(f"unknown stage(s): {', '.join(unknown)} (see --list)")
+        wanted: Set[str] = set(with_optional)
+        todo = list(targets) or [n for n, s in self.stages.items() if not s.optional]
+        while todo:
+            name = todo.pop()
+            if name in wanted and name not in with_optional:
+                continue
+            wanted.add(name)
+            todo.extend(d for d in self.stages[name].after if not self.stages[d].optional)
+        return [n for n in self.stages if n in wanted]
+
+    def _up_to_date(self, stage: Stage, key: str) -> Optional[str]:
+        prev = self.state.get(stage.name)
+        if self.force or not prev or prev.get("key") != key:
+            return None
+        if prev.get("outputs") != hash_paths(stage.outputs):
+            return None
+        if stage.ttl is not None and time.time() - prev.get("finished_at", 0) > stage.ttl:
+            return None
+        return "inputs unchanged"
+
+    def _run_stage(self, stage: Stage) -> Result:
+        t0 = time.perf_counter()
+        reason = self._up_to_date(stage, stage_key(stage))
+        if reason:
+            return Result("skipped", time.perf_counter() - t0, reason)
+        if self.dry_run:
+            return Result("would run", time.perf_counter() - t0)
+
+        cmd = [sys.executable, str(SCRIPTS_DIR / stage.args[0]), *stage.args[1:]]
+        proc = subprocess.run(cmd, cwd=str(BASE_DIR), capture_output=True, text=True)
+        elapsed = time.perf_counter() - t0
+        with self._lock:
+            for line in (proc.stdout + proc.stderr).splitlines():
+                print(f"[{stage.name}] {line}")
+            if proc.returncode != 0:
+                return Result("failed", elapsed, f"exit {proc.returncode}")
+            # Keyed on the inputs as the stage left them: in-place stages (normalize) are then
+            # skipped next time unless something else touched their files.
+            self.state[stage.name] = {
+                "key": stage_key(stage),
+                "outputs": hash_paths(stage.outputs),
+                "finished_at": time.time(),
+                "seconds": round(elapsed, 3),
+            }
+            STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp = STATE_PATH.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+            tmp.replace(STATE_PATH)
+        return Result("ran", elapsed)
+
+    def run(self, names: List[str], skip: Sequence[str] = ()) -> Dict[str, Result]:
+        results: Dict[str, Result] = {n: Result("skipped", 0.0, "--skip") for n in names if n in skip}
+        deps = {n: [d for d in self.stages[n].after if d in names] for n in names}
+        pending = [n for n in names if n not in results]
+        running: Dict[Future, str] = {}
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for name in list(pending):
+                    if any(d not in results for d in deps[name]):
+                        continue
+                    pending.remove(name)
+                    bad = [d for d in deps[name] if results[d].status in ("failed", "blocked")]
+                    if bad:
+                        results[name] = Result("blocked", 0.0, f"after {', '.join(bad)}")
+                        continue
+                    running[pool.submit(self._run_stage, self.stages[name])] = name
+                if not running:
+                    continue
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in done:
+                    name = running.pop(fut)
+                    try:
+                        results[name] = fut.result()
+                    except Exception as e:  # noqa: BLE001 - reported as a failed stage
+                        results[name] = Result("failed", 0.0, repr(e))
+        return results
+
+
+def print_report(names: List[str], results: Dict[str, Result], wall: float) -> None:
+    width = max(len(n) for n in names)
+    print()
+    print(f"{'stage':<{width}}  {'status':<9}  {'time':>8}")
+    for name in names:
+        r = results[name]
+        note = f"  ({r.note})" if r.note else ""
+        print(f"{name:<{width}}  {r.status:<9}  {r.seconds:>7.2f}s{note}")
+    ran = sum(1 for r in results.values() if r.status == "ran")
+    skipped = sum(1 for r in results.values() if r.status == "skipped")
+    print(f"total {wall:.2f}s wall, {ran} ran, {skipped} skipped")
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description="Run the data/map build as a DAG of cached stages")
+    ap.add_argument("targets", nargs="*", help="Stages to bring up to date (default: all non-optional)")
+    ap.add_argument("--with", dest="with_optional", default="", help="Comma-separated optional stages to include")
+    ap.add_argument("--force", action="store_true", help="Run selected stages even if up to date")
+    ap.add_argument("--jobs", "-j", type=int, default=4, help="Max stages running at once")
+    ap.add_argument("--skip", default="", help="Comma-separated stages to treat as done (e.g. indicators offline)")
+    ap.add_argument("--dry-run", action="store_true", help="Only report what would run")
+    ap.add_argument("--map-output", default=DEFAULT_MAP_OUTPUT, help="Map page path (relative to the repo)")
+    ap.add_argument("--list", action="store_true", help="List stages and exit")
+    args = ap.parse_args()
+
+    stages = build_stages(args.map_output)
+    if args.list:
+        for s in stages.values():
+            after = f" after {', '.join(s.after)}" if s.after else ""
+            print(f"{s.name:<17}{' (optional)' if s.optional else '':<12}{s.doc}{after}")
+        return
+
+    pipeline = Pipeline(stages, jobs=args.jobs, force=args.force, dry_run=args.dry_run)
+    with_optional = [n.strip() for n in args.with_optional.split(",") if n.strip()]
+    names = pipeline.select(args.targets, with_optional)
+    skip = [n.strip() for n in args.skip.split(",") if n.strip()]
+    t0 = time.perf_counter()
+    results = pipeline.run(names, skip)
+    print_report(names, results, time.perf_counter() - t0)
+    if any(r.status in ("failed", "blocked") for r in results.values()):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
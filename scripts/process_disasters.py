@@ -1,10 +1,41 @@
-import pandas as pd
+"""
+Attach significant EM-DAT disasters to country_metadata.json (`felaketler` lists).
+
+Pipeline (column operations, no per-row Python loop until the JSON objects are built):
+- The Excel export is parsed once and cached as Parquet (Pickle when pyarrow is missing) under
+  .cache/emdat/, keyed on the Excel file's sha256, so re-runs skip `pd.read_excel` entirely.
+- Significance filter and Turkish translations are vectorized column operations.
+- Country canonicalization is resolved once per distinct EM-DAT country name and applied as a join.
+
+Each country with disasters also gets `felaket_ozet` (see disaster_summary.py): decade/type
+aggregates and the top entries, which is all the map page embeds.
+
+Re-running with different thresholds (--min-deaths / --min-affected / --min-damage) only
+re-filters the cached frame.
+"""
+
+import argparse
+import hashlib
 import json
-import os
+from pathlib import Path
+
+import pandas as pd
+
+from disaster_summary import attach_summaries
+
+BASE_DIR = Path(__file__).resolve().parent.parent
 
 # File paths
-excel_path = '/Users/gurursonmez/Documents/Harita/data/public_emdat_2026-01-27.xlsx'
-json_path = '/Users/gurursonmez/Documents/Harita/data/country_metadata.json'
+excel_path = BASE_DIR / 'data' / 'public_emdat_2026-01-27.xlsx'
+json_path = BASE_DIR / 'data' / 'country_metadata.json'
+CACHE_DIR = BASE_DIR / '.cache' / 'emdat'
+
+DAMAGE_COL = 'Total Damage (\'000 US$)'
+# Only these columns are used (and cached).
+EMDAT_COLUMNS = [
+    'Country', 'Start Year', 'Disaster Type', 'Disaster Subtype', 'Event Name',
+    'Total Deaths', 'Total Affected', DAMAGE_COL,
+]
 
 # Significance Thresholds
 MIN_DEATHS = 50
@@ -104,174 +135,216 @@ COUNTRY_MAP = {
     "Mongolia": ["Moğolistan", "Mongolia"],
 }
 
-def load_data():
+# Translation Map
+DISASTER_TRANSLATIONS = {
+    "Flood": "Sel",
+    "Flash flood": "Ani Sel",
+    "Riverine flood": "Nehir Taşkını",
+    "Coastal flood": "Kıyı Seli",
+    "Earthquake": "Deprem",
+    "Ground movement": "Yer Sarsıntısı",
+    "Tsunami": "Tsunami",
+    "Storm": "Fırtına",
+    "Tropical cyclone": "Tropikal Kasırga",
+    "Convective storm": "Konvektif Fırtına",
+    "Extra-tropical storm": "Ekstra-tropikal Fırtına",
+    "Tornado": "Hortum",
+    "Drought": "Kuraklık",
+    "Wildfire": "Orman Yangını",
+    "Forest fire": "Orman Yangını",
+    "Land fire (Brush, Bush, Pasture)": "Arazi Yangını",
+    "Extreme temperature": "Aşırı Sıcaklık",
+    "Heat wave": "Sıcak Hava Dalgası",
+    "Cold wave": "Soğuk Hava Dalgası",
+    "Severe winter conditions": "Ağır Kış Şartları",
+    "Epidemic": "Salgın",
+    "Viral disease": "Viral Hastalık",
+    "Bacterial disease": "Bakteriyel Hastalık",
+    "Parasitic disease": "Paraziter Hastalık",
+    "Volcanic activity": "Volkanik Aktivite",
+    "Ash fall": "Kül Yağmuru",
+    "Lava flow": "Lav Akıntısı",
+    "Mass movement (dry)": "Toprak Kayması (Kuru)",
+    "Landslide": "Heyelan",
+    "Rockfall": "Kaya Düşmesi",
+    "Mass movement (wet)": "Toprak Kayması (Islak)",
+    "Avalanche": "Çığ",
+    "Insect infestation": "Böcek İstilası",
+    "Locust": "Çekirge",
+    "Animal accident": "Hayvan Kazası",
+    "Impact": "Göktaşı/Çarpma",
+    "Glacial lake outburst": "Buzul Gölü Taşkını",
+    "Fog": "Sis",
+    "Derecho": "Derecho Fırtınası",
+    "Sandstorm": "Kum Fırtınası",
+    "Mudslide": "Çamur Kayması",
+    "Explosion": "Patlama",
+    "Fire": "Yangın",
+    "Transport accident": "Ulaşım Kazası",
+    "Collapse": "Çökme",
+    "Air": "Hava Kazası",
+    "Road": "Trafik Kazası",
+    "Water": "Deniz Kazası",
+    "Rail": "Tren Kazası",
+    "Fire (Miscellaneous)": "Yangın (Çeşitli)",
+    "Explosion (Industrial)": "Patlama (Endüstriyel)",
+    "Collapse (Miscellaneous)": "Çökme (Çeşitli)",
+    "Collapse (Industrial)": "Çökme (Endüstriyel)",
+    "Structure Collapse": "Yapı Çökmesi",
+    "Miscellaneous accident": "Çeşitli Kazalar",
+    "Wildfire (General)": "Orman Yangını",
+    "Lightning/Thunderstorms": "Yıldırım/Fırtına",
+    "Blizzard/Winter storm": "Kar Fırtınası",
+    "Severe weather": "Şiddetli Hava Koşulları",
+    "Flood (General)": "Sel",
+    "Storm (General)": "Fırtına",
+}
+
+
+def _file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def _read_cached(base):
+    parquet, pickle = base.with_suffix('.parquet'), base.with_suffix('.pkl')
+    if parquet.exists():
+        try:
+            return pd.read_parquet(parquet)
+        except ImportError:
+            pass
+    if pickle.exists():
+        return pd.read_pickle(pickle)
+    return None
+
+def _write_cached(df, base):
+    base.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        target = base.with_suffix('.parquet')
+        df.to_parquet(target, index=False)
+    except ImportError:
+        # No pyarrow/fastparquet: pandas' own pickle format is still far faster than Excel.
+        target = base.with_suffix('.pkl')
+        df.to_pickle(target)
+    return target
+
+def load_emdat(path=excel_path, use_cache=True):
+    """EM-DAT frame with EMDAT_COLUMNS, from the columnar cache when the Excel file is unchanged."""
+    base = CACHE_DIR / _file_sha256(path)
+    if use_cache:
+        df = _read_cached(base)
+        if df is not None:
+            print(f"Loaded EM-DAT from cache ({len(df)} rows).")
+            return df
+
     print("Loading Excel data...")
-    df = pd.read_excel(excel_path)
-    
+    df = pd.read_excel(path, usecols=lambda c: c in EMDAT_COLUMNS)
+    if use_cache:
+        print(f"Cached parsed Excel to {_write_cached(df, base)}")
+    return df
+
+def load_data(path=excel_path, use_cache=True):
+    df = load_emdat(path, use_cache=use_cache)
+
     print("Loading JSON metadata...")
     with open(json_path, 'r', encoding='utf-8') as f:
         metadata = json.load(f)
     return df, metadata
 
-def process_disasters(df, metadata):
+def _target_keys(country, metadata, lower_keys):
+    """Metadata keys for one EM-DAT country name (explicit map, direct match, case-insensitive)."""
+    target_keys = []
+
+    # 1. Check Explicit Map
+    for cand in COUNTRY_MAP.get(country, []):
+        if cand in metadata:
+            target_keys.append(cand)
+
+    # 2. Check Direct Match
+    if country in metadata and country not in target_keys:
+        target_keys.append(country)
+
+    # 3. If no match yet, try simple case-insensitive check
+    if not target_keys:
+        target_keys = lower_keys.get(country.lower(), [])
+    return target_keys
+
+def country_key_table(countries, metadata):
+    """(Country, key, key_rank) rows: the join table for canonicalization."""
+    lower_keys = {}
+    for key in metadata:
+        lower_keys.setdefault(key.lower(), []).append(key)
+    rows = [
+        (country, key, rank)
+        for country in countries
+        for rank, key in enumerate(_target_keys(country, metadata, lower_keys))
+    ]
+    return pd.DataFrame(rows, columns=['Country', 'key', 'key_rank'])
+
+def significant_disasters(df, min_deaths=MIN_DEATHS, min_affected=MIN_AFFECTED, min_damage=MIN_DAMAGE_USD):
+    """Filter + clean + translate as column operations; keeps the original row order."""
+    # Criteria: Deaths >= min_deaths OR Affected >= min_affected OR Damage >= min_damage ('000 USD)
+    sig = df[
+        (df['Total Deaths'] >= min_deaths) |
+        (df['Total Affected'] >= min_affected) |
+        (df[DAMAGE_COL] >= min_damage)
+    ]
+
+    subtype = sig['Disaster Subtype'].fillna('')
+    damage = sig[DAMAGE_COL].fillna(0)
+    return pd.DataFrame({
+        'row': range(len(sig)),
+        'Country': sig['Country'],
+        'year': sig['Start Year'].astype(int),
+        'type': sig['Disaster Type'].map(DISASTER_TRANSLATIONS).fillna(sig['Disaster Type']),
+        'subtype': subtype.map(DISASTER_TRANSLATIONS).fillna(subtype),
+        'name': sig['Event Name'].fillna(''),
+        'deaths': sig['Total Deaths'].fillna(0).astype(int),
+        'affected': sig['Total Affected'].fillna(0).astype(int),
+        'damage': damage,
+    })
+
+def process_disasters(df, metadata, min_deaths=MIN_DEATHS, min_affected=MIN_AFFECTED, min_damage=MIN_DAMAGE_USD):
     print("Processing disasters...")
-    
-    # Filter for significant events
-    # Criteria: Deaths >= 50 OR Affected >= 50k OR Damage >= 500k ('000 USD)
-    sig_df = df[
-        (df['Total Deaths'] >= MIN_DEATHS) |
-        (df['Total Affected'] >= MIN_AFFECTED) |
-        (df['Total Damage (\'000 US$)'] >= MIN_DAMAGE_USD)
-    ].copy()
-    
-    print(f"Found {len(sig_df)} significant disasters out of {len(df)} total.")
-    
-    # Process each disaster
-    matches_found = 0
-    
-    # Create normalized keys map for metadata
-    # We want to match EMDAT country to Metadata keys.
-    # Metadata keys are mixed (TR, EN).
-    
+
+    sig = significant_disasters(df, min_deaths, min_affected, min_damage)
+    print(f"Found {len(sig)} significant disasters out of {len(df)} total.")
+
+    # Country canonicalization as a join against a per-distinct-country key table.
+    keys = country_key_table(sig['Country'].dropna().unique(), metadata)
+    matched = sig.merge(keys, on='Country', how='inner').sort_values(['row', 'key_rank'], kind='stable')
+    matches_found = matched['row'].nunique()
+
+    # Avoid duplicates (same year, type and deaths within a country; first occurrence wins).
+    matched = matched.drop_duplicates(subset=['key', 'year', 'type', 'deaths'], keep='first')
+
     # Clear existing 'felaketler' data start fresh
     print("Clearing existing disaster data...")
     for key in metadata:
         if "felaketler" in metadata[key]:
             metadata[key]["felaketler"] = []
 
-    # Iterate over significant disasters
-    for _, row in sig_df.iterrows():
-        country = row['Country']
-        year = row['Start Year']
-        dis_type = row['Disaster Type']
-        dis_subtype = row['Disaster Subtype'] if pd.notna(row['Disaster Subtype']) else ""
-        event_name = row['Event Name'] if pd.notna(row['Event Name']) else ""
-        
-        deaths = row['Total Deaths'] if pd.notna(row['Total Deaths']) else 0
-        affected = row['Total Affected'] if pd.notna(row['Total Affected']) else 0
-        damage = row['Total Damage (\'000 US$)'] if pd.notna(row['Total Damage (\'000 US$)']) else 0
-        
-        # Translation Map
-        DISASTER_TRANSLATIONS = {
-            "Flood": "Sel",
-            "Flash flood": "Ani Sel",
-            "Riverine flood": "Nehir Taşkını",
-            "Coastal flood": "Kıyı Seli",
-            "Earthquake": "Deprem",
-            "Ground movement": "Yer Sarsıntısı",
-            "Tsunami": "Tsunami",
-            "Storm": "Fırtına",
-            "Tropical cyclone": "Tropikal Kasırga",
-            "Convective storm": "Konvektif Fırtına",
-            "Extra-tropical storm": "Ekstra-tropikal Fırtına",
-            "Tornado": "Hortum",
-            "Drought": "Kuraklık",
-            "Wildfire": "Orman Yangını",
-            "Forest fire": "Orman Yangını",
-            "Land fire (Brush, Bush, Pasture)": "Arazi Yangını",
-            "Extreme temperature": "Aşırı Sıcaklık",
-            "Heat wave": "Sıcak Hava Dalgası",
-            "Cold wave": "Soğuk Hava Dalgası",
-            "Severe winter conditions": "Ağır Kış Şartları",
-            "Epidemic": "Salgın",
-            "Viral disease": "Viral Hastalık",
-            "Bacterial disease": "Bakteriyel Hastalık",
-            "Parasitic disease": "Paraziter Hastalık",
-            "Volcanic activity": "Volkanik Aktivite",
-            "Ash fall": "Kül Yağmuru",
-            "Lava flow": "Lav Akıntısı",
-            "Mass movement (dry)": "Toprak Kayması (Kuru)",
-            "Landslide": "Heyelan",
-            "Rockfall": "Kaya Düşmesi",
-            "Mass movement (wet)": "Toprak Kayması (Islak)",
-            "Avalanche": "Çığ",
-            "Insect infestation": "Böcek İstilası",
-            "Locust": "Çekirge",
-            "Animal accident": "Hayvan Kazası",
-            "Impact": "Göktaşı/Çarpma",
-            "Glacial lake outburst": "Buzul Gölü Taşkını",
-            "Fog": "Sis",
-            "Derecho": "Derecho Fırtınası",
-            "Sandstorm": "Kum Fırtınası",
-            "Mudslide": "Çamur Kayması",
-            "Explosion": "Patlama",
-            "Fire": "Yangın",
-            "Transport accident": "Ulaşım Kazası",
-            "Collapse": "Çökme",
-            "Air": "Hava Kazası",
-            "Road": "Trafik Kazası",
-            "Water": "Deniz Kazası",
-            "Rail": "Tren Kazası",
-            "Fire (Miscellaneous)": "Yangın (Çeşitli)",
-            "Explosion (Industrial)": "Patlama (Endüstriyel)",
-            "Collapse (Miscellaneous)": "Çökme (Çeşitli)",
-            "Collapse (Industrial)": "Çökme (Endüstriyel)",
-            "Structure Collapse": "Yapı Çökmesi",
-            "Miscellaneous accident": "Çeşitli Kazalar",
-            "Wildfire (General)": "Orman Yangını",
-            "Lightning/Thunderstorms": "Yıldırım/Fırtına",
-            "Blizzard/Winter storm": "Kar Fırtınası",
-            "Severe weather": "Şiddetli Hava Koşulları",
-            "Flood (General)": "Sel",
-            "Storm (General)": "Fırtına"
-        }
-
-        # Apply Translation
-        dis_type = DISASTER_TRANSLATIONS.get(dis_type, dis_type)
-        dis_subtype = DISASTER_TRANSLATIONS.get(dis_subtype, dis_subtype)
-        
-        # Build the disaster object
-        disaster_obj = {
-            "year": int(year),
-            "type": dis_type,
-            "subtype": dis_subtype,
-            "name": event_name,
-            "deaths": int(deaths),
-            "affected": int(affected),
-            "damage_usd_millions": float(damage) / 1000 if damage > 0 else 0
-        }
-        
-        # Find matching keys in metadata
-        target_keys = []
-        
-        # 1. Check Explicit Map
-        if country in COUNTRY_MAP:
-            candidates = COUNTRY_MAP[country]
-            for cand in candidates:
-                if cand in metadata:
-                    target_keys.append(cand)
-        
-        # 2. Check Direct Match
-        if country in metadata and country not in target_keys:
-            target_keys.append(country)
-            
-        # 3. If no match yet, try simple fuzzy/lower check
-        if not target_keys:
-            for key in metadata.keys():
-                if key.lower() == country.lower():
-                    target_keys.append(key)
-        
-        if target_keys:
-            matches_found += 1
-            for key in target_keys:
-                if "felaketler" not in metadata[key]:
-                    metadata[key]["felaketler"] = []
-                
-                # Avoid duplicates? (Simple check based on year and type)
-                exists = False
-                for d in metadata[key]["felaketler"]:
-                    if d['year'] == disaster_obj['year'] and d['type'] == disaster_obj['type'] and d['deaths'] == disaster_obj['deaths']:
-                        exists = True
-                        break
-                
-                if not exists:
-                    metadata[key]["felaketler"].append(disaster_obj)
-        else:
-            # Uncomment to debug missing countries
-            # print(f"Warning: No match for {country}")
-            pass
+    for key, group in matched.groupby('key', sort=False):
+        metadata[key]["felaketler"] = [
+            {
+                "year": int(year),
+                "type": dis_type,
+                "subtype": dis_subtype,
+                "name": name,
+                "deaths": int(deaths),
+                "affected": int(affected),
+                "damage_usd_millions": float(damage) / 1000 if damage > 0 else 0,
+            }
+            for year, dis_type, dis_subtype, name, deaths, affected, damage in zip(
+                group['year'], group['type'], group['subtype'], group['name'],
+                group['deaths'], group['affected'], group['damage'],
+            )
+        ]
 
     print(f"Processed events. Updated metadata for {matches_found} events (note: one event might update multiple keys).")
+    print(f"Summarized disasters for {attach_summaries(metadata)} countries.")
     return metadata
 
 def save_data(metadata):
@@ -280,7 +353,18 @@ def save_data(metadata):
         json.dump(metadata, f, ensure_ascii=False, indent=4)
     print("Done.")
 
-if __name__ == "__main__":
-    df, metadata = load_data()
-    updated_metadata = process_disasters(df, metadata)
+def main():
+    parser = argparse.ArgumentParser(description="Attach significant EM-DAT disasters to country metadata")
+    parser.add_argument('--excel', default=str(excel_path), help="EM-DAT Excel export")
+    parser.add_argument('--min-deaths', type=float, default=MIN_DEATHS)
+    parser.add_argument('--min-affected', type=float, default=MIN_AFFECTED)
+    parser.add_argument('--min-damage', type=float, default=MIN_DAMAGE_USD, help="'000 USD")
+    parser.add_argument('--no-cache', action='store_true', help="Always re-read the Excel file")
+    args = parser.parse_args()
+
+    df, metadata = load_data(Path(args.excel), use_cache=not args.no_cache)
+    updated_metadata = process_disasters(df, metadata, args.min_deaths, args.min_affected, args.min_damage)
     save_data(updated_metadata)
+
+if __name__ == "__main__":
+    main()
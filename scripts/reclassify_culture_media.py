@@ -8,19 +8,20 @@ Motivation:
 
 This script:
 - Ensures category definitions exist (adds music/cinema if missing)
-- Moves events from category=culture -> cinema/music using simple heuristics
+- Moves events from category=culture -> cinema/music using the `media` rules in
+  data/event_rules.json (see event_rules.py)
 
 It is intentionally conservative; it only changes events already tagged as `culture`.
 """
 
 from __future__ import annotations
 
-import json
-import re
-from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from event_rules import RuleEngine, apply_match
+from event_store import EventStore
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
@@ -51,84 +52,45 @@ def _ensure_category_defs(categories: Dict[str, Any]) -> None:
             categories[k].setdefault(kk, vv)
 
 
-def _text(ev: Dict[str, Any]) -> str:
-    return f"{ev.get('title') or ''}\n{ev.get('description') or ''}".strip()
-
-
-def _should_cinema(t: str) -> bool:
-    # Prefer explicit film terms; avoid generic "festival" which is ambiguous.
-    return bool(
-        re.search(
-            r"\b(film|sinema|cannes|oscar|altın palmiye|altin palmiye|prömiyer|promiyer|gösterim|gosterim)\b",
-            t,
-            re.IGNORECASE,
-        )
-    )
-
-
-def _should_music(t: str) -> bool:
-    return bool(
-        re.search(
-            r"\b(müzik|muzik|konser|albüm|album|şarkı|sarki|grup|grammy)\b",
-            t,
-            re.IGNORECASE,
-        )
-    )
-
-
 def main() -> None:
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events") or []
-    if not isinstance(events, list):
-        raise SystemExit("events.json: `events` must be a list")
-
-    categories = data.get("categories") or {}
-    if not isinstance(categories, dict):
-        categories = {}
-    _ensure_category_defs(categories)
-    data["categories"] = categories
+    store = EventStore.load(EVENTS_PATH)
+    events = store.events
+    _ensure_category_defs(store.categories)
 
     changed = 0
-    changed_samples: List[Tuple[str, int, str, str, str]] = []
-    for ev in events:
-        if not isinstance(ev, dict):
-            continue
-        if (ev.get("category") or "").strip() != "culture":
-            continue
-        t = _text(ev)
-        if not t:
+    per_rule: Dict[str, int] = {}
+    changed_samples: List[Tuple[str, int, str, str, str, str]] = []
+    for i, match in RuleEngine.load().classify_all(events, ["media"]):
+        ev = events[i]
+        old_cat = ev.get("category")
+        if not apply_match(ev, match):
             continue
-        new_cat = None
-        if _should_cinema(t):
-            new_cat = "cinema"
-        elif _should_music(t):
-            new_cat = "music"
-        if new_cat and new_cat != ev.get("category"):
-            ev["category"] = new_cat
-            changed += 1
-            if len(changed_samples) < 25:
-                changed_samples.append(
-                    (
-                        str(ev.get("country_name") or ""),
-                        int(ev.get("year") or 0),
-                        str(ev.get("title") or ""),
-                        "culture",
-                        new_cat,
-                    )
+        changed += 1
+        per_rule[match.rule] = per_rule.get(match.rule, 0) + 1
+        if len(changed_samples) < 25:
+            changed_samples.append(
+                (
+                    str(ev.get("country_name") or ""),
+                    int(ev.get("year") or 0),
+                    str(ev.get("title") or ""),
+                    str(old_cat),
+                    str(ev.get("category")),
+                    match.rule,
                 )
+            )
 
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    backup_path = EVENTS_PATH.with_suffix(f".json.bak.{ts}")
-    backup_path.write_text(EVENTS_PATH.read_text(encoding="utf-8"), encoding="utf-8")
-    EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    store.save()
 
     print("Reclassification complete.")
     print(f"- culture -> cinema/music changes: {changed}")
-    print(f"- Backup: {backup_path}")
+    for rule, n in sorted(per_rule.items()):
+        print(f"  - {rule}: {n}")
+    if store.last_revision:
+        print(f"- Journal revision: {store.last_revision} (undo: python3 scripts/event_store.py restore {store.last_revision - 1})")
     if changed_samples:
         print("- Sample changes:")
-        for country, year, title, old, new in changed_samples[:10]:
-            print(f"  - {country} {year}: {title} ({old} -> {new})")
+        for country, year, title, old, new, rule in changed_samples[:10]:
+            print(f"  - {country} {year}: {title} ({old} -> {new}, {rule})")
 
 
 if __name__ == "__main__":
@@ -12,6 +12,8 @@ It intentionally avoids removing:
 - Turkish single-word titles like "Bağımsızlık" (handled by Latin-title check)
 - cinema/music items (media can be single-word)
 
+The criteria are the `contextless` ruleset in data/event_rules.json (see event_rules.py).
+
 Usage:
   python3 scripts/remove_contextless_events.py --dry-run
   python3 scripts/remove_contextless_events.py --apply
@@ -21,70 +23,18 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
-import re
 from collections import Counter
 from pathlib import Path
 from typing import Any, Dict, List, Set
 
+from event_rules import RuleEngine
+from event_store import EventStore
+
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 EVENTS_PATH = BASE_DIR / "data" / "events.json"
 
 
-HIGH_STAKES_CATEGORIES: Set[str] = {
-    "politics",
-    "diplomacy",
-    "leader",
-    "war",
-    "revolution",
-    "terror",
-    "genocide",
-    "time_100",
-}
-
-TURKISH_CHARS = set("çğıöşüÇĞİÖŞÜ")
-
-
-def _word_count(s: str) -> int:
-    return len([t for t in re.split(r"\s+", (s or "").strip()) if t])
-
-
-def _is_latin_single_token(title: str) -> bool:
-    t = (title or "").strip()
-    if not t:
-        return False
-    if any(ch in TURKISH_CHARS for ch in t):
-        return False
-    if _word_count(t) != 1:
-        return False
-    # ASCII-ish token: letters/digits/hyphen/dot/apostrophe
-    return bool(re.fullmatch(r"[A-Za-z0-9][A-Za-z0-9\-\.']*", t))
-
-
-def _has_any_link(e: Dict[str, Any]) -> bool:
-    if (e.get("wikipedia_url") or "").strip():
-        return True
-    if e.get("youtube_video_id") or e.get("youtube_url") or e.get("youtube"):
-        return True
-    return False
-
-
-def _is_bad_description(desc: str, title: str) -> bool:
-    d = (desc or "").strip()
-    t = (title or "").strip()
-    if not d:
-        return True
-    if d == t or d == f"{t}.":
-        return True
-    # One word, or ultra-short two-word stubs.
-    if _word_count(d) <= 1:
-        return True
-    if _word_count(d) <= 2 and len(d) <= 18:
-        return True
-    return False
-
-
 def _should_remove(e: Dict[str, Any], countries_filter: Set[str] | None) -> bool:
     if not isinstance(e, dict):
         return False
@@ -92,27 +42,7 @@ def _should_remove(e: Dict[str, Any], countries_filter: Set[str] | None) -> bool
         c = (e.get("country_name") or "").strip()
         if c not in countries_filter:
             return False
-
-    eid = str(e.get("id") or "")
-    if eid.startswith("ev_gap_"):
-        return False
-
-    cat = (e.get("category") or "").strip()
-    if cat not in HIGH_STAKES_CATEGORIES:
-        return False
-
-    if _has_any_link(e):
-        return False
-
-    title = (e.get("title") or "").strip()
-    if not _is_latin_single_token(title):
-        return False
-
-    desc = (e.get("description") or "").strip()
-    if not _is_bad_description(desc, title):
-        return False
-
-    return True
+    return RuleEngine.load().match(e, "contextless") is not None
 
 
 def main() -> int:
@@ -126,11 +56,8 @@ def main() -> int:
         print(f"ERROR: not found: {EVENTS_PATH}")
         return 2
 
-    data = json.loads(EVENTS_PATH.read_text(encoding="utf-8"))
-    events = data.get("events", [])
-    if not isinstance(events, list):
-        print("ERROR: events.json: `events` must be a list")
-        return 2
+    store = EventStore.load(EVENTS_PATH)
+    events = store.events
 
     countries_filter = None
     if args.countries.strip():
@@ -161,8 +88,8 @@ def main() -> int:
 
     remove_ids = {str(e.get("id") or "") for e in to_remove}
     new_events = [e for e in events if not (isinstance(e, dict) and str(e.get("id") or "") in remove_ids)]
-    data["events"] = new_events
-    EVENTS_PATH.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    store.events = new_events
+    store.save()
     print(f"applied: removed={len(events) - len(new_events)} events_after={len(new_events)} wrote={EVENTS_PATH}")
     return 0
 
@@ -1,18 +1,20 @@
-import json
 from collections import defaultdict
+from pathlib import Path
 
-EVENTS_PATH = '/Users/gurursonmez/Documents/Harita/data/events.json'
+from event_store import EventStore
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+EVENTS_PATH = BASE_DIR / "data" / "events.json"
 
 def remove_duplicates():
-    with open(EVENTS_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    store = EventStore.load(EVENTS_PATH)
     
-    initial_count = len(data['events'])
+    initial_count = len(store)
     
     # Group by unique key
     grouped_events = defaultdict(list)
     
-    for ev in data['events']:
+    for ev in store.events:
         # Key: Country + Year + Title (normalized)
         key = (
             ev.get('country_name', '').strip(), 
@@ -39,10 +41,8 @@ def remove_duplicates():
     print(f"Final event count:   {final_count}")
     print(f"Removed duplicates:  {removed_count}")
     
-    data['events'] = unique_events
-    
-    with open(EVENTS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    store.events = unique_events
+    store.save()
 
 if __name__ == "__main__":
     remove_duplicates()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Shared multi-pattern substring matcher (Aho–Corasick) with Turkish-aware case folding.
+
+Why:
+- Video enrichment used to test every mapping key against every title (O(events × keys)).
+- An Aho–Corasick automaton is compiled once and scans each text in a single pass, so the
+  cost stays linear in total text length no matter how large the video catalog grows.
+
+Used by `geopolitical_map.py` (VIDEO_MAPPINGS) and the video scripts
+(`add_youtube_videos.py`, `add_tarih101_videos.py`, `add_more_channel_videos.py`).
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+
+_TR_UPPER_TO_LOWER = str.maketrans({"İ": "i", "I": "ı"})
+_DOTTED_DOTLESS_I = str.maketrans({"İ": "i", "I": "i", "ı": "i"})
+
+TR_ASCII_TRANSLATE = str.maketrans(
+    {
+        "ı": "i",
+        "İ": "i",
+        "ş": "s",
+        "Ş": "s",
+        "ğ": "g",
+        "Ğ": "g",
+        "ü": "u",
+        "Ü": "u",
+        "ö": "o",
+        "Ö": "o",
+        "ç": "c",
+        "Ç": "c",
+        "â": "a",
+        "Â": "a",
+        "î": "i",
+        "Î": "i",
+        "û": "u",
+        "Û": "u",
+    }
+)
+
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def fold_tr(value: str) -> str:
+    """Turkish-aware lowercase: İ -> i and I -> ı (plain str.lower() maps İ to 'i̇')."""
+    return (value or "").translate(_TR_UPPER_TO_LOWER).lower()
+
+
+def casefold_tr(value: str) -> str:
+    """str.casefold() with I/İ/ı as one letter: 'MUSSOLINI', 'SUİKAST' and 'KAÇIŞ' all match
+    lowercase keywords (fold_tr would turn Latin 'MUSSOLINI' into 'mussolını')."""
+    return (value or "").translate(_DOTTED_DOTLESS_I).casefold()
+
+
+def fold_ascii(value: str) -> str:
+    """Diacritic-free, punctuation-insensitive key: 'Çavuşesku'nun' -> 'cavusesku nun'."""
+    s = (value or "").strip().translate(TR_ASCII_TRANSLATE).lower()
+    # Runs are already collapsed to one space; only the ends can still carry one.
+    return _NON_ALNUM_RE.sub(" ", s).strip()
+
+
+class AhoCorasick:
+    """Substring automaton over a fixed pattern list; pattern ids are list positions."""
+
+    def __init__(self, patterns: Iterable[str], normalize: Callable[[str], str] = casefold_tr):
+        self.normalize = normalize
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+
+        for pid, pattern in enumerate(patterns):
+            self.patterns.append(pattern)
+            key = normalize(pattern)
+            if not key:
+                # An empty pattern would match every text; ignore it.
+                continue
+            node = 0
+            for ch in key:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] += (pid,)
+
+        # Breadth-first: a node's failure target is always shallower, so its outputs are final.
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] += self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (end_index, pattern_id) for every occurrence in the normalized text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(self.normalize(text)):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for pid in out[node]:
+                yield i, pid
+
+    def matched_ids(self, text: str) -> Set[int]:
+        # Same walk as iter_matches() without the per-match generator round trips (hot in batch use).
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        node = 0
+        for ch in self.normalize(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+    def first(self, text: str) -> Optional[int]:
+        """Lowest pattern id found in text (i.e. first pattern in declaration order), or None."""
+        ids = self.matched_ids(text)
+        return min(ids) if ids else None
+
+
+class KeywordRules:
+    """Rules that fire when *all* of their keywords occur in a text (AND of substrings).
+
+    Every distinct keyword across all rules goes into one automaton, so a text is scanned
+    once regardless of how many rules there are.
+    """
+
+    def __init__(self, rules: Dict[Hashable, Sequence[str]], normalize: Callable[[str], str] = casefold_tr):
+        self.rule_keys: List[Hashable] = list(rules)
+        keyword_ids: Dict[str, int] = {}
+        self._required: List[Set[int]] = []
+        for key in self.rule_keys:
+            ids = set()
+            for kw in rules[key]:
+                norm = normalize(kw)
+                if not norm:
+                    continue
+                ids.add(keyword_ids.setdefault(norm, len(keyword_ids)))
+            self._required.append(ids)
+        self._keyword_rules: List[List[int]] = [[] for _ in keyword_ids]
+        for ridx, ids in enumerate(self._required):
+            for kid in ids:
+                self._keyword_rules[kid].append(ridx)
+        # Keywords are already normalized; the automaton normalizes texts with the same function.
+        self._ac = AhoCorasick(list(keyword_ids), normalize=normalize)
+
+    def match(self, text: str) -> List[Hashable]:
+        """Keys of every rule satisfied by text, in rule declaration order."""
+        hit = self._ac.matched_ids(text)
+        candidates = {ridx for kid in hit for ridx in self._keyword_rules[kid]}
+        return [
+            self.rule_keys[ridx]
+            for ridx in sorted(candidates)
+            if self._required[ridx] <= hit
+        ]
+
+    def first_per_rule(self, texts: Iterable[str]) -> Dict[Hashable, int]:
+        """rule key -> index of the first text that satisfies it (single pass over texts)."""
+        found: Dict[Hashable, int] = {}
+        for idx, text in enumerate(texts):
+            if len(found) == len(self.rule_keys):
+                break
+            for key in self.match(text):
+                found.setdefault(key, idx)
+        return found
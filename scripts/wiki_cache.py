@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Persistent SQLite cache for Wikipedia API lookups (search hits and langlinks).
+
+Why:
+- `WikiResolver` kept its caches in plain dicts, so every `fix_wiki.py` run re-queried the
+  same thousands of titles, and a transient failure was remembered as "" for the whole run.
+- Entries now survive across runs and are shared by `fix_wiki.py` and `enrich_wiki_links.py`.
+
+Policy:
+- Hits live for `hit_ttl` seconds.
+- Misses ("no such page") live for `miss_ttl`, doubled for every consecutive miss of the same
+  key (negative-cache backoff) up to `max_miss_ttl`, so hopeless queries stop being retried
+  every run while new misses are re-checked soon.
+- Network/HTTP errors are never stored.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_CACHE_PATH = Path(os.environ.get("WIKI_CACHE_PATH") or (BASE_DIR / ".cache" / "wiki_cache.sqlite"))
+
+DAY = 24 * 3600
+DEFAULT_HIT_TTL = 30 * DAY
+DEFAULT_MISS_TTL = 1 * DAY
+DEFAULT_MAX_MISS_TTL = 30 * DAY
+
+# Commit after this many writes (and on flush/close) instead of per entry.
+_COMMIT_EVERY = 200
+
+SEARCH = "search"  # key: (lang, query)
+LANGLINK = "langlink"  # key: (from_lang, to_lang, title)
+
+
+def _key(parts: Sequence[str]) -> str:
+    return "\x1f".join(parts)
+
+
+class WikiCache:
+    """Thread-safe (kind, key) -> value store with separate hit/miss TTLs."""
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        hit_ttl: float = DEFAULT_HIT_TTL,
+        miss_ttl: float = DEFAULT_MISS_TTL,
+        max_miss_ttl: float = DEFAULT_MAX_MISS_TTL,
+    ) -> None:
+        self.path = Path(path)
+        self.hit_ttl = hit_ttl
+        self.miss_ttl = miss_ttl
+        self.max_miss_ttl = max_miss_ttl
+        self.stats: Dict[str, int] = {"hits": 0, "negative_hits": 0, "expired": 0, "absent": 0, "stored": 0}
+
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                kind TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                misses INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (kind, key)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, kind: str, parts: Sequence[str]) -> Optional[str]:
+        """Cached value ("" = known miss), or None when absent or expired."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE kind = ? AND key = ?",
+                (kind, _key(parts)),
+            ).fetchone()
+            if row is None:
+                self.stats["absent"] += 1
+                return None
+            value, expires_at = row
+            if expires_at < time.time():
+                self.stats["expired"] += 1
+                return None
+            self.stats["hits" if value else "negative_hits"] += 1
+            return value
+
+    def put(self, kind: str, parts: Sequence[str], value: str) -> None:
+        """Store a lookup result; "" records a miss with backoff on repeated misses."""
+        now = time.time()
+        key = _key(parts)
+        with self._lock:
+            if value:
+                misses, ttl = 0, self.hit_ttl
+            else:
+                row = self._conn.execute(
+                    "SELECT misses FROM entries WHERE kind = ? AND key = ?", (kind, key)
+                ).fetchone()
+                misses = (row[0] if row else 0) + 1
+                ttl = min(self.miss_ttl * (2 ** (misses - 1)), self.max_miss_ttl)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (kind, key, value, fetched_at, expires_at, misses) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (kind, key, value, now, now + ttl, misses),
+            )
+            self.stats["stored"] += 1
+            self._pending += 1
+            if self._pending >= _COMMIT_EVERY:
+                self._conn.commit()
+                self._pending = 0
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            cur = self._conn.execute("DELETE FROM entries WHERE expires_at < ?", (time.time(),))
+            self._conn.commit()
+            self._pending = 0
+            return cur.rowcount
+
+    def flush(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        self.flush()
+        self._conn.close()
+
+    def hit_rate(self) -> float:
+        served = self.stats["hits"] + self.stats["negative_hits"]
+        lookups = served + self.stats["expired"] + self.stats["absent"]
+        return served / lookups if lookups else 0.0
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"hit rate {self.hit_rate():.1%} "
+            f"(hits {s['hits']}, cached misses {s['negative_hits']}, "
+            f"expired {s['expired']}, absent {s['absent']}, stored {s['stored']})"
+        )